@@ -1,7 +1,9 @@
 """ Code to allow module store to interface with courseware index """
 
+import json
 import logging
 import re
+import zlib
 from abc import ABCMeta, abstractmethod
 from datetime import timedelta
 
@@ -13,6 +15,7 @@ from eventtracking import tracker
 from search.search_engine_base import SearchEngine
 
 from cms.djangoapps.contentstore.course_group_config import GroupConfiguration
+from cms.djangoapps.contentstore.models import SearchIndexedVersions
 from common.djangoapps.course_modes.models import CourseMode
 from openedx.core.lib.courses import course_image_url
 from xmodule.annotator_mixin import html_to_text
@@ -30,6 +33,14 @@ REINDEX_AGE = timedelta(0, 60)  # 60 seconds
 # timed out for courseware indexing.
 INDEXING_REQUEST_TIMEOUT = 60
 
+# INDEXING_BATCH_SIZE is the maximum number of items sent to the search engine
+# in a single bulk request.
+INDEXING_BATCH_SIZE = 500
+
+# Version of the format of the indexed versions stored for incremental
+# indexing; changing it causes full reindexes.
+INDEXED_VERSIONS_FORMAT = 1
+
 log = logging.getLogger('edx.modulestore')
 
 
@@ -114,7 +125,7 @@ class SearchIndexerBase(metaclass=ABCMeta):
         searcher.remove(result_ids)
 
     @classmethod
-    def index(cls, modulestore, structure_key, triggered_at=None, reindex_age=REINDEX_AGE, timeout=INDEXING_REQUEST_TIMEOUT):  # lint-amnesty, pylint: disable=line-too-long, too-many-statements
+    def index(cls, modulestore, structure_key, triggered_at=None, reindex_age=REINDEX_AGE, timeout=INDEXING_REQUEST_TIMEOUT, incremental=False):  # lint-amnesty, pylint: disable=line-too-long, too-many-statements
         """
         Process course for indexing
 
@@ -130,6 +141,15 @@ class SearchIndexerBase(metaclass=ABCMeta):
             which items may need to be removed from the index
             If None, then a full reindex takes place
 
+        incremental (bool) - only update the index of the items whose version
+            changed since the structure was last indexed, along with their
+            ancestors and descendants, and only remove the items that were
+            removed since.  Falls back to a full reindex when the versions last
+            indexed are unknown or the top level item changed.  Only modulestores
+            that version their items (split) support it; triggered_at is
+            ignored when it is used, since the items it skips would be recorded
+            as indexed.
+
         Returns:
         Number of items that have been added to the index
         """
@@ -138,6 +158,9 @@ class SearchIndexerBase(metaclass=ABCMeta):
         if not searcher:
             return
 
+        if incremental:
+            triggered_at = None
+
         structure_key = cls.normalize_structure_key(structure_key)
         location_info = cls._get_location_info(structure_key)
 
@@ -157,13 +180,20 @@ class SearchIndexerBase(metaclass=ABCMeta):
         # instead of per item index API call.
         items_index = []
 
+        # item_versions maps the ids of the items to their version and whether
+        # they have an index, to be stored for the next incremental indexing.
+        # previous_item_versions is the same for the last indexing, if this one
+        # is incremental.
+        item_versions = {}
+        previous_item_versions = None
+
         def get_item_location(item):
             """
             Gets the version agnostic item location
             """
             return item.location.version_agnostic().replace(branch=None)
 
-        def prepare_item_index(item, skip_index=False, groups_usage_info=None):
+        def prepare_item_index(item, skip_index=False, groups_usage_info=None, force_index=False):
             """
             Add this item to the items_index and indexed_items list
 
@@ -175,13 +205,31 @@ class SearchIndexerBase(metaclass=ABCMeta):
                 This should really only be passed from the recursive child calls when
                 this method has determined that it is safe to do so
 
+            force_index - index the item even if it did not change since the last
+                incremental indexing, because one of its ancestors did
+
             Returns:
             item_content_groups - content groups assigned to indexed item
             """
-            item_index_dictionary = item.index_dictionary()
-            # if it's not indexable and it does not have children, then ignore
-            if not item_index_dictionary and not item.has_children:
-                return
+            item_id = str(cls._id_modifier(item.scope_ids.usage_id))
+            item_version = getattr(item, 'update_version', None)
+            previous_version = previous_item_versions.get(item_id) if previous_item_versions is not None else None
+            unchanged = (
+                not force_index and
+                item_version is not None and
+                previous_version is not None and
+                previous_version[0] == str(item_version)
+            )
+            if unchanged:
+                # it was indexed (or walked) in the last indexing, and has not changed since
+                item_index_dictionary = None
+                has_index = previous_version[1]
+            else:
+                item_index_dictionary = item.index_dictionary()
+                # if it's not indexable and it does not have children, then ignore
+                if not item_index_dictionary and not item.has_children:
+                    return
+                has_index = bool(item_index_dictionary)
 
             item_content_groups = None
 
@@ -205,24 +253,36 @@ class SearchIndexerBase(metaclass=ABCMeta):
                 item_location = get_item_location(item)
                 item_content_groups = groups_usage_info.get(str(item_location), None)
 
-            item_id = str(cls._id_modifier(item.scope_ids.usage_id))
             indexed_items.add(item_id)
             if item.has_children:
                 # determine if it's okay to skip adding the children herein based upon how recently any may have changed
                 skip_child_index = skip_index or \
                     (triggered_at is not None and (triggered_at - item.subtree_edited_on) > reindex_age)
                 children_groups_usage = []
+                count_before_children = indexed_count["count"]
                 for child_item in item.get_children():
                     if modulestore.has_published_version(child_item):
                         children_groups_usage.append(
                             prepare_item_index(
                                 child_item,
                                 skip_index=skip_child_index,
-                                groups_usage_info=groups_usage_info
+                                groups_usage_info=groups_usage_info,
+                                force_index=force_index or not unchanged,
                             )
                         )
                 if None in children_groups_usage:
                     item_content_groups = None
+                if unchanged and indexed_count["count"] > count_before_children:
+                    # the content groups of the item depend on those of its children
+                    unchanged = False
+                    item_index_dictionary = item.index_dictionary()
+                    has_index = bool(item_index_dictionary)
+
+            if item_version is not None:
+                item_versions[item_id] = (str(item_version), has_index)
+
+            if unchanged:
+                return item_content_groups if has_index else None
 
             if skip_index or not item_index_dictionary:
                 return
@@ -244,10 +304,18 @@ class SearchIndexerBase(metaclass=ABCMeta):
                 # broad exception so that index operation does not fail on one item of many
                 log.warning('Could not index item: %s - %r', item.location, err)
                 error_list.append(_('Could not index item: {}').format(item.location))
+                # so that the next incremental indexing tries again
+                item_versions.pop(item_id, None)
 
         try:
             with modulestore.branch_setting(ModuleStoreEnum.RevisionOption.published_only):
                 structure = cls._fetch_top_level(modulestore, structure_key)
+                structure_version = getattr(structure, 'update_version', None)
+                if incremental and structure_version is not None:
+                    previous_item_versions = cls._get_indexed_versions(structure_key, structure_version)
+                    if previous_item_versions is None:
+                        log.info('Fully reindexing %s, its last indexed versions are outdated', structure_key)
+
                 groups_usage_info = cls.fetch_group_usage(modulestore, structure)
 
                 # First perform any additional indexing from the structure object
@@ -256,8 +324,24 @@ class SearchIndexerBase(metaclass=ABCMeta):
                 # Now index the content
                 for item in structure.get_children():
                     prepare_item_index(item, groups_usage_info=groups_usage_info)
-                searcher.index(items_index, request_timeout=timeout)
-                cls.remove_deleted_items(searcher, structure_key, indexed_items)
+                for batch_start in range(0, len(items_index), INDEXING_BATCH_SIZE):
+                    searcher.index(items_index[batch_start:batch_start + INDEXING_BATCH_SIZE], request_timeout=timeout)
+                if previous_item_versions is not None:
+                    removed_items = [
+                        item_id for item_id, (__, has_index) in previous_item_versions.items()
+                        if has_index and item_id not in indexed_items
+                    ]
+                    if removed_items:
+                        searcher.remove(removed_items)
+                else:
+                    cls.remove_deleted_items(searcher, structure_key, indexed_items)
+
+                if structure_version is not None:
+                    if triggered_at is None:
+                        cls._set_indexed_versions(structure_key, structure_version, item_versions)
+                    else:
+                        # the versions of the items skipped because of triggered_at are unknown
+                        cls._delete_indexed_versions(structure_key)
         except Exception as err:  # pylint: disable=broad-except
             # broad exception so that index operation does not prevent the rest of the application from working
             log.exception(
@@ -272,6 +356,49 @@ class SearchIndexerBase(metaclass=ABCMeta):
 
         return indexed_count["count"]
 
+    @classmethod
+    def _get_indexed_versions(cls, structure_key, structure_version):
+        """
+        Returns the versions of the items last indexed for the structure, by
+        item id, or None if they are unknown or the top level item changed
+        since.
+        """
+        try:
+            indexed_versions = SearchIndexedVersions.objects.get(
+                index_name=cls.INDEX_NAME, structure_key=structure_key
+            )
+        except SearchIndexedVersions.DoesNotExist:
+            return None
+        if indexed_versions.structure_version != str(structure_version):
+            return None
+        item_versions = json.loads(zlib.decompress(indexed_versions.item_versions).decode('utf-8'))
+        if item_versions['format'] != INDEXED_VERSIONS_FORMAT:
+            return None
+        return item_versions['items']
+
+    @classmethod
+    def _set_indexed_versions(cls, structure_key, structure_version, item_versions):
+        """
+        Stores the versions of the items indexed for the structure.
+        """
+        SearchIndexedVersions.objects.update_or_create(
+            index_name=cls.INDEX_NAME,
+            structure_key=structure_key,
+            defaults={
+                'structure_version': str(structure_version),
+                'item_versions': zlib.compress(
+                    json.dumps({'format': INDEXED_VERSIONS_FORMAT, 'items': item_versions}).encode('utf-8')
+                ),
+            },
+        )
+
+    @classmethod
+    def _delete_indexed_versions(cls, structure_key):
+        """
+        Forgets the versions of the items last indexed for the structure.
+        """
+        SearchIndexedVersions.objects.filter(index_name=cls.INDEX_NAME, structure_key=structure_key).delete()
+
     @classmethod
     def _do_reindex(cls, modulestore, structure_key):
         """
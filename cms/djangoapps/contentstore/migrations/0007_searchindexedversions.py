@@ -0,0 +1,27 @@
+# Generated by Django 2.2.24 on 2026-10-18 12:00
+
+from django.db import migrations, models
+import opaque_keys.edx.django.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contentstore', '0006_courseoutlineregenerate'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchIndexedVersions',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('index_name', models.CharField(max_length=255)),
+                ('structure_key', opaque_keys.edx.django.models.CourseKeyField(max_length=255)),
+                ('structure_version', models.CharField(max_length=255)),
+                ('item_versions', models.BinaryField()),
+            ],
+            options={
+                'unique_together': {('index_name', 'structure_key')},
+            },
+        ),
+    ]
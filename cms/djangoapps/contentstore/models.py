@@ -4,7 +4,9 @@ Models for contentstore
 
 
 from config_models.models import ConfigurationModel
+from django.db import models
 from django.db.models.fields import TextField
+from opaque_keys.edx.django.models import CourseKeyField
 
 
 class VideoUploadConfig(ConfigurationModel):
@@ -22,3 +24,21 @@ class VideoUploadConfig(ConfigurationModel):
     def get_profile_whitelist(cls):
         """Get the list of profiles to include in the encoding download"""
         return [profile for profile in cls.current().profile_whitelist.split(",") if profile]
+
+
+class SearchIndexedVersions(models.Model):
+    """
+    The versions of the items of a course or library last indexed for search,
+    used to only index the items that changed since.
+
+    .. no_pii:
+    """
+    index_name = models.CharField(max_length=255)
+    structure_key = CourseKeyField(max_length=255)
+    # version of the top level item of the structure when it was indexed
+    structure_version = models.CharField(max_length=255)
+    # zlib compressed JSON object mapping item ids to their version and whether they have an index
+    item_versions = models.BinaryField()
+
+    class Meta:
+        unique_together = ('index_name', 'structure_key')
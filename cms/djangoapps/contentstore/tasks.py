@@ -65,7 +65,7 @@ from xmodule.modulestore.xml_importer import CourseImportException, import_cours
 
 from .outlines import update_outline_from_modulestore
 from .outlines_regenerate import CourseOutlineRegenerate
-from .toggles import bypass_olx_failure_enabled
+from .toggles import bypass_olx_failure_enabled, incremental_search_indexing_enabled
 from .utils import course_import_olx_validation_is_enabled
 
 User = get_user_model()
@@ -204,7 +204,12 @@ def update_search_index(course_id, triggered_time_isoformat):
             )
             return
 
-        CoursewareSearchIndexer.index(modulestore(), course_key, triggered_at=(_parse_time(triggered_time_isoformat)))
+        CoursewareSearchIndexer.index(
+            modulestore(),
+            course_key,
+            triggered_at=(_parse_time(triggered_time_isoformat)),
+            incremental=incremental_search_indexing_enabled(),
+        )
 
     except SearchIndexingError as exc:
         error_list = exc.error_list
@@ -5,7 +5,7 @@ Testing indexing of the courseware as it is changed
 
 import json
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest import skip
 from unittest.mock import patch
 from uuid import uuid4
@@ -13,6 +13,7 @@ from uuid import uuid4
 import ddt
 import pytest
 from django.conf import settings
+from django.test import TestCase
 from lazy.lazy import lazy
 from pytz import UTC
 from search.search_engine_base import SearchEngine
@@ -23,6 +24,7 @@ from cms.djangoapps.contentstore.courseware_index import (
     LibrarySearchIndexer,
     SearchIndexingError
 )
+from cms.djangoapps.contentstore.models import SearchIndexedVersions
 from cms.djangoapps.contentstore.signals.handlers import listen_for_course_publish, listen_for_library_update
 from cms.djangoapps.contentstore.tasks import update_search_index
 from cms.djangoapps.contentstore.tests.utils import CourseTestCase
@@ -93,8 +95,12 @@ def create_large_course(store, load_factor):
     return course, child_count
 
 
-class MixedWithOptionsTestCase(MixedSplitTestCase):
-    """ Base class for test cases within this file """
+class MixedWithOptionsTestCase(MixedSplitTestCase, TestCase):
+    """
+    Base class for test cases within this file
+
+    Indexing records the versions of the items indexed in the database.
+    """
     HOST = MONGO_HOST
     PORT = MONGO_PORT_NUM
     DATABASE = 'test_mongo_%s' % uuid4().hex[:5]
@@ -416,6 +422,82 @@ class TestCoursewareSearchIndexer(MixedWithOptionsTestCase):
         indexed_count = self.reindex_course(store)
         self.assertEqual(indexed_count, 7)
 
+    def _test_incremental_index(self, store):
+        """ Make sure that an incremental index only indexes items that changed since the last index """
+        chapter2 = ItemFactory.create(
+            parent_location=self.course.location,
+            category='chapter',
+            display_name="Week 2",
+            modulestore=store,
+            publish_item=True,
+        )
+        ItemFactory.create(
+            parent_location=chapter2.location,
+            category='sequential',
+            display_name="Lesson 2",
+            modulestore=store,
+            publish_item=True,
+        )
+        self.publish_item(store, self.vertical.location)
+        indexed_count = self.reindex_course(store)
+        self.assertEqual(indexed_count, 6)
+
+        # nothing changed
+        indexed_count = CoursewareSearchIndexer.index(store, self.course.id, incremental=True)
+        self.assertEqual(indexed_count, 0)
+        self.assertEqual(self.search()["total"], 6)
+
+        # the published unit and its ancestors are indexed
+        self.html_unit.display_name = "Updated Html Content"
+        self.update_item(store, self.html_unit)
+        self.publish_item(store, self.vertical.location)
+        indexed_count = CoursewareSearchIndexer.index(store, self.course.id, incremental=True)
+        self.assertEqual(indexed_count, 4)
+        response = self.search(query_string="Updated")
+        self.assertEqual(response["total"], 1)
+
+        # removed items are removed from the index
+        self.delete_item(store, self.html_unit.location)
+        self.publish_item(store, self.vertical.location)
+        indexed_count = CoursewareSearchIndexer.index(store, self.course.id, incremental=True)
+        self.assertEqual(indexed_count, 3)
+        self.assertEqual(self.search()["total"], 5)
+
+        # triggered_at is ignored
+        self.html_unit.display_name = "Html Content Updated Long Ago"
+        self.update_item(store, self.html_unit)
+        self.publish_item(store, self.vertical.location)
+        triggered_at = datetime.now(UTC) + timedelta(days=1)
+        indexed_count = CoursewareSearchIndexer.index(
+            store, self.course.id, triggered_at=triggered_at, incremental=True
+        )
+        self.assertEqual(indexed_count, 4)
+        self.assertEqual(self.search(query_string="Ago")["total"], 1)
+
+        # the whole course is indexed when the versions last indexed are unknown
+        SearchIndexedVersions.objects.all().delete()
+        indexed_count = CoursewareSearchIndexer.index(store, self.course.id, incremental=True)
+        self.assertEqual(indexed_count, 5)
+
+        # and after an indexing which skipped items because of triggered_at
+        CoursewareSearchIndexer.index(store, self.course.id, triggered_at=triggered_at)
+        indexed_count = CoursewareSearchIndexer.index(store, self.course.id, incremental=True)
+        self.assertEqual(indexed_count, 5)
+
+    @patch('cms.djangoapps.contentstore.courseware_index.INDEXING_BATCH_SIZE', 3)
+    def _test_indexing_in_batches(self, store):
+        """ Make sure that all the items are indexed when they are sent in several batches """
+        self.publish_item(store, self.vertical.location)
+        engine_class = self.searcher.__class__
+        with patch.object(engine_class, 'index', autospec=True, side_effect=engine_class.index) as mock_index:
+            indexed_count = self.reindex_course(store)
+        self.assertEqual(indexed_count, 4)
+        batch_sizes = [
+            len(call[0][1]) for call in mock_index.call_args_list if call[0][0].index_name == self.INDEX_NAME
+        ]
+        self.assertEqual(batch_sizes, [3, 1])
+        self.assertEqual(self.search()["total"], 4)
+
     def _test_course_about_property_index(self, store):
         """
         Test that informational properties in the course object end up in the course_info index.
@@ -555,6 +637,14 @@ class TestCoursewareSearchIndexer(MixedWithOptionsTestCase):
     def test_exception(self, store_type):
         self._perform_test_using_store(store_type, self._test_exception)
 
+    def test_incremental_index(self):
+        # only split versions its items
+        self._perform_test_using_store(ModuleStoreEnum.Type.split, self._test_incremental_index)
+
+    @ddt.data(*WORKS_WITH_STORES)
+    def test_indexing_in_batches(self, store_type):
+        self._perform_test_using_store(store_type, self._test_indexing_in_batches)
+
     @ddt.data(*WORKS_WITH_STORES)
     def test_course_about_property_index(self, store_type):
         self._perform_test_using_store(store_type, self._test_course_about_property_index)
@@ -64,6 +64,28 @@ def bypass_olx_failure_enabled():
     return BYPASS_OLX_FAILURE.is_enabled()
 
 
+# .. toggle_name: contentstore.incremental_search_indexing
+# .. toggle_implementation: WaffleFlag
+# .. toggle_default: False
+# .. toggle_description: When enabled, publishing a course only updates the courseware search index of the items
+#   whose version changed since the course was last indexed, along with their ancestors and descendants, and only
+#   removes the items removed since, instead of reindexing the whole course.
+# .. toggle_use_cases: open_edx
+# .. toggle_creation_date: 2026-10-18
+INCREMENTAL_SEARCH_INDEXING = LegacyWaffleFlag(
+    waffle_namespace=LegacyWaffleFlagNamespace(name=WAFFLE_NAMESPACE),
+    flag_name='incremental_search_indexing',
+    module_name=__name__
+)
+
+
+def incremental_search_indexing_enabled():
+    """
+    Check if the courseware search index is updated incrementally on publish.
+    """
+    return INCREMENTAL_SEARCH_INDEXING.is_enabled()
+
+
 # .. toggle_name: FEATURES['ENABLE_EXAM_SETTINGS_HTML_VIEW']
 # .. toggle_use_cases: open_edx
 # .. toggle_implementation: SettingDictToggle
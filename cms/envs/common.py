@@ -746,6 +746,7 @@ MIDDLEWARE = [
     'django.middleware.locale.LocaleMiddleware',
 
     'codejail.django_integration.ConfigureCodeJailMiddleware',
+    'xmodule.util.sandboxing.ConfigureSandboxWorkerPoolMiddleware',
 
     # catches any uncaught RateLimitExceptions and returns a 403 instead of a 500
     'ratelimitbackend.middleware.RateLimitMiddleware',
@@ -888,6 +889,22 @@ MODULESTORE = {
     }
 }
 
+# .. setting_name: COURSE_OVERVIEW_PROCESS_CACHE_MAX_SIZE_IN_BYTES
+# .. setting_default: 10485760
+# .. setting_description: Maximum total size of the pickled CourseOverviews, with their tabs and image sets,
+#   that each process keeps in memory. A cached overview is only used after a single query for the current
+#   versions of the requested overviews' rows shows it is still up to date, so that loading the overviews of
+#   many courses doesn't take separate queries for each of them. Set to 0 to disable this cache.
+COURSE_OVERVIEW_PROCESS_CACHE_MAX_SIZE_IN_BYTES = 10485760
+
+# .. setting_name: COURSE_STRUCTURE_PROCESS_CACHE_MAX_BLOCKS
+# .. setting_default: 20000
+# .. setting_description: Maximum total number of blocks in the course structures that each process keeps
+#   decoded in memory, so that split modulestore doesn't have to load and unpickle them from the
+#   course_structure_cache on every use. Structures are immutable, so they are never invalidated; the
+#   least recently used ones are evicted first. Set to 0 to disable this cache.
+COURSE_STRUCTURE_PROCESS_CACHE_MAX_BLOCKS = 20000
+
 # Modulestore-level field override providers. These field override providers don't
 # require student context.
 MODULESTORE_FIELD_OVERRIDE_PROVIDERS = ()
@@ -968,6 +985,34 @@ CODE_JAIL = {
 
 COURSES_WITH_UNSAFE_CODE = []
 
+# .. setting_name: SAFE_EXEC_RESULT_CACHE
+# .. setting_default: {'LOCAL_PATH': None, 'LOCAL_MAX_SIZE_IN_BYTES': 100 * 1024 * 1024, 'SHARED_CACHE': 'default',
+#     'SHARED_TIMEOUT': None}
+# .. setting_description: Configuration of the cache of the results of sandboxed code (see
+#     xmodule.util.sandboxing.get_safe_exec_result_cache). LOCAL_PATH is the path of an SQLite database used
+#     as a local cache tier, limited to LOCAL_MAX_SIZE_IN_BYTES; the local tier is disabled when it is None.
+#     SHARED_CACHE is the name of the Django cache used as the shared tier, with SHARED_TIMEOUT seconds as
+#     the timeout of its entries (None for the cache's default).
+SAFE_EXEC_RESULT_CACHE = {
+    'LOCAL_PATH': None,
+    'LOCAL_MAX_SIZE_IN_BYTES': 100 * 1024 * 1024,
+    'SHARED_CACHE': 'default',
+    'SHARED_TIMEOUT': None,
+}
+
+# .. setting_name: CODE_JAIL_WORKER_POOL
+# .. setting_default: {'SIZE': 0, 'MAX_JOBS_PER_WORKER': 100, 'MAX_RSS_IN_BYTES': 256 * 1024 * 1024}
+# .. setting_description: Configuration of the pool of warm sandbox workers that run sandboxed code (see
+#     capa.safe_exec.worker_pool). Each process starts SIZE workers, with codejail's python and user, the first
+#     time it runs sandboxed code; a SIZE of 0 disables the pool and runs each execution in a new codejail
+#     process. Workers are replaced after MAX_JOBS_PER_WORKER executions, or once the process that ran an
+#     execution, forked from the worker, used more than MAX_RSS_IN_BYTES of memory (None for no limit).
+CODE_JAIL_WORKER_POOL = {
+    'SIZE': 0,
+    'MAX_JOBS_PER_WORKER': 100,
+    'MAX_RSS_IN_BYTES': 256 * 1024 * 1024,
+}
+
 ############################ DJANGO_BUILTINS ################################
 # Change DEBUG in your environment settings files, not here
 DEBUG = False
@@ -1627,6 +1672,10 @@ EVENT_TRACKING_BACKENDS = {
         'ENGINE': 'eventtracking.backends.routing.RoutingBackend',
         'OPTIONS': {
             'backends': {
+                # Events are written by the thread that emits them. To write them from a background thread
+                # instead, wrap this backend in common.djangoapps.track.backends.asynchronous.AsyncBackend (see
+                # its docstring). That is opt-in: queued events are lost if the process is killed, and with the
+                # block overflow policy, emitting threads can wait for room in the queue.
                 'logger': {
                     'ENGINE': 'eventtracking.backends.logger.LoggerBackend',
                     'OPTIONS': {
@@ -2162,6 +2211,23 @@ ANALYTICS_DASHBOARD_NAME = 'Your Platform Name Here Insights'
 COMMENTS_SERVICE_URL = 'http://localhost:18080'
 COMMENTS_SERVICE_KEY = 'password'
 
+# .. setting_name: COMMENTS_SERVICE_POOL_SIZE
+# .. setting_default: 10
+# .. setting_description: Number of connections to the comments service that each process keeps open, so that
+#   requests to it don't open a new connection each. Set to 0 to open a new connection for every request.
+COMMENTS_SERVICE_POOL_SIZE = 10
+# .. setting_name: COMMENTS_SERVICE_MAX_RETRIES
+# .. setting_default: 2
+# .. setting_description: Number of times a request to the comments service is retried when connecting to it
+#   fails, or when reading the response of a GET, HEAD, PUT, DELETE, OPTIONS or TRACE request fails. Only used
+#   when COMMENTS_SERVICE_POOL_SIZE isn't 0.
+COMMENTS_SERVICE_MAX_RETRIES = 2
+# .. setting_name: COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS
+# .. setting_default: 4
+# .. setting_description: Largest number of requests to the comments service that a discussion view makes at
+#   once, when it needs several independent responses from it.
+COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS = 4
+
 FINANCIAL_REPORTS = {
     'STORAGE_TYPE': 'localfs',
     'BUCKET': None,
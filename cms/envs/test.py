@@ -176,6 +176,10 @@ CACHES = {
     },
 }
 
+# Like the course_structure_cache, don't keep course structures or overviews across tests.
+COURSE_STRUCTURE_PROCESS_CACHE_MAX_BLOCKS = 0
+COURSE_OVERVIEW_PROCESS_CACHE_MAX_SIZE_IN_BYTES = 0
+
 ############################### BLOCKSTORE #####################################
 # Blockstore tests
 RUN_BLOCKSTORE_TESTS = os.environ.get('EDXAPP_RUN_BLOCKSTORE_TESTS', 'no').lower() in ('true', 'yes', '1')
@@ -2,10 +2,12 @@
 
 import logging
 import re
+from functools import lru_cache
 
 from django.conf import settings
 from django.contrib.staticfiles import finders
 from django.contrib.staticfiles.storage import staticfiles_storage
+from edx_django_utils.cache import RequestCache
 from opaque_keys.edx.locator import AssetLocator
 
 from xmodule.contentstore.content import StaticContent
@@ -171,58 +173,132 @@ def replace_static_urls(text, data_directory=None, course_id=None, static_asset_
         Replace a single matched url.
         """
         original_uri = "".join([prefix, rest])
-        # Don't mess with things that end in '?raw'
-        if rest.endswith('?raw'):
+        url = _replace_static_url(prefix, rest, data_directory, course_id, static_asset_path)
+        if url is None:
             static_paths_out.append((original_uri, original_uri))
             return original
 
-        # In debug mode, if we can find the url as is,
-        if settings.DEBUG and finders.find(rest, True):
-            static_paths_out.append((original_uri, original_uri))
-            return original
+        static_paths_out.append((original_uri, url))
+        return "".join([quote, url, quote])
 
-        # if we're running with a MongoBacked store course_namespace is not None, then use studio style urls
-        elif (not static_asset_path) and course_id:
-            # first look in the static file pipeline and see if we are trying to reference
-            # a piece of static content which is in the edx-platform repo (e.g. JS associated with an xmodule)
+    return process_static_urls(text, replace_static_url, data_dir=static_asset_path or data_directory)
 
-            exists_in_staticfiles_storage = False
-            try:
-                exists_in_staticfiles_storage = staticfiles_storage.exists(rest)
-            except Exception as err:  # lint-amnesty, pylint: disable=broad-except
-                log.warning("staticfiles_storage couldn't find path {}: {}".format(
-                    rest, str(err)))
 
-            if exists_in_staticfiles_storage:
+def _replace_static_url(prefix, rest, data_directory, course_id, static_asset_path):
+    """
+    Return the url that the static url `prefix + rest` should be replaced with
+    (see replace_static_urls), or None if it should be left unchanged.
+    """
+    # Don't mess with things that end in '?raw'
+    if rest.endswith('?raw'):
+        return None
+
+    # In debug mode, if we can find the url as is,
+    if settings.DEBUG and finders.find(rest, True):
+        return None
+
+    # if we're running with a MongoBacked store course_namespace is not None, then use studio style urls
+    elif (not static_asset_path) and course_id:
+        # first look in the static file pipeline and see if we are trying to reference
+        # a piece of static content which is in the edx-platform repo (e.g. JS associated with an xmodule)
+
+        exists_in_staticfiles_storage = False
+        try:
+            exists_in_staticfiles_storage = staticfiles_storage.exists(rest)
+        except Exception as err:  # lint-amnesty, pylint: disable=broad-except
+            log.warning("staticfiles_storage couldn't find path {}: {}".format(
+                rest, str(err)))
+
+        if exists_in_staticfiles_storage:
+            url = staticfiles_storage.url(rest)
+        else:
+            # if not, then assume it's courseware specific content and then look in the
+            # Mongo-backed database
+            # Import is placed here to avoid model import at project startup.
+            from common.djangoapps.static_replace.models import AssetBaseUrlConfig, AssetExcludedExtensionsConfig
+            base_url = AssetBaseUrlConfig.get_base_url()
+            excluded_exts = AssetExcludedExtensionsConfig.get_excluded_extensions()
+            url = StaticContent.get_canonicalized_asset_path(course_id, rest, base_url, excluded_exts)
+
+            if AssetLocator.CANONICAL_NAMESPACE in url:
+                url = url.replace('block@', 'block/', 1)
+
+    # Otherwise, look the file up in staticfiles_storage, and append the data directory if needed
+    else:
+        course_path = "/".join((static_asset_path or data_directory, rest))
+
+        try:
+            if staticfiles_storage.exists(rest):
                 url = staticfiles_storage.url(rest)
             else:
-                # if not, then assume it's courseware specific content and then look in the
-                # Mongo-backed database
-                # Import is placed here to avoid model import at project startup.
-                from common.djangoapps.static_replace.models import AssetBaseUrlConfig, AssetExcludedExtensionsConfig
-                base_url = AssetBaseUrlConfig.get_base_url()
-                excluded_exts = AssetExcludedExtensionsConfig.get_excluded_extensions()
-                url = StaticContent.get_canonicalized_asset_path(course_id, rest, base_url, excluded_exts)
-
-                if AssetLocator.CANONICAL_NAMESPACE in url:
-                    url = url.replace('block@', 'block/', 1)
-
-        # Otherwise, look the file up in staticfiles_storage, and append the data directory if needed
-        else:
-            course_path = "/".join((static_asset_path or data_directory, rest))
-
-            try:
-                if staticfiles_storage.exists(rest):
-                    url = staticfiles_storage.url(rest)
-                else:
-                    url = staticfiles_storage.url(course_path)
-            # And if that fails, assume that it's course content, and add manually data directory
-            except Exception as err:  # lint-amnesty, pylint: disable=broad-except
-                log.warning("staticfiles_storage couldn't find path {}: {}".format(
-                    rest, str(err)))
-                url = "".join([prefix, course_path])
+                url = staticfiles_storage.url(course_path)
+        # And if that fails, assume that it's course content, and add manually data directory
+        except Exception as err:  # lint-amnesty, pylint: disable=broad-except
+            log.warning("staticfiles_storage couldn't find path {}: {}".format(
+                rest, str(err)))
+            url = "".join([prefix, course_path])
 
-        static_paths_out.append((original_uri, url))
+    return url
+
+
+@lru_cache(maxsize=64)
+def _courseware_url_regex(static_url, data_dir):
+    """
+    Compile the regex that matches all the urls replace_courseware_urls
+    replaces, with the prefix that matched in the `static`, `course` or
+    `jump_to_id` group.
+    """
+    return re.compile(_url_replace_regex(
+        '(?P<static>(?:{static_url}|/static/)(?!{data_dir}))|(?P<course>/course/)|(?P<jump_to_id>/jump_to_id/)'.format(
+            static_url=static_url,
+            data_dir=data_dir,
+        )
+    ))
+
+
+def replace_courseware_urls(text, course_id, jump_to_id_base_url, data_directory=None, static_asset_path=''):
+    """
+    Replace the static, course and jump_to_id urls in the text in a single
+    pass, the way replace_static_urls, replace_course_urls and
+    replace_jump_to_id_urls do.
+
+    The url that a static url is replaced with is remembered for the rest of
+    the request, since the same assets tend to be referenced by many of the
+    blocks that are rendered together, and looking them up can take a query
+    to the contentstore.
+    """
+    data_dir = static_asset_path or data_directory
+    course_url = '/courses/' + str(course_id) + '/'
+    static_urls = RequestCache('static_replace.static_urls').data
+
+    def replace_url(match):
+        """
+        Replace a single matched url.
+        """
+        original = match.group(0)
+        quote = match.group('quote')
+        rest = match.group('rest')
+
+        if match.group('course'):
+            return "".join([quote, course_url, rest, quote])
+        if match.group('jump_to_id'):
+            return "".join([quote, jump_to_id_base_url + rest, quote])
+
+        # Same as in process_static_urls.
+        prefix = match.group('static')
+        full_url = prefix + rest
+        starts_with_static_url = full_url.startswith(str(settings.STATIC_URL))
+        starts_with_prefix = full_url.startswith(XBLOCK_STATIC_RESOURCE_PREFIX)
+        contains_prefix = XBLOCK_STATIC_RESOURCE_PREFIX in full_url
+        if starts_with_prefix or (starts_with_static_url and contains_prefix):
+            return original
+
+        key = (course_id, data_directory, static_asset_path, prefix, rest)
+        if key not in static_urls:
+            static_urls[key] = _replace_static_url(prefix, rest, data_directory, course_id, static_asset_path)
+        url = static_urls[key]
+        if url is None:
+            return original
         return "".join([quote, url, quote])
 
-    return process_static_urls(text, replace_static_url, data_dir=static_asset_path or data_directory)
+    return _courseware_url_regex(str(settings.STATIC_URL), data_dir).sub(replace_url, text)
@@ -10,6 +10,7 @@ import ddt
 import pytest
 from django.test import override_settings
 from django.utils.http import urlencode, urlquote
+from edx_django_utils.cache import RequestCache
 from opaque_keys.edx.keys import CourseKey
 from PIL import Image
 
@@ -18,6 +19,8 @@ from common.djangoapps.static_replace import (
     make_static_urls_absolute,
     process_static_urls,
     replace_course_urls,
+    replace_courseware_urls,
+    replace_jump_to_id_urls,
     replace_static_urls
 )
 from xmodule.assetstore.assetmgr import AssetManager
@@ -251,6 +254,63 @@ def test_static_url_with_xblock_resource_on_cdn(mock_modulestore, mock_storage):
     assert replace_static_urls(pre_text, DATA_DIRECTORY, COURSE_KEY) == post_text
 
 
+@patch('common.djangoapps.static_replace.staticfiles_storage', autospec=True)
+def test_replace_courseware_urls(mock_storage):
+    """
+    Make sure replace_courseware_urls replaces the same urls as the separate
+    replacement functions.
+    """
+    RequestCache.clear_all_namespaces()
+    mock_storage.exists.return_value = False
+    mock_storage.url.side_effect = lambda path: '/static/' + path
+    jump_to_id_base_url = '/courses/org/course/run/jump_to_id/'
+
+    # xss-lint: disable=python-wrap-html
+    pre_text = (
+        '<img src="/static/file.png"/><a href=\'/course/info\'>info</a><a href="/jump_to_id/block">block</a>'
+        '<img src="/static/file.png?raw"/><img src="/static/xblock/resources/x.png"/><a href="/courses/other">'
+    )
+    expected = replace_jump_to_id_urls(
+        replace_course_urls(
+            replace_static_urls(pre_text, DATA_DIRECTORY, COURSE_KEY, static_asset_path='static_dir'),
+            COURSE_KEY,
+        ),
+        COURSE_KEY,
+        jump_to_id_base_url,
+    )
+    assert '/static/static_dir/file.png' in expected
+    assert '/courses/org/course/run/info' in expected
+    assert '/courses/org/course/run/jump_to_id/block' in expected
+
+    assert replace_courseware_urls(
+        pre_text, COURSE_KEY, jump_to_id_base_url, data_directory=DATA_DIRECTORY, static_asset_path='static_dir',
+    ) == expected
+
+
+@patch('common.djangoapps.static_replace.staticfiles_storage', autospec=True)
+def test_replace_courseware_urls_memoized(mock_storage):
+    """
+    Make sure replace_courseware_urls looks up each static url once per request.
+    """
+    RequestCache.clear_all_namespaces()
+    mock_storage.exists.return_value = True
+    mock_storage.url.return_value = '/static/file.abcdef.png'
+    text = '"/static/file.png" "/static/file.png"'
+
+    for _ in range(2):
+        assert replace_courseware_urls(text, COURSE_KEY, '/jump_to_id/', data_directory=DATA_DIRECTORY) == \
+            '"/static/file.abcdef.png" "/static/file.abcdef.png"'
+    assert mock_storage.exists.call_count == 1
+
+    # Other courses look their static urls up again.
+    replace_courseware_urls(text, CourseKey.from_string('org/other/run'), '/jump_to_id/', data_directory=DATA_DIRECTORY)
+    assert mock_storage.exists.call_count == 2
+
+    RequestCache.clear_all_namespaces()
+    replace_courseware_urls(text, COURSE_KEY, '/jump_to_id/', data_directory=DATA_DIRECTORY)
+    assert mock_storage.exists.call_count == 3
+
+
 @ddt.ddt
 class CanonicalContentTest(SharedModuleStoreTestCase):
     """
@@ -33,7 +33,7 @@ from django.contrib.sites.models import Site
 from django.core.cache import cache
 from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
 from django.core.validators import FileExtensionValidator, RegexValidator
-from django.db import IntegrityError, models
+from django.db import IntegrityError, models, transaction
 from django.db.models import Count, Index, Q
 from django.db.models.signals import post_save, pre_save
 from django.db.utils import ProgrammingError
@@ -1252,8 +1252,12 @@ class CourseEnrollment(models.Model):
 
     objects = CourseEnrollmentManager()
 
-    # cache key format e.g enrollment.<username>.<course_key>.mode = 'honor'
-    COURSE_ENROLLMENT_CACHE_KEY = "enrollment.{}.{}.mode"  # TODO Can this be removed?  It doesn't seem to be used.
+    # cache key format e.g enrollment.<user_id>.<course_key>.state = CourseEnrollmentState('honor', True)
+    COURSE_ENROLLMENT_CACHE_KEY = "enrollment.{}.{}.state"
+
+    # Seconds to keep enrollment states in the shared cache.  They are also
+    # deleted from it whenever the enrollment is saved or deleted.
+    ENROLLMENT_STATE_CACHE_TIMEOUT = 5 * 60
 
     MODE_CACHE_NAMESPACE = 'CourseEnrollment.mode_and_active'
 
@@ -1753,10 +1757,9 @@ class CourseEnrollment(models.Model):
         We try to preload all CourseOverviews, which are usually lazily loaded
         as the .course_overview property. This is to avoid making an extra
         query for every enrollment when displaying something like the student
-        dashboard. If some of the CourseOverviews are not found, we make no
-        attempt to initialize them -- we just fall back to existing lazy-load
-        behavior. The goal is to optimize the most common case as simply as
-        possible, without changing any of the existing contracts.
+        dashboard. CourseOverviews that are not found are loaded together,
+        with their courses fetched from the modulestore in bulk, rather than
+        lazily one enrollment at a time.
 
         The name of this method is long, but was the end result of hashing out a
         number of alternatives, so pylint can stuff it (disable=invalid-name)
@@ -1764,9 +1767,30 @@ class CourseEnrollment(models.Model):
         enrollments = cls.enrollments_for_user(user).select_related('schedule', 'course', 'course__image_set')
 
         if courses_limit:
-            return enrollments.order_by('-created')[:courses_limit]
-        else:
-            return enrollments
+            enrollments = enrollments.order_by('-created')[:courses_limit]
+
+        enrollments = list(enrollments)
+        missing_overview_enrollments = []
+        for enrollment in enrollments:
+            try:
+                enrollment._course_overview = enrollment.course  # pylint: disable=protected-access
+            except CourseOverview.DoesNotExist:
+                missing_overview_enrollments.append(enrollment)
+
+        if missing_overview_enrollments:
+            log.info('Course Overviews: unable to find course overviews for enrollments, loading from modulestore.')
+            try:
+                overviews = CourseOverview.get_from_ids(
+                    [enrollment.course_id for enrollment in missing_overview_enrollments]
+                )
+            except OSError:
+                # Leave it to the enrollments to load their overviews, and
+                # skip the broken ones.
+                overviews = {}
+            for enrollment in missing_overview_enrollments:
+                enrollment._course_overview = overviews.get(enrollment.course_id)  # pylint: disable=protected-access
+
+        return enrollments
 
     @classmethod
     def enrollment_status_hash_cache_key(cls, user):
@@ -2182,14 +2206,82 @@ class CourseEnrollment(models.Model):
             return CourseEnrollmentState(None, None)
         enrollment_state = cls._get_enrollment_in_request_cache(user, course_key)
         if not enrollment_state:
-            try:
-                record = cls.objects.get(user=user, course_id=course_key)
-                enrollment_state = CourseEnrollmentState(record.mode, record.is_active)
-            except cls.DoesNotExist:
-                enrollment_state = CourseEnrollmentState(None, None)
-            cls._update_enrollment_in_request_cache(user, course_key, enrollment_state)
+            enrollment_state = cls.bulk_get_enrollment_states([user], [course_key])[(user.id, course_key)]
         return enrollment_state
 
+    @classmethod
+    def bulk_get_enrollment_states(cls, users, course_keys):
+        """
+        Returns the CourseEnrollmentState of each of the given users in each
+        of the given courses, as a dict keyed by (user id, course key).
+        Anonymous users are left out.
+
+        The states that aren't in the request cache are looked up in the
+        shared cache with a single get_many, and those that aren't there
+        either with a single database query.  All of them are then cached
+        in the request cache, and the ones read from the database in the
+        shared cache.
+        """
+        request_cache = cls._get_mode_active_request_cache()
+        user_ids = {user.id for user in users if not user.is_anonymous}
+        course_keys = set(course_keys)
+
+        enrollment_states = {}
+        missing_keys = []
+        for user_id in user_ids:
+            for course_key in course_keys:
+                enrollment_state = request_cache.get((user_id, course_key))
+                if enrollment_state:
+                    enrollment_states[(user_id, course_key)] = enrollment_state
+                else:
+                    missing_keys.append((user_id, course_key))
+        if not missing_keys:
+            return enrollment_states
+
+        cache_keys = {
+            cls.cache_key_name(user_id, course_key): (user_id, course_key) for user_id, course_key in missing_keys
+        }
+        cached_states = cache.get_many(list(cache_keys))
+        for cache_key, enrollment_state in cached_states.items():
+            enrollment_states[cache_keys[cache_key]] = CourseEnrollmentState(*enrollment_state)
+
+        missing_keys = [key for cache_key, key in cache_keys.items() if cache_key not in cached_states]
+        if missing_keys:
+            records = cls.objects.filter(
+                user_id__in={user_id for user_id, _ in missing_keys},
+                course_id__in={course_key for _, course_key in missing_keys},
+            ).order_by().values_list('user_id', 'course_id', 'mode', 'is_active')
+            # course_keys may be given as strings
+            fetched_states = {
+                (user_id, str(course_id)): CourseEnrollmentState(mode, is_active)
+                for user_id, course_id, mode, is_active in records
+            }
+            new_cached_states = {}
+            for user_id, course_key in missing_keys:
+                enrollment_state = fetched_states.get((user_id, str(course_key)), CourseEnrollmentState(None, None))
+                enrollment_states[(user_id, course_key)] = enrollment_state
+                new_cached_states[cls.cache_key_name(user_id, course_key)] = tuple(enrollment_state)
+            cache.set_many(new_cached_states, cls.ENROLLMENT_STATE_CACHE_TIMEOUT)
+
+        for key, enrollment_state in enrollment_states.items():
+            request_cache[key] = enrollment_state
+        return enrollment_states
+
+    @classmethod
+    def cache_enrollment_states(cls, enrollments):
+        """
+        Caches the states of the given CourseEnrollments in the request cache,
+        for the checks of the rest of the request not to look them up again.
+        """
+        request_cache = cls._get_mode_active_request_cache()
+        for enrollment in enrollments:
+            cls._update_enrollment(
+                request_cache,
+                enrollment.user_id,
+                enrollment.course_id,
+                CourseEnrollmentState(enrollment.mode, enrollment.is_active),
+            )
+
     @classmethod
     def bulk_fetch_enrollment_states(cls, users, course_key):
         """
@@ -2280,6 +2372,9 @@ def invalidate_enrollment_mode_cache(sender, instance, **kwargs):  # pylint: dis
         str(instance.course_id)
     )
     cache.delete(cache_key)
+    # The state may be cached again from another request before the change is
+    # committed, so delete it again once it is.
+    transaction.on_commit(lambda: cache.delete(cache_key))
 
 
 @receiver(models.signals.post_save, sender=CourseEnrollment)
@@ -11,6 +11,7 @@ from django.core.cache import cache
 from django.db.models import signals  # pylint: disable=unused-import
 from django.db.models.functions import Lower
 from django.test import TestCase
+from edx_django_utils.cache import RequestCache
 from edx_toggles.toggles.testutils import override_waffle_flag
 from freezegun import freeze_time
 from opaque_keys.edx.keys import CourseKey
@@ -23,6 +24,7 @@ from common.djangoapps.student.models import (
     AccountRecovery,
     CourseEnrollment,
     CourseEnrollmentAllowed,
+    CourseEnrollmentState,
     ManualEnrollmentAudit,
     PendingEmailChange,
     PendingNameChange,
@@ -116,6 +118,38 @@ class CourseEnrollmentTests(SharedModuleStoreTestCase):  # lint-amnesty, pylint:
         CourseEnrollmentFactory.create(user=self.user)
         assert cache.get(CourseEnrollment.enrollment_status_hash_cache_key(self.user)) is None
 
+    def test_bulk_get_enrollment_states(self):
+        """ Verify the states are read from the database at once, then from the caches. """
+        course_key = self.course.id  # pylint: disable=no-member
+        other_course_key = CourseKey.from_string('course-v1:edX+Other+Run')
+        CourseEnrollmentFactory.create(user=self.user, course_id=course_key, mode='verified')
+        CourseEnrollmentFactory.create(user=self.user_2, course_id=course_key, mode='audit', is_active=False)
+        users = [self.user, self.user_2, AnonymousUser()]
+        course_keys = [course_key, other_course_key]
+        expected = {
+            (self.user.id, course_key): CourseEnrollmentState('verified', True),
+            (self.user.id, other_course_key): CourseEnrollmentState(None, None),
+            (self.user_2.id, course_key): CourseEnrollmentState('audit', False),
+            (self.user_2.id, other_course_key): CourseEnrollmentState(None, None),
+        }
+
+        RequestCache.clear_all_namespaces()
+        with self.assertNumQueries(1):
+            assert CourseEnrollment.bulk_get_enrollment_states(users, course_keys) == expected
+        with self.assertNumQueries(0):
+            assert CourseEnrollment.is_enrolled(self.user, course_key)
+
+        # Without the request cache, the states come from the shared cache.
+        RequestCache.clear_all_namespaces()
+        with self.assertNumQueries(0):
+            assert CourseEnrollment.bulk_get_enrollment_states(users, course_keys) == expected
+
+        # Changing an enrollment deletes its state from the shared cache.
+        CourseEnrollment.unenroll(self.user, course_key)
+        RequestCache.clear_all_namespaces()
+        with self.assertNumQueries(1):
+            assert not CourseEnrollment.is_enrolled(self.user, course_key)
+
     def test_users_enrolled_in_active_only(self):
         """CourseEnrollment.users_enrolled_in should return only Users with active enrollments when
         `include_inactive` has its default value (False)."""
@@ -212,6 +246,21 @@ class CourseEnrollmentTests(SharedModuleStoreTestCase):  # lint-amnesty, pylint:
         assert enrollment.schedule is not None
         assert enrollment.upgrade_deadline is None
 
+    def test_enrollments_with_overviews_preload(self):
+        """ Missing CourseOverviews are loaded together, rather than one enrollment at a time. """
+        course_ids = [CourseFactory().id for _ in range(2)]
+        for course_id in course_ids:
+            CourseEnrollmentFactory(user=self.user, course_id=course_id)
+        CourseOverview.objects.filter(id__in=course_ids).delete()
+
+        with mock.patch.object(CourseOverview, 'get_from_ids', wraps=CourseOverview.get_from_ids) as mock_get_from_ids:
+            enrollments = CourseEnrollment.enrollments_for_user_with_overviews_preload(self.user)
+        assert set(mock_get_from_ids.call_args[0][0]) == set(course_ids)
+
+        with mock.patch.object(CourseOverview, 'get_from_id') as mock_get_from_id:
+            assert {enrollment.course_overview.id for enrollment in enrollments} == set(course_ids)
+        mock_get_from_id.assert_not_called()
+
     @skip_unless_lms
     def test_enrollments_not_deleted(self):
         """ Recreating a CourseOverview with an outdated version should not delete the associated enrollment. """
@@ -521,6 +521,8 @@ def student_dashboard(request):  # lint-amnesty, pylint: disable=too-many-statem
     # Get the org whitelist or the org blacklist for the current site
     site_org_whitelist, site_org_blacklist = get_org_black_and_whitelist_for_site()
     course_enrollments = list(get_course_enrollments(user, site_org_whitelist, site_org_blacklist, course_limit))
+    # The enrollment checks made while rendering the courses don't need to look their states up again.
+    CourseEnrollment.cache_enrollment_states(course_enrollments)
 
     # Get the entitlements for the user and a mapping to all available sessions for that entitlement
     # If an entitlement has no available sessions, pass through a mock course overview object
@@ -25,3 +25,12 @@ class BaseBackend(metaclass=abc.ABCMeta):
     def send(self, event):
         """Send event to tracker."""
         pass  # lint-amnesty, pylint: disable=unnecessary-pass
+
+    def send_many(self, events):
+        """
+        Send a batch of events to tracker.
+
+        Backends that can write several events at once should override this.
+        """
+        for event in events:
+            self.send(event)
@@ -0,0 +1,253 @@
+"""
+Event tracker backend that sends events to another backend asynchronously.
+
+Sending an event to a backend like MongoBackend blocks the request that
+emits it until the event is written.  AsyncBackend instead puts the event on
+a bounded in-memory queue and returns right away.  A background thread takes
+the events off the queue and sends them to the wrapped backend in batches,
+using its `send_many` method, once `batch_size` events are waiting or
+`flush_interval` seconds have passed since the first of them was queued.
+
+When the queue is full, events are dropped (the `drop` overflow policy) or
+the emitting thread waits up to `block_timeout` seconds for room before
+dropping them (the `block` policy).  The number of queued and dropped events
+are reported as custom monitoring attributes of the request that emits them.
+
+Events still queued when the process exits are sent before it does, but
+those of a process that is killed are lost.  So no backend is wrapped by
+default; wrapping one is opt-in, for deployments that prefer request latency
+over losing events on a hard kill.
+
+It can wrap both the backends of `track.tracker` and those of the
+eventtracking library.  The former are configured by TRACKING_BACKENDS, and
+passed to it as a dict with their `ENGINE` and `OPTIONS`.  The latter are
+configured by EVENT_TRACKING_BACKENDS, where eventtracking creates them
+before passing them to it.
+
+Example configurations:
+
+    TRACKING_BACKENDS = {
+        'mongo': {
+            'ENGINE': 'common.djangoapps.track.backends.asynchronous.AsyncBackend',
+            'OPTIONS': {
+                'backend': {
+                    'ENGINE': 'common.djangoapps.track.backends.mongodb.MongoBackend',
+                    'OPTIONS': {'database': 'track'},
+                },
+                'max_queue_size': 10000,
+                'batch_size': 100,
+                'flush_interval': 1,
+                'overflow_policy': 'drop',
+            },
+        },
+    }
+
+    EVENT_TRACKING_BACKENDS['tracking_logs']['OPTIONS']['backends'] = {
+        'logger': {
+            'ENGINE': 'common.djangoapps.track.backends.asynchronous.AsyncBackend',
+            'OPTIONS': {
+                'backend': {
+                    'ENGINE': 'eventtracking.backends.logger.LoggerBackend',
+                    'OPTIONS': {'name': 'tracking'},
+                },
+                'overflow_policy': 'block',
+            },
+        },
+    }
+"""
+
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+
+from django.utils.module_loading import import_string
+from edx_django_utils.monitoring import set_custom_attribute
+
+from common.djangoapps.track.backends import BaseBackend
+
+log = logging.getLogger(__name__)
+
+OVERFLOW_DROP = 'drop'
+OVERFLOW_BLOCK = 'block'
+OVERFLOW_POLICIES = (OVERFLOW_DROP, OVERFLOW_BLOCK)
+
+# Seconds to allow the flusher thread to send the queued events when the
+# process exits.
+CLOSE_TIMEOUT = 5
+
+# Put on the queue to stop the flusher thread.
+_STOP = object()
+
+
+class AsyncBackend(BaseBackend):
+    """
+    Sends events to the wrapped backend from a background thread, in batches.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Set up the queue.  The flusher thread is started by the first event.
+
+        :Parameters:
+
+          - `backend`: the wrapped backend, or a dict with its `ENGINE` and
+            `OPTIONS`
+          - `max_queue_size`: the number of events that can be queued
+          - `batch_size`: the largest number of events to send at once
+          - `flush_interval`: the longest number of seconds to keep an event
+            queued before sending it
+          - `overflow_policy`: `drop` or `block`, what to do with an event
+            when the queue is full
+          - `block_timeout`: the number of seconds to wait for room in the
+            queue with the `block` policy
+
+        """
+        super().__init__(**kwargs)
+
+        backend = kwargs['backend']
+        if isinstance(backend, dict):
+            backend_class = import_string(backend['ENGINE'])
+            backend = backend_class(**backend.get('OPTIONS', {}))
+        self.backend = backend
+
+        self.max_queue_size = kwargs.get('max_queue_size', 10000)
+        self.batch_size = kwargs.get('batch_size', 100)
+        self.flush_interval = kwargs.get('flush_interval', 1)
+        self.overflow_policy = kwargs.get('overflow_policy', OVERFLOW_DROP)
+        self.block_timeout = kwargs.get('block_timeout', 1)
+        if self.overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f'Unknown overflow policy: {self.overflow_policy}')
+
+        self.dropped_events = 0
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+        # Also covers the processes forked from this one, which inherit it.
+        atexit.register(self.close)
+
+    @property
+    def queue_depth(self):
+        """
+        The number of events waiting to be sent.
+        """
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def send(self, event):
+        """
+        Queue the event to be sent to the wrapped backend.
+        """
+        event_queue = self._get_queue()
+        try:
+            if self.overflow_policy == OVERFLOW_BLOCK:
+                event_queue.put(event, timeout=self.block_timeout)
+            else:
+                event_queue.put_nowait(event)
+        except queue.Full:
+            self._drop(event)
+        set_custom_attribute('tracking_async_queue_depth', event_queue.qsize())
+
+    def flush(self):
+        """
+        Wait until all the queued events have been sent.
+        """
+        if self._queue is not None and self._pid == os.getpid():
+            self._queue.join()
+
+    def close(self, timeout=CLOSE_TIMEOUT):
+        """
+        Send the queued events and stop the flusher thread.
+        """
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid():
+                return
+            thread, self._thread = self._thread, None
+        deadline = time.time() + timeout
+        try:
+            # Waits for room if the queue is full, while the thread empties it.
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        thread.join(max(0, deadline - time.time()))
+        if thread.is_alive():
+            log.warning('Timed out sending %d queued tracking events', self._queue.qsize())
+
+    def _get_queue(self):
+        """
+        Return the queue of this process, starting its flusher thread if it
+        isn't running yet.
+
+        Processes forked from each other (e.g. web server workers) don't
+        share the thread, so each process starts its own.
+        """
+        if self._thread is not None and self._pid == os.getpid():
+            return self._queue
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self.max_queue_size)
+                self._pid = os.getpid()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._queue,), name='tracking-async-backend', daemon=True,
+                )
+                self._thread.start()
+            return self._queue
+
+    def _drop(self, event):
+        """
+        Count and log an event that didn't fit in the queue.
+        """
+        self.dropped_events += 1
+        set_custom_attribute('tracking_async_dropped_events', self.dropped_events)
+        # Log the first dropped event, and then one in every max_queue_size,
+        # rather than flooding the log while the queue is full.
+        if self.dropped_events % self.max_queue_size == 1 or self.max_queue_size == 1:
+            log.warning(
+                'Tracking event queue is full, dropped event %s (%d dropped so far)',
+                event.get('event_type') if isinstance(event, dict) else None,
+                self.dropped_events,
+            )
+
+    def _run(self, event_queue):
+        """
+        The flusher thread: send the queued events in batches until stopped.
+        """
+        stopping = False
+        while not stopping:
+            batch = [event_queue.get()]
+            deadline = time.time() + self.flush_interval
+            while len(batch) < self.batch_size and batch[-1] is not _STOP:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(event_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            num_events = len(batch)
+            if batch[-1] is _STOP:
+                stopping = True
+                batch.pop()
+            self._send_batch(batch)
+            for _ in range(num_events):
+                event_queue.task_done()
+
+    def _send_batch(self, batch):
+        """
+        Send the batch to the wrapped backend, which may not support batches.
+        """
+        if not batch:
+            return
+        try:
+            if hasattr(self.backend, 'send_many'):
+                self.backend.send_many(batch)
+            else:
+                for event in batch:
+                    self.backend.send(event)
+        except Exception:  # pylint: disable=broad-except
+            # Keep the thread running, the next batch may well succeed.
+            log.exception('Error sending %d events to tracking backend %s', len(batch), self.backend)
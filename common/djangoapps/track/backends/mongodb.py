@@ -98,3 +98,17 @@ class MongoBackend(BaseBackend):
             # during the next event.
             msg = 'Error inserting to MongoDB event tracker backend'
             log.exception(msg)
+
+    def send_many(self, events):
+        """Insert the events in to the Mongo collection with a single bulk write"""
+        if not events:
+            return
+        try:
+            # insert_many adds an _id to the documents it inserts, so give it
+            # copies, like send does with manipulate=False.  Unordered, so that
+            # an event that can't be inserted doesn't prevent the rest of the
+            # batch from being inserted.
+            self.collection.insert_many([dict(event) for event in events], ordered=False)
+        except (PyMongoError, BSONError):
+            msg = 'Error inserting a batch of %d events to MongoDB event tracker backend'
+            log.exception(msg, len(events))
@@ -0,0 +1,123 @@
+"""Tests for the asynchronous event tracker backend."""
+
+
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+
+from common.djangoapps.track.backends import BaseBackend
+from common.djangoapps.track.backends.asynchronous import AsyncBackend
+
+
+class RecordingBackend(BaseBackend):
+    """
+    Records the batches it is sent, optionally waiting for `release` first.
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+        self.release = threading.Event()
+        if not kwargs.get('wait'):
+            self.release.set()
+
+    def send(self, event):
+        self.send_many([event])
+
+    def send_many(self, events):
+        self.release.wait()
+        self.batches.append(list(events))
+
+
+RECORDING_BACKEND = {'ENGINE': f'{__name__}.RecordingBackend'}
+
+
+@patch('common.djangoapps.track.backends.asynchronous.set_custom_attribute')
+class TestAsyncBackend(TestCase):  # lint-amnesty, pylint: disable=missing-class-docstring
+
+    def make_backend(self, backend=RECORDING_BACKEND, **kwargs):
+        backend = AsyncBackend(backend=backend, **kwargs)
+        self.addCleanup(backend.close)
+        return backend
+
+    def test_send_in_batches(self, _mock_set_custom_attribute):
+        backend = self.make_backend(
+            backend=dict(RECORDING_BACKEND, OPTIONS={'wait': True}), batch_size=3, flush_interval=60,
+        )
+        for i in range(7):
+            backend.send({'event_type': i})
+        assert backend.queue_depth > 0
+        backend.backend.release.set()
+        backend.close()
+
+        batches = backend.backend.batches
+        assert [event['event_type'] for batch in batches for event in batch] == list(range(7))
+        assert all(len(batch) <= 3 for batch in batches)
+        assert backend.queue_depth == 0
+
+    def test_flush_interval(self, _mock_set_custom_attribute):
+        backend = self.make_backend(batch_size=100, flush_interval=0.01)
+        backend.send({'event_type': 'first'})
+        backend.flush()
+        backend.send({'event_type': 'second'})
+        backend.flush()
+        assert backend.backend.batches == [[{'event_type': 'first'}], [{'event_type': 'second'}]]
+
+    def test_drop_on_overflow(self, mock_set_custom_attribute):
+        backend = self.make_backend(
+            backend=dict(RECORDING_BACKEND, OPTIONS={'wait': True}), max_queue_size=2, batch_size=1,
+        )
+        for i in range(10):
+            backend.send({'event_type': i})
+        # One event is held by the flusher thread, two are queued.
+        assert 7 <= backend.dropped_events <= 8
+        mock_set_custom_attribute.assert_any_call('tracking_async_dropped_events', backend.dropped_events)
+        backend.backend.release.set()
+        backend.flush()
+        sent = sum(len(batch) for batch in backend.backend.batches)
+        assert sent + backend.dropped_events == 10
+
+    def test_block_on_overflow(self, _mock_set_custom_attribute):
+        backend = self.make_backend(
+            backend=dict(RECORDING_BACKEND, OPTIONS={'wait': True}), max_queue_size=1, batch_size=1,
+            overflow_policy='block', block_timeout=5,
+        )
+        backend.send({'event_type': 0})
+        backend.send({'event_type': 1})
+        threading.Timer(0.1, backend.backend.release.set).start()
+        for i in range(2, 5):
+            backend.send({'event_type': i})
+        backend.flush()
+        assert backend.dropped_events == 0
+        assert [batch[0]['event_type'] for batch in backend.backend.batches] == list(range(5))
+
+    def test_backend_error(self, _mock_set_custom_attribute):
+        backend = self.make_backend(batch_size=1)
+        with patch.object(backend.backend, 'send_many', side_effect=[Exception('Boom'), None]) as mock_send_many:
+            backend.send({'event_type': 'lost'})
+            backend.send({'event_type': 'sent'})
+            backend.flush()
+        assert mock_send_many.call_count == 2
+
+    def test_created_backend(self, _mock_set_custom_attribute):
+        # eventtracking creates the backends before passing them
+        recording_backend = RecordingBackend()
+        backend = self.make_backend(backend=recording_backend)
+        assert backend.backend is recording_backend
+        backend.send({'event_type': 'sent'})
+        backend.flush()
+        assert recording_backend.batches == [[{'event_type': 'sent'}]]
+
+    def test_close_registered_once(self, _mock_set_custom_attribute):
+        with patch('common.djangoapps.track.backends.asynchronous.atexit.register') as mock_register:
+            backend = self.make_backend()
+            for i in range(3):
+                backend.send({'event_type': i})
+            backend.close()
+            backend.send({'event_type': 'restarted'})
+        mock_register.assert_called_once_with(backend.close)
+
+    def test_unknown_overflow_policy(self, _mock_set_custom_attribute):
+        with pytest.raises(ValueError):
+            AsyncBackend(backend=RECORDING_BACKEND, overflow_policy='retry')
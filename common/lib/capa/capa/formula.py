@@ -0,0 +1,167 @@
+"""
+Sampled evaluation of math expressions for FormulaResponse.
+
+`calc.evaluator` parses its expression on every call, so checking a formula
+against N samples used to parse both the student and the instructor formula
+N times.  A CompiledFormula parses its expression once and evaluates it for
+all samples in a single pass over the parse tree, with each variable bound
+to a numpy array holding its sampled values.
+
+Vectorized evaluation is only an optimization: it raises on anything that
+the scalar evaluation might handle differently (floating point errors,
+functions that don't accept arrays, undefined variables, parse errors), in
+which case callers are expected to fall back to `calc.evaluator` per sample.
+"""
+
+
+from functools import lru_cache
+
+import numpy
+from calc.calc import ParseAugmenter, add_defaults, check_parens, eval_number
+
+# Number of compiled formulas kept by compile_cached.  They are keyed by the
+# expression string, so this mostly holds instructor answers.
+COMPILED_FORMULA_CACHE_SIZE = 1024
+
+
+def _operands(parse_result):
+    """
+    Returns the evaluated operands in parse_result, skipping the operators
+    and parentheses, which are left as strings.
+    """
+    return [token for token in parse_result if not isinstance(token, str)]
+
+
+def _eval_atom(parse_result):
+    """
+    Vectorized counterpart of calc.eval_atom.
+    """
+    return _operands(parse_result)[0]
+
+
+def _eval_power(parse_result):
+    """
+    Vectorized counterpart of calc.eval_power: exponentiate right to left.
+    """
+    operands = _operands(parse_result)
+    power = operands.pop()
+    while operands:
+        power = operands.pop() ** power
+    return power
+
+
+def _eval_parallel(parse_result):
+    """
+    Vectorized counterpart of calc.eval_parallel: NaN wherever one of the
+    inputs is zero.
+    """
+    operands = _operands(parse_result)
+    if len(operands) == 1:
+        return operands[0]
+    has_zero = numpy.logical_or.reduce([operand == 0 for operand in operands])
+    reciprocals = [1. / numpy.where(operand == 0, 1., operand) for operand in operands]
+    return numpy.where(has_zero, numpy.nan, 1. / sum(reciprocals))
+
+
+def _eval_sum(parse_result):
+    """
+    Vectorized counterpart of calc.eval_sum.
+    """
+    total = 0.0
+    negate = False
+    for token in parse_result:
+        if isinstance(token, str):
+            negate = token == '-'
+        else:
+            total = total - token if negate else total + token
+    return total
+
+
+def _eval_product(parse_result):
+    """
+    Vectorized counterpart of calc.eval_product.
+    """
+    product = 1.0
+    divide = False
+    for token in parse_result:
+        if isinstance(token, str):
+            divide = token == '/'
+        else:
+            product = product / token if divide else product * token
+    return product
+
+
+class CompiledFormula:
+    """
+    A math expression parsed once, to be evaluated over arrays of samples.
+    """
+    def __init__(self, math_expr, case_sensitive=False):
+        self.math_expr = math_expr
+        self.case_sensitive = case_sensitive
+        self._parser = None
+        if math_expr.strip():
+            check_parens(math_expr)
+            self._parser = ParseAugmenter(math_expr, case_sensitive)
+            self._parser.parse_algebra()
+
+    def evaluate(self, samples, num_samples):
+        """
+        Evaluates the formula for all samples at once.
+
+        Arguments:
+            samples (dict): maps each variable name to a numpy array of
+                num_samples values.
+            num_samples (int): the number of samples.
+
+        Returns a numpy array with the value of the formula for each sample.
+        Raises if the formula can't be evaluated as arrays; see the module
+        docstring.
+        """
+        if self._parser is None:
+            # Like calc.evaluator, treat an empty expression as NaN.
+            return numpy.full(num_samples, numpy.nan)
+
+        all_variables, all_functions = add_defaults(samples, {}, self.case_sensitive)
+        self._parser.check_variables(all_variables, all_functions)
+
+        casify = (lambda x: x) if self.case_sensitive else (lambda x: x.lower())
+        evaluate_actions = {
+            'number': eval_number,
+            'variable': lambda x: all_variables[casify(x[0])],
+            'function': lambda x: all_functions[casify(x[0])](x[1]),
+            'atom': _eval_atom,
+            'power': _eval_power,
+            'parallel': _eval_parallel,
+            'product': _eval_product,
+            'sum': _eval_sum,
+        }
+        with numpy.errstate(divide='raise', over='raise', invalid='raise'):
+            result = numpy.asarray(self._parser.reduce_tree(evaluate_actions))
+
+        if result.dtype.kind not in 'fc':
+            raise TypeError(f'Unexpected result type {result.dtype} for formula')
+        return numpy.broadcast_to(result, (num_samples,))
+
+
+@lru_cache(maxsize=COMPILED_FORMULA_CACHE_SIZE)
+def compile_cached(math_expr, case_sensitive=False):
+    """
+    Returns the CompiledFormula for the given expression, reusing it across
+    calls in this process.  Use it for expressions that are checked often,
+    such as instructor answers.
+    """
+    return CompiledFormula(math_expr, case_sensitive)
+
+
+def samples_to_arrays(var_dict_list):
+    """
+    Converts a list of dicts mapping variables to sampled values (as made by
+    FormulaResponse.randomize_variables) to a dict mapping each variable to
+    a numpy array of its values.
+    """
+    if not var_dict_list:
+        return {}
+    return {
+        var: numpy.array([var_dict[var] for var_dict in var_dict_list])
+        for var in var_dict_list[0]
+    }
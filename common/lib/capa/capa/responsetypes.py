@@ -50,8 +50,10 @@ from openedx.core.lib import edx_six
 from openedx.core.lib.grade_utils import round_away_from_zero
 
 from . import correctmap
+from .formula import CompiledFormula, compile_cached, samples_to_arrays
 from .registry import TagRegistry
 from .util import (
+    compare_samples_with_tolerance,
     compare_with_tolerance,
     contextualize_text,
     convert_files_to_filenames,
@@ -3175,6 +3177,27 @@ class FormulaResponse(LoncapaResponse):
             out.append(var_dict)
         return out
 
+    def evaluate_samples(self, expected, given, var_dict_list):
+        """
+        Returns the (student, instructor) results of the given and expected
+        formulas for each of the samples in var_dict_list.
+
+        Both formulas are evaluated for all samples at once, parsing each of
+        them only once (the expected formula is cached across submissions).
+        Formulas that can't be evaluated that way, including invalid ones,
+        are evaluated sample by sample by tupleize_answers instead, which
+        also raises the appropriate StudentInputError.
+        """
+        samples = samples_to_arrays(var_dict_list)
+        try:
+            student_result = CompiledFormula(given, self.case_sensitive).evaluate(samples, len(var_dict_list))
+            instructor_result = compile_cached(expected, self.case_sensitive).evaluate(samples, len(var_dict_list))
+        except Exception as err:  # pylint: disable=broad-except
+            log.debug('formularesponse: evaluating samples one at a time after error %r', err)
+            student_result = self.tupleize_answers(given, var_dict_list)
+            instructor_result = self.tupleize_answers(expected, var_dict_list)
+        return student_result, instructor_result
+
     def check_formula(self, expected, given, samples):
         """
         Given an expected answer string, a given (student-produced) answer
@@ -3182,11 +3205,9 @@ class FormulaResponse(LoncapaResponse):
         "correct" or "incorrect".
         """
         var_dict_list = self.randomize_variables(samples)
-        student_result = self.tupleize_answers(given, var_dict_list)
-        instructor_result = self.tupleize_answers(expected, var_dict_list)
+        student_result, instructor_result = self.evaluate_samples(expected, given, var_dict_list)
 
-        correct = all(compare_with_tolerance(student, instructor, self.tolerance)
-                      for student, instructor in zip(student_result, instructor_result))
+        correct = compare_samples_with_tolerance(student_result, instructor_result, self.tolerance).all()
         if correct:
             return "correct"
         else:
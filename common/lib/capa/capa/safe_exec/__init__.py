@@ -1,3 +1,5 @@
 """Capa's specialized use of codejail.safe_exec."""
 
-from .safe_exec import safe_exec, update_hash
+from .result_cache import SafeExecResultCache, SqliteResultStore
+from .safe_exec import safe_exec, safe_exec_cache_key, update_hash
+from . import worker_pool
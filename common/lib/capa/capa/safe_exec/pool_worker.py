@@ -0,0 +1,221 @@
+"""
+The main loop of a sandbox worker process (see worker_pool.py).
+
+This file is never imported: its source is run by the sandboxed Python, as
+codejail does with the code it jails, so it must only use the standard
+library.
+
+The worker imports the modules sandboxed code commonly uses once, then reads
+jobs from stdin.  Each job is run in a child forked from the worker, so jobs
+start warm but can't affect each other or the worker:  the child applies the
+job's resource limits, runs the code in a fresh temporary directory, and
+sends its resulting globals back through a pipe.  The worker kills the
+child's process group once the job is done or its REALTIME limit is reached,
+and writes the result to stdout.
+
+Messages in both directions are json, prefixed with their length.
+"""
+
+import base64
+import gc
+import json
+import os
+import resource
+import select
+import shutil
+import signal
+import struct
+import sys
+import tempfile
+import time
+import traceback
+
+FRAME_HEADER = struct.Struct('!I')
+
+OK_TYPES = (type(None), int, float, bytes, str, list, tuple, dict)
+BAD_KEYS = ('__builtins__',)
+
+
+def read_frame(stream):
+    """
+    Read a message from the stream, or return None at the end of the stream.
+    """
+    header = stream.read(FRAME_HEADER.size)
+    if len(header) < FRAME_HEADER.size:
+        return None
+    (length,) = FRAME_HEADER.unpack(header)
+    return json.loads(stream.read(length).decode('utf-8'))
+
+
+def write_frame(stream, message):
+    data = json.dumps(message).encode('utf-8')
+    stream.write(FRAME_HEADER.pack(len(data)) + data)
+    stream.flush()
+
+
+class DevNull:
+    """
+    Swallows whatever the sandboxed code prints.
+    """
+    def write(self, *args, **kwargs):
+        pass
+
+    def flush(self, *args, **kwargs):
+        pass
+
+
+def jsonable(value):
+    if not isinstance(value, OK_TYPES):
+        return False
+    try:
+        json.dumps(value)
+    except Exception:  # pylint: disable=broad-except
+        return False
+    return True
+
+
+def set_limits(limits):
+    """
+    Apply the job's resource limits to this process, like codejail does.
+    """
+    rlimits = [
+        (resource.RLIMIT_NPROC, limits['NPROC']),
+        (resource.RLIMIT_FSIZE, limits['FSIZE']),
+    ]
+    if limits['CPU']:
+        rlimits.append((resource.RLIMIT_CPU, limits['CPU']))
+    if limits['VMEM']:
+        rlimits.append((resource.RLIMIT_AS, limits['VMEM']))
+    for rlimit, value in rlimits:
+        resource.setrlimit(rlimit, (value, value))
+
+
+def run_job(job, job_dir, result_fd, base_path):
+    """
+    Run the job in this (forked) process, write its result to result_fd and
+    exit.
+    """
+    status = 0
+    try:
+        os.setsid()
+        devnull = os.open(os.devnull, os.O_RDWR)
+        os.dup2(devnull, 0)
+        os.dup2(devnull, 1)
+        sys.stdout = DevNull()
+        os.chdir(job_dir)
+        sys.path = base_path + job['python_path']
+        set_limits(job['limits'])
+
+        g_dict = job['globals']
+        exec(job['code'], g_dict)  # pylint: disable=exec-used
+        result = {'globals': {k: v for k, v in g_dict.items() if jsonable(v) and k not in BAD_KEYS}}
+    except BaseException:  # pylint: disable=broad-except
+        status = 1
+        result = {'error': traceback.format_exc()}
+
+    try:
+        data = json.dumps(result).encode('utf-8')
+        while data:
+            data = data[os.write(result_fd, data):]
+    finally:
+        os._exit(status)  # pylint: disable=protected-access
+
+
+def read_result(read_fd, deadline):
+    """
+    Read the child's result until it closes the pipe or the deadline passes.
+    Returns the data read and whether the deadline passed.
+    """
+    chunks = []
+    while True:
+        remaining = deadline - time.time() if deadline else None
+        if remaining is not None and remaining <= 0:
+            return b''.join(chunks), True
+        readable, _, _ = select.select([read_fd], [], [], remaining)
+        if not readable:
+            continue
+        chunk = os.read(read_fd, 65536)
+        if not chunk:
+            return b''.join(chunks), False
+        chunks.append(chunk)
+
+
+def handle_job(job, base_path, protocol_fds):
+    """
+    Run the job in a child process and return the response for the pool.
+    """
+    job_dir = tempfile.mkdtemp(prefix='codejail-')
+    try:
+        for name, contents in job['files']:
+            with open(os.path.join(job_dir, name), 'wb') as extra_file:
+                extra_file.write(base64.b64decode(contents))
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            for fd in protocol_fds:
+                os.close(fd)
+            run_job(job, job_dir, write_fd, base_path)
+        os.close(write_fd)
+
+        realtime = job['limits']['REALTIME']
+        output, timed_out = read_result(read_fd, time.time() + realtime if realtime else None)
+        os.close(read_fd)
+        # Kill the child if it is still running, and whatever it left running.
+        for kill in (os.kill, os.killpg):
+            try:
+                kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
+        _, status, rusage = os.wait4(pid, 0)
+    finally:
+        shutil.rmtree(job_dir, ignore_errors=True)
+
+    if os.WIFSIGNALED(status):
+        status = -os.WTERMSIG(status)
+    else:
+        status = os.WEXITSTATUS(status)
+    # The peak memory use of the job's process, which includes the pages it
+    # shares with the worker.  ru_maxrss is in kilobytes on Linux.
+    response = {'status': status, 'timed_out': timed_out, 'maxrss': rusage.ru_maxrss * 1024}
+    if output and not timed_out:
+        response.update(json.loads(output.decode('utf-8')))
+    return response
+
+
+def main():
+    os.environ['OPENBLAS_NUM_THREADS'] = '1'
+
+    # Keep stdin and stdout for the protocol, and point the standard file
+    # descriptors elsewhere so that nothing else writes to the pool.
+    protocol_in = os.fdopen(os.dup(0), 'rb')
+    protocol_out = os.fdopen(os.dup(1), 'wb')
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    sys.stdout = DevNull()
+
+    hello = read_frame(protocol_in)
+    for module_name in hello['preload']:
+        try:
+            __import__(module_name)
+        except Exception:  # pylint: disable=broad-except
+            pass
+    base_path = list(sys.path)
+    # Keep the preloaded objects out of the way of the garbage collector,
+    # so that the children don't copy the pages they are on.
+    if hasattr(gc, 'freeze'):
+        gc.freeze()
+
+    protocol_fds = (protocol_in.fileno(), protocol_out.fileno())
+    while True:
+        job = read_frame(protocol_in)
+        if job is None:
+            break
+        response = handle_job(job, base_path, protocol_fds)
+        write_frame(protocol_out, response)
+
+
+if __name__ == '__main__':
+    main()
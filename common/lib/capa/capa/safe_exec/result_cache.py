@@ -0,0 +1,260 @@
+"""
+A dedicated, tiered cache for the results of safe_exec.
+
+Results of sandboxed code are small, json-safe and only depend on the cache
+key, so they can be kept for a long time.  SafeExecResultCache looks them up
+in a local on-disk tier first, then in a shared tier (usually the Django
+cache shared by all app servers), and fills in the local tier from the
+shared one.  Misses are what send code to a codejail subprocess, so both
+tiers keep counters to compute their hit rates.
+
+The local tier is an SQLite database, so that it survives restarts and is
+shared by all the processes of a server.  It is limited in size; the least
+recently used results are evicted first.
+"""
+
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+log = logging.getLogger(__name__)
+
+
+class SqliteResultStore:
+    """
+    A local, size limited store of safe_exec results in an SQLite database.
+
+    Results are stored as compressed json, along with their size and the time
+    they were last used.  Triggers keep a running total of the sizes, so that
+    it doesn't have to be summed up on every write.  Once the total size
+    exceeds `max_size_in_bytes`, the least recently used results are removed
+    until the total size is back under EVICT_TO_RATIO of it.
+    """
+    EVICT_TO_RATIO = 0.9
+
+    # Don't update the last used time of a result more often than this, in
+    # seconds, so that hits don't always require a write.
+    TOUCH_INTERVAL = 60
+
+    def __init__(self, path, max_size_in_bytes):
+        self.path = path
+        self.max_size_in_bytes = max_size_in_bytes
+        self._local = threading.local()
+
+    def get(self, key):
+        """
+        Returns the result stored for the given key, or None.
+        """
+        row = self._execute('SELECT value, accessed FROM results WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        value, accessed = row
+        now = time.time()
+        if now - accessed > self.TOUCH_INTERVAL:
+            self._execute('UPDATE results SET accessed = ? WHERE key = ?', (now, key))
+        return _decode(value)
+
+    def set(self, key, value):
+        """
+        Stores the given result for the given key, evicting the least recently
+        used results if the store grows too large.
+        """
+        encoded = _encode(value)
+        if len(encoded) > self.max_size_in_bytes:
+            return
+        self._execute(
+            'INSERT OR REPLACE INTO results (key, value, size, accessed) VALUES (?, ?, ?, ?)',
+            (key, encoded, len(encoded), time.time()),
+        )
+        self._evict()
+
+    def size_in_bytes(self):
+        """
+        Returns the total size of the stored results.
+        """
+        return self._execute('SELECT size FROM results_size WHERE id = 0').fetchone()[0]
+
+    def clear(self):
+        self._execute('DELETE FROM results')
+
+    def _evict(self):
+        """
+        Removes the least recently used results if the store is too large.
+        """
+        excess = self.size_in_bytes() - self.max_size_in_bytes
+        if excess <= 0:
+            return
+        excess += self.max_size_in_bytes * (1 - self.EVICT_TO_RATIO)
+        freed = 0
+        evicted = []
+        for key, size in self._execute('SELECT key, size FROM results ORDER BY accessed'):
+            evicted.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._connection().executemany('DELETE FROM results WHERE key = ?', evicted)
+        log.info('Evicted %d results from the safe_exec result cache at %s', len(evicted), self.path)
+
+    def _execute(self, sql, params=()):
+        return self._connection().execute(sql, params)
+
+    def _connection(self):
+        """
+        Returns this thread's connection to the database, creating it (and
+        the database) if needed.  Connections aren't shared across processes.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            # INSERT OR REPLACE only fires the delete trigger for the replaced
+            # row if recursive triggers are on.
+            connection.execute('PRAGMA recursive_triggers = ON')
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                _create_schema(connection)
+            except sqlite3.Error:
+                connection.execute('ROLLBACK')
+                raise
+            connection.execute('COMMIT')
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+
+def _create_schema(connection):
+    """
+    Creates the tables of a result store, and the triggers that keep the
+    total size of its results up to date, if they don't exist yet.
+    """
+    connection.execute(
+        'CREATE TABLE IF NOT EXISTS results '
+        '(key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)'
+    )
+    connection.execute('CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)')
+    connection.execute('CREATE TABLE IF NOT EXISTS results_size (id INTEGER PRIMARY KEY, size INTEGER NOT NULL)')
+    connection.execute(
+        'CREATE TRIGGER IF NOT EXISTS results_size_insert AFTER INSERT ON results BEGIN '
+        'UPDATE results_size SET size = size + NEW.size WHERE id = 0; END'
+    )
+    connection.execute(
+        'CREATE TRIGGER IF NOT EXISTS results_size_delete AFTER DELETE ON results BEGIN '
+        'UPDATE results_size SET size = size - OLD.size WHERE id = 0; END'
+    )
+    connection.execute(
+        'INSERT OR IGNORE INTO results_size (id, size) SELECT 0, COALESCE(SUM(size), 0) FROM results'
+    )
+
+
+def _encode(value):
+    return zlib.compress(json.dumps(value).encode('utf-8'))
+
+
+def _decode(encoded):
+    # safe_exec results are (exception message, globals) pairs, which
+    # json turns into lists.
+    return tuple(json.loads(zlib.decompress(encoded).decode('utf-8')))
+
+
+class SafeExecResultCache:
+    """
+    Caches safe_exec results in a local tier and a shared tier.
+
+    Either tier may be None.  `shared_cache` is any object with Django
+    cache-like get(key) and set(key, value, timeout) methods.  Instances can
+    be passed to safe_exec as its `cache`.
+    """
+    LOCAL = 'local'
+    SHARED = 'shared'
+    MISS = 'miss'
+
+    def __init__(self, local_store=None, shared_cache=None, shared_timeout=None, on_lookup=None):
+        """
+        Arguments:
+            local_store (SqliteResultStore): the local tier.
+            shared_cache: the shared tier.
+            shared_timeout (int): timeout of results in the shared tier, in
+                seconds.  None means the shared cache's default timeout.
+            on_lookup (callable): called with the tier that answered
+                each lookup (LOCAL, SHARED or MISS), to report metrics.
+        """
+        self.local_store = local_store
+        self.shared_cache = shared_cache
+        self.shared_timeout = shared_timeout
+        self.on_lookup = on_lookup
+        self._counts = {self.LOCAL: 0, self.SHARED: 0, self.MISS: 0}
+
+    def __bool__(self):
+        # safe_exec only uses caches that are truthy.
+        return True
+
+    def get(self, key):
+        """
+        Returns the result cached for the given key, or None.
+        """
+        value = self._get_local(key)
+        if value is not None:
+            return self._found(self.LOCAL, value)
+
+        if self.shared_cache is not None:
+            value = self.shared_cache.get(key)
+            if value is not None:
+                self._set_local(key, value)
+                return self._found(self.SHARED, value)
+
+        return self._found(self.MISS, None)
+
+    def set(self, key, value):
+        """
+        Caches the given result in both tiers.
+        """
+        self._set_local(key, value)
+        if self.shared_cache is None:
+            return
+        if self.shared_timeout is None:
+            self.shared_cache.set(key, value)
+        else:
+            self.shared_cache.set(key, value, self.shared_timeout)
+
+    def stats(self):
+        """
+        Returns the number of lookups answered by each tier and the overall
+        hit rate, as a dict.
+        """
+        stats = dict(self._counts)
+        lookups = sum(self._counts.values())
+        stats['hit_rate'] = (lookups - self._counts[self.MISS]) / lookups if lookups else 0.0
+        return stats
+
+    def _found(self, tier, value):
+        self._counts[tier] += 1
+        if self.on_lookup:
+            self.on_lookup(tier)
+        return value
+
+    def _get_local(self, key):
+        """
+        Returns the result for the given key from the local tier, if any.
+        Errors from the local tier are logged and treated as misses, since
+        the shared tier can still answer.
+        """
+        if self.local_store is None:
+            return None
+        try:
+            return self.local_store.get(key)
+        except sqlite3.Error:
+            log.exception('Could not read from the safe_exec result cache at %s', self.local_store.path)
+            return None
+
+    def _set_local(self, key, value):
+        if self.local_store is None:
+            return
+        try:
+            self.local_store.set(key, value)
+        except sqlite3.Error:
+            log.exception('Could not write to the safe_exec result cache at %s', self.local_store.path)
@@ -2,6 +2,7 @@
 
 
 import hashlib
+from functools import lru_cache
 
 from codejail.safe_exec import SafeExecException, json_safe
 from codejail.safe_exec import not_safe_exec as codejail_not_safe_exec
@@ -79,6 +80,88 @@ def update_hash(hasher, obj):
         hasher.update(six.b(repr(obj)))
 
 
+@lru_cache(maxsize=1024)
+def _code_digest(code):
+    """
+    Returns the md5 digest of `code`.  The same code is run over and over
+    with different globals and seeds, so the digests are memoized.
+    """
+    return hashlib.md5(repr(code).encode('utf-8')).digest()
+
+
+def _freeze(obj):
+    """
+    Returns a hashable copy of the global value `obj`, tagged with types so
+    that equal values of different types (like 1 and True) stay distinct.
+    Raises TypeError for values that can't be made hashable.
+
+    Strings and bytes are kept as they are, and they cache their own hash,
+    so freezing even a large global is cheap compared to digesting it.
+    """
+    if isinstance(obj, (list, tuple)):
+        return (list, tuple(_freeze(item) for item in obj))
+    if isinstance(obj, dict):
+        return (dict, tuple((_freeze(key), _freeze(value)) for key, value in obj.items()))
+    hash(obj)
+    return (type(obj), obj)
+
+
+def _thaw(frozen):
+    """
+    Returns a value equivalent to the one `frozen` was made from by _freeze.
+    """
+    obj_type, obj = frozen
+    if obj_type is list:
+        return [_thaw(item) for item in obj]
+    if obj_type is dict:
+        return {_thaw(key): _thaw(value) for key, value in obj}
+    return obj
+
+
+def _global_digest(name, value):
+    """
+    Returns the md5 digest of the global `name` with its json-safe `value`,
+    or None if json_safe drops it.
+    """
+    safe_global = json_safe({name: value})
+    if name not in safe_global:
+        return None
+    md5er = hashlib.md5()
+    update_hash(md5er, name)
+    update_hash(md5er, safe_global[name])
+    return md5er.digest()
+
+
+@lru_cache(maxsize=256)
+def _frozen_global_digest(name, frozen_value):
+    """
+    Returns the _global_digest of a frozen value.  Most globals, like the
+    problem's script code and files, are the same on every call for a
+    problem, so their digests are memoized.  The memoized values are kept
+    alive, so fewer of them are kept than of code digests.
+    """
+    return _global_digest(name, _thaw(frozen_value))
+
+
+def safe_exec_cache_key(code, globals_dict, random_seed=None):
+    """
+    Returns the key of the cached result of running `code` with the given
+    globals and random seed.
+
+    The key combines the digest of the code, the random seed and a canonical
+    digest of each of the json-safe globals (see update_hash).
+    """
+    md5er = hashlib.md5(_code_digest(code))
+    for name in sorted(globals_dict):
+        try:
+            digest = _frozen_global_digest(name, _freeze(globals_dict[name]))
+        except TypeError:
+            digest = _global_digest(name, globals_dict[name])
+        if digest is not None:
+            md5er.update(digest)
+    return "safe_exec.%r.%s" % (random_seed, md5er.hexdigest())
+
+
 def safe_exec(
     code,
     globals_dict,
@@ -106,9 +189,9 @@ def safe_exec(
     `extra_files` is a list of (filename, contents) pairs.  These files are
     created in the sandbox.
 
-    `cache` is an object with .get(key) and .set(key, value) methods.  It will be used
-    to cache the execution, taking into account the code, the values of the globals,
-    and the random seed.
+    `cache` is an object with .get(key) and .set(key, value) methods, such as a
+    `SafeExecResultCache`.  It will be used to cache the execution, taking into account
+    the code, the values of the globals, and the random seed (see safe_exec_cache_key).
 
     `limit_overrides_context` is an optional string to be used as a key on
     the `settings.CODE_JAIL['limit_overrides']` dictionary in order to apply
@@ -123,11 +206,7 @@ def safe_exec(
     """
     # Check the cache for a previous result.
     if cache:
-        safe_globals = json_safe(globals_dict)
-        md5er = hashlib.md5()
-        md5er.update(repr(code).encode('utf-8'))
-        update_hash(md5er, safe_globals)
-        key = "safe_exec.%r.%s" % (random_seed, md5er.hexdigest())
+        key = safe_exec_cache_key(code, globals_dict, random_seed)
         cached = cache.get(key)
         if cached is not None:
             # We have a cached result.  The result is a pair: the exception
@@ -145,7 +224,10 @@ def safe_exec(
     if unsafely:
         exec_fn = codejail_not_safe_exec
     else:
-        exec_fn = codejail_safe_exec
+        # worker_pool imports this module, so import it here.
+        from .worker_pool import get_pool  # pylint: disable=import-outside-toplevel
+        pool = get_pool()
+        exec_fn = pool.safe_exec if pool else codejail_safe_exec
 
     # Run the code!  Results are side effects in globals_dict.
     try:
@@ -0,0 +1,99 @@
+"""Test result_cache.py"""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from capa.safe_exec.result_cache import SafeExecResultCache, SqliteResultStore
+
+from .test_safe_exec import DictCache
+
+
+class TestSqliteResultStore(unittest.TestCase):
+    """Test the local, on-disk tier of the safe_exec result cache."""
+
+    def setUp(self):
+        super().setUp()
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        self.path = os.path.join(tmp_dir, 'safe_exec.sqlite')
+
+    def test_get_and_set(self):
+        store = SqliteResultStore(self.path, 10000)
+        assert store.get('key') is None
+        store.set('key', (None, {'a': 17, 'b': [1, 2]}))
+        assert store.get('key') == (None, {'a': 17, 'b': [1, 2]})
+
+        # The results are persisted, and shared with other instances.
+        assert SqliteResultStore(self.path, 10000).get('key') == (None, {'a': 17, 'b': [1, 2]})
+
+    def test_eviction(self):
+        store = SqliteResultStore(self.path, 500)
+        store.TOUCH_INTERVAL = -1
+        for index in range(20):
+            store.set(f'key{index}', (None, {'a': os.urandom(30).hex()}))
+            # Use the first result, so that it is the most recently used one.
+            assert store.get('key0') is not None
+
+        assert store.size_in_bytes() <= 500
+        assert store.get('key0') is not None
+        assert store.get('key1') is None
+
+    def test_size_in_bytes(self):
+        store = SqliteResultStore(self.path, 500)
+        store.TOUCH_INTERVAL = -1
+        for index in range(20):
+            store.set(f'key{index % 7}', (None, {'a': os.urandom(index).hex()}))
+            total = store._execute('SELECT SUM(size) FROM results').fetchone()[0]  # pylint: disable=protected-access
+            assert store.size_in_bytes() == total
+
+        # The total is kept when the database is opened again.
+        assert SqliteResultStore(self.path, 500).size_in_bytes() == total
+
+    def test_too_large(self):
+        store = SqliteResultStore(self.path, 10)
+        store.set('key', (None, {'a': 'x' * 100}))
+        assert store.get('key') is None
+
+
+class TestSafeExecResultCache(unittest.TestCase):
+    """Test looking up safe_exec results in the two tiers."""
+
+    def setUp(self):
+        super().setUp()
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        self.local_store = SqliteResultStore(os.path.join(tmp_dir, 'safe_exec.sqlite'), 10000)
+        self.shared = {}
+        self.lookups = []
+        self.cache = SafeExecResultCache(
+            local_store=self.local_store,
+            shared_cache=DictCache(self.shared),
+            on_lookup=self.lookups.append,
+        )
+
+    def test_tiers(self):
+        assert self.cache.get('key') is None
+        self.cache.set('key', (None, {'a': 17}))
+        assert self.shared['key'] == (None, {'a': 17})
+        assert self.cache.get('key') == (None, {'a': 17})
+
+        # Results found in the shared tier are copied to the local tier.
+        self.local_store.clear()
+        self.cache.set('other', ('error', {}))
+        self.local_store.clear()
+        assert self.cache.get('key') == (None, {'a': 17})
+        assert self.local_store.get('key') == (None, {'a': 17})
+        assert self.local_store.get('other') is None
+
+        assert self.lookups == [self.cache.MISS, self.cache.LOCAL, self.cache.SHARED]
+        assert self.cache.stats() == {'local': 1, 'shared': 1, 'miss': 1, 'hit_rate': 2 / 3}
+
+    def test_without_tiers(self):
+        cache = SafeExecResultCache()
+        assert cache
+        cache.set('key', (None, {}))
+        assert cache.get('key') is None
+        assert cache.stats()['hit_rate'] == 0.0
@@ -19,7 +19,7 @@ from django.test import override_settings
 from six import text_type, unichr
 from six.moves import range
 
-from capa.safe_exec import safe_exec, update_hash
+from capa.safe_exec import safe_exec, safe_exec_cache_key, update_hash
 
 
 class TestSafeExec(unittest.TestCase):  # lint-amnesty, pylint: disable=missing-class-docstring
@@ -249,6 +249,34 @@ class TestSafeExecCaching(unittest.TestCase):
         safe_exec(code, g, cache=DictCache(cache))
         assert g['a'] == 17
 
+    def test_cache_per_student(self):
+        # The anonymous student id is part of the key, even if the code
+        # doesn't refer to it by name.
+        cache = {}
+        g = {'anonymous_student_id': 'student1', 'seed': 1}
+        safe_exec("a = seed + 1", g, random_seed=1, cache=DictCache(cache))
+        assert list(cache.values()) == [(None, {'a': 2, 'anonymous_student_id': 'student1', 'seed': 1})]
+
+        g = {'anonymous_student_id': 'student2', 'seed': 1}
+        safe_exec("a = globals()['anonymous_' + 'student_id']", g, random_seed=1, cache=DictCache(cache))
+        assert len(cache) == 2
+        assert g['a'] == 'student2'
+
+        g = {'anonymous_student_id': 'student3', 'seed': 1}
+        safe_exec("a = globals()['anonymous_' + 'student_id']", g, random_seed=1, cache=DictCache(cache))
+        assert len(cache) == 3
+        assert g['a'] == 'student3'
+
+    def test_cache_key_globals(self):
+        key = safe_exec_cache_key("a = 1", {'b': [1, (2, 'x')], 'c': {'d': b'e'}, 'f': object()})
+        # The memoized digests give the same key for equal globals.
+        assert safe_exec_cache_key("a = 1", {'b': [1, (2, 'x')], 'c': {'d': b'e'}}) == key
+        # Values of different types are told apart.
+        assert safe_exec_cache_key("a = 1", {'b': [True, (2, 'x')], 'c': {'d': b'e'}}) != key
+        assert safe_exec_cache_key("a = 1", {'b': [1.5, (2, 'x')], 'c': {'d': b'e'}}) != key
+        # Unhashable values are digested too.
+        assert safe_exec_cache_key("a = 1", {'b': [1, (2, 'x')], 'c': {'d': b'e'}, 'g': [{'h': []}]}) != key
+
     def test_unicode_submission(self):
         # Check that using non-ASCII unicode does not raise an encoding error.
         # Try several non-ASCII unicode characters.
@@ -0,0 +1,157 @@
+"""Test worker_pool.py"""
+
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import pytest
+from codejail.safe_exec import SafeExecException
+
+from capa.safe_exec import worker_pool
+from capa.safe_exec.worker_pool import SandboxWorker, SandboxWorkerPool
+
+LIMITS = {'CPU': 1, 'VMEM': 0, 'REALTIME': 3, 'FSIZE': 0, 'NPROC': 15, 'PROXY': 0}
+
+
+def _is_running(pid, timeout=5):
+    """
+    Return whether the process is still running (and not a zombie) after
+    waiting up to `timeout` seconds for it to die.
+    """
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with open(f'/proc/{pid}/stat') as stat_file:
+                if stat_file.read().rsplit(')', 1)[1].split()[0] == 'Z':
+                    return False
+        except FileNotFoundError:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+class TestSandboxWorkerPool(unittest.TestCase):
+    """
+    Test the pool with workers running this python, without a sandbox user.
+    """
+
+    def setUp(self):
+        super().setUp()
+        for patcher in (
+            patch.object(SandboxWorkerPool, '_cmdline', return_value=[sys.executable]),
+            patch('capa.safe_exec.worker_pool.jail_code.get_effective_limits', return_value=LIMITS),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def make_pool(self, **kwargs):
+        pool = SandboxWorkerPool(**kwargs)
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_globals(self):
+        pool = self.make_pool(size=1)
+        g = {'a': 17, 'b': [1, 2]}
+        pool.safe_exec('import math\nc = a + sum(b) + int(math.pi)\nf = open', g)
+        assert g['c'] == 23
+        # Values that can't be serialized are dropped.
+        assert 'f' not in g
+
+    def test_extra_files(self):
+        pool = self.make_pool(size=1)
+        g = {}
+        pool.safe_exec('c = open("data.txt").read()', g, extra_files=[('data.txt', b'hello')])
+        assert g['c'] == 'hello'
+
+    def test_exception(self):
+        pool = self.make_pool(size=1)
+        with pytest.raises(SafeExecException) as err:
+            pool.safe_exec('a = 1 / 0', {})
+        assert 'ZeroDivisionError' in str(err.value)
+
+        # The worker is still usable.
+        g = {}
+        pool.safe_exec('a = 1', g)
+        assert g['a'] == 1
+
+    def test_jobs_are_isolated(self):
+        pool = self.make_pool(size=1)
+        pool.safe_exec('import sys\nsys.leaked = 1', {})
+        g = {}
+        pool.safe_exec('import sys\nleaked = hasattr(sys, "leaked")', g)
+        assert g['leaked'] is False
+
+    def test_recycle_after_max_jobs(self):
+        pool = self.make_pool(size=1, max_jobs_per_worker=2)
+        pids = []
+        for _ in range(4):
+            g = {}
+            pool.safe_exec('import os\nppid = os.getppid()', g)
+            pids.append(g['ppid'])
+        assert pids[0] == pids[1]
+        assert pids[1] != pids[2]
+        assert pids[2] == pids[3]
+
+    def test_recycle_over_max_rss(self):
+        pool = self.make_pool(size=1, max_rss_in_bytes=1)
+        pids = set()
+        for _ in range(2):
+            g = {}
+            pool.safe_exec('import os\nppid = os.getppid()', g)
+            pids.add(g['ppid'])
+        assert len(pids) == 2
+
+    def test_realtime_limit(self):
+        pool = self.make_pool(size=1)
+        with pytest.raises(SafeExecException):
+            pool.safe_exec('while True: pass', {})
+
+    def test_stop_kills_process_group(self):
+        # Like sudo, the shell runs a child instead of replacing itself with
+        # it; the child doesn't exit when its stdin is closed.
+        with tempfile.NamedTemporaryFile() as pid_file:
+            worker = SandboxWorker(['/bin/sh', '-c', 'sleep 60 & echo $! > "$0"; wait', pid_file.name])
+            deadline = time.time() + 5
+            while not os.path.getsize(pid_file.name) and time.time() < deadline:
+                time.sleep(0.05)
+            child_pid = int(pid_file.read())
+            worker.stop()
+        assert not _is_running(child_pid)
+
+    @patch('capa.safe_exec.worker_pool.codejail_safe_exec')
+    def test_start_failure_falls_back(self, mock_codejail_safe_exec):
+        pool = self.make_pool(size=1)
+        with patch.object(SandboxWorkerPool, '_cmdline', return_value=['/nonexistent/python']):
+            pool.safe_exec('a = 1', {})
+        assert mock_codejail_safe_exec.call_count == 1
+        # The slot of the worker that couldn't start is free again.
+        g = {}
+        pool.safe_exec('a = 1', g)
+        assert g['a'] == 1
+
+    @patch('capa.safe_exec.worker_pool.codejail_safe_exec')
+    def test_replacement_failure(self, mock_codejail_safe_exec):
+        pool = self.make_pool(size=1, max_jobs_per_worker=1)
+        with patch.object(SandboxWorkerPool, '_cmdline', side_effect=[[sys.executable], ['/nonexistent/python']]):
+            g = {}
+            pool.safe_exec('a = 1', g)
+        assert g['a'] == 1
+        assert not mock_codejail_safe_exec.called
+        pool.safe_exec('a = 2', g)
+        assert g['a'] == 2
+
+    def test_get_pool_start_failure(self):
+        worker_pool.configure(size=1)
+        self.addCleanup(worker_pool.configure, size=0)
+        with patch('capa.safe_exec.worker_pool.jail_code.is_configured', return_value=True):
+            with patch.object(SandboxWorkerPool, '_cmdline', return_value=['/nonexistent/python']):
+                assert worker_pool.get_pool() is None
+            pool = worker_pool.get_pool()
+        assert pool is not None
+        g = {}
+        pool.safe_exec('a = 1', g)
+        assert g['a'] == 1
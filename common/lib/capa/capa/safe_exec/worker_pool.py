@@ -0,0 +1,377 @@
+"""
+A pool of warm sandbox worker processes for safe_exec.
+
+codejail starts a new sandboxed Python process for every execution, which
+then has to import numpy and the other modules problem code uses before it
+can run anything.  The pool keeps sandboxed worker processes around that
+have already done so, and runs each execution in a child forked from one of
+them (see pool_worker.py), with the same resource limits as codejail.
+
+Workers are started with codejail's configured Python and sandbox user, so
+the pool is only used when codejail is configured.  They are recycled after
+running `max_jobs_per_worker` jobs, or once the child that ran a job used
+more than `max_rss_in_bytes` of memory.  Executions the pool can't run the way codejail would
+(extra directories on the python path, proxied limits) and failures to
+start or run the workers themselves fall back to codejail.
+
+The isolation between executions is weaker than codejail's.  codejail runs
+each execution in a new process, while the pool's long-lived workers run
+many executions in children forked from the same process, all under the
+one sandbox user.  Each child starts from the worker's memory and gets a
+fresh temporary directory, but an execution that escapes its child could
+affect the worker, and so the executions that follow it, until the worker
+is recycled.  Only enable the pool where that trade-off is acceptable.
+"""
+
+
+import atexit
+import base64
+import json
+import logging
+import os
+import select
+import signal
+import struct
+import subprocess
+import threading
+import time
+
+from codejail import jail_code
+from codejail.safe_exec import SafeExecException, json_safe
+from codejail.safe_exec import safe_exec as codejail_safe_exec
+
+from .safe_exec import ASSUMED_IMPORTS
+
+log = logging.getLogger(__name__)
+
+FRAME_HEADER = struct.Struct('!I')
+
+# Modules the workers import before running any job.
+PRELOAD_MODULES = ['json', 'random2', 'six'] + [module_name for _, module_name in ASSUMED_IMPORTS]
+
+# Seconds to allow a worker on top of a job's REALTIME limit before giving
+# up on it, to account for the fork and the transfer of the results.
+WORKER_TIMEOUT_MARGIN = 5
+
+# Seconds to allow a job when it has no REALTIME limit... or a new worker to
+# import the preloaded modules.
+WORKER_STARTUP_TIMEOUT = 60
+
+# We'll need the code from pool_worker.py to start the workers, so read it now.
+pool_worker_py_file = os.path.join(os.path.dirname(__file__), 'pool_worker.py')
+with open(pool_worker_py_file) as f:
+    pool_worker_py = f.read()
+
+
+class WorkerError(Exception):
+    """
+    A worker process failed, rather than the code it ran.
+    """
+
+
+class SandboxWorker:
+    """
+    A sandboxed worker process, and the pipes to talk to it.
+    """
+    def __init__(self, cmdline):
+        self.process = subprocess.Popen(
+            cmdline + ['-c', pool_worker_py],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env={},
+            # The worker's own process group, so that stop can kill all of it.
+            start_new_session=True,
+        )
+        self.started = time.time()
+        self.num_jobs = 0
+        self.maxrss = 0
+        try:
+            self._send({'preload': PRELOAD_MODULES})
+        except WorkerError:
+            self.stop()
+            raise
+
+    def run(self, job, timeout):
+        """
+        Run the job and return the worker's response.
+        """
+        self._send(job)
+        if self.num_jobs == 0:
+            # The worker may still be importing the preloaded modules.
+            timeout += max(0, WORKER_STARTUP_TIMEOUT - (time.time() - self.started))
+        response = self._receive(timeout)
+        self.num_jobs += 1
+        self.maxrss = response['maxrss']
+        return response
+
+    def stop(self):
+        """
+        Stop the worker process.
+        """
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        self._kill_process_group()
+        self.process.wait()
+        self.process.stdout.close()
+
+    def _kill_process_group(self):
+        """
+        Kill the worker's process group.  With a sandbox user, the process
+        started is the sudo wrapper, and killing only it could leave the
+        sandboxed worker under it running.
+        """
+        pgid = self.process.pid
+        try:
+            os.killpg(pgid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        except PermissionError:
+            # The sandbox user's processes can't be signalled directly, so
+            # kill them the way codejail does.
+            subprocess.call(['sudo', 'pkill', '-9', '-g', str(pgid)])
+
+    def _send(self, message):
+        data = json.dumps(message).encode('utf-8')
+        try:
+            self.process.stdin.write(FRAME_HEADER.pack(len(data)) + data)
+            self.process.stdin.flush()
+        except OSError as err:
+            raise WorkerError(f'Could not send to worker: {err}')  # lint-amnesty, pylint: disable=raise-missing-from
+
+    def _receive(self, timeout):
+        deadline = time.time() + timeout
+        header = self._read(FRAME_HEADER.size, deadline)
+        (length,) = FRAME_HEADER.unpack(header)
+        return json.loads(self._read(length, deadline).decode('utf-8'))
+
+    def _read(self, size, deadline):
+        """
+        Read exactly `size` bytes from the worker before the deadline.
+        """
+        stdout_fd = self.process.stdout.fileno()
+        chunks = []
+        while size:
+            remaining = deadline - time.time()
+            if remaining <= 0 or not select.select([stdout_fd], [], [], remaining)[0]:
+                raise WorkerError('Timed out waiting for worker')
+            chunk = os.read(stdout_fd, size)
+            if not chunk:
+                raise WorkerError(f'Worker exited with status {self.process.poll()}')
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b''.join(chunks)
+
+
+class SandboxWorkerPool:
+    """
+    A pool of up to `size` sandbox workers; see the module docstring.
+    """
+    def __init__(self, size, max_jobs_per_worker=100, max_rss_in_bytes=None):
+        self.size = size
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.max_rss_in_bytes = max_rss_in_bytes
+        self._idle_workers = []
+        self._num_workers = 0
+        self._condition = threading.Condition()
+        self._closed = False
+
+    @staticmethod
+    def _cmdline():
+        command = jail_code.COMMANDS['python']
+        cmdline = list(command['cmdline_start'])
+        if command['user']:
+            cmdline = ['sudo', '-u', command['user']] + cmdline
+        return cmdline
+
+    def prefork(self):
+        """
+        Start all the workers that aren't running yet.
+        """
+        while True:
+            with self._condition:
+                if self._closed or self._num_workers >= self.size:
+                    return
+                self._num_workers += 1
+            self._add_idle_worker(self._start_worker())
+
+    def safe_exec(
+        self, code, globals_dict, python_path=None, extra_files=None, limit_overrides_context=None, slug=None,
+    ):
+        """
+        Run code in a sandbox worker, like codejail.safe_exec.safe_exec.
+        """
+        python_path = python_path or ()
+        extra_files = extra_files or ()
+        limits = jail_code.get_effective_limits(limit_overrides_context)
+        extra_names = {name for name, _ in extra_files}
+        if limits.get('PROXY') or any(os.path.basename(pydir) not in extra_names for pydir in python_path):
+            return codejail_safe_exec(
+                code, globals_dict, python_path=python_path, extra_files=extra_files,
+                limit_overrides_context=limit_overrides_context, slug=slug,
+            )
+
+        job = {
+            'code': code,
+            'globals': json_safe(globals_dict),
+            'python_path': [os.path.basename(pydir) for pydir in python_path],
+            'files': [(name, base64.b64encode(contents).decode('ascii')) for name, contents in extra_files],
+            'limits': limits,
+        }
+        timeout = (limits['REALTIME'] or WORKER_STARTUP_TIMEOUT) + WORKER_TIMEOUT_MARGIN
+
+        try:
+            worker = self._acquire()
+            try:
+                response = worker.run(job, timeout)
+            except WorkerError:
+                self._release(worker, failed=True)
+                raise
+        except (WorkerError, OSError):
+            log.exception('Sandbox worker failed running %s, falling back to codejail', slug)
+            return codejail_safe_exec(
+                code, globals_dict, python_path=python_path, extra_files=extra_files,
+                limit_overrides_context=limit_overrides_context, slug=slug,
+            )
+        self._release(worker)
+
+        if response['status'] != 0:
+            # Same message as codejail's.
+            raise SafeExecException(
+                "Couldn't execute jailed code: stdout: {!r}, stderr: {!r} with status code: {}".format(
+                    b'', response.get('error', '').encode('utf-8'), response['status'],
+                )
+            )
+        globals_dict.update(response['globals'])
+
+    def close(self):
+        """
+        Stop all the workers.
+        """
+        with self._condition:
+            self._closed = True
+            for worker in self._idle_workers:
+                worker.stop()
+            self._num_workers -= len(self._idle_workers)
+            self._idle_workers = []
+
+    def _start_worker(self):
+        """
+        Start a worker in a slot of the pool that the caller reserved by
+        counting it in _num_workers.  The slot is given back if the worker
+        can't be started.
+
+        Starting a worker takes a while, so this must be called without
+        holding the pool's lock.
+        """
+        try:
+            return SandboxWorker(self._cmdline())
+        except (WorkerError, OSError):
+            with self._condition:
+                self._num_workers -= 1
+                self._condition.notify()
+            raise
+
+    def _add_idle_worker(self, worker):
+        """
+        Make a newly started worker available, unless the pool was closed
+        in the meantime.
+        """
+        with self._condition:
+            if self._closed:
+                self._num_workers -= 1
+            else:
+                self._idle_workers.append(worker)
+                worker = None
+            self._condition.notify()
+        if worker is not None:
+            worker.stop()
+
+    def _acquire(self):
+        """
+        Return an idle worker, starting one if the pool isn't full, or else
+        waiting for one.
+        """
+        with self._condition:
+            while not self._idle_workers and self._num_workers >= self.size:
+                self._condition.wait()
+            if self._idle_workers:
+                return self._idle_workers.pop()
+            self._num_workers += 1
+        return self._start_worker()
+
+    def _release(self, worker, failed=False):
+        """
+        Return the worker to the pool, or replace it if it failed or needs
+        to be recycled.  Failing to start the replacement is only logged,
+        the next execution that needs a worker tries again.
+        """
+        recycle = (
+            failed or
+            worker.num_jobs >= self.max_jobs_per_worker or
+            (self.max_rss_in_bytes and worker.maxrss > self.max_rss_in_bytes)
+        )
+        with self._condition:
+            if not recycle and not self._closed:
+                self._idle_workers.append(worker)
+                self._condition.notify()
+                return
+            # The replacement takes over the worker's slot.
+            replace = not self._closed
+            if not replace:
+                self._num_workers -= 1
+                self._condition.notify()
+        worker.stop()
+        if replace:
+            # Start the replacement right away, so that it is warm by the
+            # time it is needed.
+            try:
+                self._add_idle_worker(self._start_worker())
+            except (WorkerError, OSError):
+                log.exception('Could not start a replacement sandbox worker')
+
+
+# The pool configuration, and the pool of the current process.
+_POOL_CONFIG = {'size': 0}
+_POOL = None
+_POOL_PID = None
+_POOL_LOCK = threading.Lock()
+
+
+def configure(size, max_jobs_per_worker=100, max_rss_in_bytes=None):
+    """
+    Configure the sandbox worker pool.  A size of 0 disables it.
+    """
+    global _POOL  # pylint: disable=global-statement
+    with _POOL_LOCK:
+        _POOL_CONFIG.update(size=size, max_jobs_per_worker=max_jobs_per_worker, max_rss_in_bytes=max_rss_in_bytes)
+        if _POOL is not None and _POOL_PID == os.getpid():
+            _POOL.close()
+        _POOL = None
+
+
+def get_pool():
+    """
+    Return this process's sandbox worker pool, or None if it is disabled or
+    codejail isn't configured.
+
+    The workers are started the first time the pool is used in a process,
+    so that processes forked from each other don't share them.
+    """
+    global _POOL, _POOL_PID  # pylint: disable=global-statement
+    if not _POOL_CONFIG['size'] or not jail_code.is_configured('python'):
+        return None
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_PID != os.getpid():
+            pool = SandboxWorkerPool(**_POOL_CONFIG)
+            try:
+                pool.prefork()
+            except (WorkerError, OSError):
+                log.exception('Could not start the sandbox worker pool, using codejail')
+                pool.close()
+                return None
+            _POOL, _POOL_PID = pool, os.getpid()
+            atexit.register(pool.close)
+        return _POOL
@@ -0,0 +1,64 @@
+"""
+Tests for capa.formula
+"""
+
+
+import unittest
+
+import ddt
+import numpy
+import pytest
+import random2 as random
+from calc import UndefinedVariable, evaluator
+
+from capa.formula import CompiledFormula, compile_cached, samples_to_arrays
+
+
+@ddt.ddt
+class CompiledFormulaTest(unittest.TestCase):
+    """
+    Tests that CompiledFormula evaluates all samples like calc.evaluator does
+    for each of them.
+    """
+    def setUp(self):
+        super().setUp()
+        self.var_dict_list = [
+            {'x': random.uniform(-10, 10), 'y': random.uniform(1, 5)}
+            for _ in range(20)
+        ]
+        self.samples = samples_to_arrays(self.var_dict_list)
+
+    @ddt.data(
+        'x+2*y',
+        '2*x - x + y + y',
+        '-(x-y)*(x+y)/y',
+        'sin(x)^2 + cos(x)^2',
+        'y^2^0.5',
+        'x||y',
+        'sqrt(x)',
+        'x*i + 3',
+        'e^y/pi',
+        '3%*x',
+        'arctan(x)*sec(y)',
+        'x*1e999',
+        'X+Y',
+        '2',
+        '',
+    )
+    def test_evaluate(self, math_expr):
+        result = CompiledFormula(math_expr).evaluate(self.samples, len(self.var_dict_list))
+        expected = [evaluator(var_dict, {}, math_expr) for var_dict in self.var_dict_list]
+        numpy.testing.assert_allclose(result, numpy.array(expected, dtype=complex), rtol=1e-12)
+
+    @ddt.data('x/0', 'x^0.5', 'fact(y)', '0*x*1e999')
+    def test_floating_point_errors_raise(self, math_expr):
+        with pytest.raises(Exception):
+            CompiledFormula(math_expr).evaluate(self.samples, len(self.var_dict_list))
+
+    def test_case_sensitive(self):
+        with pytest.raises(UndefinedVariable):
+            CompiledFormula('X+y', case_sensitive=True).evaluate(self.samples, len(self.var_dict_list))
+
+    def test_compile_cached(self):
+        assert compile_cached('x+2*y') is compile_cached('x+2*y')
+        assert compile_cached('x+2*y') is not compile_cached('x+2*y', True)
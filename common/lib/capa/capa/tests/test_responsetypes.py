@@ -560,6 +560,21 @@ class FormulaResponseTest(ResponseTest):
         input_dict = {'1_2_1': '1/0'}
         self.assertRaises(StudentInputError, problem.grade_answers, input_dict)
 
+    def test_grade_sample_by_sample(self):
+        """
+        Test formulas that can't be evaluated for all samples at once.
+        """
+        sample_dict = {'x': (-2, -1)}
+        problem = self.build_problem(sample_dict=sample_dict,
+                                     num_samples=10,
+                                     tolerance="1%",
+                                     answer="sqrt(x)*fact(3)")
+        # Fractional powers of negative numbers and factorials are evaluated one sample at a time.
+        self.assert_grade(problem, "6*x^0.5", "correct")
+        self.assert_grade(problem, "6*x^0.25", "incorrect")
+        self.assertRaises(StudentInputError, problem.grade_answers, {'1_2_1': 'fact(x)'})
+        self.assertRaises(StudentInputError, problem.grade_answers, {'1_2_1': 'y'})
+
     def test_validate_answer(self):
         """
         Makes sure that validate_answer works.
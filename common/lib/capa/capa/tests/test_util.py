@@ -11,6 +11,7 @@ from lxml import etree
 
 from capa.tests.helpers import test_capa_system
 from capa.util import (
+    compare_samples_with_tolerance,
     compare_with_tolerance,
     contextualize_text,
     get_inner_html_from_xpath,
@@ -119,6 +120,30 @@ class UtilTest(unittest.TestCase):
         result = compare_with_tolerance(111.0, complex(100.0, 0), '10%', True)
         assert result
 
+    @ddt.data(
+        ('0.001%', False),
+        ('10%', False),
+        ('10%', True),
+        ('0.01', False),
+        (0.001, False),
+        (0.001, True),
+    )
+    @ddt.unpack
+    def test_compare_samples_with_tolerance(self, tolerance, relative_tolerance):
+        infinity = float('Inf')
+        samples = [
+            (100.0, 100.0), (100.001, 100.0), (100.002, 100.0), (101.0, 100.0), (109.9, 100.0), (110.1, 100.0),
+            (100.01, 100.0), (0.4, 0.44), (-100.001, -100.0), (0.0, 0.0), (float('nan'), 100.0),
+            (infinity, 100.0), (infinity, infinity), (-infinity, infinity),
+            (100.0 + 1e-3j, 100.0), (complex(100.01, 0), complex(100.0, 0)), (3j, 3j),
+        ]
+        student_samples, instructor_samples = zip(*samples)
+        result = compare_samples_with_tolerance(student_samples, instructor_samples, tolerance, relative_tolerance)
+        assert list(result) == [
+            compare_with_tolerance(student, instructor, tolerance, relative_tolerance)
+            for student, instructor in samples
+        ]
+
     def test_sanitize_html(self):
         """
         Test for html sanitization with bleach.
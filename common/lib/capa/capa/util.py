@@ -9,6 +9,7 @@ from cmath import isinf, isnan
 from decimal import Decimal
 
 import bleach
+import numpy
 import six
 from calc import evaluator
 from lxml import etree
@@ -98,6 +99,50 @@ def compare_with_tolerance(student_complex, instructor_complex, tolerance=defaul
         return abs(student_complex - instructor_complex) <= tolerance
 
 
+def compare_samples_with_tolerance(student_samples, instructor_samples, tolerance=default_tolerance,
+                                   relative_tolerance=False):
+    """
+    Compare arrays of student and instructor results element by element, like
+    compare_with_tolerance does for single results, and return a numpy array
+    of booleans.
+
+    The tolerance is only evaluated once for all samples.  Real results are
+    compared as floats, except for those too close to the tolerance bound for
+    that to be exact, which are left to compare_with_tolerance.
+    """
+    student = numpy.asarray(student_samples, dtype=complex)
+    instructor = numpy.asarray(instructor_samples, dtype=complex)
+
+    if isinstance(tolerance, str):
+        if tolerance == default_tolerance:
+            relative_tolerance = True
+        if tolerance.endswith('%'):
+            tolerance = evaluator(dict(), dict(), tolerance[:-1]) * 0.01
+            if not relative_tolerance:
+                tolerance = tolerance * numpy.abs(instructor)
+        else:
+            tolerance = evaluator(dict(), dict(), tolerance)
+
+    with numpy.errstate(all='ignore'):
+        if relative_tolerance:
+            tolerance = tolerance * numpy.maximum(numpy.abs(student), numpy.abs(instructor))
+        tolerance = numpy.broadcast_to(tolerance, student.shape)
+        difference = numpy.abs(student - instructor)
+        result = difference <= tolerance
+
+    # See compare_with_tolerance for why infinite results are compared directly.
+    infinite = numpy.isinf(student) | numpy.isinf(instructor)
+    result[infinite] = (student == instructor)[infinite]
+
+    real = ~infinite & (student.imag == 0) & (instructor.imag == 0)
+    borderline = real & numpy.isclose(difference, tolerance, rtol=1e-9, atol=0)
+    for index in numpy.flatnonzero(borderline):
+        result[index] = compare_with_tolerance(
+            float(student[index].real), float(instructor[index].real), float(tolerance[index]),
+        )
+    return result
+
+
 def contextualize_text(text, context):  # private
     """
     Takes a string with variables. E.g. $a+$b.
@@ -294,6 +294,22 @@ class StaticContent:  # lint-amnesty, pylint: disable=missing-class-docstring
     def stream_data(self):
         yield self._data
 
+    def stream_data_in_range(self, first_byte, last_byte):
+        """
+        Stream the data between first_byte and last_byte (included)
+        """
+        yield self._data[first_byte:last_byte + 1]
+
+    def copy_metadata(self):
+        """
+        Returns a copy of this content without its data, e.g. to cache it
+        without the data of large assets.
+        """
+        return StaticContent(self.location, self.name, self.content_type, None,
+                             last_modified_at=self.last_modified_at, thumbnail_location=self.thumbnail_location,
+                             import_path=self.import_path, length=self.length, locked=self.locked,
+                             content_digest=self.content_digest)
+
     @staticmethod
     def serialize_asset_key_with_slash(asset_key):
         """
@@ -316,7 +332,7 @@ class StaticContentStream(StaticContent):  # lint-amnesty, pylint: disable=missi
 
     def stream_data(self):
         while True:
-            chunk = self._stream.read(STREAM_DATA_CHUNK_SIZE)
+            chunk = self._read_chunk()
             if len(chunk) == 0:
                 break
             yield chunk
@@ -326,16 +342,25 @@ class StaticContentStream(StaticContent):  # lint-amnesty, pylint: disable=missi
         Stream the data between first_byte and last_byte (included)
         """
         self._stream.seek(first_byte)
-        position = first_byte
-        while True:
-            if last_byte < position + STREAM_DATA_CHUNK_SIZE - 1:
-                chunk = self._stream.read(last_byte - position + 1)
-                yield chunk
+        remaining = last_byte - first_byte + 1
+        while remaining > 0:
+            chunk = self._read_chunk()
+            if len(chunk) == 0:
                 break
-            chunk = self._stream.read(STREAM_DATA_CHUNK_SIZE)
-            position += STREAM_DATA_CHUNK_SIZE
+            if len(chunk) > remaining:
+                chunk = chunk[:remaining]
+            remaining -= len(chunk)
             yield chunk
 
+    def _read_chunk(self):
+        """
+        Reads the next chunk of the stream.  GridFS files are read a stored
+        chunk at a time, as is, rather than copied into a buffer of our own.
+        """
+        if hasattr(self._stream, 'readchunk'):
+            return self._stream.readchunk()
+        return self._stream.read(STREAM_DATA_CHUNK_SIZE)
+
     def close(self):
         self._stream.close()
 
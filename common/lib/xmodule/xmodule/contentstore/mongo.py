@@ -14,6 +14,7 @@ from gridfs.errors import NoFile, FileExists
 from mongodb_proxy import autoretry_read
 from opaque_keys.edx.keys import AssetKey
 
+from openedx.core.djangoapps.contentserver.caching import del_cached_content
 from xmodule.contentstore.content import XASSET_LOCATION_TAG
 from xmodule.exceptions import NotFoundError
 from xmodule.modulestore.django import ASSET_IGNORE_REGEX
@@ -114,6 +115,9 @@ class MongoContentStore(ContentStore):
                 else:
                     fp.write(content.data)
 
+        # The asset may be cached by the contentserver under its location, drop it so
+        # that the new content and metadata are served.
+        del_cached_content(content.location)
         return content
 
     def delete(self, location_or_id):
@@ -121,6 +125,7 @@ class MongoContentStore(ContentStore):
         Delete an asset.
         """
         if isinstance(location_or_id, AssetKey):
+            del_cached_content(location_or_id)
             location_or_id, _ = self.asset_db_key(location_or_id)
         # Deletes of non-existent files are considered successful
         self.fs.delete(location_or_id)
@@ -382,6 +387,7 @@ class MongoContentStore(ContentStore):
         result = self.fs_files.update_one({'_id': asset_db_key}, {"$set": attr_dict}, upsert=False)
         if result.matched_count == 0:
             raise NotFoundError(asset_db_key)
+        del_cached_content(location)
 
     @autoretry_read()
     def get_attrs(self, location):
@@ -9,7 +9,7 @@ import logging
 import re
 import threading
 from abc import ABCMeta, abstractmethod
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 from contextlib import contextmanager
 from operator import itemgetter
 
@@ -112,6 +112,11 @@ class ModuleStoreEnum:
         descending = 2
 
 
+# The changes made by a publish: the subtrees at usage_keys were published,
+# taking the published course from previous_version to version.
+PublishedChanges = namedtuple('PublishedChanges', ['usage_keys', 'previous_version', 'version'])
+
+
 class BulkOpsRecord:
     """
     For handling nesting of bulk operations
@@ -120,6 +125,9 @@ class BulkOpsRecord:
         self._active_count = 0
         self.has_publish_item = False
         self.has_library_updated_item = False
+        # The usage keys of the subtrees published in this bulk operation,
+        # or None if something else was published.
+        self.published_usage_keys = set()
 
     @property
     def active(self):
@@ -147,6 +155,16 @@ class BulkOpsRecord:
         """
         return self._active_count == 1
 
+    def add_published_usage_key(self, usage_key):
+        """
+        Record that the subtree at usage_key was published, or that
+        something else was published if usage_key is None.
+        """
+        if usage_key is None:
+            self.published_usage_keys = None
+        elif self.published_usage_keys is not None:
+            self.published_usage_keys.add(usage_key.for_branch(None))
+
 
 class ActiveBulkThread(threading.local):
     """
@@ -302,6 +320,30 @@ class BulkOperationsMixin:
         """
         return self._get_bulk_ops_record(course_key, ignore_case).active
 
+    def get_published_changes(self, course_key):
+        """
+        Return what the bulk operation on `course_key` published, for use by
+        handlers of the course_published signal it sends.
+
+        Returns a PublishedChanges, or None if no bulk operation is active or
+        its changes aren't known. Stores that don't version courses don't
+        know them.
+        """
+        bulk_ops_record = self._get_bulk_ops_record(course_key)
+        if not bulk_ops_record.active or not bulk_ops_record.published_usage_keys:
+            return None
+        previous_version, version = self._get_published_versions(bulk_ops_record)
+        if previous_version is None or version is None:
+            return None
+        return PublishedChanges(frozenset(bulk_ops_record.published_usage_keys), previous_version, version)
+
+    def _get_published_versions(self, bulk_ops_record):  # pylint: disable=unused-argument
+        """
+        Return the versions of the published course before and after the given
+        bulk operation, or (None, None) if unknown.
+        """
+        return None, None
+
     def send_pre_publish_signal(self, bulk_ops_record, course_id):
         """
         Send a signal just before items are published in the course.
@@ -318,6 +360,7 @@ class BulkOperationsMixin:
             # We remove the branch, because publishing always means copying from draft to published
             self.signal_handler.send("course_published", course_key=course_id.for_branch(None))
             bulk_ops_record.has_publish_item = False
+            bulk_ops_record.published_usage_keys = set()
 
     def send_bulk_library_updated_signal(self, bulk_ops_record, library_id):
         """
@@ -122,7 +122,7 @@ class ModuleStoreDraftAndPublished(BranchSettingMixin, BulkOperationsMixin, meta
         """
         raise NotImplementedError
 
-    def _flag_publish_event(self, course_key):
+    def _flag_publish_event(self, course_key, usage_key=None):
         """
         Wrapper around calls to fire the course_published signal
         Unless we're nested in an active bulk operation, this simply fires the signal
@@ -130,11 +130,13 @@ class ModuleStoreDraftAndPublished(BranchSettingMixin, BulkOperationsMixin, meta
 
         Arguments:
             course_key - course_key to which the signal applies
+            usage_key - the root of the published subtree, if that is all that was published
         """
         if self.signal_handler:
             bulk_record = self._get_bulk_ops_record(course_key) if isinstance(self, BulkOperationsMixin) else None
             if bulk_record and bulk_record.active:
                 bulk_record.has_publish_item = True
+                bulk_record.add_published_usage_key(usage_key)
             else:
                 # We remove the branch, because publishing always means copying from draft to published
                 self.signal_handler.send("course_published", course_key=course_key.for_branch(None))
@@ -16,6 +16,7 @@ from opaque_keys.edx.keys import CourseKey
 from opaque_keys.edx.locator import LibraryLocator
 
 from xmodule.assetstore import AssetMetadata
+from xmodule.error_module import ErrorBlock
 
 from . import XMODULE_FIELDS_WITH_USAGE_KEYS, ModuleStoreEnum, ModuleStoreWriteBase
 from .draft_and_published import ModuleStoreDraftAndPublished
@@ -286,9 +287,25 @@ class MixedModuleStore(ModuleStoreDraftAndPublished, ModuleStoreWriteBase):
         """
         Returns a list containing the course information in CourseSummary objects.
         Information contains `location`, `display_name`, `locator` of the courses in this modulestore.
+
+        If `course_keys` is given, each store is only asked, in bulk, for the courses that weren't
+        found in earlier stores.
         """
+        course_keys = kwargs.get('course_keys')
         course_summaries = {}
         for store in self.modulestores:
+            if course_keys:
+                store_course_keys = [
+                    course_key for course_key in course_keys
+                    if self._clean_locator_for_mapping(course_key) not in course_summaries
+                ]
+                if store.get_modulestore_type() == ModuleStoreEnum.Type.split:
+                    # Split can't have courses with old-style keys.
+                    store_course_keys = [course_key for course_key in store_course_keys if not course_key.deprecated]
+                if not store_course_keys:
+                    continue
+                kwargs['course_keys'] = store_course_keys
+
             for course_summary in store.get_course_summaries(**kwargs):
                 course_id = self._clean_locator_for_mapping(locator=course_summary.id)
 
@@ -305,7 +322,14 @@ class MixedModuleStore(ModuleStoreDraftAndPublished, ModuleStoreWriteBase):
     def get_courses(self, **kwargs):
         '''
         Returns a list containing the top level XModuleDescriptors of the courses in this modulestore.
+
+        If `course_keys` is given, only returns the courses with those keys. Split fetches them in
+        bulk; the other stores fetch the courses that weren't found in earlier stores one at a time.
         '''
+        course_keys = kwargs.pop('course_keys', None)
+        if course_keys is not None:
+            return self._get_courses_by_keys(course_keys, **kwargs)
+
         courses = {}
         for store in self.modulestores:
             # filter out ones which were fetched from earlier stores but locations may not be ==
@@ -316,6 +340,39 @@ class MixedModuleStore(ModuleStoreDraftAndPublished, ModuleStoreWriteBase):
                     courses[course_id] = course
         return list(courses.values())
 
+    def _get_courses_by_keys(self, course_keys, **kwargs):
+        '''
+        Returns a list of the top level XModuleDescriptors of the courses with the given keys
+        that are in this modulestore.
+        '''
+        course_keys = {self._clean_locator_for_mapping(course_key) for course_key in course_keys}
+        courses = {}
+        for store in self.modulestores:
+            remaining_course_keys = [course_key for course_key in course_keys if course_key not in courses]
+            if not remaining_course_keys:
+                break
+
+            if store.get_modulestore_type() == ModuleStoreEnum.Type.split:
+                # Split can't have courses with old-style keys.
+                split_course_keys = [course_key for course_key in remaining_course_keys if not course_key.deprecated]
+                store_courses = store.get_courses(course_keys=split_course_keys, **kwargs) if split_course_keys else []
+            else:
+                store_courses = []
+                for course_key in remaining_course_keys:
+                    try:
+                        store_courses.append(store.get_course(course_key, **kwargs))
+                    except ItemNotFoundError:
+                        pass
+
+            for course in store_courses:
+                if course is None or isinstance(course, ErrorBlock):
+                    continue
+                course_id = self._clean_locator_for_mapping(course.id)
+                if course_id in course_keys and course_id not in courses:
+                    courses[course_id] = course
+                    self.mappings.setdefault(course_id, store)
+        return list(courses.values())
+
     def get_library_keys(self):
         """
         Returns a list of all unique content library keys in the mixed
@@ -952,6 +1009,16 @@ class MixedModuleStore(ModuleStoreDraftAndPublished, ModuleStoreWriteBase):
         store = self._verify_modulestore_support(xblock.location.course_key, 'has_changes')
         return store.has_changes(xblock)
 
+    def get_published_changes(self, course_key):
+        """
+        Returns what the active bulk operation on the given course published, or None.
+        See :py:meth `xmodule.modulestore.BulkOperationsMixin.get_published_changes`
+        """
+        store = self._get_modulestore_for_courselike(course_key)
+        if not hasattr(store, 'get_published_changes'):
+            return None
+        return store.get_published_changes(course_key)
+
     def check_supports(self, course_key, method):
         """
         Verifies that the modulestore for a particular course supports a feature.
@@ -184,6 +184,7 @@ class CachingDescriptorSystem(MakoDescriptorSystem, EditInfoRuntimeMixin):  # li
                 block_key.type,
                 definition_id,
                 convert_fields,
+                field_level=self.modulestore.field_level_definition_loading,
             )
         else:
             definition_loader = None
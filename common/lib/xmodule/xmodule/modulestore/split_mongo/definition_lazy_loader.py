@@ -12,16 +12,19 @@ class DefinitionLazyLoader:
     object doesn't force access during init but waits until client wants the
     definition. Only works if the modulestore is a split mongo store.
     """
-    def __init__(self, modulestore, course_key, block_type, definition_id, field_converter):
+    def __init__(self, modulestore, course_key, block_type, definition_id, field_converter, field_level=False):
         """
         Simple placeholder for yet-to-be-fetched data
         :param modulestore: the pymongo db connection with the definitions
         :param definition_locator: the id of the record in the above to fetch
+        :param field_level: whether the definition's fields should be fetched one at a time,
+            as they are accessed, rather than all at once (see fetch_fields)
         """
         self.modulestore = modulestore
         self.course_key = course_key
         self.definition_locator = DefinitionLocator(block_type, definition_id)
         self.field_converter = field_converter
+        self.field_level = field_level
 
     def fetch(self):
         """
@@ -33,3 +36,13 @@ class DefinitionLazyLoader:
         # value in such a way that we can't tell that the definition's been updated.
         definition = self.modulestore.get_definition(self.course_key, self.definition_locator.definition_id)
         return copy.deepcopy(definition)
+
+    def fetch_fields(self, field_names):
+        """
+        Fetch only the given fields of the definition, as a dict of those of
+        them that the definition has.
+        """
+        fields = self.modulestore.get_definition_fields(
+            self.course_key, self.definition_locator.definition_id, field_names
+        )
+        return copy.deepcopy(fields)
@@ -8,7 +8,9 @@ import logging
 import math
 import pickle
 import re
+import threading
 import zlib
+from collections import OrderedDict
 from contextlib import contextmanager
 from time import time
 
@@ -23,6 +25,7 @@ from xmodule.modulestore.split_mongo import BlockKey
 from xmodule.mongo_utils import connect_to_mongodb, create_collection_index
 
 try:
+    from django.conf import settings
     from django.core.cache import caches, InvalidCacheBackendError
     DJANGO_AVAILABLE = True
 except ImportError:
@@ -231,6 +234,47 @@ class CourseStructureCache:
                 self.cache.delete(key)
                 return None
 
+    def get_many(self, keys, course_context=None):
+        """
+        Pull the compressed, pickled structs for the given keys from cache and deserialize them.
+
+        Returns a dict of the structures found, by key.
+        """
+        if self.cache is None:
+            return {}
+
+        with TIMER.timer("CourseStructureCache.get_many", course_context) as tagger:
+            compressed_pickled_data_by_key = self.cache.get_many(keys)
+            tagger.measure('requested', len(keys))
+            tagger.measure('found', len(compressed_pickled_data_by_key))
+
+            structures = {}
+            for key, compressed_pickled_data in compressed_pickled_data_by_key.items():
+                try:
+                    structures[key] = pickle.loads(zlib.decompress(compressed_pickled_data), encoding='latin-1')
+                except Exception:  # lint-amnesty, pylint: disable=broad-except
+                    # The cached data is corrupt in some way, get rid of it.
+                    log.warning("CourseStructureCache: Bad data in cache for %s", key)
+                    self.cache.delete(key)
+            return structures
+
+    def set_many(self, structures, course_context=None):
+        """Given a dict of structures by key, will pickle, compress, and write them to cache."""
+        if self.cache is None or not structures:
+            return
+
+        with TIMER.timer("CourseStructureCache.set_many", course_context) as tagger:
+            tagger.measure('structures', len(structures))
+            self.cache.set_many(
+                {
+                    # Protocol can't be incremented until cache is cleared
+                    key: zlib.compress(pickle.dumps(structure, 4), 1)
+                    for key, structure in structures.items()
+                },
+                # Stuctures are immutable, so we set a timeout of "never"
+                None,
+            )
+
     def set(self, key, structure, course_context=None):
         """Given a structure, will pickle, compress, and write to cache."""
         if self.cache is None:
@@ -248,6 +292,88 @@ class CourseStructureCache:
             self.cache.set(key, compressed_pickled_data, None)
 
 
+class StructureProcessCache:
+    """
+    A per-process LRU cache of decoded course structures, keyed by their id.
+
+    Structures are immutable once saved (changes create a new structure with a
+    new id), so entries never need to be invalidated, and the same decoded
+    structure can be returned to every caller.  Callers must not modify it;
+    split modulestore copies structures with `version_structure` before
+    changing them.
+
+    The cache is bounded by the total number of blocks in the cached
+    structures, which is what their memory use is proportional to.  A
+    `max_blocks` of 0 disables it.
+    """
+    def __init__(self, max_blocks):
+        self.max_blocks = max_blocks
+        self._structures = OrderedDict()
+        self._num_blocks = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        Return the cached structure with the given id, or None.
+        """
+        with self._lock:
+            structure = self._structures.get(key)
+            if structure is None:
+                self.misses += 1
+                return None
+            self._structures.move_to_end(key)
+            self.hits += 1
+            return structure
+
+    def set(self, key, structure):
+        """
+        Cache the given structure, evicting the least recently used structures
+        if the cache grows too large.
+        """
+        num_blocks = len(structure['blocks'])
+        if num_blocks > self.max_blocks:
+            return
+        with self._lock:
+            if key in self._structures:
+                return
+            self._structures[key] = structure
+            self._num_blocks += num_blocks
+            while self._num_blocks > self.max_blocks:
+                _, evicted = self._structures.popitem(last=False)
+                self._num_blocks -= len(evicted['blocks'])
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        with self._lock:
+            self._structures.clear()
+            self._num_blocks = 0
+
+
+_STRUCTURE_PROCESS_CACHE = None
+_STRUCTURE_PROCESS_CACHE_LOCK = threading.Lock()
+
+
+def get_structure_process_cache():
+    """
+    Return the StructureProcessCache of this process, or None if it is
+    disabled.  Its size is set by the COURSE_STRUCTURE_PROCESS_CACHE_MAX_BLOCKS
+    setting, and it is disabled outside of Django.
+    """
+    global _STRUCTURE_PROCESS_CACHE  # pylint: disable=global-statement
+    if _STRUCTURE_PROCESS_CACHE is None:
+        max_blocks = getattr(settings, 'COURSE_STRUCTURE_PROCESS_CACHE_MAX_BLOCKS', 0) if DJANGO_AVAILABLE else 0
+        with _STRUCTURE_PROCESS_CACHE_LOCK:
+            if _STRUCTURE_PROCESS_CACHE is None:
+                _STRUCTURE_PROCESS_CACHE = StructureProcessCache(max_blocks)
+    return _STRUCTURE_PROCESS_CACHE if _STRUCTURE_PROCESS_CACHE.max_blocks else None
+
+
 class MongoConnection:
     """
     Segregation of pymongo functions from the data modeling mechanisms for split modulestore.
@@ -291,6 +417,13 @@ class MongoConnection:
         This method will use a cached version of the structure if it is available.
         """
         with TIMER.timer("get_structure", course_context) as tagger_get_structure:
+            process_cache = get_structure_process_cache()
+            if process_cache is not None:
+                structure = process_cache.get(key)
+                tagger_get_structure.tag(from_process_cache=str(structure is not None).lower())
+                if structure is not None:
+                    return structure
+
             cache = CourseStructureCache()
 
             structure = cache.get(key, course_context)
@@ -313,6 +446,8 @@ class MongoConnection:
 
                 cache.set(key, structure, course_context)
 
+            if process_cache is not None:
+                process_cache.set(key, structure)
             return structure
 
     @autoretry_read()
@@ -320,17 +455,44 @@ class MongoConnection:
         """
         Return all structures that specified in ``ids``.
 
+        Like get_structure, this uses the cached versions of the structures that
+        are available, and queries the persistence mechanism for the others at once.
+
         Arguments:
             ids (list): A list of structure ids
         """
         with TIMER.timer("find_structures_by_id", course_context) as tagger:
             tagger.measure("requested_ids", len(ids))
-            docs = [
-                structure_from_mongo(structure, course_context)
-                for structure in self.structures.find({'_id': {'$in': ids}})
-            ]
-            tagger.measure("structures", len(docs))
-            return docs
+            structures = {}
+
+            process_cache = get_structure_process_cache()
+            if process_cache is not None:
+                for key in ids:
+                    structure = process_cache.get(key)
+                    if structure is not None:
+                        structures[key] = structure
+
+            cache = CourseStructureCache()
+            missing_ids = [key for key in ids if key not in structures]
+            if missing_ids:
+                structures.update(cache.get_many(missing_ids, course_context))
+
+            missing_ids = [key for key in ids if key not in structures]
+            tagger.measure("missing_ids", len(missing_ids))
+            if missing_ids:
+                docs = {
+                    structure['_id']: structure_from_mongo(structure, course_context)
+                    for structure in self.structures.find({'_id': {'$in': missing_ids}})
+                }
+                cache.set_many(docs, course_context)
+                structures.update(docs)
+
+            if process_cache is not None:
+                for key, structure in structures.items():
+                    process_cache.set(key, structure)
+
+            tagger.measure("structures", len(structures))
+            return list(structures.values())
 
     @autoretry_read()
     def find_courselike_blocks_by_id(self, ids, block_type, course_context=None):
@@ -521,12 +683,23 @@ class MongoConnection:
             }
             return self.course_index.remove(query)
 
-    def get_definition(self, key, course_context=None):
+    def get_definition(self, key, course_context=None, fields=None):
         """
         Get the definition from the persistence mechanism whose id is the given key
+
+        Arguments:
+            fields (list): If specified, only these of the definition's fields are loaded.
         """
         with TIMER.timer("get_definition", course_context) as tagger:
-            definition = self.definitions.find_one({'_id': key})
+            if fields is None:
+                definition = self.definitions.find_one({'_id': key})
+            else:
+                projection = {'block_type': True}
+                projection.update({f'fields.{field_name}': True for field_name in fields})
+                definition = self.definitions.find_one({'_id': key}, projection)
+                if definition is not None:
+                    definition.setdefault('fields', {})
+                tagger.tag(projected=True)
             tagger.measure("fields", len(definition['fields']))
             tagger.tag(block_type=definition['block_type'])
             return definition
@@ -59,6 +59,7 @@ import copy
 import datetime
 import hashlib
 import logging
+import sys
 from collections import defaultdict
 from importlib import import_module
 
@@ -79,6 +80,7 @@ from pytz import UTC
 from xblock.core import XBlock
 from xblock.fields import Reference, ReferenceList, ReferenceValueDict, Scope
 
+from openedx.core.lib.cache_utils import BoundedLRUCache
 from xmodule.assetstore import AssetMetadata
 from xmodule.course_module import CourseSummary
 from xmodule.error_module import ErrorBlock
@@ -132,6 +134,14 @@ log = logging.getLogger(__name__)
 # When blacklists are this, all children should be excluded
 EXCLUDE_ALL = '*'
 
+# The total size of the definition fields that get_definition_fields keeps for
+# the rest of a request.
+DEFINITION_FIELDS_CACHE_SIZE_IN_BYTES = 256 * 1024
+
+# Markers for the definition fields cache
+_NOT_CACHED = object()
+_NOT_IN_DEFINITION = object()
+
 
 class SplitBulkWriteRecord(BulkOpsRecord):  # lint-amnesty, pylint: disable=missing-class-docstring
     def __init__(self):
@@ -292,6 +302,18 @@ class SplitBulkWriteMixin(BulkOperationsMixin):
 
         return dirty
 
+    def _get_published_versions(self, bulk_write_record):
+        """
+        Return the versions of the published branch before and after the given bulk write operation.
+        """
+        if bulk_write_record.initial_index is None or bulk_write_record.index is None:
+            return None, None
+        branch = ModuleStoreEnum.BranchName.published
+        return (
+            bulk_write_record.initial_index.get('versions', {}).get(branch),
+            bulk_write_record.index.get('versions', {}).get(branch),
+        )
+
     def get_course_index(self, course_key, ignore_case=False):
         """
         Return the index for course_key.
@@ -419,6 +441,56 @@ class SplitBulkWriteMixin(BulkOperationsMixin):
             definition_guid = course_key.as_object_id(definition_guid)
             return self.db_connection.get_definition(definition_guid, course_key)
 
+    def get_definition_fields(self, course_key, definition_guid, field_names):
+        """
+        Return the given fields of the definition with the given id, as a dict of
+        those of them that the definition has, loading only those fields.
+
+        Definitions never change once saved, so the loaded fields are kept in a
+        small per-request cache, for the other blocks of the request that share
+        the definition. Fields too large for it, like big `data`, aren't kept.
+        """
+        fields_cache = self._get_definition_fields_cache()
+        fields = {}
+        missing_field_names = []
+        for field_name in field_names:
+            value = fields_cache.get((str(definition_guid), field_name), _NOT_CACHED)
+            if value is _NOT_CACHED:
+                missing_field_names.append(field_name)
+            elif value is not _NOT_IN_DEFINITION:
+                fields[field_name] = value
+        if not missing_field_names:
+            return fields
+
+        definition = None
+        bulk_write_record = self._get_bulk_ops_record(course_key)
+        if bulk_write_record.active:
+            definition = bulk_write_record.definitions.get(definition_guid)
+        if definition is None:
+            definition = self.db_connection.get_definition(
+                course_key.as_object_id(definition_guid), course_key, fields=missing_field_names
+            )
+        if definition is None:
+            return fields
+        for field_name in missing_field_names:
+            value = definition['fields'].get(field_name, _NOT_IN_DEFINITION)
+            fields_cache.set((str(definition_guid), field_name), value, sys.getsizeof(value))
+            if value is not _NOT_IN_DEFINITION:
+                fields[field_name] = value
+        return fields
+
+    def _get_definition_fields_cache(self):
+        """
+        Return the cache of the definition fields loaded field by field, which
+        only lasts for the current request.
+        """
+        request_cache = getattr(self, 'request_cache', None)
+        if request_cache is None:
+            return BoundedLRUCache(0)
+        if 'definition_fields_cache' not in request_cache.data:
+            request_cache.data['definition_fields_cache'] = BoundedLRUCache(DEFINITION_FIELDS_CACHE_SIZE_IN_BYTES)
+        return request_cache.data['definition_fields_cache']
+
     def get_definitions(self, course_key, ids):
         """
         Return all definitions that specified in ``ids``.
@@ -453,6 +525,30 @@ class SplitBulkWriteMixin(BulkOperationsMixin):
             definitions.extend(defs_from_db)
         return definitions
 
+    def find_definitions_by_id(self, ids):
+        """
+        Return all definitions specified in ``ids``, whichever courses they belong to.
+
+        If a definition with the same id is in both the cache and the database,
+        the cached version will be preferred.
+
+        Arguments:
+            ids (list): A list of definition ids
+        """
+        definitions = []
+        ids = set(ids)
+
+        for _, record in self._active_records:
+            for definition in record.definitions.values():
+                definition_id = definition.get('_id')
+                if definition_id in ids:
+                    ids.remove(definition_id)
+                    definitions.append(definition)
+
+        if ids:
+            definitions.extend(self.db_connection.get_definitions(list(ids)))
+        return definitions
+
     def update_definition(self, course_key, definition):
         """
         Update a definition, respecting the current bulk operation status
@@ -706,14 +802,20 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                  default_class=None,
                  error_tracker=null_error_tracker,
                  i18n_service=None, fs_service=None, user_service=None,
-                 services=None, signal_handler=None, **kwargs):
+                 services=None, signal_handler=None, field_level_definition_loading=False, **kwargs):
         """
         :param doc_store_config: must have a host, db, and collection entries. Other common entries: port, tz_aware.
+        :param field_level_definition_loading: whether lazily loaded definitions should only load the
+            content fields that are accessed, rather than the whole definition as soon as any is. Each
+            field then takes a query of its own (up to SplitMongoKVS.MAX_FIELD_LEVEL_LOADS per block,
+            unless another block of the request already loaded it), so this pays off where only a few
+            small content fields are read from blocks with large definitions, as in course outlines.
         """
 
         super().__init__(contentstore, **kwargs)
 
         self.db_connection = MongoConnection(**doc_store_config)
+        self.field_level_definition_loading = field_level_definition_loading
 
         if default_class is not None:
             module_path, __, class_name = default_class.rpartition('.')
@@ -762,7 +864,7 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
         self.db_connection._drop_database(database, collections, connections)  # pylint: disable=protected-access
 
-    def cache_items(self, system, base_block_ids, course_key, depth=0, lazy=True):
+    def cache_items(self, system, base_block_ids, course_key, depth=0, lazy=True, definitions=None):
         """
         Handles caching of items once inheritance and any other one time
         per course per fetch operations are done.
@@ -773,6 +875,8 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             course_key: the destination course providing the context
             depth: how deep below these to prefetch
             lazy: whether to load definitions now or later
+            definitions: already fetched definitions, by id, to load into the
+                blocks that use them regardless of lazy
         """
         with self.bulk_operations(course_key, emit_signals=False):
             new_module_data = {}
@@ -793,31 +897,41 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                     [
                         block.definition
                         for block in new_module_data.values()
+                        if not definitions or block.definition not in definitions
                     ]
                 )
                 # Turn definitions into a map.
-                definitions = {definition['_id']: definition
-                               for definition in descendent_definitions}
+                fetched_definitions = {definition['_id']: definition
+                                       for definition in descendent_definitions}
+                fetched_definitions.update(definitions or {})
+                definitions = fetched_definitions
 
-                for block in new_module_data.values():
+            if definitions:
+                for block_id, block in new_module_data.items():
                     if block.definition in definitions:
                         definition = definitions[block.definition]
+                        # The structure may be shared with other requests (see
+                        # StructureProcessCache), so load the definition into a copy of its block.
+                        block = copy.copy(block)
                         # convert_fields gets done later in the runtime's xblock_from_json
+                        block.fields = dict(block.fields)
                         block.fields.update(definition.get('fields'))
                         block.definition_loaded = True
+                        new_module_data[block_id] = block
 
             system.module_data.update(new_module_data)
             return system.module_data
 
-    def _load_items(self, course_entry, block_keys, depth=0, **kwargs):
+    def _load_items(self, course_entry, block_keys, depth=0, definitions=None, **kwargs):
         """
         Load & cache the given blocks from the course. May return the blocks in any order.
 
         Load the definitions into each block if lazy is in kwargs and is False;
         otherwise, do not load the definitions - they'll be loaded later when needed.
+        Already fetched `definitions`, by id, are loaded into the blocks either way.
         """
         lazy = kwargs.pop('lazy', True)
-        should_cache_items = not lazy
+        should_cache_items = not lazy or bool(definitions)
 
         runtime = self._get_cache(course_entry.structure['_id'])
         if runtime is None:
@@ -826,7 +940,7 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             should_cache_items = True
 
         if should_cache_items:
-            self.cache_items(runtime, block_keys, course_entry.course_key, depth, lazy)
+            self.cache_items(runtime, block_keys, course_entry.course_key, depth, lazy, definitions)
 
         with self.bulk_operations(course_entry.course_key, emit_signals=False):
             return [runtime.load_item(block_key, course_entry, **kwargs) for block_key in block_keys]
@@ -975,11 +1089,26 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         :param type locator_factory: Factory to create locator from structure info and branch
         """
         result = []
-        for entry, structure_info in self._get_structures_for_branch(branch, **kwargs):
+        entries = list(self._get_structures_for_branch(branch, **kwargs))
+
+        # Fetch the definitions of all the root blocks at once, rather than
+        # lazily loading them one courselike at a time.
+        root_definition_ids = {
+            entry['blocks'][entry['root']].definition
+            for entry, _ in entries
+            if entry['root'] in entry['blocks']
+        }
+        root_definition_ids.discard(None)
+        definitions = {
+            definition['_id']: definition
+            for definition in self.find_definitions_by_id(root_definition_ids)
+        } if root_definition_ids else {}
+
+        for entry, structure_info in entries:
             locator = locator_factory(structure_info, branch)
             envelope = CourseEnvelope(locator, entry)
             root = entry['root']
-            structures_list = self._load_items(envelope, [root], depth=0, **kwargs)
+            structures_list = self._load_items(envelope, [root], depth=0, definitions=definitions, **kwargs)
             if not isinstance(structures_list[0], ErrorBlock):
                 result.append(structures_list[0])
         return result
@@ -1016,6 +1145,9 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         Note, this is to find the current head of the named branch type.
         To get specific versions via guid use get_course.
 
+        Given `course_keys`, this fetches the indexes, structures and root
+        definitions of those courses in bulk, with a constant number of queries.
+
         :param branch: the branch for which to return courses.
         """
         # get the blocks for each course index (s/b the root)
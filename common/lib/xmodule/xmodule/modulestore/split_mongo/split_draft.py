@@ -234,7 +234,7 @@ class DraftVersioningModuleStore(SplitMongoModuleStore, ModuleStoreDraftAndPubli
                         parent_loc.block_type in DIRECT_ONLY_CATEGORIES
                     )
 
-            self._flag_publish_event(location.course_key)
+            self._flag_publish_event(location.course_key, location)
             for branch in branches_to_delete:
                 branched_location = location.for_branch(branch)
                 super().delete_item(branched_location, user_id)
@@ -372,20 +372,23 @@ class DraftVersioningModuleStore(SplitMongoModuleStore, ModuleStoreDraftAndPubli
         Publishes the subtree under location from the draft branch to the published branch
         Returns the newly published item.
         """
-        super().copy(
-            user_id,
-            # Directly using the replace function rather than the for_branch function
-            # because for_branch obliterates the version_guid and will lead to missed version conflicts.
-            # TODO Instead, the for_branch implementation should be fixed in the Opaque Keys library.
-            location.course_key.replace(branch=ModuleStoreEnum.BranchName.draft),
-            # We clear out the version_guid here because the location here is from the draft branch, and that
-            # won't have the same version guid
-            location.course_key.replace(branch=ModuleStoreEnum.BranchName.published, version_guid=None),
-            [location],
-            blacklist=blacklist
-        )
+        # Publish within a bulk operation, so that the course_published signal
+        # handlers can get the published changes.
+        with self.bulk_operations(location.course_key):
+            super().copy(
+                user_id,
+                # Directly using the replace function rather than the for_branch function
+                # because for_branch obliterates the version_guid and will lead to missed version conflicts.
+                # TODO Instead, the for_branch implementation should be fixed in the Opaque Keys library.
+                location.course_key.replace(branch=ModuleStoreEnum.BranchName.draft),
+                # We clear out the version_guid here because the location here is from the draft branch, and that
+                # won't have the same version guid
+                location.course_key.replace(branch=ModuleStoreEnum.BranchName.published, version_guid=None),
+                [location],
+                blacklist=blacklist
+            )
 
-        self._flag_publish_event(location.course_key)
+            self._flag_publish_event(location.course_key, location)
 
         return self.get_item(location.for_branch(ModuleStoreEnum.BranchName.published), **kwargs)
 
@@ -23,6 +23,10 @@ class SplitMongoKVS(InheritanceKeyValueStore):
 
     VALID_SCOPES = (Scope.parent, Scope.children, Scope.settings, Scope.content)
 
+    # When the definition is loaded field by field, the number of fields to load
+    # one at a time before loading all the remaining ones at once.
+    MAX_FIELD_LEVEL_LOADS = 3
+
     def __init__(self, definition, initial_values, default_values, parent, aside_fields=None, field_decorator=None):
         """
 
@@ -35,6 +39,8 @@ class SplitMongoKVS(InheritanceKeyValueStore):
         super().__init__(copy.deepcopy(initial_values))
         self._definition = definition  # either a DefinitionLazyLoader or the db id of the definition.
         # if the db id, then the definition is presumed to be loaded into _fields
+        # the content fields loaded so far, if the DefinitionLazyLoader loads them field by field
+        self._loaded_definition_fields = set()
 
         self._defaults = default_values
         # a decorator function for field values (to be called when a field is accessed)
@@ -78,7 +84,7 @@ class SplitMongoKVS(InheritanceKeyValueStore):
                     raise KeyError()
                 elif key.scope == Scope.content:
                     if isinstance(self._definition, DefinitionLazyLoader):
-                        self._load_definition()
+                        self._load_definition_field(key.field_name)
                     else:
                         raise KeyError()
                 else:
@@ -144,7 +150,10 @@ class SplitMongoKVS(InheritanceKeyValueStore):
             return False
 
         if key.scope == Scope.content:
-            self._load_definition()
+            if key.block_family == XBlockAside.entry_point:
+                self._load_definition()
+            else:
+                self._load_definition_field(key.field_name)
         elif key.scope == Scope.parent:
             return True
 
@@ -175,6 +184,25 @@ class SplitMongoKVS(InheritanceKeyValueStore):
         # If not, try inheriting from a parent, then use the XBlock type's normal default value:
         return super().default(key)
 
+    def _load_definition_field(self, field_name):
+        """
+        Update fields w/ the lazily loaded value of the given content field, if
+        the definition is loaded field by field, or else w/ the whole definition.
+
+        Loading field by field means that reading a small field doesn't also load
+        the large ones, like the xml or html `data` of problems and html blocks.
+        Once MAX_FIELD_LEVEL_LOADS fields have been loaded that way, the rest of
+        the definition is loaded at once.
+        """
+        if not isinstance(self._definition, DefinitionLazyLoader) or field_name in self._loaded_definition_fields:
+            return
+        if not self._definition.field_level or len(self._loaded_definition_fields) >= self.MAX_FIELD_LEVEL_LOADS:
+            self._load_definition()
+        else:
+            fields = self._definition.fetch_fields([field_name])
+            self._fields.update(self._definition.field_converter(fields))
+            self._loaded_definition_fields.add(field_name)
+
     def _load_definition(self):
         """
         Update fields w/ the lazily loaded definitions
@@ -8,6 +8,7 @@ import mimetypes
 import shutil
 import unittest
 from tempfile import mkdtemp
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
@@ -108,6 +109,25 @@ class TestContentstore(unittest.TestCase):
         # ensure deleting a non-existent file is a noop
         self.contentstore.delete(asset_key)
 
+    @ddt.data(True, False)
+    def test_writes_invalidate_cached_content(self, deprecated):
+        """
+        Test that writing an asset drops it from the contentserver cache
+        """
+        self.set_up_assets(deprecated)
+        asset_key = self.course1_key.make_asset_key('asset', self.course1_files[0])
+        with patch('xmodule.contentstore.mongo.del_cached_content') as mock_del_cached_content:
+            self.save_asset(self.course1_files[0], asset_key, self.course1_files[0], False)
+            mock_del_cached_content.assert_called_with(asset_key)
+            mock_del_cached_content.reset_mock()
+
+            self.contentstore.set_attr(asset_key, 'locked', True)
+            mock_del_cached_content.assert_called_once_with(asset_key)
+            mock_del_cached_content.reset_mock()
+
+            self.contentstore.delete(asset_key)
+            mock_del_cached_content.assert_called_once_with(asset_key)
+
     @ddt.data(True, False)
     def test_find(self, deprecated):
         """
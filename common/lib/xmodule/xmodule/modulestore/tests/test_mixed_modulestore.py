@@ -1053,6 +1053,37 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
             published_courses = self.store.get_courses(remove_branch=True)
         assert [c.id for c in draft_courses] == [c.id for c in published_courses]
 
+    # Draft:
+    #   1) find the course (1 course)
+    # Split:
+    #   1-3) active_versions, structures and root definitions of all the requested courses
+    @ddt.data((ModuleStoreEnum.Type.mongo, 1), (ModuleStoreEnum.Type.split, 3))
+    @ddt.unpack
+    def test_get_courses_by_keys(self, default_ms, max_find):
+        self.initdb(default_ms)
+        course_key = self.course_locations[self.MONGO_COURSEID].course_key
+        with check_mongo_calls(max_find):
+            courses = self.store.get_courses(course_keys=[course_key])
+        assert [course.id for course in courses] == [course_key]
+
+        other_course_key = self.store.make_course_key('Other', 'Course', 'Run')
+        assert self.store.get_courses(course_keys=[other_course_key]) == []
+        assert self.store.get_courses(course_keys=[]) == []
+
+    # Draft:
+    #   1) find the course summary
+    # Split:
+    #   1-2) active_versions and course blocks of the requested courses
+    # The other store isn't asked for courses that were already found.
+    @ddt.data((ModuleStoreEnum.Type.mongo, 1), (ModuleStoreEnum.Type.split, 2))
+    @ddt.unpack
+    def test_get_course_summaries_by_keys(self, default_ms, max_find):
+        self.initdb(default_ms)
+        course_key = self.course_locations[self.MONGO_COURSEID].course_key
+        with check_mongo_calls(max_find):
+            course_summaries = self.store.get_course_summaries(course_keys=[course_key])
+        assert [course_summary.id for course_summary in course_summaries] == [course_key]
+
     @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
     def test_create_child_detached_tabs(self, default_ms):
         """
@@ -34,6 +34,7 @@ from xmodule.modulestore.exceptions import (
 )
 from xmodule.modulestore.inheritance import InheritanceMixin
 from xmodule.modulestore.split_mongo import BlockKey
+from xmodule.modulestore.split_mongo.mongo_connection import StructureProcessCache
 from xmodule.modulestore.split_mongo.split import SplitMongoModuleStore
 from xmodule.modulestore.tests.factories import check_mongo_calls
 from xmodule.modulestore.tests.mongo_connection import MONGO_HOST, MONGO_PORT_NUM
@@ -1004,6 +1005,37 @@ class TestCourseStructureCache(SplitModuleTest):
         # now make sure that you get the same structure
         assert cached_structure == not_cached_structure
 
+    @patch('xmodule.modulestore.split_mongo.mongo_connection.get_cache')
+    def test_find_structures_by_id_cache(self, mock_get_cache):
+        mock_get_cache.return_value = self.cache
+        structure_id = self.new_course.location.as_object_id(self.new_course.location.version_guid)
+
+        with check_mongo_calls(1):
+            not_cached_structures = modulestore().db_connection.find_structures_by_id([structure_id])
+
+        # the structures found in the cache aren't queried again
+        with check_mongo_calls(0):
+            cached_structures = modulestore().db_connection.find_structures_by_id([structure_id])
+
+        assert cached_structures == not_cached_structures
+        assert [structure['_id'] for structure in cached_structures] == [structure_id]
+
+    @patch('xmodule.modulestore.split_mongo.mongo_connection.get_structure_process_cache')
+    def test_structure_process_cache(self, mock_get_process_cache):
+        process_cache = StructureProcessCache(max_blocks=1000)
+        mock_get_process_cache.return_value = process_cache
+
+        with check_mongo_calls(1):
+            not_cached_structure = self._get_structure(self.new_course)
+
+        # the decoded structure is kept in the process, even without the
+        # course_structure_cache
+        with check_mongo_calls(0):
+            cached_structure = self._get_structure(self.new_course)
+
+        assert cached_structure is not_cached_structure
+        assert process_cache.hits == 1
+
     def _get_structure(self, course):
         """
         Helper function to get a structure from a course.
@@ -6,7 +6,7 @@ Tests for bulk operations in Split Modulestore.
 
 import copy
 import unittest
-from unittest.mock import MagicMock, Mock, call
+from unittest.mock import MagicMock, Mock, call, patch
 
 import ddt
 from bson.objectid import ObjectId
@@ -466,6 +466,39 @@ class TestBulkWriteMixinFindMethods(TestBulkWriteMixin):
             else:
                 assert db_definition(_id) not in results
 
+    @ddt.data(
+        ([], [], []),
+        ([1, 2, 3], [1, 2], [1, 2]),
+        ([1, 2, 3], [1], [1, 2]),
+        ([1, 2, 3], [], [1, 2]),
+    )
+    @ddt.unpack
+    def test_find_definitions_by_id(self, search_ids, active_ids, db_ids):
+        db_definition = lambda _id: {'db': 'definition', '_id': _id}
+        active_definition = lambda _id: {'active': 'definition', '_id': _id}
+
+        db_definitions = [db_definition(_id) for _id in db_ids if _id not in active_ids]
+        for n, _id in enumerate(active_ids):
+            # the definitions may belong to different courses
+            course_key = CourseLocator('org', 'course', f'run{n}')
+            self.bulk._begin_bulk_operation(course_key)
+            self.bulk.update_definition(course_key, active_definition(_id))
+
+        self.conn.get_definitions.return_value = db_definitions
+        results = self.bulk.find_definitions_by_id(search_ids)
+        definitions_gotten = list(set(search_ids) - set(active_ids))
+        if len(definitions_gotten) > 0:
+            self.conn.get_definitions.assert_called_once_with(definitions_gotten)
+        else:
+            assert self.conn.get_definitions.call_count == 0
+        for _id in active_ids:
+            assert active_definition(_id) in results
+        for _id in db_ids:
+            if _id in search_ids and _id not in active_ids:
+                assert db_definition(_id) in results
+            else:
+                assert db_definition(_id) not in results
+
     def test_get_definitions_doesnt_update_db(self):
         test_ids = [1, 2]
         db_definition = lambda _id: {'db': 'definition', '_id': _id}
@@ -579,6 +612,56 @@ class TestBulkWriteMixinFindMethods(TestBulkWriteMixin):
         self.assertCountEqual(active_match + db_match, results)
 
 
+class TestBulkWriteMixinDefinitionFields(TestBulkWriteMixin):
+    """
+    Tests of BulkWriteMixin.get_definition_fields
+    """
+    def setUp(self):
+        super().setUp()
+        self.bulk.request_cache = Mock(data={})
+        self.definition = {'_id': ObjectId(), 'fields': {'data': '<problem/>', 'weight': 2}}
+        self.conn.get_definition.side_effect = lambda _id, course_key, fields: {
+            '_id': _id, 'fields': {name: self.definition['fields'][name] for name in fields
+                                   if name in self.definition['fields']},
+        }
+
+    def test_loads_only_requested_fields(self):
+        fields = self.bulk.get_definition_fields(self.course_key, self.definition['_id'], ['weight', 'markdown'])
+        assert fields == {'weight': 2}
+        self.conn.get_definition.assert_called_once_with(
+            self.definition['_id'], self.course_key, fields=['weight', 'markdown'],
+        )
+
+    def test_request_cache(self):
+        self.bulk.get_definition_fields(self.course_key, self.definition['_id'], ['weight', 'markdown'])
+        fields = self.bulk.get_definition_fields(self.course_key, self.definition['_id'], ['markdown', 'data'])
+        assert fields == {'data': '<problem/>'}
+        # only the fields that weren't loaded yet are loaded
+        assert self.conn.get_definition.call_count == 2
+        self.conn.get_definition.assert_called_with(self.definition['_id'], self.course_key, fields=['data'])
+
+        fields = self.bulk.get_definition_fields(self.course_key, self.definition['_id'], ['weight', 'data'])
+        assert fields == {'weight': 2, 'data': '<problem/>'}
+        assert self.conn.get_definition.call_count == 2
+
+    @patch('xmodule.modulestore.split_mongo.split.DEFINITION_FIELDS_CACHE_SIZE_IN_BYTES', 1000)
+    def test_request_cache_large_fields(self):
+        self.definition['fields']['data'] = '<problem>{}</problem>'.format('x' * 1000)
+        for _ in range(2):
+            fields = self.bulk.get_definition_fields(self.course_key, self.definition['_id'], ['weight', 'data'])
+            assert fields == self.definition['fields']
+        # the large field isn't cached
+        assert self.conn.get_definition.call_count == 2
+        self.conn.get_definition.assert_called_with(self.definition['_id'], self.course_key, fields=['data'])
+
+    def test_bulk_operation(self):
+        self.bulk._begin_bulk_operation(self.course_key)
+        self.bulk.update_definition(self.course_key, self.definition)
+        fields = self.bulk.get_definition_fields(self.course_key, self.definition['_id'], ['weight'])
+        assert fields == {'weight': 2}
+        assert not self.conn.get_definition.called
+
+
 @ddt.ddt
 class TestBulkWriteMixinOpen(TestBulkWriteMixin):
     """
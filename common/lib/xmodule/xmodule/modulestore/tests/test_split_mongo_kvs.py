@@ -0,0 +1,101 @@
+""" Test the lazy loading of definitions by split_mongo/SplitMongoKVS """
+
+
+import unittest
+from unittest.mock import Mock
+
+from bson.objectid import ObjectId
+from opaque_keys.edx.locator import CourseLocator
+from xblock.core import XBlock, XBlockAside
+from xblock.fields import Scope, ScopeIds
+from xblock.runtime import KeyValueStore
+
+from xmodule.modulestore.split_mongo.definition_lazy_loader import DefinitionLazyLoader
+from xmodule.modulestore.split_mongo.split_mongo_kvs import SplitMongoKVS
+
+
+class TestSplitMongoKVSDefinitionLoading(unittest.TestCase):
+    """
+    Test that SplitMongoKVS loads the definition when its content fields are accessed.
+    """
+    DEFINITION_FIELDS = {'data': '<problem/>', 'weight': 2, 'markdown': 'x', 'max_attempts': 1}
+
+    def setUp(self):
+        super().setUp()
+        self.modulestore = Mock()
+        self.modulestore.get_definition.return_value = {'fields': dict(self.DEFINITION_FIELDS)}
+        self.modulestore.get_definition_fields.side_effect = lambda course_key, definition_id, field_names: {
+            name: self.DEFINITION_FIELDS[name] for name in field_names if name in self.DEFINITION_FIELDS
+        }
+        self.definition_id = ObjectId()
+        self.scope_ids = ScopeIds(None, 'problem', self.definition_id, 'usage_id')
+
+    def _kvs(self, field_level):
+        loader = DefinitionLazyLoader(
+            self.modulestore,
+            CourseLocator('org', 'course', 'run'),
+            'problem',
+            self.definition_id,
+            lambda fields: fields,
+            field_level=field_level,
+        )
+        return SplitMongoKVS(loader, {'display_name': 'Problem'}, {}, parent=None)
+
+    def _key(self, field_name, scope=Scope.content, block_family=XBlock.entry_point):
+        return KeyValueStore.Key(scope, None, self.scope_ids, field_name, block_family)
+
+    def test_whole_definition(self):
+        kvs = self._kvs(field_level=False)
+        assert kvs.has(self._key('weight'))
+        assert kvs.get(self._key('data')) == '<problem/>'
+        assert self.modulestore.get_definition.call_count == 1
+        assert not self.modulestore.get_definition_fields.called
+
+    def test_field_level(self):
+        kvs = self._kvs(field_level=True)
+        assert kvs.get(self._key('display_name', Scope.settings)) == 'Problem'
+        assert not self.modulestore.get_definition_fields.called
+
+        assert kvs.has(self._key('weight'))
+        assert kvs.get(self._key('weight')) == 2
+        assert not kvs.has(self._key('unknown'))
+        assert self.modulestore.get_definition_fields.call_count == 2
+        assert not self.modulestore.get_definition.called
+
+    def test_field_level_outline_fields(self):
+        # reading the fields an outline shows doesn't load the problem's data
+        kvs = self._kvs(field_level=True)
+        assert kvs.get(self._key('display_name', Scope.settings)) == 'Problem'
+        assert kvs.get(self._key('weight')) == 2
+        loaded_field_names = [
+            field_name
+            for call in self.modulestore.get_definition_fields.call_args_list
+            for field_name in call[0][2]
+        ]
+        assert loaded_field_names == ['weight']
+        assert not self.modulestore.get_definition.called
+
+    def test_field_level_limit(self):
+        kvs = self._kvs(field_level=True)
+        for field_name in ('weight', 'markdown', 'max_attempts'):
+            assert kvs.has(self._key(field_name))
+        assert not self.modulestore.get_definition.called
+
+        # the rest of the definition is loaded at once
+        assert kvs.get(self._key('data')) == '<problem/>'
+        assert self.modulestore.get_definition_fields.call_count == SplitMongoKVS.MAX_FIELD_LEVEL_LOADS
+        assert self.modulestore.get_definition.call_count == 1
+
+    def test_field_level_write(self):
+        kvs = self._kvs(field_level=True)
+        kvs.has(self._key('weight'))
+        kvs.set(self._key('weight'), 3)
+        # writes load the whole definition first
+        assert self.modulestore.get_definition.call_count == 1
+        assert kvs.get(self._key('weight')) == 3
+        assert kvs.get(self._key('data')) == '<problem/>'
+
+    def test_field_level_asides(self):
+        kvs = self._kvs(field_level=True)
+        kvs.has(self._key('aside_field', block_family=XBlockAside.entry_point))
+        assert self.modulestore.get_definition.call_count == 1
@@ -8,7 +8,7 @@ import pytest
 from pymongo.errors import ConnectionFailure
 
 from xmodule.exceptions import HeartbeatFailure
-from xmodule.modulestore.split_mongo.mongo_connection import MongoConnection
+from xmodule.modulestore.split_mongo.mongo_connection import MongoConnection, StructureProcessCache
 
 
 class TestHeartbeatFailureException(unittest.TestCase):
@@ -24,3 +24,43 @@ class TestHeartbeatFailureException(unittest.TestCase):
 
             with pytest.raises(HeartbeatFailure):
                 useless_conn.heartbeat()
+
+
+class TestStructureProcessCache(unittest.TestCase):
+    """ Test the per-process LRU cache of decoded structures """
+
+    def _structure(self, num_blocks):
+        return {'blocks': {i: None for i in range(num_blocks)}}
+
+    def test_get_and_set(self):
+        cache = StructureProcessCache(max_blocks=10)
+        structure = self._structure(3)
+        assert cache.get('a') is None
+        cache.set('a', structure)
+        assert cache.get('a') is structure
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.hit_rate == 0.5
+
+    def test_evicts_least_recently_used(self):
+        cache = StructureProcessCache(max_blocks=10)
+        cache.set('a', self._structure(4))
+        cache.set('b', self._structure(4))
+        cache.get('a')
+        cache.set('c', self._structure(4))
+        assert cache.get('b') is None
+        assert cache.get('a') is not None
+        assert cache.get('c') is not None
+
+    def test_too_large(self):
+        cache = StructureProcessCache(max_blocks=10)
+        cache.set('a', self._structure(4))
+        cache.set('b', self._structure(11))
+        assert cache.get('b') is None
+        assert cache.get('a') is not None
+
+    def test_clear(self):
+        cache = StructureProcessCache(max_blocks=10)
+        cache.set('a', self._structure(4))
+        cache.clear()
+        assert cache.get('a') is None
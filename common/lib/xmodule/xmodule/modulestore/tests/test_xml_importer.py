@@ -3,6 +3,7 @@ Tests for XML importer.
 """
 
 
+import hashlib
 import importlib
 import os
 import unittest
@@ -332,6 +333,7 @@ class StaticContentImporterTest(unittest.TestCase):  # lint-amnesty, pylint: dis
     def setUp(self):  # lint-amnesty, pylint: disable=super-method-not-called
         self.course_data_path = path('/path')
         self.mocked_content_store = mock.Mock()
+        self.mocked_content_store.get_all_content_for_course.return_value = ([], 0)
         self.static_content_importer = StaticContentImporter(
             static_content_store=self.mocked_content_store,
             course_data_path=self.course_data_path,
@@ -373,3 +375,50 @@ class StaticContentImporterTest(unittest.TestCase):  # lint-amnesty, pylint: dis
             )
             mock_file.assert_called_with(full_file_path, 'rb')
             self.mocked_content_store.generate_thumbnail.assert_called_once()
+
+    def test_import_unchanged_static_file(self):
+        static_dir = self.course_data_path / 'static'
+        asset_key = self.static_content_importer.target_id.make_asset_key('asset', 'some_file.txt')
+        self.mocked_content_store.get_all_content_for_course.return_value = ([{
+            'asset_key': asset_key,
+            'md5': hashlib.md5(b'data').hexdigest(),
+            'displayname': 'some_file.txt',
+            'contentType': 'text/plain',
+            'import_path': 'some_file.txt',
+        }], 1)
+        with mock.patch(
+            'xmodule.modulestore.xml_importer.os.walk',
+            return_value=[(static_dir, None, ['some_file.txt'])]
+        ), mock.patch(OPEN_BUILTIN, mock.mock_open(read_data=b"data")):
+            remap_dict = self.static_content_importer.import_static_content_directory('static')
+        assert remap_dict == {'some_file.txt': asset_key}
+        self.mocked_content_store.save.assert_not_called()
+
+        with mock.patch(
+            'xmodule.modulestore.xml_importer.os.walk',
+            return_value=[(static_dir, None, ['some_file.txt'])]
+        ), mock.patch(OPEN_BUILTIN, mock.mock_open(read_data=b"new data")):
+            self.static_content_importer.import_static_content_directory('static')
+        self.mocked_content_store.save.assert_called_once()
+
+    def test_import_static_content_directory_thumbnails(self):
+        static_dir = self.course_data_path / 'static'
+        thumbnail_location = self.static_content_importer.target_id.make_asset_key('thumbnail', 'image.jpg')
+        self.mocked_content_store.generate_thumbnail.return_value = (mock.Mock(), thumbnail_location)
+        # mock_open isn't thread-safe
+        self.static_content_importer.max_workers = 1
+        with mock.patch(
+            'xmodule.modulestore.xml_importer.os.walk',
+            return_value=[(static_dir, None, ['image.png', 'file.txt'])]
+        ), mock.patch(OPEN_BUILTIN, mock.mock_open(read_data=b"data")):
+            self.static_content_importer.import_static_content_directory('static')
+
+        # thumbnails are generated after the files are saved, for images only
+        assert self.mocked_content_store.save.call_count == 2
+        self.mocked_content_store.generate_thumbnail.assert_called_once()
+        thumbnail_source = self.mocked_content_store.generate_thumbnail.call_args[0][0]
+        assert thumbnail_source.name == 'image.png'
+        assert thumbnail_source.data == b'data'
+        self.mocked_content_store.set_attr.assert_called_once_with(
+            thumbnail_source.location, 'thumbnail_location', thumbnail_location.to_deprecated_list_repr()
+        )
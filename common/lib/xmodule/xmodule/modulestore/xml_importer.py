@@ -21,12 +21,14 @@ Modulestore virtual   |          XML physical (draft, published)
              (a, b)   |  (a, b) | (x, b) | (x, x) | (x, y) | (a, x)
 """
 
+import hashlib
 import json
 import logging
 import mimetypes
 import os
 import re
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 import xblock
 from django.utils.translation import ugettext as _
@@ -60,6 +62,9 @@ log = logging.getLogger(__name__)
 
 DEFAULT_STATIC_CONTENT_SUBDIR = 'static'
 
+# The number of threads reading, hashing and saving static files in parallel.
+STATIC_CONTENT_IMPORT_WORKERS = 8
+
 
 class CourseImportException(Exception):
     """
@@ -116,11 +121,20 @@ class LocationMixin(XBlockMixin):
         )
 
 
-class StaticContentImporter:  # lint-amnesty, pylint: disable=missing-class-docstring
-    def __init__(self, static_content_store, course_data_path, target_id):
+class StaticContentImporter:
+    """
+    Imports the files of a course's static directories into the contentstore.
+
+    Files are read, hashed and saved by a pool of threads.  Files whose
+    content and attributes are the same as those of the asset already in the
+    contentstore are not saved again, and thumbnails of the images that are
+    saved are generated once all the files have been saved.
+    """
+    def __init__(self, static_content_store, course_data_path, target_id, max_workers=STATIC_CONTENT_IMPORT_WORKERS):
         self.static_content_store = static_content_store
         self.target_id = target_id
         self.course_data_path = course_data_path
+        self.max_workers = max_workers
         try:
             with open(course_data_path / 'policies/assets.json') as f:
                 self.policy = json.load(f)
@@ -133,10 +147,17 @@ class StaticContentImporter:  # lint-amnesty, pylint: disable=missing-class-docs
         mimetypes.add_type('application/octet-stream', '.srt')
         self.mimetypes_list = list(mimetypes.types_map.values())
 
+        # While importing a directory: the assets already in the contentstore,
+        # by asset key, and the saved contents whose thumbnails are to be
+        # generated, with the path of their file.
+        self._existing_assets = None
+        self._deferred_thumbnails = None
+
     def import_static_content_directory(self, content_subdir=DEFAULT_STATIC_CONTENT_SUBDIR, verbose=False):  # lint-amnesty, pylint: disable=missing-function-docstring
         remap_dict = {}
 
         static_dir = self.course_data_path / content_subdir
+        file_paths = []
         for dirname, _, filenames in os.walk(static_dir):
             for filename in filenames:
 
@@ -147,15 +168,31 @@ class StaticContentImporter:  # lint-amnesty, pylint: disable=missing-class-docs
                         log.debug('skipping static content %s...', file_path)
                     continue
 
-                if verbose:
-                    log.debug('importing static content %s...', file_path)
+                file_paths.append(file_path)
+
+        if not file_paths:
+            return remap_dict
 
-                imported_file_attrs = self.import_static_file(file_path, base_dir=static_dir)
+        def import_file(file_path):
+            if verbose:
+                log.debug('importing static content %s...', file_path)
+            return self.import_static_file(file_path, base_dir=static_dir)
 
-                if imported_file_attrs:
-                    # store the remapping information which will be needed
-                    # to subsitute in the module data
-                    remap_dict[imported_file_attrs[0]] = imported_file_attrs[1]
+        self._existing_assets = self._get_existing_assets()
+        self._deferred_thumbnails = []
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for imported_file_attrs in executor.map(import_file, file_paths):
+                    if imported_file_attrs:
+                        # store the remapping information which will be needed
+                        # to subsitute in the module data
+                        remap_dict[imported_file_attrs[0]] = imported_file_attrs[1]
+
+                # then generate the thumbnails of the saved images
+                list(executor.map(self._save_thumbnail, self._deferred_thumbnails))
+        finally:
+            self._existing_assets = None
+            self._deferred_thumbnails = None
 
         return remap_dict
 
@@ -193,14 +230,18 @@ class StaticContentImporter:  # lint-amnesty, pylint: disable=missing-class-docs
             mime_type = mimetypes.guess_type(filename)[0]  # Assign guessed mimetype
         content = StaticContent(
             asset_key, displayname, mime_type, data,
-            import_path=file_subpath, locked=locked
+            import_path=file_subpath, locked=locked, content_digest=hashlib.md5(data).hexdigest()
         )
 
-        # first let's save a thumbnail so we can get back a thumbnail location
-        thumbnail_content, thumbnail_location = self.static_content_store.generate_thumbnail(content)
+        if self._is_unchanged(content):
+            return file_subpath, asset_key
+
+        if self._deferred_thumbnails is None:
+            # first let's save a thumbnail so we can get back a thumbnail location
+            thumbnail_content, thumbnail_location = self.static_content_store.generate_thumbnail(content)
 
-        if thumbnail_content is not None:
-            content.thumbnail_location = thumbnail_location
+            if thumbnail_content is not None:
+                content.thumbnail_location = thumbnail_location
 
         # then commit the content
         try:
@@ -209,9 +250,57 @@ class StaticContentImporter:  # lint-amnesty, pylint: disable=missing-class-docs
             msg = f'Error importing {file_subpath}, error={err}'
             log.exception(f'Course import {self.target_id}: {msg}')
             monitor_import_failure(self.target_id, 'Updating', exception=err)
+        else:
+            if self._deferred_thumbnails is not None and mime_type and mime_type.split('/')[0] == 'image':
+                self._deferred_thumbnails.append((content.copy_metadata(), full_file_path))
 
         return file_subpath, asset_key
 
+    def _get_existing_assets(self):
+        """
+        Returns the attributes of the assets of the target course already in
+        the contentstore, by asset key.
+        """
+        assets, __ = self.static_content_store.get_all_content_for_course(self.target_id)
+        return {asset['asset_key']: asset for asset in assets}
+
+    def _is_unchanged(self, content):
+        """
+        Returns whether the asset of the content is already in the
+        contentstore with the same data and attributes.
+        """
+        if not self._existing_assets:
+            return False
+        existing_asset = self._existing_assets.get(content.location)
+        return existing_asset is not None and existing_asset.get('md5') == content.content_digest and (
+            existing_asset.get('displayname'),
+            existing_asset.get('contentType'),
+            existing_asset.get('locked', False),
+            existing_asset.get('import_path'),
+        ) == (content.name, content.content_type, content.locked, content.import_path)
+
+    def _save_thumbnail(self, deferred_thumbnail):
+        """
+        Generates the thumbnail of a saved content from its file, and sets its
+        location on the asset.
+        """
+        content, full_file_path = deferred_thumbnail
+        try:
+            with open(full_file_path, 'rb') as f:
+                content = StaticContent(
+                    content.location, content.name, content.content_type, f.read(),
+                    import_path=content.import_path, locked=content.locked,
+                )
+            thumbnail_content, thumbnail_location = self.static_content_store.generate_thumbnail(content)
+            if thumbnail_content is not None:
+                self.static_content_store.set_attr(
+                    content.location, 'thumbnail_location', thumbnail_location.to_deprecated_list_repr()
+                )
+        except Exception as err:  # lint-amnesty, pylint: disable=broad-except
+            msg = f'Error generating the thumbnail of {content.import_path}, error={err}'
+            log.exception(f'Course import {self.target_id}: {msg}')
+            monitor_import_failure(self.target_id, 'Updating', exception=err)
+
 
 class ImportManager:
     """
@@ -206,6 +206,23 @@ class ContentTest(unittest.TestCase):  # lint-amnesty, pylint: disable=missing-c
 
         assert total_length == ((last_byte - first_byte) + 1)
 
+    def test_static_content_stream_data_in_range(self):
+        """
+        Test StaticContent stream_data_in_range function, for content in memory
+        """
+        static_content = StaticContent('loc', 'name', 'type', SAMPLE_STRING, length=len(SAMPLE_STRING))
+        assert ''.join(static_content.stream_data_in_range(100, 1500)) == SAMPLE_STRING[100:1501]
+
+    def test_static_content_copy_metadata(self):
+        """
+        Test that StaticContent copy_metadata drops the data of the content
+        """
+        static_content = StaticContent('loc', 'name', 'type', SAMPLE_STRING, length=len(SAMPLE_STRING), locked=True)
+        metadata = static_content.copy_metadata()
+        assert metadata.data is None
+        assert metadata.length == static_content.length
+        assert metadata.locked
+
     def test_static_content_write_js(self):
         """
         Test that only one filename starts with 000.
@@ -38,6 +38,7 @@ class IgnoredFilesTestCase(unittest.TestCase):
         """
         course_id = CourseLocator("edX", "course_ignore", "2014_Fall")
         content_store = Mock()
+        content_store.get_all_content_for_course.return_value = ([], 0)
         content_store.generate_thumbnail.return_value = ("content", "location")
         static_content_importer = StaticContentImporter(
             static_content_store=content_store,
@@ -3,6 +3,12 @@
 import re
 
 from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import MiddlewareNotUsed
+from edx_django_utils.monitoring import set_custom_attribute
+
+from capa.safe_exec import SafeExecResultCache, SqliteResultStore, worker_pool
+from openedx.core.lib.cache_utils import process_cached
 
 DEFAULT_PYTHON_LIB_FILENAME = 'python_lib.zip'
 
@@ -41,3 +47,67 @@ def get_python_lib_zip(contentstore, course_id):
         return zip_lib.data
     else:
         return None
+
+
+@process_cached
+def get_safe_exec_result_cache():
+    """
+    Return this process's cache for the results of sandboxed code, as
+    configured by the SAFE_EXEC_RESULT_CACHE setting.
+
+    The shared tier is the Django cache named by SHARED_CACHE.  The local,
+    on-disk tier is only used if LOCAL_PATH is set.
+
+    The returned cache is shared by all the threads of the process, so it
+    can't hold on to a Django cache object, which belongs to one thread.
+    """
+    config = getattr(settings, 'SAFE_EXEC_RESULT_CACHE', {})
+    local_store = None
+    if config.get('LOCAL_PATH'):
+        local_store = SqliteResultStore(config['LOCAL_PATH'], config.get('LOCAL_MAX_SIZE_IN_BYTES', 100 * 1024 * 1024))
+    return SafeExecResultCache(
+        local_store=local_store,
+        shared_cache=_NamedCache(config.get('SHARED_CACHE', 'default')),
+        shared_timeout=config.get('SHARED_TIMEOUT'),
+        on_lookup=_record_safe_exec_cache_lookup,
+    )
+
+
+class _NamedCache:
+    """
+    Proxy to the Django cache with the given name, looked up on every use so
+    that each thread uses its own cache client.
+    """
+    def __init__(self, name):
+        self.name = name
+
+    def get(self, key):
+        return caches[self.name].get(key)
+
+    def set(self, key, value, *args):
+        caches[self.name].set(key, value, *args)
+
+
+def _record_safe_exec_cache_lookup(tier):
+    """
+    Record which tier of the safe_exec result cache answered the last lookup.
+    """
+    set_custom_attribute('safe_exec_cache_lookup', tier)
+
+
+class ConfigureSandboxWorkerPoolMiddleware:
+    """
+    Configure the pool of warm sandbox workers used by safe_exec, as set by
+    the CODE_JAIL_WORKER_POOL setting.
+
+    Like codejail's ConfigureCodeJailMiddleware, this only runs once, when
+    the middleware is loaded, and must come after it.
+    """
+    def __init__(self, get_response=None):  # lint-amnesty, pylint: disable=unused-argument
+        config = getattr(settings, 'CODE_JAIL_WORKER_POOL', {})
+        worker_pool.configure(
+            size=config.get('SIZE', 0),
+            max_jobs_per_worker=config.get('MAX_JOBS_PER_WORKER', 100),
+            max_rss_in_bytes=config.get('MAX_RSS_IN_BYTES'),
+        )
+        raise MiddlewareNotUsed
@@ -4,6 +4,8 @@ Models for bulk email
 
 
 import logging
+import re
+import string
 
 import markupsafe
 from config_models.models import ConfigurationModel
@@ -14,7 +16,7 @@ from opaque_keys.edx.django.models import CourseKeyField
 
 from common.djangoapps.course_modes.models import CourseMode
 from common.djangoapps.student.roles import CourseInstructorRole, CourseStaffRole
-from common.djangoapps.util.keyword_substitution import substitute_keywords_with_data
+from common.djangoapps.util.keyword_substitution import anonymous_id_from_user_id, substitute_keywords_with_data
 from common.djangoapps.util.query import use_read_replica_if_available
 from openedx.core.djangoapps.course_groups.cohorts import get_cohort_by_name
 from openedx.core.djangoapps.course_groups.models import CourseUserGroup
@@ -393,6 +395,14 @@ class CourseEmailTemplate(models.Model):
         of settings.DEFAULT_CHARSET to encode the message.
         """
 
+        # finally, return the result, after wrapping long lines and without converting to an encoded byte array.
+        return wrap_message(CourseEmailTemplate._render_unwrapped(format_string, message_body, context))
+
+    @staticmethod
+    def _render_unwrapped(format_string, message_body, context):
+        """
+        Same as `_render`, without wrapping the long lines of the result.
+        """
         # Substitute all %%-encoded keywords in the message body
         if 'user_id' in context and 'course_id' in context:
             message_body = substitute_keywords_with_data(message_body, context)
@@ -403,10 +413,7 @@ class CourseEmailTemplate(models.Model):
         # "formatted", so we need to do the same to the tag being
         # searched for.
         message_body_tag = COURSE_EMAIL_MESSAGE_BODY_TAG.format()
-        result = result.replace(message_body_tag, message_body, 1)
-
-        # finally, return the result, after wrapping long lines and without converting to an encoded byte array.
-        return wrap_message(result)
+        return result.replace(message_body_tag, message_body, 1)
 
     def render_plaintext(self, plaintext, context):
         """
@@ -430,6 +437,122 @@ class CourseEmailTemplate(models.Model):
                 context[key] = markupsafe.escape(value)
         return CourseEmailTemplate._render(self.html_template, htmltext, context)
 
+    def compile_plaintext(self, plaintext, context):
+        """
+        Create a plain text message to be rendered for many recipients.
+
+        `context` holds the values shared by all the recipients, the
+        returned CompiledCourseEmail renders the message for each of them.
+        """
+        return CompiledCourseEmail(self.plain_template, plaintext, context, html=False)
+
+    def compile_htmltext(self, htmltext, context):
+        """
+        Create an HTML message to be rendered for many recipients.
+
+        `context` holds the values shared by all the recipients, the
+        returned CompiledCourseEmail renders the message for each of them.
+        """
+        return CompiledCourseEmail(self.html_template, htmltext, context, html=True)
+
+
+class CompiledCourseEmail:
+    """
+    A course email message rendered once for all of its recipients.
+
+    Rendering the template with placeholders for the values that differ
+    between recipients leaves the message split into text that is the same
+    for all of them and slots for those values, so that rendering it for a
+    recipient only takes filling the slots in.
+
+    Templates that use the recipient values in a way this can't reproduce
+    (e.g. with a format spec) are rendered in full for each recipient.
+    """
+    # The context keys that differ between recipients.
+    RECIPIENT_KEYS = ('name', 'email', 'user_id', 'unsubscribe_link')
+
+    # The keywords of the message body that differ between recipients,
+    # with the key of their value.
+    RECIPIENT_KEYWORDS = {
+        '%%USER_ID%%': 'anonymous_user_id',
+        '%%USER_FULLNAME%%': 'name',
+    }
+
+    SLOT = '\x00{}\x00'
+    SLOT_PATTERN = re.compile(r'\x00(\w+)\x00')
+
+    def __init__(self, format_string, message_body, context, html=False):
+        self.format_string = format_string
+        self.message_body = message_body
+        self.context = context
+        self.html = html
+        self.segments = self._compile()
+
+    def render(self, recipient_context):
+        """
+        Returns the message for the recipient whose values are in
+        `recipient_context`.
+        """
+        if self.segments is None:
+            context = dict(self.context, **recipient_context)
+            if self.html:
+                context = {key: self._escape(value) for key, value in context.items()}
+            return CourseEmailTemplate._render(  # pylint: disable=protected-access
+                self.format_string, self.message_body, context
+            )
+
+        parts = list(self.segments)
+        # Slots are at odd indexes, between the fixed segments.
+        for index in range(1, len(parts), 2):
+            key = parts[index]
+            if key == 'anonymous_user_id':
+                parts[index] = str(anonymous_id_from_user_id(recipient_context['user_id']))
+            elif self.html:
+                parts[index] = str(self._escape(recipient_context[key]))
+            else:
+                parts[index] = str(recipient_context[key])
+        return wrap_message(''.join(parts))
+
+    def _compile(self):
+        """
+        Renders the message with slots for the recipient values, and returns
+        it split into fixed segments and slot keys, or None if it can't be.
+        """
+        texts = [self.format_string, self.message_body or '']
+        texts.extend(value for value in self.context.values() if isinstance(value, str))
+        if any('\x00' in text for text in texts):
+            return None
+        for _, field_name, format_spec, conversion in string.Formatter().parse(self.format_string):
+            if field_name is None:
+                continue
+            if format_spec and '{' in format_spec:
+                return None
+            key = re.split(r'[.[]', field_name, maxsplit=1)[0]
+            if key in self.RECIPIENT_KEYS and (field_name != key or format_spec or conversion):
+                return None
+
+        context = dict(self.context, **{key: self.SLOT.format(key) for key in self.RECIPIENT_KEYS})
+        if self.html:
+            context = {key: self._escape(value) for key, value in context.items()}
+
+        message_body = self.message_body
+        # The recipient keywords are only substituted when the others are.
+        if 'course_id' in context and context.get('course_title') is not None:
+            for keyword, key in self.RECIPIENT_KEYWORDS.items():
+                message_body = message_body.replace(keyword, self.SLOT.format(key))
+
+        result = CourseEmailTemplate._render_unwrapped(  # pylint: disable=protected-access
+            self.format_string, message_body, context
+        )
+        return self.SLOT_PATTERN.split(result)
+
+    @staticmethod
+    def _escape(value):
+        """
+        HTML-escapes string values, like `render_htmltext` does.
+        """
+        return markupsafe.escape(value) if isinstance(value, str) else value
+
 
 @python_2_unicode_compatible
 class CourseAuthorization(models.Model):
@@ -49,7 +49,7 @@ from lms.djangoapps.instructor_task.models import InstructorTask
 from lms.djangoapps.instructor_task.subtasks import (
     SubtaskStatus,
     check_subtask_is_valid,
-    queue_subtasks_for_query,
+    queue_subtasks_for_id_ranges,
     update_subtask_status
 )
 from openedx.core.djangoapps.site_configuration import helpers as configuration_helpers
@@ -57,6 +57,9 @@ from openedx.core.lib.courses import course_image_url
 
 log = logging.getLogger('edx.celery.task')
 
+# The fields of the recipients of an email that are passed to _send_course_email, in addition to 'pk'.
+RECIPIENT_FIELDS = ['profile__name', 'email', 'username']
+
 # Errors that an individual email is failing to be sent, and should just
 # be treated as a fail.
 SINGLE_EMAIL_FAILURE_ERRORS = (
@@ -178,18 +181,8 @@ def perform_delegate_email_batches(entry_id, course_id, task_input, action_name)
     course = get_course(course_id)
 
     # Get arguments that will be passed to every subtask.
-    targets = email_obj.targets.all()
     global_email_context = _get_course_email_context(course)
-
-    recipient_qsets = [
-        target.get_users(course_id, user_id)
-        for target in targets
-    ]
-    # Use union here to combine the qsets instead of the | operator.  This avoids generating an
-    # inefficient OUTER JOIN query that would read the whole user table.
-    combined_set = recipient_qsets[0].union(*recipient_qsets[1:]) if len(recipient_qsets) > 1 \
-        else recipient_qsets[0]
-    recipient_fields = ['profile__name', 'email', 'username']
+    combined_set = _get_recipient_queryset(email_obj, user_id)
 
     log.info("Task %s: Preparing to queue subtasks for sending emails for course %s, email %s",
              task_id, course_id, email_id)
@@ -203,14 +196,15 @@ def perform_delegate_email_batches(entry_id, course_id, task_input, action_name)
         log.warning(msg)
         raise ValueError(msg)
 
-    def _create_send_email_subtask(to_list, initial_subtask_status):
-        """Creates a subtask to send email to a given recipient list."""
+    def _create_send_email_subtask(recipient_id_range, initial_subtask_status):
+        """Creates a subtask to send email to the recipients with ids in the given range."""
         subtask_id = initial_subtask_status.task_id
+        min_id, max_id = recipient_id_range
         new_subtask = send_course_email.subtask(
             (
                 entry_id,
                 email_id,
-                to_list,
+                {'min_id': min_id, 'max_id': max_id},
                 global_email_context,
                 initial_subtask_status.to_dict(),
             ),
@@ -218,12 +212,11 @@ def perform_delegate_email_batches(entry_id, course_id, task_input, action_name)
         )
         return new_subtask
 
-    progress = queue_subtasks_for_query(
+    progress = queue_subtasks_for_id_ranges(
         entry,
         action_name,
         _create_send_email_subtask,
         [combined_set],
-        recipient_fields,
         settings.BULK_EMAIL_EMAILS_PER_TASK,
         total_recipients,
     )
@@ -236,6 +229,34 @@ def perform_delegate_email_batches(entry_id, course_id, task_input, action_name)
     return progress
 
 
+def _get_recipient_queryset(course_email, user_id, min_id=None, max_id=None):
+    """
+    Returns the queryset of the users the email is to be sent to, as requested by the user with `user_id`.
+
+    If `min_id` and `max_id` are given, only the users with ids between them (including both) are returned.
+    """
+    recipient_qsets = []
+    for target in course_email.targets.all():
+        recipient_qset = target.get_users(course_email.course_id, user_id)
+        if min_id is not None and max_id is not None:
+            recipient_qset = recipient_qset.filter(pk__gte=min_id, pk__lte=max_id)
+        recipient_qsets.append(recipient_qset)
+    # Use union here to combine the qsets instead of the | operator.  This avoids generating an
+    # inefficient OUTER JOIN query that would read the whole user table.
+    return recipient_qsets[0].union(*recipient_qsets[1:]) if len(recipient_qsets) > 1 else recipient_qsets[0]
+
+
+def _get_recipients_in_id_range(entry_id, email_id, min_id, max_id):
+    """
+    Returns the list of recipients of the email with ids between `min_id` and `max_id`, in the form
+    expected by _send_course_email.
+    """
+    entry = InstructorTask.objects.get(pk=entry_id)
+    course_email = CourseEmail.objects.get(id=email_id)
+    recipient_qset = _get_recipient_queryset(course_email, entry.requester_id, min_id, max_id)
+    return list(recipient_qset.values(*RECIPIENT_FIELDS, 'pk'))
+
+
 @shared_task(default_retry_delay=settings.BULK_EMAIL_DEFAULT_RETRY_DELAY, max_retries=settings.BULK_EMAIL_MAX_RETRIES)
 @set_code_owner_attribute
 def send_course_email(entry_id, email_id, to_list, global_email_context, subtask_status_dict):
@@ -249,6 +270,9 @@ def send_course_email(entry_id, email_id, to_list, global_email_context, subtask
         - 'profile__name': full name of User.
         - 'email': email address of User.
         - 'pk': primary key of User model.
+        Alternatively, a dict with the 'min_id' and 'max_id' of the recipients, who are then
+        queried from the email's targets.  Subtasks are first queued this way, and retried with
+        the list of the recipients that remain.
       * `global_email_context`: dict containing values that are unique for this email but the same
         for all recipients of this email.  This dict is to be used to fill in slots in email
         template.  It does not include 'name' and 'email', which will be provided by the to_list.
@@ -274,6 +298,9 @@ def send_course_email(entry_id, email_id, to_list, global_email_context, subtask
     """
     subtask_status = SubtaskStatus.from_dict(subtask_status_dict)
     current_task_id = subtask_status.task_id
+    if isinstance(to_list, dict):
+        # The subtask was queued with the range of the ids of its recipients.
+        to_list = _get_recipients_in_id_range(entry_id, email_id, to_list['min_id'], to_list['max_id'])
     num_to_send = len(to_list)
     log.info(("Preparing to send email %s to %d recipients as subtask %s "
               "for instructor task %d: context = %s, status=%s, time=%s"),
@@ -510,9 +537,11 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
         connection = get_connection()
         connection.open()
 
-        # Define context values to use in all course emails:
-        email_context = {'name': '', 'email': ''}
-        email_context.update(global_email_context)
+        # Define context values to use in all course emails, and render the
+        # parts of the messages that are the same for all the recipients once:
+        email_context = dict(global_email_context, course_id=course_email.course_id)
+        plaintext_template = course_email_template.compile_plaintext(course_email.text_message, email_context)
+        html_template = course_email_template.compile_htmltext(course_email.html_message, email_context)
 
         start_time = time.time()
         while to_list:
@@ -537,16 +566,17 @@ def _send_course_email(entry_id, email_id, to_list, global_email_context, subtas
                 subtask_status.increment(failed=1)
                 continue
 
-            email_context['email'] = email
-            email_context['name'] = current_recipient['profile__name']
-            email_context['user_id'] = current_recipient['pk']
-            email_context['course_id'] = course_email.course_id
-            email_context['unsubscribe_link'] = get_unsubscribed_link(current_recipient['username'],
-                                                                      str(course_email.course_id))
-
-            # Construct message content using templates and context:
-            plaintext_msg = course_email_template.render_plaintext(course_email.text_message, email_context)
-            html_msg = course_email_template.render_htmltext(course_email.html_message, email_context)
+            recipient_context = {
+                'email': email,
+                'name': current_recipient['profile__name'],
+                'user_id': current_recipient['pk'],
+                'unsubscribe_link': get_unsubscribed_link(current_recipient['username'],
+                                                          str(course_email.course_id)),
+            }
+
+            # Construct message content by filling the recipient's values in:
+            plaintext_msg = plaintext_template.render(recipient_context)
+            html_msg = html_template.render(recipient_context)
 
             # Create email:
             email_msg = EmailMultiAlternatives(
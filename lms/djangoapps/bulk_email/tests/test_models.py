@@ -270,6 +270,35 @@ class CourseEmailTemplateTest(TestCase):
         assert context['course_title'] in message
         assert context['name'] in message
 
+    def test_compiled_messages(self):
+        template = CourseEmailTemplate.get_template()
+        context = self._get_sample_html_context()
+        context['course_id'] = "course-v1:edx+100+1"
+        body = "Dear %%USER_FULLNAME%%, thanks for enrolling in %%COURSE_DISPLAY_NAME%%."
+        compiled_plaintext = template.compile_plaintext(body, context)
+        compiled_htmltext = template.compile_htmltext(body, context)
+        assert compiled_plaintext.segments is not None
+        assert compiled_htmltext.segments is not None
+
+        for name in ("Profile Name", "<script>alert('Profile Name!');</alert>", "Long Name" * 200):
+            recipient_context = {
+                'name': name,
+                'email': 'your-email@test.com',
+                'user_id': 12345,
+                'unsubscribe_link': '/bulk_email/email/optout/dummy',
+            }
+            assert compiled_plaintext.render(recipient_context) == \
+                template.render_plaintext(body, dict(context, **recipient_context))
+            assert compiled_htmltext.render(recipient_context) == \
+                template.render_htmltext(body, dict(context, **recipient_context))
+
+    def test_compiled_message_fallback(self):
+        template = CourseEmailTemplate(plain_template="Dear {name:>20},\n{{message_body}}")
+        context = self._get_sample_plain_context()
+        compiled = template.compile_plaintext("My new plain text.", context)
+        assert compiled.segments is None
+        assert compiled.render({'name': 'Profile Name'}) == "Dear         Profile Name,\nMy new plain text."
+
 
 class CourseAuthorizationTest(TestCase):
     """Test the CourseAuthorization model."""
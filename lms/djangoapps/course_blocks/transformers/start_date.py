@@ -34,6 +34,7 @@ class StartDateTransformer(FilteringTransformerMixin, BlockStructureTransformer)
     """
     WRITE_VERSION = 1
     READ_VERSION = 1
+    SUPPORTS_INCREMENTAL_COLLECT = True
     MERGED_START_DATE = 'merged_start_date'
 
     @classmethod
@@ -77,6 +78,15 @@ class StartDateTransformer(FilteringTransformerMixin, BlockStructureTransformer)
         Collects any information that's necessary to execute this
         transformer's transform method.
         """
+        cls.collect_incrementally(block_structure, block_keys=None)
+
+    @classmethod
+    def collect_incrementally(cls, block_structure, block_keys):
+        """
+        Collects the merged start date of only the given blocks.  Since it
+        only depends on the blocks' ancestors, the merged start date of all
+        other blocks is unaffected.
+        """
         block_structure.request_xblock_fields('days_early_for_beta')
 
         collect_merged_date_field(
@@ -87,6 +97,7 @@ class StartDateTransformer(FilteringTransformerMixin, BlockStructureTransformer)
             default_date=DEFAULT_START_DATE,
             func_merge_parents=min,
             func_merge_ancestors=max,
+            block_keys=block_keys,
         )
 
     def transform_block_filters(self, usage_info, block_structure):
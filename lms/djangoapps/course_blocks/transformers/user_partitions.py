@@ -4,8 +4,9 @@ User Partitions Transformer
 
 
 from lms.djangoapps.courseware.access import has_access
-from openedx.core.djangoapps.content.block_structure.transformer import (  # lint-amnesty, pylint: disable=unused-import
-    BlockStructureTransformer
+from openedx.core.djangoapps.content.block_structure.transformer import (
+    BlockStructureTransformer,
+    FilteringTransformerMixin
 )
 from xmodule.partitions.partitions_service import (
     get_all_partitions_for_course,
@@ -17,7 +18,7 @@ from .split_test import SplitTestTransformer
 from .utils import get_field_on_block
 
 
-class UserPartitionTransformer(BlockStructureTransformer):
+class UserPartitionTransformer(FilteringTransformerMixin, BlockStructureTransformer):
     """
     A transformer that enforces the group access rules on course blocks,
     by honoring their user_partitions and group_access fields, and
@@ -75,27 +76,31 @@ class UserPartitionTransformer(BlockStructureTransformer):
             merged_group_access = _MergedGroupAccess(user_partitions, xblock, merged_parent_access_list)
             block_structure.set_transformer_block_field(block_key, cls, 'merged_group_access', merged_group_access)
 
-    def transform(self, usage_info, block_structure):
+    def transform_block_filters(self, usage_info, block_structure):
         user = usage_info.user
-        SplitTestTransformer().transform(usage_info, block_structure)
+        filters = SplitTestTransformer().transform_block_filters(usage_info, block_structure)
         staff_access = has_access(user, 'staff', usage_info.course_key)
 
         # If you have staff access, you are allowed access to the entire result list
         if staff_access:
-            return
+            return filters
 
         user_partitions = block_structure.get_transformer_data(self, 'user_partitions')
         if not user_partitions:
-            return
+            return filters
 
         user_groups = get_user_partition_groups(usage_info.course_key, user_partitions, user, 'id')
 
-        for block_key in block_structure.topological_traversal():
+        def is_access_denied(block_key):
+            """
+            Returns whether the block should be removed, and otherwise
+            records why the user's access to it is denied, if it is.
+            """
             transformer_block_field = block_structure.get_transformer_block_field(
                 block_key, self, 'merged_group_access'
             )
             if transformer_block_field is None:
-                continue
+                return False
 
             access_denying_partition_ids = transformer_block_field.get_access_denying_partitions(
                 user_groups
@@ -116,16 +121,19 @@ class UserPartitionTransformer(BlockStructureTransformer):
                         access_denying_messages.append(access_denied_message)
 
             if access_denying_reasons and not access_denying_messages:
-                block_structure.remove_block(block_key, keep_descendants=False)
-            else:
-                if access_denying_reasons:
-                    block_structure.override_xblock_field(
-                        block_key, 'authorization_denial_reason', access_denying_reasons[0]
-                    )
-                if access_denying_messages:
-                    block_structure.override_xblock_field(
-                        block_key, 'authorization_denial_message', access_denying_messages[0]
-                    )
+                return True
+
+            if access_denying_reasons:
+                block_structure.override_xblock_field(
+                    block_key, 'authorization_denial_reason', access_denying_reasons[0]
+                )
+            if access_denying_messages:
+                block_structure.override_xblock_field(
+                    block_key, 'authorization_denial_message', access_denying_messages[0]
+                )
+            return False
+
+        return filters + [block_structure.create_removal_filter(is_access_denied)]
 
 
 class _MergedGroupAccess:
@@ -18,7 +18,17 @@ def get_field_on_block(block, field_name, default_value=None):
     return default_value
 
 
-def collect_unioned_set_field(block_structure, transformer, merged_field_name, filter_by):
+def _traverse_blocks(block_structure, block_keys=None):
+    """
+    Topologically traverses the given block_structure, yielding only the
+    blocks in block_keys if it is given.
+    """
+    for block_key in block_structure.topological_traversal():
+        if block_keys is None or block_key in block_keys:
+            yield block_key
+
+
+def collect_unioned_set_field(block_structure, transformer, merged_field_name, filter_by, block_keys=None):
     """
     Recursively union a set field on the block structure.
 
@@ -29,6 +39,9 @@ def collect_unioned_set_field(block_structure, transformer, merged_field_name, f
     This set union operation takes place during a topological traversal
     of the block_structure, so all sets are inherited by descendants.
 
+    If block_keys is given, only the set of those blocks is collected;
+    see BlockStructureTransformer.collect_incrementally.
+
     Parameters:
         block_structure: BlockStructure to traverse
         transformer: transformer that will be used for get_ and
@@ -36,8 +49,9 @@ def collect_unioned_set_field(block_structure, transformer, merged_field_name, f
         merged_field_name: name of the field to store
         filter_by: a unary lambda that returns true if a given
             block_key should be included in the result set
+        block_keys: the blocks to collect the set of, if not all
     """
-    for block_key in block_structure.topological_traversal():
+    for block_key in _traverse_blocks(block_structure, block_keys):
         result_set = {block_key} if filter_by(block_key) else set()
         for parent in block_structure.get_parents(block_key):
             result_set |= block_structure.get_transformer_block_field(
@@ -60,6 +74,7 @@ def collect_merged_boolean_field(
         transformer,
         xblock_field_name,
         merged_field_name,
+        block_keys=None,
 ):
     """
     Collects a boolean xBlock field of name xblock_field_name
@@ -72,9 +87,12 @@ def collect_merged_boolean_field(
     the value is ANDed across all parents for blocks with
     multiple parents and ORed across all ancestors down a single
     hierarchy chain.
+
+    If block_keys is given, only the value of those blocks is
+    collected; see BlockStructureTransformer.collect_incrementally.
     """
 
-    for block_key in block_structure.topological_traversal():
+    for block_key in _traverse_blocks(block_structure, block_keys):
         # compute merged value of the boolean field from all parents
         parents = block_structure.get_parents(block_key)
         all_parents_merged_value = all(
@@ -107,6 +125,7 @@ def collect_merged_date_field(
         default_date,
         func_merge_parents=min,
         func_merge_ancestors=max,
+        block_keys=None,
 ):
     """
     Collects a date xBlock field of name xblock_field_name
@@ -114,9 +133,12 @@ def collect_merged_date_field(
     value is percolated down the hierarchy of the block_structure
     and stored as a value of merged_field_name in the
     block_structure.
+
+    If block_keys is given, only the value of those blocks is
+    collected; see BlockStructureTransformer.collect_incrementally.
     """
 
-    for block_key in block_structure.topological_traversal():
+    for block_key in _traverse_blocks(block_structure, block_keys):
 
         parents = block_structure.get_parents(block_key)
         block_date = get_field_on_block(block_structure.get_xblock(block_key), xblock_field_name)
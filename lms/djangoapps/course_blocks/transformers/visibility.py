@@ -26,6 +26,7 @@ class VisibilityTransformer(FilteringTransformerMixin, BlockStructureTransformer
     """
     WRITE_VERSION = 1
     READ_VERSION = 1
+    SUPPORTS_INCREMENTAL_COLLECT = True
 
     MERGED_VISIBLE_TO_STAFF_ONLY = 'merged_visible_to_staff_only'
 
@@ -54,11 +55,21 @@ class VisibilityTransformer(FilteringTransformerMixin, BlockStructureTransformer
         Collects any information that's necessary to execute this
         transformer's transform method.
         """
+        cls.collect_incrementally(block_structure, block_keys=None)
+
+    @classmethod
+    def collect_incrementally(cls, block_structure, block_keys):
+        """
+        Collects the merged visibility of only the given blocks.  Since it
+        only depends on the blocks' ancestors, the merged visibility of
+        all other blocks is unaffected.
+        """
         collect_merged_boolean_field(
             block_structure,
             transformer=cls,
             xblock_field_name='visible_to_staff_only',
             merged_field_name=cls.MERGED_VISIBLE_TO_STAFF_ONLY,
+            block_keys=block_keys,
         )
 
     def transform_block_filters(self, usage_info, block_structure):
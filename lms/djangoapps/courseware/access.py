@@ -15,8 +15,12 @@ Note: The access control logic in this file does NOT check for enrollment in
 import logging
 from datetime import datetime
 
+from crum import get_current_request
 from django.conf import settings  # pylint: disable=unused-import
 from django.contrib.auth.models import AnonymousUser
+from django.dispatch import receiver
+from django.utils.functional import cached_property
+from edx_django_utils.cache import RequestCache
 from edx_django_utils.monitoring import function_trace
 from opaque_keys.edx.keys import CourseKey, UsageKey
 from pytz import UTC
@@ -38,15 +42,21 @@ from lms.djangoapps.courseware.access_utils import (
     debug,
     in_preview_mode
 )
-from lms.djangoapps.courseware.masquerade import get_masquerade_role, is_masquerading_as_student
+from lms.djangoapps.courseware.masquerade import (
+    get_course_masquerade,
+    get_masquerade_role,
+    is_masquerading_as_student
+)
 from lms.djangoapps.ccx.custom_exception import CCXLocatorValidationException
 from lms.djangoapps.ccx.models import CustomCourseForEdX
 from lms.djangoapps.mobile_api.models import IgnoreMobileAvailableFlagConfig
 from lms.djangoapps.courseware.toggles import is_courses_default_invite_only_enabled
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+from openedx.core.djangoapps.course_groups.signals.signals import COHORT_MEMBERSHIP_UPDATED
 from openedx.features.course_duration_limits.access import check_course_expired
 from common.djangoapps.student import auth
 from common.djangoapps.student.models import CourseEnrollmentAllowed
+from common.djangoapps.student.signals import ENROLL_STATUS_CHANGE, ENROLLMENT_TRACK_UPDATED
 from common.djangoapps.student.roles import (
     CourseBetaTesterRole,
     CourseCcxCoachRole,
@@ -70,6 +80,8 @@ from xmodule.x_module import XModule
 
 log = logging.getLogger(__name__)
 
+DESCRIPTOR_ACCESS_CACHE_NAMESPACE = 'courseware.access.descriptor_access'
+
 
 def has_ccx_coach_role(user, course_key):
     """
@@ -156,7 +168,7 @@ def has_access(user, action, obj, course_key=None):
 
     # NOTE: any descriptor access checkers need to go above this
     if isinstance(obj, XBlock):
-        return _has_access_descriptor(user, action, obj, course_key)
+        return _has_access_descriptor_cached(user, action, obj, course_key)
 
     if isinstance(obj, CourseKey):
         return _has_access_course_key(user, action, obj)
@@ -173,6 +185,34 @@ def has_access(user, action, obj, course_key=None):
                     .format(type(obj)))
 
 
+def has_access_many(user, action, descriptors, course_key):
+    """
+    Check whether a user has the access to do action on each of the given
+    descriptors of a course, such as the children of a sequence.
+
+    This is the same as calling has_access on each of them, except that what
+    the checks need to know about the user in the course (their roles, their
+    partition groups) is only looked up once for all of them.
+
+    Returns a list of AccessResponse objects, in the order of `descriptors`.
+    """
+    if not user:
+        user = AnonymousUser()
+
+    if in_preview_mode() and course_key:
+        if not has_staff_access_to_preview_mode(user, course_key):
+            return [ACCESS_DENIED for _ in descriptors]
+
+    access_inputs = _BlockAccessInputs(user, course_key)
+    responses = []
+    for descriptor in descriptors:
+        if isinstance(descriptor, (CourseBlock, ErrorBlock, XModule)) or not isinstance(descriptor, XBlock):
+            responses.append(has_access(user, action, descriptor, course_key))
+        else:
+            responses.append(_has_access_descriptor_cached(user, action, descriptor, course_key, access_inputs))
+    return responses
+
+
 def has_staff_access_to_preview_mode(user, course_key):
     """
     Checks if given user can access course in preview mode.
@@ -437,13 +477,59 @@ def _has_access_error_desc(user, action, descriptor, course_key):
     return _dispatch(checkers, action, user, descriptor)
 
 
-def _has_group_access(descriptor, user, course_key):
+class _BlockAccessInputs:
+    """
+    What the access checks of a user on blocks need to know about the user in
+    the course, looked up once for all the blocks that are checked together.
+    """
+    def __init__(self, user, course_key):
+        self.user = user
+        self.course_key = course_key
+        self._partition_groups = {}
+
+    @cached_property
+    def user_role(self):
+        """
+        The role of the user in the course, see get_user_role.
+        """
+        return get_user_role(self.user, self.course_key)
+
+    @cached_property
+    def staff_access(self):
+        """
+        Whether the user has staff access to the course.
+        """
+        return _has_access_to_course(self.user, 'staff', self.course_key)
+
+    @cached_property
+    def instructor_access(self):
+        """
+        Whether the user has instructor access to the course.
+        """
+        return _has_access_to_course(self.user, 'instructor', self.course_key)
+
+    def get_group_for_user(self, partition):
+        """
+        Returns the user's group in the given partition.
+        """
+        if partition.id not in self._partition_groups:
+            self._partition_groups[partition.id] = partition.scheme.get_group_for_user(
+                self.course_key,
+                self.user,
+                partition,
+            )
+        return self._partition_groups[partition.id]
+
+
+def _has_group_access(descriptor, user, course_key, access_inputs=None):
     """
     This function returns a boolean indicating whether or not `user` has
     sufficient group memberships to "load" a block (the `descriptor`)
     """
+    access_inputs = access_inputs or _BlockAccessInputs(user, course_key)
+
     # Allow staff and instructors roles group access, as they are not masquerading as a student.
-    if get_user_role(user, course_key) in ['staff', 'instructor']:
+    if access_inputs.user_role in ['staff', 'instructor']:
         return ACCESS_GRANTED
 
     # use merged_group_access which takes group access on the block's
@@ -504,11 +590,7 @@ def _has_group_access(descriptor, user, course_key):
     missing_groups = []
     block_key = descriptor.scope_ids.usage_id
     for partition, groups in partition_groups:
-        user_group = partition.scheme.get_group_for_user(
-            course_key,
-            user,
-            partition,
-        )
+        user_group = access_inputs.get_group_for_user(partition)
         if user_group not in groups:
             missing_groups.append((
                 partition,
@@ -535,7 +617,57 @@ def _has_group_access(descriptor, user, course_key):
     return ACCESS_GRANTED
 
 
-def _has_access_descriptor(user, action, descriptor, course_key=None):
+def _has_access_descriptor_cached(user, action, descriptor, course_key=None, access_inputs=None):
+    """
+    Same as _has_access_descriptor, but the decisions made while handling a
+    request are kept until its end.
+
+    They are kept by user, action, block, course and masquerade settings.
+    Blocks bound to the user are kept apart from the same unbound blocks,
+    since the user's field overrides may change their access.  The user's
+    enrollment and partition groups are not part of the key, so the decisions
+    are forgotten when they change, see clear_descriptor_access_cache.
+    """
+    if get_current_request() is None:
+        return _has_access_descriptor(user, action, descriptor, course_key, access_inputs)
+
+    course_masquerade = get_course_masquerade(user, course_key) if course_key else None
+    cache_key = (
+        user.id,
+        getattr(user, 'real_user', user).id,
+        action,
+        descriptor.scope_ids.usage_id,
+        descriptor.scope_ids.user_id,
+        course_key,
+        (
+            course_masquerade.role,
+            course_masquerade.user_partition_id,
+            course_masquerade.group_id,
+            course_masquerade.user_name,
+        ) if course_masquerade else None,
+    )
+    request_cache = RequestCache(DESCRIPTOR_ACCESS_CACHE_NAMESPACE)
+    cached_response = request_cache.get_cached_response(cache_key)
+    if cached_response.is_found:
+        return cached_response.value
+
+    response = _has_access_descriptor(user, action, descriptor, course_key, access_inputs)
+    request_cache.set(cache_key, response)
+    return response
+
+
+@receiver(ENROLL_STATUS_CHANGE, dispatch_uid='courseware.access.clear_descriptor_access_cache.enroll_status')
+@receiver(ENROLLMENT_TRACK_UPDATED, dispatch_uid='courseware.access.clear_descriptor_access_cache.enrollment_track')
+@receiver(COHORT_MEMBERSHIP_UPDATED, dispatch_uid='courseware.access.clear_descriptor_access_cache.cohort')
+def clear_descriptor_access_cache(**kwargs):  # pylint: disable=unused-argument
+    """
+    Forgets the block access decisions made while handling the request when
+    a user's enrollment or cohort changes, since they depend on them.
+    """
+    RequestCache(DESCRIPTOR_ACCESS_CACHE_NAMESPACE).clear()
+
+
+def _has_access_descriptor(user, action, descriptor, course_key=None, access_inputs=None):
     """
     Check if user has access to this descriptor.
 
@@ -547,6 +679,8 @@ def _has_access_descriptor(user, action, descriptor, course_key=None):
     (e.g. courses).  If you call this method directly instead of going through
     has_access(), it will not do the right thing.
     """
+    access_inputs = access_inputs or _BlockAccessInputs(user, course_key or descriptor.location.course_key)
+
     def can_load():
         """
         NOTE: This does not check that the student is enrolled in the course
@@ -558,12 +692,12 @@ def _has_access_descriptor(user, action, descriptor, course_key=None):
         # access to this content, then deny access. The problem with calling _has_staff_access_to_descriptor
         # before this method is that _has_staff_access_to_descriptor short-circuits and returns True
         # for staff users in preview mode.
-        group_access_response = _has_group_access(descriptor, user, course_key)
+        group_access_response = _has_group_access(descriptor, user, course_key, access_inputs)
         if not group_access_response:
             return group_access_response
 
         # If the user has staff access, they can load the module and checks below are not needed.
-        staff_access_response = _has_staff_access_to_descriptor(user, descriptor, course_key)
+        staff_access_response = access_inputs.staff_access
         if staff_access_response:
             return staff_access_response
 
@@ -583,8 +717,8 @@ def _has_access_descriptor(user, action, descriptor, course_key=None):
 
     checkers = {
         'load': can_load,
-        'staff': lambda: _has_staff_access_to_descriptor(user, descriptor, course_key),
-        'instructor': lambda: _has_instructor_access_to_descriptor(user, descriptor, course_key)
+        'staff': lambda: access_inputs.staff_access,
+        'instructor': lambda: access_inputs.instructor_access,
     }
 
     return _dispatch(checkers, action, user, descriptor)
@@ -28,10 +28,11 @@ from abc import ABCMeta, abstractmethod
 from collections import defaultdict, namedtuple
 
 from django.db import DatabaseError, IntegrityError, transaction
+from edx_django_utils import monitoring as monitoring_utils
 from opaque_keys.edx.asides import AsideUsageKeyV1, AsideUsageKeyV2
 from opaque_keys.edx.block_types import BlockTypeKeyV1
 from opaque_keys.edx.keys import LearningContextKey
-from xblock.core import XBlockAside
+from xblock.core import XBlock, XBlockAside
 from xblock.exceptions import InvalidScopeError, KeyValueMultiSaveError
 from xblock.fields import Scope, UserScope
 from xblock.runtime import KeyValueStore
@@ -56,15 +57,26 @@ def _all_usage_keys(descriptors, aside_types):
     Return a set of all usage_ids for the `descriptors` and for
     as all asides in `aside_types` for those descriptors.
     """
-    usage_ids = set()
-    for descriptor in descriptors:
-        usage_ids.add(descriptor.scope_ids.usage_id)
+    return _all_usage_keys_for_ids(
+        (descriptor.scope_ids.usage_id for descriptor in descriptors),
+        aside_types,
+    )
+
+
+def _all_usage_keys_for_ids(usage_ids, aside_types):
+    """
+    Return a set of all `usage_ids` and of the usage ids of all asides in
+    `aside_types` for them.
+    """
+    all_usage_ids = set()
+    for usage_id in usage_ids:
+        all_usage_ids.add(usage_id)
 
         for aside_type in aside_types:
-            usage_ids.add(AsideUsageKeyV1(descriptor.scope_ids.usage_id, aside_type))
-            usage_ids.add(AsideUsageKeyV2(descriptor.scope_ids.usage_id, aside_type))
+            all_usage_ids.add(AsideUsageKeyV1(usage_id, aside_type))
+            all_usage_ids.add(AsideUsageKeyV2(usage_id, aside_type))
 
-    return usage_ids
+    return all_usage_ids
 
 
 def _all_block_types(descriptors, aside_types):
@@ -82,6 +94,34 @@ def _all_block_types(descriptors, aside_types):
     return block_types
 
 
+def _all_block_types_for_ids(usage_ids, aside_types):
+    """
+    Return a set of all block_types of the XBlocks with the supplied
+    `usage_ids` and of the aside types in `aside_types`.
+    """
+    block_types = {BlockTypeKeyV1(XBlock.entry_point, usage_id.block_type) for usage_id in usage_ids}
+    block_types.update(BlockTypeKeyV1(XBlockAside.entry_point, aside_type) for aside_type in aside_types)
+    return block_types
+
+
+def block_structure_usage_keys(block_structure, root_block_key, depth=None):
+    """
+    Return the usage keys of the block with `root_block_key` and of its
+    descendants in `block_structure`, down to `depth` levels below it (or all
+    of them if depth is None), for FieldDataCache.prefetch.
+    """
+    usage_keys = []
+    level = [root_block_key] if root_block_key in block_structure else []
+    while level:
+        usage_keys.extend(level)
+        if depth is not None:
+            if depth == 0:
+                break
+            depth -= 1
+        level = [child_key for block_key in level for child_key in block_structure.get_children(block_key)]
+    return usage_keys
+
+
 class DjangoKeyValueStore(KeyValueStore):
     """
     This KeyValueStore will read and write data in the following scopes to django models
@@ -170,6 +210,18 @@ class DjangoOrmFieldCache(metaclass=ABCMeta):
         for field_object in self._read_objects(fields, xblocks, aside_types):
             self._cache[self._cache_key_for_field_object(field_object)] = field_object
 
+    def prefetch_fields(self, usage_keys, aside_types):
+        """
+        Load all stored fields of the XBlocks with the supplied ``usage_keys``
+        and of the ``aside_types`` associated with them into this cache.
+
+        Arguments:
+            usage_keys (set of :class:`UsageKey`): XBlocks to cache fields for.
+            aside_types (list of str): Aside types to cache fields for.
+        """
+        for field_object in self._prefetch_objects(usage_keys, aside_types):
+            self._cache[self._cache_key_for_field_object(field_object)] = field_object
+
     def get(self, kvs_key):
         """
         Return the django model object specified by `kvs_key` from
@@ -309,6 +361,20 @@ class DjangoOrmFieldCache(metaclass=ABCMeta):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def _prefetch_objects(self, usage_keys, aside_types):
+        """
+        Return an iterator for all objects stored in the underlying datastore
+        for any field of the XBlocks with the supplied ``usage_keys`` and of
+        the ``aside_types`` associated with them.
+
+        Arguments:
+            usage_keys (set of :class:`UsageKey`): XBlocks to load fields for
+            aside_types (list of str): Asides to load field for (which annotate the supplied
+                xblocks).
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def _cache_key_for_field_object(self, field_object):
         """
@@ -357,6 +423,22 @@ class UserStateCache:
         for user_state in block_field_state:
             self._cache[user_state.block_key] = user_state.state
 
+    def prefetch_fields(self, usage_keys, aside_types):
+        """
+        Load the state of the XBlocks with the supplied ``usage_keys`` and of
+        the ``aside_types`` associated with them into this cache.
+
+        Arguments:
+            usage_keys (set of :class:`UsageKey`): XBlocks to cache fields for.
+            aside_types (list of str): Aside types to cache fields for.
+        """
+        block_field_state = self._client.get_many(
+            self.user.username,
+            _all_usage_keys_for_ids(usage_keys, aside_types),
+        )
+        for user_state in block_field_state:
+            self._cache[user_state.block_key] = user_state.state
+
     def set(self, kvs_key, value):
         """
         Set the specified `kvs_key` to the field value `value`.
@@ -518,6 +600,22 @@ class UserStateSummaryCache(DjangoOrmFieldCache):
             field_name__in={field.name for field in fields},
         )
 
+    def _prefetch_objects(self, usage_keys, aside_types):
+        """
+        Return an iterator for all objects stored in the underlying datastore
+        for any field of the XBlocks with the supplied ``usage_keys`` and of
+        the ``aside_types`` associated with them.
+
+        Arguments:
+            usage_keys (set of :class:`UsageKey`): XBlocks to load fields for
+            aside_types (list of str): Asides to load field for (which annotate the supplied
+                xblocks).
+        """
+        return XModuleUserStateSummaryField.objects.chunked_filter(
+            'usage_id__in',
+            _all_usage_keys_for_ids(usage_keys, aside_types),
+        )
+
     def _cache_key_for_field_object(self, field_object):
         """
         Return the key used in this DjangoOrmFieldCache to store the specified field_object.
@@ -581,6 +679,23 @@ class PreferencesCache(DjangoOrmFieldCache):
             field_name__in={field.name for field in fields},
         )
 
+    def _prefetch_objects(self, usage_keys, aside_types):
+        """
+        Return an iterator for all objects stored in the underlying datastore
+        for any field of the XBlocks with the supplied ``usage_keys`` and of
+        the ``aside_types`` associated with them.
+
+        Arguments:
+            usage_keys (set of :class:`UsageKey`): XBlocks to load fields for
+            aside_types (list of str): Asides to load field for (which annotate the supplied
+                xblocks).
+        """
+        return XModuleStudentPrefsField.objects.chunked_filter(
+            'module_type__in',
+            _all_block_types_for_ids(usage_keys, aside_types),
+            student=self.user.pk,
+        )
+
     def _cache_key_for_field_object(self, field_object):
         """
         Return the key used in this DjangoOrmFieldCache to store the specified field_object.
@@ -641,6 +756,19 @@ class UserInfoCache(DjangoOrmFieldCache):
             field_name__in={field.name for field in fields},
         )
 
+    def _prefetch_objects(self, usage_keys, aside_types):
+        """
+        Return an iterator for all objects stored in the underlying datastore
+        for any field of the XBlocks with the supplied ``usage_keys`` and of
+        the ``aside_types`` associated with them.
+
+        Arguments:
+            usage_keys (set of :class:`UsageKey`): XBlocks to load fields for
+            aside_types (list of str): Asides to load field for (which annotate the supplied
+                xblocks).
+        """
+        return XModuleStudentInfoField.objects.filter(student=self.user.pk)
+
     def _cache_key_for_field_object(self, field_object):
         """
         Return the key used in this DjangoOrmFieldCache to store the specified field_object.
@@ -705,20 +833,68 @@ class FieldDataCache:
             ),
         }
         self.scorable_locations = set()
+        self.prefetched_usage_keys = set()
+        self.queries_saved = 0
         self.add_descriptors_to_cache(descriptors)
 
+    def prefetch(self, usage_keys):
+        """
+        Load the data of every field of the XBlocks with the supplied
+        `usage_keys`, with one query per scope.
+
+        Descriptors later added to this FieldDataCache are served from the
+        prefetched data, rather than queried for again, when their usage key
+        was prefetched.  Use it with all the usage keys a request is going
+        to render, so that loading them one part at a time doesn't query
+        each scope again for each part.
+
+        Arguments:
+            usage_keys (iterable of :class:`UsageKey`): the XBlocks to load
+                field data for.
+        """
+        if not self.user.is_authenticated:
+            return
+
+        usage_keys = set(usage_keys) - self.prefetched_usage_keys
+        if not usage_keys:
+            return
+
+        for scope_cache in self.cache.values():
+            scope_cache.prefetch_fields(usage_keys, self.asides)
+        self.prefetched_usage_keys.update(usage_keys)
+
     def add_descriptors_to_cache(self, descriptors):
         """
         Add all `descriptors` to this FieldDataCache.
         """
         if self.user.is_authenticated:
             self.scorable_locations.update(desc.location for desc in descriptors if desc.has_score)
+
+            if self.prefetched_usage_keys:
+                fetched_descriptors = [
+                    desc for desc in descriptors if desc.scope_ids.usage_id not in self.prefetched_usage_keys
+                ]
+                if not fetched_descriptors:
+                    self._record_queries_saved(descriptors)
+                    return
+                descriptors = fetched_descriptors
+
             for scope, fields in self._fields_to_cache(descriptors).items():
                 if scope not in self.cache:
                     continue
 
                 self.cache[scope].cache_fields(fields, descriptors, self.asides)
 
+    def _record_queries_saved(self, descriptors):
+        """
+        Count the queries that loading the (prefetched) `descriptors` would
+        have needed, in this FieldDataCache and in a custom attribute of the
+        request.
+        """
+        queries_saved = len(self.cache.keys() & self._fields_to_cache(descriptors).keys())
+        self.queries_saved += queries_saved
+        monitoring_utils.accumulate('field_data_cache.queries_saved', queries_saved)
+
     def add_descriptor_descendents(self, descriptor, depth=None, descriptor_filter=lambda descriptor: True):
         """
         Add all descendants of `descriptor` to this FieldDataCache.
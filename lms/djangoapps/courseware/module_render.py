@@ -13,7 +13,6 @@ from completion.waffle import ENABLE_COMPLETION_TRACKING_SWITCH
 from completion.models import BlockCompletion
 from django.conf import settings
 from django.contrib.auth.models import User  # lint-amnesty, pylint: disable=imported-auth-user
-from django.core.cache import cache
 from django.db import transaction
 from django.http import Http404, HttpResponse, HttpResponseForbidden
 from django.middleware.csrf import CsrfViewMiddleware
@@ -43,7 +42,7 @@ from xblock.runtime import KvsFieldData
 
 from common.djangoapps import static_replace
 from capa.xqueue_interface import XQueueInterface
-from lms.djangoapps.courseware.access import get_user_role, has_access
+from lms.djangoapps.courseware.access import get_user_role, has_access, has_access_many
 from lms.djangoapps.courseware.entrance_exams import user_can_skip_entrance_exam, user_has_passed_entrance_exam
 from lms.djangoapps.courseware.masquerade import (
     MasqueradingKeyValueStore,
@@ -55,6 +54,7 @@ from lms.djangoapps.courseware.model_data import DjangoKeyValueStore, FieldDataC
 from common.djangoapps.edxmako.shortcuts import render_to_string
 from lms.djangoapps.courseware.field_overrides import OverrideFieldData
 from lms.djangoapps.courseware.services import UserStateService
+from lms.djangoapps.courseware.user_state_client import UserStateWriteBehindBuffer
 from lms.djangoapps.grades.api import GradesUtilService
 from lms.djangoapps.grades.api import signals as grades_signals
 from lms.djangoapps.lms_xblock.field_data import LmsFieldData
@@ -76,9 +76,7 @@ from openedx.core.lib.xblock_utils import (
     get_aside_from_xblock,
     hash_resource,
     is_xblock_aside,
-    replace_course_urls,
-    replace_jump_to_id_urls,
-    replace_static_urls
+    replace_courseware_urls
 )
 from openedx.core.lib.xblock_utils import request_token as xblock_request_token
 from openedx.core.lib.xblock_utils import wrap_xblock
@@ -96,7 +94,7 @@ from xmodule.error_module import ErrorBlock, NonStaffErrorBlock
 from xmodule.exceptions import NotFoundError, ProcessingError
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.exceptions import ItemNotFoundError
-from xmodule.util.sandboxing import can_execute_unsafe_code, get_python_lib_zip
+from xmodule.util.sandboxing import can_execute_unsafe_code, get_python_lib_zip, get_safe_exec_result_cache
 from xmodule.x_module import XModuleDescriptor
 
 log = logging.getLogger(__name__)
@@ -174,6 +172,7 @@ def toc_for_course(user, request, course, active_chapter, active_section, field_
             return None, None, None
 
         toc_chapters = list()
+        bind_children_for_user(user, course_module, course.id)
         chapters = course_module.get_display_items()
 
         # Check for content which needs to be completed
@@ -202,6 +201,7 @@ def toc_for_course(user, request, course, active_chapter, active_section, field_
                 continue
 
             sections = list()
+            bind_children_for_user(user, chapter, course.id)
             for section in chapter.get_display_items():
                 # skip the section if it is hidden from the user
                 if section.hide_from_toc:
@@ -498,11 +498,11 @@ def get_module_system_for_user(
         'waittime': settings.XQUEUE_WAITTIME_BETWEEN_REQUESTS
     }
 
-    def inner_get_module(descriptor):
+    def inner_get_module(descriptor, check_access=True):
         """
         Delegate to get_module_for_descriptor_internal() with all values except `descriptor` set.
 
-        Because it does an access check, it may return None.
+        Because it does an access check, unless `check_access` is False, it may return None.
         """
         # TODO: fix this so that make_xqueue_callback uses the descriptor passed into
         # inner_get_module, not the parent's callback.  Add it as an argument....
@@ -521,6 +521,7 @@ def get_module_system_for_user(
             request_token=request_token,
             course=course,
             will_recheck_access=will_recheck_access,
+            check_access=check_access,
         )
 
     def get_event_handler(event_type):
@@ -702,27 +703,21 @@ def get_module_system_for_user(
     # prefix is going to have to be specific to the module, not the directory
     # that the xml was loaded from
 
-    # Rewrite urls beginning in /static to point to course-specific content
-    block_wrappers.append(partial(
-        replace_static_urls,
-        getattr(descriptor, 'data_dir', None),
-        course_id=course_id,
-        static_asset_path=static_asset_path or descriptor.static_asset_path
-    ))
-
-    # Allow URLs of the form '/course/' refer to the root of multicourse directory
-    #   hierarchy of this course
-    block_wrappers.append(partial(replace_course_urls, course_id))
-
-    # this will rewrite intra-courseware links (/jump_to_id/<id>). This format
-    # is an improvement over the /course/... format for studio authored courses,
-    # because it is agnostic to course-hierarchy.
+    # In a single pass over the fragment:
+    #  * Rewrite urls beginning in /static to point to course-specific content
+    #  * Allow URLs of the form '/course/' refer to the root of multicourse directory
+    #    hierarchy of this course
+    #  * Rewrite intra-courseware links (/jump_to_id/<id>). This format
+    #    is an improvement over the /course/... format for studio authored courses,
+    #    because it is agnostic to course-hierarchy.
     # NOTE: module_id is empty string here. The 'module_id' will get assigned in the replacement
     # function, we just need to specify something to get the reverse() to work.
     block_wrappers.append(partial(
-        replace_jump_to_id_urls,
+        replace_courseware_urls,
+        getattr(descriptor, 'data_dir', None),
         course_id,
         reverse('jump_to_id', kwargs={'course_id': str(course_id), 'module_id': ''}),
+        static_asset_path=static_asset_path or descriptor.static_asset_path
     ))
 
     block_wrappers.append(partial(display_access_messages, user))
@@ -796,7 +791,7 @@ def get_module_system_for_user(
         publish=publish,
         anonymous_student_id=anonymous_student_id,
         course_id=course_id,
-        cache=cache,
+        cache=get_safe_exec_result_cache(),
         can_execute_unsafe_code=(lambda: can_execute_unsafe_code(course_id)),
         get_python_lib_zip=(lambda: get_python_lib_zip(contentstore, course_id)),
         # TODO: When we merge the descriptor and module systems, we can stop reaching into the mixologist (cpennington)
@@ -854,7 +849,7 @@ def get_module_for_descriptor_internal(user, descriptor, student_data, course_id
                                        track_function, xqueue_callback_url_prefix, request_token,
                                        position=None, wrap_xmodule_display=True, grade_bucket_type=None,
                                        static_asset_path='', user_location=None, disable_staff_debug_info=False,
-                                       course=None, will_recheck_access=False):
+                                       course=None, will_recheck_access=False, check_access=True):
     """
     Actually implement get_module, without requiring a request.
 
@@ -862,6 +857,8 @@ def get_module_for_descriptor_internal(user, descriptor, student_data, course_id
 
     Arguments:
         request_token (str): A unique token for this request, used to isolate xblock rendering
+        check_access (bool): Whether to check the user's access to the descriptor.  Only pass False
+            if the caller checks it, with _module_if_accessible.
     """
 
     (system, student_data) = get_module_system_for_user(
@@ -898,24 +895,65 @@ def get_module_for_descriptor_internal(user, descriptor, student_data, course_id
     # Not that the access check needs to happen after the descriptor is bound
     # for the student, since there may be field override data for the student
     # that affects xblock visibility.
-    user_needs_access_check = getattr(user, 'known', True) and not isinstance(user, SystemUser)
-    if user_needs_access_check:
+    if check_access and _user_needs_access_check(user):
         access = has_access(user, 'load', descriptor, course_id)
-        # A descriptor should only be returned if either the user has access, or the user doesn't have access, but
-        # the failed access has a message for the user and the caller of this function specifies it will check access
-        # again. This allows blocks to show specific error message or upsells when access is denied.
-        caller_will_handle_access_error = (
-            not access
-            and will_recheck_access
-            and (access.user_message or access.user_fragment)
-        )
-        if access or caller_will_handle_access_error:
-            descriptor.has_access_error = bool(caller_will_handle_access_error)
-            return descriptor
-        return None
+        return _module_if_accessible(descriptor, access, will_recheck_access)
     return descriptor
 
 
+def _user_needs_access_check(user):
+    """
+    Returns whether the access of the user to the modules they load is checked.
+    """
+    return getattr(user, 'known', True) and not isinstance(user, SystemUser)
+
+
+def _module_if_accessible(descriptor, access, will_recheck_access):
+    """
+    Returns the bound descriptor, given the user's load access to it, or None.
+    """
+    # A descriptor should only be returned if either the user has access, or the user doesn't have access, but
+    # the failed access has a message for the user and the caller of this function specifies it will check access
+    # again. This allows blocks to show specific error message or upsells when access is denied.
+    caller_will_handle_access_error = (
+        not access
+        and will_recheck_access
+        and (access.user_message or access.user_fragment)
+    )
+    if access or caller_will_handle_access_error:
+        descriptor.has_access_error = bool(caller_will_handle_access_error)
+        return descriptor
+    return None
+
+
+def bind_children_for_user(user, block, course_key, will_recheck_access=False):
+    """
+    Binds the children of `block`, which is bound to `user`, and checks the
+    user's access to all of them at once with has_access_many, rather than one
+    at a time as they are loaded.  They are kept in the child cache of `block`,
+    from where its get_children returns them.
+
+    `will_recheck_access` must be the value `block` was bound with.
+    """
+    child_cache = block._child_cache  # pylint: disable=protected-access
+    if not block.has_children or child_cache or not _user_needs_access_check(user):
+        return
+
+    module_system = block.xmodule_runtime
+    children = []
+    for child_id in block.children:
+        try:
+            child_descriptor = module_system.descriptor_runtime.get_block(child_id, for_parent=block)
+        except ItemNotFoundError:
+            # left for get_child to log and skip
+            continue
+        children.append((child_id, module_system.get_module(child_descriptor, check_access=False)))
+
+    access_responses = has_access_many(user, 'load', [child for __, child in children], course_key)
+    for (child_id, child), access in zip(children, access_responses):
+        child_cache[child_id] = _module_if_accessible(child, access, will_recheck_access)
+
+
 def load_single_xblock(request, user_id, course_id, usage_key_string, course=None, will_recheck_access=False):
     """
     Load a single XBlock identified by usage_key_string.
@@ -1206,7 +1244,10 @@ def _invoke_xblock_handler(request, course_id, usage_id, handler, suffix, course
         tracking_context_name = 'module_callback_handler'
         req = django_to_webob_request(request)
         try:
-            with tracker.get_tracker().context(tracking_context_name, tracking_context):
+            # Buffered user state is written when the handler returns, within
+            # the view, and discarded if the handler raises an exception.
+            with tracker.get_tracker().context(tracking_context_name, tracking_context), \
+                    UserStateWriteBehindBuffer.buffering():
                 if is_xblock_aside(usage_key):
                     # In this case, 'instance' is the XBlock being wrapped by the aside, so
                     # the actual aside instance needs to be retrieved in order to invoke its
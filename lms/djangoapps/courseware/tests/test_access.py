@@ -16,6 +16,7 @@ from django.test import TestCase
 from django.test.client import RequestFactory
 from django.test.utils import override_settings
 from django.urls import reverse
+from edx_django_utils.cache import RequestCache
 from milestones.tests.utils import MilestonesTestCaseMixin
 from opaque_keys.edx.locator import CourseLocator
 
@@ -383,6 +384,45 @@ class AccessTestCase(LoginEnrollmentTestCase, ModuleStoreTestCase, MilestonesTes
         with pytest.raises(ValueError):
             access._has_access_descriptor(user, 'not_load_or_staff', descriptor)
 
+    def test_has_access_many(self):
+        chapters = [
+            ItemFactory.create(category='chapter', parent_location=self.course.location),
+            ItemFactory.create(category='chapter', parent_location=self.course.location, visible_to_staff_only=True),
+            ItemFactory.create(category='chapter', parent_location=self.course.location),
+        ]
+        for user, expected_access in (
+            (self.student, [True, False, True]),
+            (self.anonymous_user, [True, False, True]),
+            (self.course_staff, [True, True, True]),
+        ):
+            with patch('lms.djangoapps.courseware.access.get_user_role', wraps=access.get_user_role) as mock_user_role:
+                responses = access.has_access_many(user, 'load', chapters, self.course.id)
+            assert [bool(response) for response in responses] == expected_access
+            # The user's role is looked up once for all the chapters.
+            assert mock_user_role.call_count == 1
+
+    def test_has_access_descriptor_cached_in_request(self):
+        chapter = ItemFactory.create(category='chapter', parent_location=self.course.location)
+        with patch('lms.djangoapps.courseware.access.get_current_request', return_value=RequestFactory().get('/')):
+            assert access.has_access(self.student, 'load', chapter, self.course.id)
+            chapter.visible_to_staff_only = True
+            # The decision made earlier in the request is kept.
+            assert access.has_access(self.student, 'load', chapter, self.course.id)
+            assert access.has_access_many(self.student, 'load', [chapter], self.course.id)[0]
+            # But not for other users.
+            assert not access.has_access(self.anonymous_user, 'load', chapter, self.course.id)
+
+            RequestCache(access.DESCRIPTOR_ACCESS_CACHE_NAMESPACE).clear()
+            assert not access.has_access(self.student, 'load', chapter, self.course.id)
+
+    def test_has_access_descriptor_cache_cleared_on_enrollment_change(self):
+        chapter = ItemFactory.create(category='chapter', parent_location=self.course.location)
+        with patch('lms.djangoapps.courseware.access.get_current_request', return_value=RequestFactory().get('/')):
+            assert access.has_access(self.student, 'load', chapter, self.course.id)
+            chapter.visible_to_staff_only = True
+            CourseEnrollment.enroll(self.student, self.course.id)
+            assert not access.has_access(self.student, 'load', chapter, self.course.id)
+
     @ddt.data(
         (True, None, access_response.VisibilityError),
         (False, None),
@@ -13,7 +13,12 @@ from xblock.exceptions import KeyValueMultiSaveError
 from xblock.fields import BlockScope, Scope, ScopeIds
 
 from common.djangoapps.student.tests.factories import UserFactory
-from lms.djangoapps.courseware.model_data import DjangoKeyValueStore, FieldDataCache, InvalidScopeError
+from lms.djangoapps.courseware.model_data import (
+    DjangoKeyValueStore,
+    FieldDataCache,
+    InvalidScopeError,
+    block_structure_usage_keys
+)
 from lms.djangoapps.courseware.models import (
     StudentModule,
     XModuleStudentInfoField,
@@ -26,6 +31,7 @@ from lms.djangoapps.courseware.tests.factories import StudentInfoFactory
 from lms.djangoapps.courseware.tests.factories import StudentModuleFactory as cmfStudentModuleFactory
 from lms.djangoapps.courseware.tests.factories import StudentPrefsFactory
 from lms.djangoapps.courseware.tests.factories import UserStateSummaryFactory
+from openedx.core.djangoapps.content.block_structure.tests.helpers import ChildrenMapTestMixin
 
 
 def mock_field(scope, name):
@@ -444,3 +450,65 @@ class TestStudentInfoStorage(OtherUserFailureTestMixin, StorageTestBase, TestCas
     storage_class = XModuleStudentInfoField
     other_key_factory = partial(DjangoKeyValueStore.Key, Scope.user_info, 2, 'mock_problem')  # user_id=2, not 1
     existing_field_name = "existing_field"
+
+
+class TestFieldDataCachePrefetch(TestCase):
+    """Tests for prefetching the field data of a set of usage keys"""
+    # Tell Django to clean out all databases, not just default
+    databases = {alias for alias in connections}  # lint-amnesty, pylint: disable=unnecessary-comprehension
+
+    def setUp(self):
+        super().setUp()
+        student_module = StudentModuleFactory(state=json.dumps({'a_field': 'a_value'}))
+        self.user = student_module.student
+        UserStateSummaryFactory(field_name='summary_field', value=json.dumps('summary_value'))
+        self.descriptor = mock_descriptor([
+            mock_field(Scope.user_state, 'a_field'),
+            mock_field(Scope.user_state_summary, 'summary_field'),
+        ])
+        self.field_data_cache = FieldDataCache([], COURSE_KEY, self.user)
+        self.kvs = DjangoKeyValueStore(self.field_data_cache)
+
+    def test_prefetched_descriptors(self):
+        # One query per scope.
+        with self.assertNumQueries(4):
+            self.field_data_cache.prefetch([LOCATION('usage_id'), LOCATION('other_usage_id')])
+
+        with self.assertNumQueries(0):
+            self.field_data_cache.add_descriptors_to_cache([self.descriptor])
+            assert self.kvs.get(user_state_key('a_field')) == 'a_value'
+            assert self.kvs.get(user_state_summary_key('summary_field')) == 'summary_value'
+
+        # The user_state and user_state_summary queries were saved.
+        assert self.field_data_cache.queries_saved == 2
+
+        # Prefetching again doesn't query for usage keys already prefetched.
+        with self.assertNumQueries(0):
+            self.field_data_cache.prefetch([LOCATION('usage_id')])
+
+    def test_descriptors_not_prefetched(self):
+        self.field_data_cache.prefetch([LOCATION('other_usage_id')])
+
+        with self.assertNumQueries(2):
+            self.field_data_cache.add_descriptors_to_cache([self.descriptor])
+        assert self.kvs.get(user_state_key('a_field')) == 'a_value'
+        assert self.field_data_cache.queries_saved == 0
+
+    def test_set_after_prefetch(self):
+        self.field_data_cache.prefetch([LOCATION('usage_id')])
+        self.field_data_cache.add_descriptors_to_cache([self.descriptor])
+        self.kvs.set(user_state_key('a_field'), 'new_value')
+
+        assert self.kvs.get(user_state_key('a_field')) == 'new_value'
+        assert json.loads(StudentModule.objects.get(student=self.user).state)['a_field'] == 'new_value'
+
+
+class TestBlockStructureUsageKeys(ChildrenMapTestMixin, TestCase):
+    """Tests for block_structure_usage_keys"""
+
+    def test_usage_keys(self):
+        block_structure = self.create_block_structure(self.SIMPLE_CHILDREN_MAP)
+        assert block_structure_usage_keys(block_structure, 0) == [0, 1, 2, 3, 4]
+        assert block_structure_usage_keys(block_structure, 0, depth=1) == [0, 1, 2]
+        assert block_structure_usage_keys(block_structure, 1) == [1, 3, 4]
+        assert block_structure_usage_keys(block_structure, 5) == []
@@ -2436,6 +2436,24 @@ class TestFilteredChildren(SharedModuleStoreTestCase):
         else:
             self.assertBoundChildren(block, user)
 
+    @ddt.data(*itertools.product(BLOCK_TYPES, USER_NUMBERS))
+    @ddt.unpack
+    @XBlock.register_temp_plugin(PureXBlockWithChildren, identifier='xblock')
+    @XBlock.register_temp_plugin(EmptyXModuleDescriptorWithChildren, identifier='xmodule')
+    def test_children_bound_together(self, block_type, user_number):
+        user = self.users[user_number]
+        block = self._bind_block(self._load_block(block_type), user)
+        with patch(
+            'lms.djangoapps.courseware.module_render.has_access_many', side_effect=self._has_access_many
+        ) as mock_has_access_many:
+            render.bind_children_for_user(user, block, self.course.id)
+        mock_has_access_many.assert_called_once()
+
+        # The children are not checked again when they are loaded
+        with patch('lms.djangoapps.courseware.module_render.has_access') as mock_has_access:
+            self.assertBoundChildren(block, user)
+        mock_has_access.assert_not_called()
+
     def _load_block(self, block_type):
         """
         Instantiate an XBlock of `block_type` with the appropriate set of children.
@@ -2490,6 +2508,12 @@ class TestFilteredChildren(SharedModuleStoreTestCase):
             return AccessResponse(True)
         return AccessResponse(key in self.children_for_user[user])
 
+    def _has_access_many(self, user, action, objs, course_key):
+        """
+        Mock implementation of `has_access_many`, see `_has_access`.
+        """
+        return [self._has_access(user, action, obj, course_key) for obj in objs]
+
     def assertBoundChildren(self, block, user):
         """
         Ensure the bound children are indeed children.
@@ -7,11 +7,14 @@ defined in edx_user_state_client.
 from collections import defaultdict
 
 from django.db import connections
-
+from django.test import TestCase, override_settings
+from edx_django_utils.cache import RequestCache
 from edx_user_state_client.tests import UserStateClientTestBase
+from opaque_keys.edx.keys import CourseKey
 
 from common.djangoapps.student.tests.factories import UserFactory
-from lms.djangoapps.courseware.user_state_client import DjangoXBlockUserStateClient
+from lms.djangoapps.courseware.models import StudentModule
+from lms.djangoapps.courseware.user_state_client import DjangoXBlockUserStateClient, UserStateWriteBehindBuffer
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
 
 
@@ -36,3 +39,76 @@ class TestDjangoUserStateClient(UserStateClientTestBase, ModuleStoreTestCase):
         super().setUp()
         self.client = DjangoXBlockUserStateClient()
         self.users = defaultdict(UserFactory.create)
+
+
+@override_settings(XBLOCK_USER_STATE_REQUEST_BUFFERED_BLOCK_TYPES=['video'])
+class TestUserStateWriteBehind(TestCase):
+    """
+    Tests of buffering the user state writes of a request.
+    """
+    # Tell Django to clean out all databases, not just default
+    databases = {alias for alias in connections}  # lint-amnesty, pylint: disable=unnecessary-comprehension
+
+    def setUp(self):
+        super().setUp()
+        RequestCache.clear_all_namespaces()
+        self.user = UserFactory.create()
+        self.client = DjangoXBlockUserStateClient(self.user)
+        course_key = CourseKey.from_string('course-v1:org+course+run')
+        self.video_key = course_key.make_usage_key('video', 'video')
+        self.problem_key = course_key.make_usage_key('problem', 'problem')
+
+    def get_state(self, usage_key):
+        return self.client.get(self.user.username, usage_key).state
+
+    def test_coalesced_writes(self):
+        UserStateWriteBehindBuffer.activate()
+        self.client.set(self.user.username, self.video_key, {'position': 1, 'speed': 2})
+        self.client.set(self.user.username, self.video_key, {'position': 3})
+        assert not StudentModule.objects.filter(module_state_key=self.video_key).exists()
+
+        UserStateWriteBehindBuffer.deactivate()
+        assert self.get_state(self.video_key) == {'position': 3, 'speed': 2}
+
+    def test_writes_not_buffered_without_request(self):
+        self.client.set(self.user.username, self.video_key, {'position': 1})
+        assert StudentModule.objects.filter(module_state_key=self.video_key).exists()
+
+    def test_other_block_types_written_in_order(self):
+        UserStateWriteBehindBuffer.activate()
+        self.client.set(self.user.username, self.video_key, {'position': 1})
+        self.client.set(self.user.username, self.problem_key, {'attempts': 1})
+
+        # The video's state was written first.
+        video_module = StudentModule.objects.get(module_state_key=self.video_key)
+        problem_module = StudentModule.objects.get(module_state_key=self.problem_key)
+        assert video_module.id < problem_module.id
+
+    def test_reads_see_buffered_writes(self):
+        UserStateWriteBehindBuffer.activate()
+        self.client.set(self.user.username, self.video_key, {'position': 1})
+        assert self.get_state(self.video_key) == {'position': 1}
+
+    def test_buffering_writes_on_exit(self):
+        with UserStateWriteBehindBuffer.buffering():
+            self.client.set(self.user.username, self.video_key, {'position': 1})
+            self.client.set(self.user.username, self.video_key, {'position': 2})
+            assert not StudentModule.objects.filter(module_state_key=self.video_key).exists()
+
+        assert UserStateWriteBehindBuffer.current() is None
+        assert self.get_state(self.video_key) == {'position': 2}
+
+    def test_buffering_discards_on_exception(self):
+        with self.assertRaises(ValueError):
+            with UserStateWriteBehindBuffer.buffering():
+                self.client.set(self.user.username, self.video_key, {'position': 1})
+                raise ValueError
+
+        assert UserStateWriteBehindBuffer.current() is None
+        assert not StudentModule.objects.filter(module_state_key=self.video_key).exists()
+
+    @override_settings(XBLOCK_USER_STATE_REQUEST_BUFFERED_BLOCK_TYPES=[])
+    def test_buffering_without_block_types(self):
+        with UserStateWriteBehindBuffer.buffering():
+            self.client.set(self.user.username, self.video_key, {'position': 1})
+            assert StudentModule.objects.filter(module_state_key=self.video_key).exists()
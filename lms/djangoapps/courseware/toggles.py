@@ -116,6 +116,19 @@ COURSEWARE_OPTIMIZED_RENDER_XBLOCK = CourseWaffleFlag(
     WAFFLE_FLAG_NAMESPACE, 'optimized_render_xblock', __name__
 )
 
+# .. toggle_name: courseware.prefetch_field_data
+# .. toggle_implementation: CourseWaffleFlag
+# .. toggle_default: False
+# .. toggle_description: Waffle flag to load the learner's field data for the course outline and the requested
+#   sequence of the courseware page with one query per scope, using the usage keys from the course's collected
+#   block structure, instead of querying again for each part of the page as it is loaded.
+# .. toggle_use_cases: temporary
+# .. toggle_creation_date: 2026-10-18
+# .. toggle_target_removal_date: 2027-01-31
+COURSEWARE_PREFETCH_FIELD_DATA = CourseWaffleFlag(
+    WAFFLE_FLAG_NAMESPACE, 'prefetch_field_data', __name__
+)
+
 # .. toggle_name: courseware.mfe_special_exams
 # .. toggle_implementation: CourseWaffleFlag
 # .. toggle_default: False
@@ -6,6 +6,7 @@ data in a Django ORM model.
 
 import itertools
 import logging
+from contextlib import contextmanager
 from operator import attrgetter
 from time import time
 
@@ -15,6 +16,7 @@ from django.core.paginator import Paginator
 from django.db import transaction
 from django.db.utils import IntegrityError
 from edx_django_utils import monitoring as monitoring_utils
+from edx_django_utils.cache import RequestCache
 from edx_user_state_client.interface import XBlockUserState, XBlockUserStateClient
 from xblock.fields import Scope
 
@@ -166,6 +168,7 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
         """
         if scope != Scope.user_state:
             raise ValueError(f"Only Scope.user_state is supported, not {scope}")
+        UserStateWriteBehindBuffer.flush_current()
 
         total_block_count = 0
         evt_time = time()
@@ -240,6 +243,22 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
             # what we have.
             return
 
+        write_behind_buffer = UserStateWriteBehindBuffer.current()
+        if write_behind_buffer is not None:
+            block_keys_to_state = write_behind_buffer.add_many(user, block_keys_to_state)
+            if not block_keys_to_state:
+                return
+            # Write the buffered state first, so that writes reach the database
+            # in the order they were made.
+            write_behind_buffer.flush()
+
+        self._set_many_now(user, block_keys_to_state)
+
+    def _set_many_now(self, user, block_keys_to_state):
+        """
+        Write the state of the blocks in `block_keys_to_state` for `user` to
+        the database; see :meth:`set_many`.
+        """
         evt_time = time()
 
         for usage_key, state in block_keys_to_state.items():
@@ -322,6 +341,7 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
         """
         if scope != Scope.user_state:
             raise ValueError("Only Scope.user_state is supported")
+        UserStateWriteBehindBuffer.flush_current()
 
         evt_time = time()  # lint-amnesty, pylint: disable=unused-variable
         student_modules = self._get_student_modules(username, block_keys)
@@ -361,6 +381,7 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
 
         if scope != Scope.user_state:
             raise ValueError("Only Scope.user_state is supported")
+        UserStateWriteBehindBuffer.flush_current()
         student_modules = list(
             student_module
             for student_module, usage_id
@@ -411,6 +432,7 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
         """
         if scope != Scope.user_state:
             raise ValueError("Only Scope.user_state is supported")
+        UserStateWriteBehindBuffer.flush_current()
 
         results = StudentModule.objects.order_by('id').filter(module_state_key=block_key)
         p = Paginator(results, settings.USER_STATE_BATCH_SIZE)
@@ -443,6 +465,7 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
         """
         if scope != Scope.user_state:
             raise ValueError("Only Scope.user_state is supported")
+        UserStateWriteBehindBuffer.flush_current()
 
         results = StudentModule.objects.order_by('id').filter(course_id=course_key)
         if block_type:
@@ -460,3 +483,116 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
                     continue
 
                 yield XBlockUserState(sm.student.username, sm.module_state_key, state, sm.modified, scope)
+
+
+class UserStateWriteBehindBuffer:
+    """
+    Buffers the user state writes of an XBlock handler call to blocks of the
+    types listed in the XBLOCK_USER_STATE_REQUEST_BUFFERED_BLOCK_TYPES setting,
+    to write them when the handler returns (see buffering).
+
+    The writes to a (user, block) pair made during a handler call are
+    coalesced into one, which also adds a single history row.  Writes made by
+    separate requests are not coalesced, so this only helps block types that
+    save the same state several times while handling a single request.
+
+    Buffered writes don't overtake the other writes of the request:  the
+    buffer is written before any other block's state is, including graded
+    blocks' (which shouldn't be listed in the setting), and before any state
+    is read or deleted.
+    """
+    REQUEST_CACHE_NAMESPACE = 'courseware.user_state_write_behind'
+
+    def __init__(self):
+        self._pending = {}
+
+    @classmethod
+    @contextmanager
+    def buffering(cls):
+        """
+        Context manager that buffers the writes made within it, when the
+        setting lists any block types.  The buffered writes are written when
+        it exits, or discarded if it exits with an exception, as the writes
+        of a rolled back transaction would be.
+        """
+        if not settings.XBLOCK_USER_STATE_REQUEST_BUFFERED_BLOCK_TYPES or cls.current() is not None:
+            yield
+            return
+
+        cls.activate()
+        try:
+            yield
+        except BaseException:
+            cls.deactivate(discard=True)
+            raise
+        cls.deactivate()
+
+    @classmethod
+    def activate(cls):
+        """
+        Start buffering writes for the current request.
+        """
+        buffer = cls()
+        RequestCache(cls.REQUEST_CACHE_NAMESPACE).set('buffer', buffer)
+        return buffer
+
+    @classmethod
+    def current(cls):
+        """
+        Return the buffer of the current request, or None if writes aren't
+        buffered.
+        """
+        cached_response = RequestCache(cls.REQUEST_CACHE_NAMESPACE).get_cached_response('buffer')
+        return cached_response.value if cached_response.is_found else None
+
+    @classmethod
+    def flush_current(cls):
+        """
+        Write the buffered writes of the current request, if any.
+        """
+        buffer = cls.current()
+        if buffer is not None:
+            buffer.flush()
+
+    @classmethod
+    def deactivate(cls, discard=False):
+        """
+        Stop buffering, and write the buffered writes of the current request
+        unless discard is True.
+        """
+        buffer = cls.current()
+        if buffer is not None:
+            RequestCache(cls.REQUEST_CACHE_NAMESPACE).delete('buffer')
+            if not discard:
+                buffer.flush()
+
+    def add_many(self, user, block_keys_to_state):
+        """
+        Buffer the states for the blocks whose type is written behind, and
+        return the states of the other blocks, which must be written now.
+        """
+        write_behind_types = settings.XBLOCK_USER_STATE_REQUEST_BUFFERED_BLOCK_TYPES
+        write_now = {}
+        for usage_key, state in block_keys_to_state.items():
+            if usage_key.block_type not in write_behind_types:
+                write_now[usage_key] = state
+                continue
+
+            pending_key = (user.id, usage_key)
+            if pending_key in self._pending:
+                monitoring_utils.accumulate('xb_user_state.write_behind.coalesced', 1)
+                self._pending[pending_key][1].update(state)
+            else:
+                self._pending[pending_key] = (user, dict(state))
+        return write_now
+
+    def flush(self):
+        """
+        Write the buffered writes, in the order their blocks were first
+        written to.
+        """
+        pending, self._pending = self._pending, {}
+        for (_, usage_key), (user, state) in pending.items():
+            DjangoXBlockUserStateClient(user)._set_many_now(  # pylint: disable=protected-access
+                user, {usage_key: state},
+            )
@@ -31,6 +31,7 @@ from lms.djangoapps.courseware.exceptions import CourseAccessRedirect, Redirect
 from lms.djangoapps.experiments.utils import get_experiment_user_metadata_context
 from lms.djangoapps.gating.api import get_entrance_exam_score_ratio, get_entrance_exam_usage_key
 from lms.djangoapps.grades.api import CourseGradeFactory
+from openedx.core.djangoapps.content.block_structure.api import get_block_structure_manager
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.core.djangoapps.crawlers.models import CrawlersConfig
 from openedx.core.djangoapps.lang_pref import LANGUAGE_KEY
@@ -61,10 +62,14 @@ from ..entrance_exams import (
     user_has_passed_entrance_exam
 )
 from ..masquerade import check_content_start_date_for_masquerade_user, setup_masquerade
-from ..model_data import FieldDataCache
-from ..module_render import get_module_for_descriptor, toc_for_course
+from ..model_data import FieldDataCache, block_structure_usage_keys
+from ..module_render import bind_children_for_user, get_module_for_descriptor, toc_for_course
 from ..permissions import MASQUERADE_AS_STUDENT
-from ..toggles import courseware_legacy_is_visible, courseware_mfe_is_advertised
+from ..toggles import (
+    COURSEWARE_PREFETCH_FIELD_DATA,
+    courseware_legacy_is_visible,
+    courseware_mfe_is_advertised,
+)
 from .views import CourseTabView
 
 log = logging.getLogger("edx.courseware.views.index")
@@ -361,13 +366,12 @@ class CoursewareIndex(View):
         Prefetches all descendant data for the requested section and
         sets up the runtime, which binds the request user to the section.
         """
-        self.field_data_cache = FieldDataCache.cache_for_descriptor_descendents(
-            self.course_key,
-            self.effective_user,
-            self.course,
-            depth=CONTENT_DEPTH,
-            read_only=CrawlersConfig.is_crawler(request),
+        self.field_data_cache = FieldDataCache(
+            [], self.course_key, self.effective_user, read_only=CrawlersConfig.is_crawler(request),
         )
+        if COURSEWARE_PREFETCH_FIELD_DATA.is_enabled(self.course_key):
+            self._prefetch_field_data()
+        self.field_data_cache.add_descriptor_descendents(self.course, depth=CONTENT_DEPTH)
 
         self.course = get_module_for_descriptor(
             self.effective_user,
@@ -379,6 +383,19 @@ class CoursewareIndex(View):
             will_recheck_access=True,
         )
 
+    def _prefetch_field_data(self):
+        """
+        Prefetches the field data of the course outline and of the requested
+        section, with one query per scope, so that binding the course and
+        then the section doesn't query each scope twice.
+        """
+        block_structure = get_block_structure_manager(self.course_key).get_collected()
+        usage_keys = block_structure_usage_keys(block_structure, self.course.location, depth=CONTENT_DEPTH)
+        if self.section_url_name:
+            section_key = self.course_key.make_usage_key('sequential', self.section_url_name)
+            usage_keys.extend(block_structure_usage_keys(block_structure, section_key))
+        self.field_data_cache.prefetch(usage_keys)
+
     def _prefetch_and_bind_section(self):
         """
         Prefetches all descendant data for the requested section and
@@ -399,6 +416,8 @@ class CoursewareIndex(View):
             course=self.course,
             will_recheck_access=True,
         )
+        if self.section:
+            bind_children_for_user(self.effective_user, self.section, self.course_key, will_recheck_access=True)
 
     def _save_positions(self):
         """
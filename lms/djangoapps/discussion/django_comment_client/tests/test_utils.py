@@ -3,13 +3,17 @@
 
 import datetime
 import json
+import threading
+from functools import partial
 from unittest import mock
 from unittest.mock import Mock, patch
 
 import ddt
 import pytest
 from django.test import RequestFactory, TestCase
+from django.test.utils import override_settings
 from django.urls import reverse
+from django.utils import translation
 from edx_django_utils.cache import RequestCache
 from opaque_keys.edx.keys import CourseKey
 from pytz import UTC
@@ -31,6 +35,9 @@ from openedx.core.djangoapps.course_groups.cohorts import set_course_cohorted
 from openedx.core.djangoapps.course_groups.tests.helpers import CohortFactory, config_course_cohorts
 from openedx.core.djangoapps.django_comment_common.comment_client.utils import (
     CommentClientMaintenanceError,
+    CommentClientRequestError,
+    _get_session,
+    fan_out,
     perform_request
 )
 from openedx.core.djangoapps.django_comment_common.models import (
@@ -1683,6 +1690,86 @@ class ClientConfigurationTestCase(TestCase):
         result = perform_request('GET', 'http://www.google.com')
         assert result == {}
 
+    @patch('requests.request')
+    def test_config_cached_in_request(self, mock_request):
+        """Ensures that the config is only looked up once per request."""
+        config = ForumsConfig(enabled=True)
+        mock_request.return_value = Mock(status_code=200, json=lambda: {})
+
+        RequestCache.clear_all_namespaces()
+        with patch.object(ForumsConfig, 'current', return_value=config) as mock_current:
+            with patch(
+                'openedx.core.djangoapps.django_comment_common.comment_client.utils.get_current_request',
+                return_value=RequestFactory().get('/'),
+            ):
+                perform_request('GET', 'http://www.google.com')
+                perform_request('GET', 'http://www.google.com')
+            assert mock_current.call_count == 1
+
+            perform_request('GET', 'http://www.google.com')
+            assert mock_current.call_count == 2
+        RequestCache.clear_all_namespaces()
+
+    @override_settings(COMMENTS_SERVICE_POOL_SIZE=5, COMMENTS_SERVICE_MAX_RETRIES=3)
+    @patch('requests.Session.request')
+    @patch('requests.request')
+    def test_pooled_session(self, mock_request, mock_session_request):
+        """Ensures that requests reuse the connections of a session when they are pooled."""
+        config = ForumsConfig.current()
+        config.enabled = True
+        config.save()
+        mock_session_request.return_value = Mock(status_code=200, json=lambda: {})
+
+        session = _get_session()
+        assert _get_session() is session
+        adapter = session.get_adapter('http://www.google.com')
+        assert adapter._pool_maxsize == 5
+        assert adapter.max_retries.total == 3
+
+        assert perform_request('GET', 'http://www.google.com') == {}
+        assert mock_session_request.call_count == 1
+        assert not mock_request.called
+
+        with override_settings(COMMENTS_SERVICE_POOL_SIZE=0):
+            assert _get_session() is None
+
+    @override_settings(COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS=2)
+    @patch('requests.request')
+    def test_fan_out(self, mock_request):
+        """Ensures that fan_out makes the calls from other threads, like the calling thread would."""
+        config = ForumsConfig.current()
+        config.enabled = True
+        config.save()
+        threads = []
+
+        def make_response(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return Mock(status_code=200, json=lambda: {'url': args[1]})
+
+        mock_request.side_effect = make_response
+        urls = [f'http://www.google.com/{i}' for i in range(3)]
+        with translation.override('eo'):
+            results = fan_out(*[partial(perform_request, 'GET', url) for url in urls])
+
+        assert results == [{'url': url} for url in urls]
+        assert threading.current_thread() not in threads
+        for call in mock_request.call_args_list:
+            assert call[1]['headers']['Accept-Language'] == 'eo'
+
+    @override_settings(COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS=2)
+    def test_fan_out_exception(self):
+        """Ensures that fan_out raises the exception of the first failed call once all the calls are done."""
+        calls = [
+            Mock(return_value=1),
+            Mock(side_effect=CommentClientRequestError('Not found', 404)),
+            Mock(side_effect=CommentClientMaintenanceError('Maintenance')),
+            Mock(return_value=4),
+        ]
+        with pytest.raises(CommentClientRequestError):
+            fan_out(*calls)
+        for call in calls:
+            assert call.call_count == 1
+
 
 def set_discussion_division_settings(
         course_key, enable_cohorts=False, always_divide_inline_discussions=False,
@@ -4,7 +4,7 @@ Views handling read (GET) requests for the Discussion tab and inline discussions
 
 
 import logging
-from functools import wraps
+from functools import partial, wraps
 
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
@@ -537,12 +537,16 @@ def create_user_profile_context(request, course_key, user_id):
     else:
         profiled_user = cc.User(id=user_id, course_id=course_key)
 
-    threads, page, num_pages = profiled_user.active_threads(query_params)
+    # The threads and the requesting user don't depend on each other, so they
+    # are retrieved from the comments service at the same time.
+    (threads, page, num_pages), user_info = cc.utils.fan_out(
+        partial(profiled_user.active_threads, query_params),
+        cc.User.from_django_user(request.user).to_dict,
+    )
     query_params['page'] = page
     query_params['num_pages'] = num_pages
 
     with function_trace("get_metadata_for_threads"):
-        user_info = cc.User.from_django_user(request.user).to_dict()
         annotated_content_info = utils.get_metadata_for_threads(course_key, threads, request.user, user_info)
 
     is_staff = has_permission(request.user, 'openclose_thread', course.id)
@@ -647,12 +651,16 @@ def followed_threads(request, course_key, user_id):
         if group_id is not None:
             query_params['group_id'] = group_id
 
-        paginated_results = profiled_user.subscribed_threads(query_params)
+        # The threads and the requesting user don't depend on each other, so
+        # they are retrieved from the comments service at the same time.
+        paginated_results, user_info = cc.utils.fan_out(
+            partial(profiled_user.subscribed_threads, query_params),
+            cc.User.from_django_user(request.user).to_dict,
+        )
         print("\n \n \n paginated results \n \n \n ")
         print(paginated_results)
         query_params['page'] = paginated_results.page
         query_params['num_pages'] = paginated_results.num_pages
-        user_info = cc.User.from_django_user(request.user).to_dict()
 
         with function_trace("get_metadata_for_threads"):
             annotated_content_info = utils.get_metadata_for_threads(
@@ -110,6 +110,25 @@ class CourseData:
         """
         return f'Course: course_key: {self.course_key}'
 
+    def __getstate__(self):
+        """
+        Excludes the course and block structures when pickled (for example,
+        when sent from a grading worker process), since they are large and
+        are either reloaded lazily or reattached by the receiver.
+        """
+        state = self.__dict__.copy()
+        state.update(_collected_block_structure=None, _structure=None, _course=None)
+        return state
+
+    def reattach(self, course_data):
+        """
+        Reuses the course and collected block structure already loaded by
+        the given course_data for the same course, typically after being
+        unpickled.
+        """
+        self._collected_block_structure = course_data._collected_block_structure  # pylint: disable=protected-access
+        self._course = course_data._course  # pylint: disable=protected-access
+
     def full_string(self):  # lint-amnesty, pylint: disable=missing-function-docstring
         if self.effective_structure:
             return 'Course: course_key: {}, version: {}, edited_on: {}, grading_policy: {}'.format(
@@ -34,6 +34,10 @@ class CourseGradeBase:
         self.letter_grade = letter_grade or None
         self.force_update_subsections = force_update_subsections
 
+        # Subsection grades computed before this course grade was sent to
+        # another process, keyed by subsection usage key; see detach.
+        self._detached_subsection_grades = None
+
     def __str__(self):
         return 'Course Grade: percent: {}, letter_grade: {}, passed: {}'.format(
             str(self.percent),
@@ -61,6 +65,9 @@ class CourseGradeBase:
         shown to users that shouldn't be able to access it
         (e.g. a student shouldn't see a grade for an unreleased subsection);
         """
+        if self._detached_subsection_grades and subsection_key in self._detached_subsection_grades:
+            return self._detached_subsection_grades[subsection_key]
+
         # look in the user structure first and fallback to the collected;
         # however, we assume the state of course_data is intentional,
         # so we use effective_structure to avoid additional fetching
@@ -123,6 +130,15 @@ class CourseGradeBase:
                 problem_scores.update(subsection_grade.problem_scores)
         return problem_scores
 
+    def detach(self):
+        """
+        Computes all subsection grades so that they remain available after
+        this course grade is pickled, since its course data drops the
+        user's block structure when pickled.
+        """
+        self._detached_subsection_grades = dict(self.subsection_grades)
+        self.problem_scores  # pylint: disable=pointless-statement
+
     def chapter_percentage(self, chapter_key):
         """
         Returns the rounded aggregate weighted percentage for the given chapter.
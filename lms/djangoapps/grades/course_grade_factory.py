@@ -1,14 +1,23 @@
 """
 Course Grade Factory Class
 """
-from collections import namedtuple
+import multiprocessing
+import pickle
+from collections import deque, namedtuple
+from contextlib import contextmanager
+from itertools import islice
 from logging import getLogger
 
+from django.conf import settings
+from django.core.cache import close_caches
+from django.db import connections
+
 from openedx.core.djangoapps.signals.signals import (
     COURSE_GRADE_CHANGED,
     COURSE_GRADE_NOW_FAILED,
     COURSE_GRADE_NOW_PASSED
 )
+from xmodule.modulestore.django import clear_existing_modulestores
 
 from .config import assume_zero_if_absent, should_persist_grades
 from .course_data import CourseData
@@ -18,12 +27,17 @@ from .models_api import prefetch_grade_overrides_and_visible_blocks
 
 log = getLogger(__name__)
 
+# Context shared with grading worker processes, which inherit it when
+# forked: a tuple of (CourseData, force_update).
+_worker_context = None
+
 
 class CourseGradeFactory:
     """
     Factory class to create Course Grade objects.
     """
     GradeResult = namedtuple('GradeResult', ['student', 'course_grade', 'error'])
+    WorkerPool = namedtuple('WorkerPool', ['pool', 'course_data', 'workers'])
 
     def read(
             self,
@@ -85,6 +99,8 @@ class CourseGradeFactory:
             collected_block_structure=None,
             course_key=None,
             force_update=False,
+            worker_pool=None,
+            batch_size=None,
     ):
         """
         Given a course and an iterable of students (User), yield a GradeResult
@@ -94,7 +110,20 @@ class CourseGradeFactory:
 
         If an error occurred, course_grade will be None and err_msg will be an
         exception message. If there was no error, err_msg is an empty string.
+
+        Students are graded in the calling process, unless a worker_pool
+        created by worker_pool() is given.  Then students are split into
+        batches of at most batch_size (defaulting to
+        settings.GRADES_ITER_BATCH_SIZE, and lowered so that every worker gets
+        a batch) and graded in the pool's worker processes, for the course
+        and force_update the pool was created with.  Results are still
+        yielded in the order of users.
         """
+        if worker_pool is not None:
+            batch_size = batch_size or settings.GRADES_ITER_BATCH_SIZE
+            yield from self._iter_in_workers(users, worker_pool, batch_size)
+            return
+
         # Pre-fetch the collected course_structure (in _iter_grade_result) so:
         # 1. Correctness: the same version of the course is used to
         #    compute the grade for all students.
@@ -107,6 +136,130 @@ class CourseGradeFactory:
         for user in users:
             yield self._iter_grade_result(user, course_data, force_update)
 
+    @contextmanager
+    def worker_pool(self, workers, course=None, collected_block_structure=None, course_key=None, force_update=False):
+        """
+        Context manager that yields a WorkerPool of the given number of forked
+        worker processes, for passing to iter to grade students of the given
+        course.  Forking the processes is expensive, so a task like a grade
+        report creates the pool once and passes it to each of its iter calls.
+
+        Yields None, so that iter grades students in the calling process, if
+        workers is not greater than 1 or a database transaction is open.
+        """
+        global _worker_context  # pylint: disable=global-statement
+
+        if workers <= 1:
+            yield None
+            return
+
+        course_data = CourseData(
+            user=None, course=course, collected_block_structure=collected_block_structure, course_key=course_key,
+        )
+        # Load the shared data before forking, so it is loaded only once.
+        course_data.collected_structure  # pylint: disable=pointless-statement
+        course_data.course  # pylint: disable=pointless-statement
+
+        # Keep the context for the life of the pool, since the pool forks
+        # replacements for any worker processes that exit.
+        _worker_context = (course_data, force_update)
+        try:
+            pool = self._create_pool(workers)
+            if pool is None:
+                log.warning('Grades: Grading in a single process since a transaction is open.')
+                yield None
+                return
+            with pool:
+                yield self.WorkerPool(pool, course_data, workers)
+        finally:
+            _worker_context = None
+
+    def _iter_in_workers(self, users, worker_pool, batch_size):
+        """
+        Yields a GradeResult for each of the given users, computed by the
+        processes of the given worker_pool.
+        """
+        course_data = worker_pool.course_data
+        if hasattr(users, '__len__'):
+            batch_size = min(batch_size, max(1, -(-len(users) // worker_pool.workers)))
+
+        # The pool consumes batches from another thread; remember them
+        # so results can be matched with the original user objects.
+        pending_batches = deque()
+
+        def record_batches():
+            for batch in self._iter_batches(users, batch_size):
+                pending_batches.append(batch)
+                yield batch
+
+        for results in worker_pool.pool.imap(_grade_batch_in_worker, record_batches()):
+            for user, result in zip(pending_batches.popleft(), results):
+                if result is None:
+                    yield self._read_unsent_grade_result(user, course_data)
+                    continue
+                course_grade, error = result
+                if course_grade is not None:
+                    course_grade.course_data.reattach(course_data)
+                yield self.GradeResult(user, course_grade, error)
+
+    @staticmethod
+    def _iter_batches(users, batch_size):
+        """
+        Yields lists of at most batch_size users.
+        """
+        users = iter(users)
+        batch = list(islice(users, batch_size))
+        while batch:
+            yield batch
+            batch = list(islice(users, batch_size))
+
+    @classmethod
+    def _create_pool(cls, workers):
+        """
+        Returns a pool of the given number of forked worker processes, or
+        None if a database transaction is open.
+        """
+        if cls._in_transaction():
+            return None
+        # Database connections must not be shared with forked processes;
+        # each process opens its own connections as needed.
+        connections.close_all()
+        return multiprocessing.get_context('fork').Pool(workers, initializer=_init_worker)
+
+    @staticmethod
+    def _in_transaction():
+        """
+        Returns whether a database transaction is open, which forked worker
+        processes could neither see nor share.
+        """
+        return any(connection.in_atomic_block for connection in connections.all())
+
+    def _read_unsent_grade_result(self, user, course_data):
+        """
+        Returns a GradeResult for a user whose grade was computed by a worker
+        process but could not be sent back from it.
+
+        The worker may already have updated the grade and sent the grade
+        change signals, so the grade is only read from storage here, rather
+        than computed again.
+        """
+        try:
+            course_grade = self.read(
+                user,
+                course=course_data.course,
+                collected_block_structure=course_data.collected_structure,
+                course_key=course_data.course_key,
+                create_if_needed=False,
+            )
+            if course_grade is None:
+                raise PersistentCourseGrade.DoesNotExist(
+                    f'The grade of user {user.id} could not be sent back from a worker process.'
+                )
+            return self.GradeResult(user, course_grade, None)
+        except Exception as exc:  # pylint: disable=broad-except
+            log.exception('Cannot read grade of student %s in course %s', user.id, course_data.course_key)
+            return self.GradeResult(user, None, exc)
+
     def _iter_grade_result(self, user, course_data, force_update):  # lint-amnesty, pylint: disable=missing-function-docstring
         try:
             kwargs = {
@@ -221,3 +374,44 @@ class CourseGradeFactory:
         )
 
         return course_grade
+
+
+def _init_worker():
+    """
+    Gives a newly forked worker process its own connections to the caches
+    and the modulestore.  The clients inherited from the parent process
+    share its sockets, so the processes could read each other's responses.
+
+    Closing the inherited cache clients only closes this process's copies
+    of their sockets; they reconnect when next used.  The modulestore is
+    created again when next needed; the pymongo connection pools of objects
+    loaded before forking (like the course) are reset by pymongo itself
+    when used from another process.
+    """
+    close_caches()
+    clear_existing_modulestores()
+
+
+def _grade_batch_in_worker(users):
+    """
+    Grades the given users in a worker process, using the context inherited
+    from the parent process.  Returns a (course_grade, error) tuple for each
+    user, or None for results that cannot be pickled, in which case the
+    parent process reads that user's grade from storage.
+    """
+    course_data, force_update = _worker_context
+    results = []
+    for user in users:
+        _, course_grade, error = CourseGradeFactory()._iter_grade_result(  # pylint: disable=protected-access
+            user, course_data, force_update,
+        )
+        try:
+            if course_grade is not None:
+                course_grade.detach()
+            pickle.dumps((course_grade, error))
+        except Exception:  # pylint: disable=broad-except
+            log.exception('Grades: Cannot send the grade of user %s from worker process.', user.id)
+            results.append(None)
+        else:
+            results.append((course_grade, error))
+    return results
@@ -12,3 +12,11 @@ def plugin_settings(settings):
     settings.POLICY_CHANGE_GRADES_ROUTING_KEY = settings.ENV_TOKENS.get(
         'POLICY_CHANGE_GRADES_ROUTING_KEY', settings.DEFAULT_PRIORITY_QUEUE,
     )
+
+    # Number of worker processes used by grade reports
+    settings.GRADES_ITER_WORKERS = settings.ENV_TOKENS.get('GRADES_ITER_WORKERS', settings.GRADES_ITER_WORKERS)
+
+    # Number of users sent to a worker process at a time by grade reports
+    settings.GRADES_ITER_BATCH_SIZE = settings.ENV_TOKENS.get(
+        'GRADES_ITER_BATCH_SIZE', settings.GRADES_ITER_BATCH_SIZE,
+    )
@@ -2,10 +2,12 @@
 Tests for the CourseGradeFactory class.
 """
 import itertools
+import pickle
 from unittest.mock import patch
 
 import ddt
 from django.conf import settings
+from django.test import override_settings
 from edx_toggles.toggles.testutils import override_waffle_switch
 
 from common.djangoapps.student.tests.factories import UserFactory
@@ -16,7 +18,7 @@ from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 from xmodule.modulestore.tests.factories import CourseFactory
 
 from ..config.waffle import ASSUME_ZERO_GRADE_IF_ABSENT, waffle_switch
-from ..course_grade import CourseGrade, ZeroCourseGrade
+from ..course_grade import CourseGrade, CourseGradeBase, ZeroCourseGrade
 from ..course_grade_factory import CourseGradeFactory
 from ..subsection_grade import ReadSubsectionGrade, ZeroSubsectionGrade
 from .base import GradeTestBase
@@ -335,6 +337,89 @@ class TestGradeIteration(SharedModuleStoreTestCase):
         assert all_course_grades[student2] is not None
         assert all_course_grades[student5] is not None
 
+    @override_settings(GRADES_ITER_WORKERS=2)
+    def test_iter_in_calling_process_by_default(self):
+        with patch.object(CourseGradeFactory, '_create_pool') as mock_create_pool:
+            grade_results = list(CourseGradeFactory().iter(self.students, self.course))
+
+        mock_create_pool.assert_not_called()
+        assert [student for student, _, _ in grade_results] == self.students
+
+    def test_iter_in_workers(self):
+        with patch.object(CourseGradeFactory, '_create_pool', side_effect=InProcessPool) as mock_create_pool:
+            factory = CourseGradeFactory()
+            with factory.worker_pool(2, self.course) as worker_pool:
+                grade_results = list(factory.iter(self.students[:2], worker_pool=worker_pool, batch_size=2))
+                grade_results += list(factory.iter(self.students[2:], worker_pool=worker_pool, batch_size=2))
+
+        # The pool is forked once for all the calls.
+        mock_create_pool.assert_called_once_with(2)
+        assert [student for student, _, _ in grade_results] == self.students
+        for student, course_grade, error in grade_results:
+            assert error is None
+            assert course_grade.user == student
+            assert course_grade.percent == 0.0
+            assert course_grade.course_data.collected_structure is not None
+
+    def test_iter_in_workers_batches_for_every_worker(self):
+        iter_batches = CourseGradeFactory._iter_batches
+        with patch.object(CourseGradeFactory, '_create_pool', InProcessPool), \
+                patch.object(CourseGradeFactory, '_iter_batches', wraps=iter_batches) as mock_batches:
+            grade_results = self._grade_results_in_workers(batch_size=50)
+
+        # The 5 students are split for the 2 workers, rather than all sent to one.
+        assert mock_batches.call_args[0][1] == 3
+        assert [student for student, _, _ in grade_results] == self.students
+
+    def test_iter_in_forked_workers(self):
+        # The test's transaction is open, which would keep grading in this process.
+        with patch.object(CourseGradeFactory, '_in_transaction', return_value=False):
+            grade_results = self._grade_results_in_workers()
+
+        assert [student for student, _, _ in grade_results] == self.students
+        for student, course_grade, error in grade_results:
+            assert error is None
+            assert course_grade.user == student
+            assert course_grade.percent == 0.0
+            assert course_grade.course_data.collected_structure is not None
+
+    def test_unsent_results_not_regraded(self):
+        with patch.object(CourseGradeFactory, '_create_pool', InProcessPool), \
+                patch.object(CourseGradeBase, 'detach', side_effect=pickle.PicklingError), \
+                patch.object(CourseGradeFactory, '_update', wraps=CourseGradeFactory._update) as mock_update:
+            grade_results = self._grade_results_in_workers(force_update=True)
+
+        # Only the workers updated the grades; this process read what they stored.
+        assert mock_update.call_count == len(self.students)
+        assert [student for student, _, _ in grade_results] == self.students
+        for _, course_grade, error in grade_results:
+            assert (course_grade is None) != (error is None)
+
+    @patch('lms.djangoapps.grades.course_grade_factory.CourseGradeFactory.read')
+    def test_grading_exception_in_workers(self, mock_course_grade):
+        mock_course_grade.side_effect = [
+            Exception(f"Error for {student.username}.")
+            if student.username == 'student2'
+            else None
+            for student in self.students
+        ]
+        with patch.object(CourseGradeFactory, '_create_pool', InProcessPool):
+            grade_results = self._grade_results_in_workers()
+
+        assert [student for student, _, _ in grade_results] == self.students
+        assert [str(error) if error else None for _, _, error in grade_results] == [
+            None, 'Error for student2.', None, None, None,
+        ]
+
+    def _grade_results_in_workers(self, force_update=False, batch_size=2):
+        """
+        Returns the grade results of all students, graded in a pool of 2
+        worker processes.
+        """
+        factory = CourseGradeFactory()
+        with factory.worker_pool(2, self.course, force_update=force_update) as worker_pool:
+            return list(factory.iter(self.students, worker_pool=worker_pool, batch_size=batch_size))
+
     def _course_grades_and_errors_for(self, course, students):
         """
         Simple helper method to iterate through student grades and give us
@@ -351,3 +436,22 @@ class TestGradeIteration(SharedModuleStoreTestCase):
                 students_to_errors[student] = error
 
         return students_to_course_grades, students_to_errors
+
+
+class InProcessPool:
+    """
+    Stand-in for a pool of worker processes that runs tasks in the current
+    process, pickling results as they would be when sent back by a worker.
+    """
+    def __init__(self, workers):
+        self.workers = workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def imap(self, func, iterable):
+        for item in iterable:
+            yield pickle.loads(pickle.dumps(func(item)))
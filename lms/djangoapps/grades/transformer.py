@@ -39,6 +39,7 @@ class GradesTransformer(BlockStructureTransformer):
     """
     WRITE_VERSION = 4
     READ_VERSION = 4
+    SUPPORTS_INCREMENTAL_COLLECT = True
     FIELDS_TO_COLLECT = [
         'due',
         'format',
@@ -66,16 +67,29 @@ class GradesTransformer(BlockStructureTransformer):
         Collects any information that's necessary to execute this
         transformer's transform method.
         """
+        cls.collect_incrementally(block_structure, block_keys=None)
+
+    @classmethod
+    def collect_incrementally(cls, block_structure, block_keys):
+        """
+        Collects the grading information of only the given blocks.  A
+        block's max score only depends on the block itself, and the rest of
+        its grading information on its ancestors, so the information of all
+        other blocks is unaffected.  Computing max scores is what makes
+        collecting this transformer's data expensive.
+        """
         block_structure.request_xblock_fields(*cls.FIELDS_TO_COLLECT)
-        cls._collect_max_scores(block_structure)
+        cls._collect_max_scores(block_structure, block_keys)
         collect_unioned_set_field(
             block_structure=block_structure,
             transformer=cls,
             merged_field_name='subsections',
             filter_by=lambda block_key: block_key.block_type == 'sequential',
+            block_keys=block_keys,
         )
-        cls._collect_explicit_graded(block_structure)
-        cls._collect_grading_policy_hash(block_structure)
+        cls._collect_explicit_graded(block_structure, block_keys)
+        if block_keys is None or block_structure.root_block_usage_key in block_keys:
+            cls._collect_grading_policy_hash(block_structure)
 
     def transform(self, block_structure, usage_context):  # lint-amnesty, pylint: disable=arguments-differ
         """
@@ -96,9 +110,10 @@ class GradesTransformer(BlockStructureTransformer):
         return b64encode(sha1(ordered_policy.encode('utf-8')).digest()).decode('utf-8')
 
     @classmethod
-    def _collect_explicit_graded(cls, block_structure):
+    def _collect_explicit_graded(cls, block_structure, block_keys=None):
         """
-        Collect the 'explicit_graded' field for every block.
+        Collect the 'explicit_graded' field for every block, or only for
+        the blocks in block_keys if it is given.
         """
         def _set_field(block_key, field_value):
             """
@@ -117,6 +132,8 @@ class GradesTransformer(BlockStructureTransformer):
         block_types_to_ignore = {'course', 'chapter', 'sequential'}
 
         for block_key in block_structure.topological_traversal():
+            if block_keys is not None and block_key not in block_keys:
+                continue
             if block_key.block_type in block_types_to_ignore:
                 _set_field(block_key, None)
             else:
@@ -134,11 +151,14 @@ class GradesTransformer(BlockStructureTransformer):
                     _set_field(block_key, explicit_from_parents)
 
     @classmethod
-    def _collect_max_scores(cls, block_structure):
+    def _collect_max_scores(cls, block_structure, block_keys=None):
         """
-        Collect the `max_score` for every block in the provided `block_structure`.
+        Collect the `max_score` for every block in the provided `block_structure`,
+        or only for the blocks in `block_keys` if it is given.
         """
         for block_locator in block_structure.post_order_traversal():
+            if block_keys is not None and block_locator not in block_keys:
+                continue
             block = block_structure.get_xblock(block_locator)
             if getattr(block, 'has_score', False):
                 cls._collect_max_score(block_structure, block)
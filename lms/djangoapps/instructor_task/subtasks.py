@@ -3,6 +3,7 @@ This module contains celery task functions for handling the management of subtas
 """
 
 
+import heapq
 import json
 import logging
 from contextlib import contextmanager
@@ -28,6 +29,8 @@ SUBTASK_LOCK_EXPIRE = 60 * 10  # Lock expires in 10 minutes
 # Number of times to retry if a subtask update encounters a lock on the InstructorTask.
 # (These are recursive retries, so don't make this number too large.)
 MAX_DATABASE_LOCK_RETRIES = 5
+# Number of rows to fetch at a time when streaming the items of subtasks from the database.
+ITEM_QUERY_CHUNK_SIZE = 2000
 
 
 def _get_number_of_subtasks(total_num_items, items_per_task):
@@ -97,7 +100,7 @@ def _generate_items_for_subtask(
 
     with track_memory_usage('course_email.subtask_generation.memory', course_id):
         for queryset in item_querysets:
-            for item in queryset.values(*all_item_fields).iterator():
+            for item in queryset.values(*all_item_fields).iterator(chunk_size=ITEM_QUERY_CHUNK_SIZE):
                 if len(items_for_task) == items_per_task and num_subtasks < total_num_subtasks - 1:
                     yield items_for_task
                     num_items_queued += items_per_task
@@ -120,6 +123,64 @@ def _generate_items_for_subtask(
         TASK_LOG.info("Number of items generated by chunking %s not equal to original total %s", num_items_queued, total_num_items)  # lint-amnesty, pylint: disable=line-too-long
 
 
+def _generate_id_ranges_for_subtask(
+    item_querysets,
+    total_num_items,
+    items_per_task,
+    total_num_subtasks,
+    course_id,
+):
+    """
+    Generates the range of ids of the "items" that should be passed into a subtask.
+
+    Arguments:
+        `item_querysets` : a list of query sets, each of which defines the "items" that should be passed to subtasks.
+        `total_num_items` : the result of summing the count of each queryset in `item_querysets`.
+        `items_per_task` : maximum number of items to put in the range of a subtask.
+        `course_id` : course_id of the course. Only needed for the track_memory_usage context manager.
+
+    Returns:  yields a (min_id, max_id) tuple of the smallest and largest 'pk' of the items of each subtask.
+
+    Only the ids are fetched from the database, in increasing order and a chunk at a time, so the memory used
+    doesn't depend on the number of items.  The ranges of the querysets are merged, since each subtask is expected
+    to get the items of all of them that are in its range.
+
+    Warning:  if the algorithm here changes, the _get_number_of_subtasks() method should similarly be changed.
+    """
+    num_items_queued = 0
+    num_subtasks = 0
+    min_id = max_id = None
+    num_items_for_task = 0
+
+    with track_memory_usage('course_email.subtask_generation.memory', course_id):
+        item_ids = heapq.merge(*[
+            queryset.values_list('pk', flat=True).order_by('pk').iterator(chunk_size=ITEM_QUERY_CHUNK_SIZE)
+            for queryset in item_querysets
+        ])
+        for item_id in item_ids:
+            if num_items_for_task == items_per_task and num_subtasks < total_num_subtasks - 1 and item_id != max_id:
+                yield min_id, max_id
+                num_items_queued += num_items_for_task
+                min_id = None
+                num_items_for_task = 0
+                num_subtasks += 1
+            if min_id is None:
+                min_id = item_id
+            max_id = item_id
+            num_items_for_task += 1
+
+        # yield the range of the remainder items, if any
+        if num_items_for_task:
+            yield min_id, max_id
+            num_items_queued += num_items_for_task
+
+    # As with _generate_items_for_subtask, items may have been added or removed since they were counted.
+    if num_items_queued != total_num_items:
+        TASK_LOG.info(
+            "Number of items generated by chunking %s not equal to original total %s", num_items_queued, total_num_items
+        )
+
+
 @python_2_unicode_compatible
 class SubtaskStatus:
     """
@@ -298,6 +359,68 @@ def queue_subtasks_for_query(
 
     Returns:  the task progress as stored in the InstructorTask object.
 
+    """
+    def generate_items(total_num_subtasks):
+        # Pass in the desired fields to fetch for each recipient.
+        return _generate_items_for_subtask(
+            item_querysets,
+            item_fields,
+            total_num_items,
+            items_per_task,
+            total_num_subtasks,
+            entry.course_id,
+        )
+
+    return _queue_subtasks(entry, action_name, create_subtask_fcn, generate_items, items_per_task, total_num_items)
+
+
+def queue_subtasks_for_id_ranges(
+    entry,
+    action_name,
+    create_subtask_fcn,
+    item_querysets,
+    items_per_task,
+    total_num_items,
+):
+    """
+    Generates and queues subtasks to each execute the "items" generated by a queryset within a range of ids.
+
+    Unlike queue_subtasks_for_query, the items themselves are not passed to the subtasks, which are expected
+    to query them again by their range of ids.  This keeps both the memory used to queue the subtasks and the
+    size of the subtask messages independent of the number of items.
+
+    Arguments:
+        `entry` : the InstructorTask object for which subtasks are being queued.
+        `action_name` : a past-tense verb that can be used for constructing readable status messages.
+        `create_subtask_fcn` : a function of two arguments that constructs the desired kind of subtask object.
+            Arguments are a (min_id, max_id) tuple of the range of the 'pk' of the items to be processed by
+            this subtask, including both bounds, and a SubtaskStatus object reflecting initial status
+            (and containing the subtask's id).
+        `item_querysets` : a list of query sets that define the "items" that should be processed by subtasks.
+        `items_per_task` : maximum number of items to process in a subtask.
+        `total_num_items` : total amount of items that will be processed by subtasks
+
+    Returns:  the task progress as stored in the InstructorTask object.
+
+    """
+    def generate_id_ranges(total_num_subtasks):
+        return _generate_id_ranges_for_subtask(
+            item_querysets,
+            total_num_items,
+            items_per_task,
+            total_num_subtasks,
+            entry.course_id,
+        )
+
+    return _queue_subtasks(entry, action_name, create_subtask_fcn, generate_id_ranges, items_per_task, total_num_items)
+
+
+def _queue_subtasks(entry, action_name, create_subtask_fcn, generate_subtask_args, items_per_task, total_num_items):
+    """
+    Generates and queues subtasks, passing each of them what `generate_subtask_args` generates for it.
+
+    `generate_subtask_args` is a function of the number of subtasks returning a generator of
+    the first argument of `create_subtask_fcn` for each subtask.
     """
     task_id = entry.task_id
 
@@ -317,16 +440,8 @@ def queue_subtasks_for_query(
     with outer_atomic():
         progress = initialize_subtask_info(entry, action_name, total_num_items, subtask_id_list)
 
-    # Construct a generator that will return the recipients to use for each subtask.
-    # Pass in the desired fields to fetch for each recipient.
-    item_list_generator = _generate_items_for_subtask(
-        item_querysets,
-        item_fields,
-        total_num_items,
-        items_per_task,
-        total_num_subtasks,
-        entry.course_id,
-    )
+    # Construct a generator that will return the items (or their range) to use for each subtask.
+    subtask_args_generator = generate_subtask_args(total_num_subtasks)
 
     # Now create the subtasks, and start them running.
     TASK_LOG.info(
@@ -336,11 +451,11 @@ def queue_subtasks_for_query(
         total_num_items,
     )
     num_subtasks = 0
-    for item_list in item_list_generator:
+    for subtask_args in subtask_args_generator:
         subtask_id = subtask_id_list[num_subtasks]
         num_subtasks += 1
         subtask_status = SubtaskStatus.create(subtask_id)
-        new_subtask = create_subtask_fcn(item_list, subtask_status)
+        new_subtask = create_subtask_fcn(subtask_args, subtask_status)
         TASK_LOG.info(
             "Queueing BulkEmail Task: %s Subtask: %s at timestamp: %s",
             task_id, subtask_id, datetime.now()
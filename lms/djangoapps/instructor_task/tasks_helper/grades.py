@@ -8,6 +8,7 @@ from collections import OrderedDict, defaultdict
 from datetime import datetime
 from itertools import chain
 from time import time
+from uuid import uuid4
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -45,7 +46,7 @@ from xmodule.partitions.partitions_service import PartitionService
 from xmodule.split_test_module import get_split_user_partitions
 
 from .runner import TaskProgress
-from .utils import upload_csv_to_report_store
+from .utils import ResumableCsvReportWriter, upload_csv_to_report_store
 
 TASK_LOG = logging.getLogger('edx.celery.task')
 
@@ -69,6 +70,20 @@ def _flatten(iterable):
     return list(chain.from_iterable(iterable))
 
 
+def _grades_worker_pool(context):
+    """
+    Returns a context manager for the pool of settings.GRADES_ITER_WORKERS
+    worker processes that grade the users of the given report context.  The
+    pool is created once for the whole report, rather than for each batch.
+    """
+    return CourseGradeFactory().worker_pool(
+        settings.GRADES_ITER_WORKERS,
+        course=context.course,
+        collected_block_structure=context.course_structure,
+        course_key=context.course_id,
+    )
+
+
 class GradeReportBase:
     """
     Base class for grade reports (ProblemGradeReport and CourseGradeReport).
@@ -162,31 +177,33 @@ class GradeReportBase:
         course_id = context.course_id
         return get_enrolled_learners_for_course(course_id=course_id, verified_only=context.report_for_verified_only)
 
-    def _compile(self, context, batched_rows):
+    def _report_writer(self, context, parent_dir=''):
+        """
+        Returns the ResumableCsvReportWriter for the given context.  Written
+        batches are only resumed when the task is retried for the same
+        InstructorTask entry.
+        """
+        checkpoint_key = '{}_task_{}'.format(context.upload_filename, context.entry_id or uuid4().hex)
+        return ResumableCsvReportWriter(context.course_id, checkpoint_key, parent_dir=parent_dir)
+
+    def _compile(self, context, batched_rows, report_writer):
         """
-        Compiles and returns the complete list of (success_rows, error_rows) for
-        the given batched_rows and context.
+        Writes the given batched_rows, a generator of
+        (batch_index, success_rows, error_rows), with the given report_writer.
         """
-        # partition and chain successes and errors
-        success_rows, error_rows = zip(*batched_rows)
-        success_rows = list(chain(*success_rows))
-        error_rows = list(chain(*error_rows))
+        for batch_index, success_rows, error_rows in batched_rows:
+            report_writer.write_batch(batch_index, success_rows, error_rows)
 
         # update metrics on task status
-        context.task_progress.succeeded = len(success_rows)
-        context.task_progress.failed = len(error_rows)
+        context.task_progress.succeeded, context.task_progress.failed = report_writer.num_rows()
         context.task_progress.attempted = context.task_progress.succeeded + context.task_progress.failed
         context.task_progress.total = context.task_progress.attempted
-        return success_rows, error_rows
 
-    def _upload(self, context, success_rows, error_rows):
+    def _upload(self, context, report_writer, success_headers, error_headers):
         """
-        Creates and uploads a CSV for the given headers and rows.
+        Creates and uploads the CSVs for the given headers and written rows.
         """
-        date = datetime.now(UTC)
-        upload_csv_to_report_store(success_rows, context.upload_filename, context.course_id, date)
-        if len(error_rows) > 1:
-            upload_csv_to_report_store(error_rows, context.upload_filename + '_err', context.course_id, date)
+        report_writer.upload(context.upload_filename, success_headers, error_headers, datetime.now(UTC))
 
     def log_additional_info_for_testing(self, context, message):
         """
@@ -217,6 +234,7 @@ class _CourseGradeReportContext:
             course_id=course_id,
             task_input=_task_input,
         )
+        self.entry_id = _entry_id
         self.action_name = action_name
         self.course_id = course_id
         self.task_progress = TaskProgress(self.action_name, total=None, start_time=time())
@@ -401,7 +419,7 @@ class _CourseGradeBulkContext:  # lint-amnesty, pylint: disable=missing-class-do
         BulkCourseTags.prefetch(context.course_id, users)
 
 
-class CourseGradeReport:
+class CourseGradeReport(GradeReportBase):
     """
     Class to encapsulate functionality related to generating Grade Reports.
     """
@@ -424,13 +442,14 @@ class CourseGradeReport:
         context.update_status('Starting grades')
         success_headers = self._success_headers(context)
         error_headers = self._error_headers()
-        batched_rows = self._batched_rows(context)
+        with self._report_writer(context, parent_dir=context.upload_parent_dir) as report_writer:
+            context.update_status('Compiling grades')
+            with _grades_worker_pool(context) as worker_pool:
+                batched_rows = self._batched_rows(context, report_writer, worker_pool)
+                self._compile(context, batched_rows, report_writer)
 
-        context.update_status('Compiling grades')
-        success_rows, error_rows = self._compile(context, batched_rows)
-
-        context.update_status('Uploading grades')
-        self._upload(context, success_headers, success_rows, error_headers, error_rows)
+            context.update_status('Uploading grades')
+            self._upload(context, report_writer, success_headers, error_headers)
 
         return context.update_status('Completed grades')
 
@@ -455,51 +474,17 @@ class CourseGradeReport:
         """
         return ["Student ID", "Username", "Error"]
 
-    def _batched_rows(self, context):
+    def _batched_rows(self, context, report_writer, worker_pool=None):
         """
-        A generator of batches of (success_rows, error_rows) for this report.
+        A generator of (batch_index, success_rows, error_rows) for the
+        batches of this report not yet written by the given report_writer,
+        graded by the given worker_pool if any.
         """
-        for users in self._batch_users(context):
+        for batch_index, users in enumerate(self._batch_users(context)):
+            if report_writer.is_written(batch_index):
+                continue
             users = [u for u in users if u is not None]
-            yield self._rows_for_users(context, users)
-
-    def _compile(self, context, batched_rows):
-        """
-        Compiles and returns the complete list of (success_rows, error_rows) for
-        the given batched_rows and context.
-        """
-        # partition and chain successes and errors
-        success_rows, error_rows = zip(*batched_rows)
-        success_rows = list(chain(*success_rows))
-        error_rows = list(chain(*error_rows))
-
-        # update metrics on task status
-        context.task_progress.succeeded = len(success_rows)
-        context.task_progress.failed = len(error_rows)
-        context.task_progress.attempted = context.task_progress.succeeded + context.task_progress.failed
-        context.task_progress.total = context.task_progress.attempted
-        return success_rows, error_rows
-
-    def _upload(self, context, success_headers, success_rows, error_headers, error_rows):
-        """
-        Creates and uploads a CSV for the given headers and rows.
-        """
-        date = datetime.now(UTC)
-        upload_csv_to_report_store(
-            [success_headers] + success_rows,
-            context.upload_filename,
-            context.course_id,
-            date,
-            parent_dir=context.upload_parent_dir
-        )
-        if len(error_rows) > 0:
-            upload_csv_to_report_store(
-                [error_headers] + error_rows,
-                '{}_err'.format(context.upload_filename),
-                context.course_id,
-                date,
-                parent_dir=context.upload_parent_dir
-            )
+            yield (batch_index,) + self._rows_for_users(context, users, worker_pool)
 
     def _grades_header(self, context):
         """
@@ -686,9 +671,10 @@ class CourseGradeReport:
         )
         return certificate_info
 
-    def _rows_for_users(self, context, users):
+    def _rows_for_users(self, context, users, worker_pool=None):
         """
-        Returns a list of rows for the given users for this report.
+        Returns a list of rows for the given users for this report, graded
+        by the given worker_pool if any.
         """
         with modulestore().bulk_operations(context.course_id):
             bulk_context = _CourseGradeBulkContext(context, users)
@@ -699,6 +685,7 @@ class CourseGradeReport:
                 course=context.course,
                 collected_block_structure=context.course_structure,
                 course_key=context.course_id,
+                worker_pool=worker_pool,
             ):
                 if not course_grade:
                     # An empty gradeset means we failed to grade a student.
@@ -740,12 +727,13 @@ class ProblemGradeReport(GradeReportBase):
         context.update_status('ProblemGradeReport - 1: Starting problem grades')
         success_headers = self._success_headers(context)
         error_headers = self._error_headers()
-        batched_rows = self._batched_rows(context)
-
-        context.update_status('ProblemGradeReport - 2: Compiling grades')
-        success_rows, error_rows = self._compile(context, batched_rows)
-        context.update_status('ProblemGradeReport - 3: Uploading grades')
-        self._upload(context, [success_headers] + success_rows, [error_headers] + error_rows)
+        with self._report_writer(context) as report_writer:
+            context.update_status('ProblemGradeReport - 2: Compiling grades')
+            with _grades_worker_pool(context) as worker_pool:
+                batched_rows = self._batched_rows(context, report_writer, worker_pool)
+                self._compile(context, batched_rows, report_writer)
+            context.update_status('ProblemGradeReport - 3: Uploading grades')
+            self._upload(context, report_writer, success_headers, error_headers)
 
         return context.update_status('ProblemGradeReport - 4: Completed problem grades')
 
@@ -771,9 +759,10 @@ class ProblemGradeReport(GradeReportBase):
         """
         return list(self._problem_grades_header().values()) + ['error_msg']
 
-    def _rows_for_users(self, context, users):
+    def _rows_for_users(self, context, users, worker_pool=None):
         """
-        Returns a list of rows for the given users for this report.
+        Returns a list of rows for the given users for this report, graded
+        by the given worker_pool if any.
         """
         self.log_additional_info_for_testing(context, 'ProblemGradeReport: Starting to process new user batch.')
         success_rows, error_rows = [], []
@@ -782,6 +771,7 @@ class ProblemGradeReport(GradeReportBase):
             course=context.course,
             collected_block_structure=context.course_structure,
             course_key=context.course_id,
+            worker_pool=worker_pool,
         ):
             context.task_progress.attempted += 1
             if not course_grade:
@@ -818,12 +808,16 @@ class ProblemGradeReport(GradeReportBase):
 
         return success_rows, error_rows
 
-    def _batched_rows(self, context):
+    def _batched_rows(self, context, report_writer, worker_pool=None):
         """
-        A generator of batches of (success_rows, error_rows) for this report.
+        A generator of (batch_index, success_rows, error_rows) for the
+        batches of this report not yet written by the given report_writer,
+        graded by the given worker_pool if any.
         """
-        for users in self._batch_users(context):
-            yield self._rows_for_users(context, users)
+        for batch_index, users in enumerate(self._batch_users(context)):
+            if report_writer.is_written(batch_index):
+                continue
+            yield (batch_index,) + self._rows_for_users(context, users, worker_pool)
             # Clear the CourseEnrollment caches after each batch of users has been processed
             get_cache('get_enrollment').clear()
             get_cache(CourseEnrollment.MODE_CACHE_NAMESPACE).clear()
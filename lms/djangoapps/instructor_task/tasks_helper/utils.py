@@ -3,6 +3,13 @@ Utility methods for instructor tasks
 """
 
 
+import csv
+import io
+import os.path
+import shutil
+import tempfile
+
+from django.core.files import File
 from eventtracking import tracker
 
 from common.djangoapps.util.file import course_filename_prefix_generator
@@ -38,15 +45,173 @@ def upload_csv_to_report_store(rows, csv_name, course_id, timestamp, config_name
         report_name: string - Name of the generated report
     """
     report_store = ReportStore.from_config(config_name)
-    report_name = "{course_prefix}_{csv_name}_{timestamp_str}.csv".format(
+    report_name = _csv_report_name(course_id, csv_name, timestamp)
+
+    report_store.store_rows(course_id, report_name, rows, parent_dir)
+    tracker_emit(csv_name)
+    return report_name
+
+
+def _csv_report_name(course_id, csv_name, timestamp):
+    """
+    Returns the file name of the CSV report with the given name and timestamp.
+    """
+    return "{course_prefix}_{csv_name}_{timestamp_str}.csv".format(
         course_prefix=course_filename_prefix_generator(course_id),
         csv_name=csv_name,
         timestamp_str=timestamp.strftime("%Y-%m-%d-%H%M")
     )
 
-    report_store.store_rows(course_id, report_name, rows, parent_dir)
-    tracker_emit(csv_name)
-    return report_name
+
+class ResumableCsvReportWriter:
+    """
+    Writes the success and error rows of a CSV report to the report store
+    batch by batch, so that the complete set of rows is never held in memory.
+
+    Each batch is stored as a pair of part files in a directory named after
+    checkpoint_key.  Since the success part of a batch is written last, a
+    retried task using the same checkpoint_key can skip the batches that
+    were already written (see is_written).  The parts are concatenated into
+    the final reports by `upload`, through temporary files on disk, and
+    then removed.
+
+    Used as a context manager, the writer also removes the parts when an
+    exception is raised within it, since the task then fails for good.  The
+    parts are only kept for a retry when the task is interrupted without an
+    exception being raised, like when its process is killed.
+
+    Note: Batches are identified by their index, so resuming is only
+    correct if the batches of the retried task match those of the original.
+    """
+    SUCCESS_PREFIX = 'success'
+    ERROR_PREFIX = 'error'
+
+    def __init__(self, course_id, checkpoint_key, config_name='GRADES_DOWNLOAD', parent_dir=''):
+        self.course_id = course_id
+        self.parent_dir = parent_dir
+        self.report_store = ReportStore.from_config(config_name)
+        self.parts_dir = self.report_store.path_to(course_id, f'{checkpoint_key}_parts', parent_dir)
+
+        # Map of (prefix, batch index) to (part file name, number of rows).
+        # dict {(string, int): (string, int)}
+        self._parts = {}
+        try:
+            _, filenames = self.report_store.storage.listdir(self.parts_dir)
+        except OSError:
+            filenames = []
+        for filename in filenames:
+            try:
+                prefix, batch_index, num_rows = os.path.splitext(filename)[0].split('-')
+                self._parts[(prefix, int(batch_index))] = (filename, int(num_rows))
+            except ValueError:
+                continue
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.delete_parts()
+
+    def is_written(self, batch_index):
+        """
+        Returns whether the batch with the given index was already written.
+        """
+        return (self.SUCCESS_PREFIX, batch_index) in self._parts
+
+    def write_batch(self, batch_index, success_rows, error_rows):
+        """
+        Writes the given rows of the batch with the given index.
+        """
+        self._write_part(self.ERROR_PREFIX, batch_index, error_rows)
+        self._write_part(self.SUCCESS_PREFIX, batch_index, success_rows)
+
+    def num_rows(self):
+        """
+        Returns a tuple of the number of (success rows, error rows) written.
+        """
+        return self._num_rows(self.SUCCESS_PREFIX), self._num_rows(self.ERROR_PREFIX)
+
+    def upload(self, csv_name, success_headers, error_headers, timestamp):
+        """
+        Concatenates the written parts into the success report and, if there
+        are any error rows, the error report, and then removes the parts.
+        """
+        self._store_parts(self.SUCCESS_PREFIX, _csv_report_name(self.course_id, csv_name, timestamp), success_headers)
+        tracker_emit(csv_name)
+        if self._num_rows(self.ERROR_PREFIX):
+            error_csv_name = f'{csv_name}_err'
+            self._store_parts(
+                self.ERROR_PREFIX, _csv_report_name(self.course_id, error_csv_name, timestamp), error_headers,
+            )
+            tracker_emit(error_csv_name)
+
+        self.delete_parts()
+
+    def delete_parts(self):
+        """
+        Removes the written parts and their directory.
+        """
+        for filename, _ in self._parts.values():
+            self.report_store.storage.delete(os.path.join(self.parts_dir, filename))
+        self._parts = {}
+        try:
+            os.rmdir(self.report_store.storage.path(self.parts_dir))
+        except (NotImplementedError, OSError):
+            # Storages without directories, like S3, can't remove them and
+            # don't need to.
+            pass
+
+    def _num_rows(self, prefix):
+        return sum(num_rows for (part_prefix, _), (_, num_rows) in self._parts.items() if part_prefix == prefix)
+
+    def _write_part(self, prefix, batch_index, rows):
+        """
+        Writes the given rows into a new part file.
+        """
+        stale_part = self._parts.pop((prefix, batch_index), None)
+        if stale_part:
+            # Left behind by an attempt that failed before completing the batch.
+            self.report_store.storage.delete(os.path.join(self.parts_dir, stale_part[0]))
+
+        with tempfile.TemporaryFile() as part_file:
+            num_rows = self._write_rows(part_file, rows)
+            part_file.seek(0)
+            filename = f'{prefix}-{batch_index:08d}-{num_rows}.csv'
+            self.report_store.storage.save(os.path.join(self.parts_dir, filename), File(part_file, name=filename))
+        self._parts[(prefix, batch_index)] = (filename, num_rows)
+
+    def _store_parts(self, prefix, report_name, headers):
+        """
+        Stores the given headers followed by the parts with the given prefix,
+        in batch order, as the report with the given name.
+        """
+        with tempfile.TemporaryFile() as report_file:
+            self._write_rows(report_file, [headers])
+            for key in sorted(key for key in self._parts if key[0] == prefix):
+                filename, _ = self._parts[key]
+                with self.report_store.storage.open(os.path.join(self.parts_dir, filename), 'rb') as part_file:
+                    shutil.copyfileobj(part_file, report_file)
+            report_file.seek(0)
+            self.report_store.storage.save(
+                self.report_store.path_to(self.course_id, report_name, self.parent_dir),
+                File(report_file, name=report_name),
+            )
+
+    def _write_rows(self, binary_file, rows):
+        """
+        Writes the given rows as utf-8 encoded CSV to the given binary file.
+        Returns the number of rows.
+        """
+        text_file = io.TextIOWrapper(binary_file, encoding='utf-8', newline='')
+        num_rows = 0
+        csvwriter = csv.writer(text_file)
+        for row in self.report_store._get_utf8_encoded_rows(rows):  # pylint: disable=protected-access
+            csvwriter.writerow(row)
+            num_rows += 1
+        text_file.flush()
+        text_file.detach()
+        return num_rows
 
 
 def upload_zip_to_report_store(file, zip_name, course_id, timestamp, config_name='GRADES_DOWNLOAD'):
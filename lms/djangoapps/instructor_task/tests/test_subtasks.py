@@ -7,7 +7,7 @@ from unittest.mock import Mock, patch
 from uuid import uuid4
 
 from common.djangoapps.student.models import CourseEnrollment
-from lms.djangoapps.instructor_task.subtasks import queue_subtasks_for_query
+from lms.djangoapps.instructor_task.subtasks import queue_subtasks_for_id_ranges, queue_subtasks_for_query
 from lms.djangoapps.instructor_task.tests.factories import InstructorTaskFactory
 from lms.djangoapps.instructor_task.tests.test_base import InstructorTaskCourseTestCase
 
@@ -26,7 +26,7 @@ class TestSubtasks(InstructorTaskCourseTestCase):
             random_id = uuid4().hex[:8]
             self.create_student(username=f'student{random_id}')
 
-    def _queue_subtasks(self, create_subtask_fcn, items_per_task, initial_count, extra_count):
+    def _queue_subtasks(self, create_subtask_fcn, items_per_task, initial_count, extra_count, id_ranges=False):
         """Queue subtasks while enrolling more students into course in the middle of the process."""
 
         task_id = str(uuid4())
@@ -47,6 +47,16 @@ class TestSubtasks(InstructorTaskCourseTestCase):
 
         with patch('lms.djangoapps.instructor_task.subtasks.initialize_subtask_info') as mock_initialize_subtask_info:
             mock_initialize_subtask_info.side_effect = initialize_subtask_info
+            if id_ranges:
+                queue_subtasks_for_id_ranges(
+                    entry=instructor_task,
+                    action_name='action_name',
+                    create_subtask_fcn=create_subtask_fcn,
+                    item_querysets=task_querysets,
+                    items_per_task=items_per_task,
+                    total_num_items=initial_count,
+                )
+                return
             queue_subtasks_for_query(
                 entry=instructor_task,
                 action_name='action_name',
@@ -80,3 +90,20 @@ class TestSubtasks(InstructorTaskCourseTestCase):
         assert len(mock_create_subtask_fcn_args[0][0][0]) == 3
         assert len(mock_create_subtask_fcn_args[1][0][0]) == 3
         assert len(mock_create_subtask_fcn_args[2][0][0]) == 5
+
+    def test_queue_subtasks_for_id_ranges(self):
+        """Test queue_subtasks_for_id_ranges() if the last subtask needs to accommodate > items_per_task items."""
+
+        mock_create_subtask_fcn = Mock()
+        self._queue_subtasks(mock_create_subtask_fcn, 3, 8, 3, id_ranges=True)
+
+        # Check that the ranges cover all the items, in order and without overlapping
+        enrollment_ids = list(
+            CourseEnrollment.objects.filter(course_id=self.course.id).order_by('pk').values_list('pk', flat=True)
+        )
+        id_ranges = [call_args[0][0] for call_args in mock_create_subtask_fcn.call_args_list]
+        assert id_ranges == [
+            (enrollment_ids[0], enrollment_ids[2]),
+            (enrollment_ids[3], enrollment_ids[5]),
+            (enrollment_ids[6], enrollment_ids[10]),
+        ]
@@ -79,7 +79,7 @@ from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory, chec
 from xmodule.partitions.partitions import Group, UserPartition
 
 from ..models import ReportStore
-from ..tasks_helper.utils import UPDATE_STATUS_FAILED, UPDATE_STATUS_SUCCEEDED
+from ..tasks_helper.utils import UPDATE_STATUS_FAILED, UPDATE_STATUS_SUCCEEDED, ResumableCsvReportWriter
 
 _TEAMS_CONFIG = TeamsConfig({
     'max_size': 2,
@@ -435,6 +435,76 @@ class TestInstructorGradeReport(InstructorGradeReportTestCase):
         )
 
 
+class TestResumableCsvReportWriter(TestReportMixin, InstructorTaskCourseTestCase):
+    """
+    Tests that report rows written in batches are resumed and uploaded correctly.
+    """
+    def setUp(self):
+        super().setUp()
+        self.course = CourseFactory.create()
+
+    def _read_report(self, filename):
+        """
+        Returns the rows of the report with the given name.
+        """
+        report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+        with report_store.storage.open(report_store.path_to(self.course.id, filename)) as csv_file:
+            return [row for row in unicodecsv.reader(csv_file, encoding='utf-8')]
+
+    def test_resume_and_upload(self):
+        writer = ResumableCsvReportWriter(self.course.id, 'grade_report_task_1')
+        writer.write_batch(0, [['1', 'ni\xf1o']], [])
+        writer.write_batch(1, [['2', 'b'], ['3', 'c']], [['4', 'error']])
+
+        resumed_writer = ResumableCsvReportWriter(self.course.id, 'grade_report_task_1')
+        assert resumed_writer.is_written(0)
+        assert resumed_writer.is_written(1)
+        assert not resumed_writer.is_written(2)
+        resumed_writer.write_batch(2, [['5', 'e']], [])
+        assert resumed_writer.num_rows() == (4, 1)
+
+        with freeze_time('2021-01-01 12:00:00'):
+            resumed_writer.upload('grade_report', ['id', 'name'], ['id', 'error'], datetime.now(UTC))
+
+        report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+        filenames = sorted(filename for filename, _ in report_store.links_for(self.course.id))
+        assert len(filenames) == 2
+        error_filename, success_filename = filenames
+        assert '_grade_report_err_' in error_filename
+        assert self._read_report(success_filename) == [
+            ['id', 'name'], ['1', 'ni\xf1o'], ['2', 'b'], ['3', 'c'], ['5', 'e'],
+        ]
+        assert self._read_report(error_filename) == [['id', 'error'], ['4', 'error']]
+        assert ResumableCsvReportWriter(self.course.id, 'grade_report_task_1').num_rows() == (0, 0)
+        assert not report_store.storage.exists(resumed_writer.parts_dir)
+
+    def test_parts_removed_on_exception(self):
+        with self.assertRaises(ValueError):
+            with ResumableCsvReportWriter(self.course.id, 'grade_report_task_3') as writer:
+                writer.write_batch(0, [['1', 'a']], [['2', 'error']])
+                raise ValueError
+
+        report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+        assert not report_store.storage.exists(writer.parts_dir)
+        assert ResumableCsvReportWriter(self.course.id, 'grade_report_task_3').num_rows() == (0, 0)
+
+    def test_parts_kept_without_exception(self):
+        with ResumableCsvReportWriter(self.course.id, 'grade_report_task_4') as writer:
+            writer.write_batch(0, [['1', 'a']], [])
+
+        assert ResumableCsvReportWriter(self.course.id, 'grade_report_task_4').is_written(0)
+
+    def test_no_error_report_without_errors(self):
+        writer = ResumableCsvReportWriter(self.course.id, 'grade_report_task_2')
+        writer.write_batch(0, [['1', 'a']], [])
+        writer.upload('grade_report', ['id', 'name'], ['id', 'error'], datetime.now(UTC))
+
+        report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+        filenames = [filename for filename, _ in report_store.links_for(self.course.id)]
+        assert len(filenames) == 1
+        assert '_grade_report_' in filenames[0]
+
+
 class TestTeamGradeReport(InstructorGradeReportTestCase):
     """ Test that teams appear correctly in the grade report when it is enabled for the course. """
 
@@ -1822,18 +1892,13 @@ class TestGradeReport(TestReportMixin, InstructorTaskModuleTestCase):
             "upload_parent_dir": directory_name
         }
 
-        patched_upload = patch('lms.djangoapps.instructor_task.tasks_helper.grades.upload_csv_to_report_store')
         with patch('lms.djangoapps.instructor_task.tasks_helper.runner._get_current_task'):
-            with patched_upload as mock_upload_report:
-                CourseGradeReport.generate(None, None, self.course.id, task_input, 'graded')
+            CourseGradeReport.generate(None, None, self.course.id, task_input, 'graded')
 
-        mock_upload_report.assert_called_once_with(
-            [ANY, ANY],
-            'grade_report',
-            self.course.id,
-            ANY,
-            parent_dir=directory_name
-        )
+        report_store = ReportStore.from_config(config_name='GRADES_DOWNLOAD')
+        _, filenames = report_store.storage.listdir(report_store.path_to(self.course.id, '', directory_name))
+        assert len(filenames) == 1
+        assert '_grade_report_' in filenames[0]
 
     def test_grade_report_with_overrides(self):
         course_data = CourseData(self.student, course=self.course)
@@ -1366,6 +1366,10 @@ EVENT_TRACKING_BACKENDS = {
         'ENGINE': 'eventtracking.backends.routing.RoutingBackend',
         'OPTIONS': {
             'backends': {
+                # Events are written by the thread that emits them. To write them from a background thread
+                # instead, wrap this backend in common.djangoapps.track.backends.asynchronous.AsyncBackend (see
+                # its docstring). That is opt-in: queued events are lost if the process is killed, and with the
+                # block overflow policy, emitting threads can wait for room in the queue.
                 'logger': {
                     'ENGINE': 'eventtracking.backends.logger.LoggerBackend',
                     'OPTIONS': {
@@ -1520,6 +1524,10 @@ MODULESTORE = {
                         'default_class': 'xmodule.hidden_module.HiddenDescriptor',
                         'fs_root': DATA_DIR,
                         'render_template': 'common.djangoapps.edxmako.shortcuts.render_to_string',
+                        # Only load the content fields of blocks that are read, so that the course
+                        # outline and navigation, which only read small fields of the blocks they
+                        # list, don't load the (large) data of problems and html blocks.
+                        'field_level_definition_loading': True,
                     }
                 },
                 {
@@ -1537,6 +1545,22 @@ MODULESTORE = {
     }
 }
 
+# .. setting_name: COURSE_OVERVIEW_PROCESS_CACHE_MAX_SIZE_IN_BYTES
+# .. setting_default: 10485760
+# .. setting_description: Maximum total size of the pickled CourseOverviews, with their tabs and image sets,
+#   that each process keeps in memory. A cached overview is only used after a single query for the current
+#   versions of the requested overviews' rows shows it is still up to date, so that loading the overviews of
+#   many courses doesn't take separate queries for each of them. Set to 0 to disable this cache.
+COURSE_OVERVIEW_PROCESS_CACHE_MAX_SIZE_IN_BYTES = 10485760
+
+# .. setting_name: COURSE_STRUCTURE_PROCESS_CACHE_MAX_BLOCKS
+# .. setting_default: 20000
+# .. setting_description: Maximum total number of blocks in the course structures that each process keeps
+#   decoded in memory, so that split modulestore doesn't have to load and unpickle them from the
+#   course_structure_cache on every use. Structures are immutable, so they are never invalidated; the
+#   least recently used ones are evicted first. Set to 0 to disable this cache.
+COURSE_STRUCTURE_PROCESS_CACHE_MAX_BLOCKS = 20000
+
 DATABASES = {
     # edxapp's edxapp-migrate scripts and the edxapp_migrate play
     # will ensure that any DB not named read_replica will be migrated
@@ -1611,6 +1635,34 @@ CODE_JAIL = {
 #   ]
 COURSES_WITH_UNSAFE_CODE = []
 
+# .. setting_name: SAFE_EXEC_RESULT_CACHE
+# .. setting_default: {'LOCAL_PATH': None, 'LOCAL_MAX_SIZE_IN_BYTES': 100 * 1024 * 1024, 'SHARED_CACHE': 'default',
+#     'SHARED_TIMEOUT': None}
+# .. setting_description: Configuration of the cache of the results of sandboxed code (see
+#     xmodule.util.sandboxing.get_safe_exec_result_cache). LOCAL_PATH is the path of an SQLite database used
+#     as a local cache tier, limited to LOCAL_MAX_SIZE_IN_BYTES; the local tier is disabled when it is None.
+#     SHARED_CACHE is the name of the Django cache used as the shared tier, with SHARED_TIMEOUT seconds as
+#     the timeout of its entries (None for the cache's default).
+SAFE_EXEC_RESULT_CACHE = {
+    'LOCAL_PATH': None,
+    'LOCAL_MAX_SIZE_IN_BYTES': 100 * 1024 * 1024,
+    'SHARED_CACHE': 'default',
+    'SHARED_TIMEOUT': None,
+}
+
+# .. setting_name: CODE_JAIL_WORKER_POOL
+# .. setting_default: {'SIZE': 0, 'MAX_JOBS_PER_WORKER': 100, 'MAX_RSS_IN_BYTES': 256 * 1024 * 1024}
+# .. setting_description: Configuration of the pool of warm sandbox workers that run sandboxed code (see
+#     capa.safe_exec.worker_pool). Each process starts SIZE workers, with codejail's python and user, the first
+#     time it runs sandboxed code; a SIZE of 0 disables the pool and runs each execution in a new codejail
+#     process. Workers are replaced after MAX_JOBS_PER_WORKER executions, or once the process that ran an
+#     execution, forked from the worker, used more than MAX_RSS_IN_BYTES of memory (None for no limit).
+CODE_JAIL_WORKER_POOL = {
+    'SIZE': 0,
+    'MAX_JOBS_PER_WORKER': 100,
+    'MAX_RSS_IN_BYTES': 256 * 1024 * 1024,
+}
+
 ############################### DJANGO BUILT-INS ###############################
 # Change DEBUG in your environment settings files, not here
 DEBUG = False
@@ -2070,6 +2122,7 @@ MIDDLEWARE = [
 
     'lms.djangoapps.discussion.django_comment_client.utils.ViewNameMiddleware',
     'codejail.django_integration.ConfigureCodeJailMiddleware',
+    'xmodule.util.sandboxing.ConfigureSandboxWorkerPoolMiddleware',
 
     # catches any uncaught RateLimitExceptions and returns a 403 instead of a 500
     'ratelimitbackend.middleware.RateLimitMiddleware',
@@ -2718,6 +2771,13 @@ BLOCK_STRUCTURES_SETTINGS = dict(
     #   https://github.com/edx/edx-platform/pull/17760,
     #   https://openedx.atlassian.net/browse/DEPR-146
     PRUNING_ACTIVE=False,
+
+    # .. setting_name: BLOCK_STRUCTURES_SETTINGS['PROCESS_CACHE_MAX_SIZE_IN_BYTES']
+    # .. setting_default: 0
+    # .. setting_description: Maximum total size, in bytes of estimated memory use, of the decoded block
+    #   structures kept in each process's in-memory LRU cache, in front of the Django cache. Only used
+    #   when `block_structure.storage_backing_for_cache` is enabled. Set to 0 to disable.
+    PROCESS_CACHE_MAX_SIZE_IN_BYTES=0,
 )
 
 ################################ Bulk Email ###################################
@@ -3484,6 +3544,19 @@ FINANCIAL_REPORTS = {
     'ROOT_PATH': 'sandbox',
 }
 
+# .. setting_name: GRADES_ITER_WORKERS
+# .. setting_default: 1
+# .. setting_description: Number of forked worker processes that the course and problem grade report tasks
+#   grade users in. The processes are forked once per report. Set to 1 to grade all users in the task's process.
+#   Other callers of CourseGradeFactory.iter always grade users in the calling process, as does any caller while a
+#   database transaction is open.
+GRADES_ITER_WORKERS = 1
+# .. setting_name: GRADES_ITER_BATCH_SIZE
+# .. setting_default: 50
+# .. setting_description: Largest number of users that a grade report sends to a worker process at a time, when
+#   GRADES_ITER_WORKERS is greater than 1. Batches are made smaller when needed to give every worker some users.
+GRADES_ITER_BATCH_SIZE = 50
+
 #### Grading policy change-related settings #####
 # Rate limit for regrading tasks that a grading policy change can kick off
 POLICY_CHANGE_TASK_RATE_LIMIT = '300/h'
@@ -3993,6 +4066,23 @@ CREDENTIALS_PUBLIC_SERVICE_URL = 'http://localhost:8005'
 COMMENTS_SERVICE_URL = 'http://localhost:18080'
 COMMENTS_SERVICE_KEY = 'password'
 
+# .. setting_name: COMMENTS_SERVICE_POOL_SIZE
+# .. setting_default: 10
+# .. setting_description: Number of connections to the comments service that each process keeps open, so that
+#   requests to it don't open a new connection each. Set to 0 to open a new connection for every request.
+COMMENTS_SERVICE_POOL_SIZE = 10
+# .. setting_name: COMMENTS_SERVICE_MAX_RETRIES
+# .. setting_default: 2
+# .. setting_description: Number of times a request to the comments service is retried when connecting to it
+#   fails, or when reading the response of a GET, HEAD, PUT, DELETE, OPTIONS or TRACE request fails. Only used
+#   when COMMENTS_SERVICE_POOL_SIZE isn't 0.
+COMMENTS_SERVICE_MAX_RETRIES = 2
+# .. setting_name: COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS
+# .. setting_default: 4
+# .. setting_description: Largest number of requests to the comments service that a discussion view makes at
+#   once, when it needs several independent responses from it.
+COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS = 4
+
 # Reverification checkpoint name pattern
 CHECKPOINT_PATTERN = r'(?P<checkpoint_name>[^/]+)'
 
@@ -4634,6 +4724,17 @@ FERNET_KEYS = [
 # Maximum number of rows to fetch in XBlockUserStateClient calls. Adjust for performance
 USER_STATE_BATCH_SIZE = 5000
 
+# .. setting_name: XBLOCK_USER_STATE_REQUEST_BUFFERED_BLOCK_TYPES
+# .. setting_default: []
+# .. setting_description: Block types whose user state writes are buffered during an XBlock handler call and
+#     written when the handler returns, coalescing the writes to the same block within that call into one (see
+#     lms.djangoapps.courseware.user_state_client.UserStateWriteBehindBuffer). The buffered writes are discarded
+#     if the handler raises an exception. Writes made by separate requests,
+#     such as the successive saves of a video's position, are not coalesced. Only list block types whose state
+#     is saved several times while handling a single request. Don't list graded block types: their state must
+#     be written right away.
+XBLOCK_USER_STATE_REQUEST_BUFFERED_BLOCK_TYPES = []
+
 ############### Settings for edx-rbac  ###############
 SYSTEM_WIDE_ROLE_CLASSES = []
 
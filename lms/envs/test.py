@@ -124,6 +124,10 @@ MOCK_STAFF_GRADING = True
 MOCK_PEER_GRADING = True
 
 COMMENTS_SERVICE_URL = 'http://localhost:4567'
+# Tests stand in for the comments service by mocking requests.request, which a pooled session doesn't call,
+# and check the requests it was sent in order.
+COMMENTS_SERVICE_POOL_SIZE = 0
+COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS = 1
 
 DJFS = {
     'type': 'osfs',
@@ -223,6 +227,10 @@ CACHES = {
     },
 }
 
+# Like the course_structure_cache, don't keep course structures or overviews across tests.
+COURSE_STRUCTURE_PROCESS_CACHE_MAX_BLOCKS = 0
+COURSE_OVERVIEW_PROCESS_CACHE_MAX_SIZE_IN_BYTES = 0
+
 ############################### BLOCKSTORE #####################################
 # Blockstore tests
 RUN_BLOCKSTORE_TESTS = os.environ.get('EDXAPP_RUN_BLOCKSTORE_TESTS', 'no').lower() in ('true', 'yes', '1')
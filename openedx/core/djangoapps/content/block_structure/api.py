@@ -23,13 +23,18 @@ def get_course_in_cache(course_key):
     return get_block_structure_manager(course_key).get_collected()
 
 
-def update_course_in_cache(course_key):
+def update_course_in_cache(course_key, changed_usage_keys=None, previous_version=None, version=None):
     """
     A higher order function implemented on top of the
     block_structure.updated_collected function that updates the block
     structure in the cache for the given course_key.
+
+    See BlockStructureManager.update_collected_if_needed for the optional
+    arguments.
     """
-    return get_block_structure_manager(course_key).update_collected_if_needed()
+    return get_block_structure_manager(course_key).update_collected_if_needed(
+        changed_usage_keys, previous_version, version,
+    )
 
 
 def clear_course_from_cache(course_key):
@@ -40,6 +40,16 @@ class _BlockRelations:
         # list [UsageKey]
         self.children = []
 
+    def copy(self):
+        """
+        Returns a new instance with copies of this block's lists of
+        parents and children.
+        """
+        relations = _BlockRelations()
+        relations.parents = list(self.parents)
+        relations.children = list(self.children)
+        return relations
+
 
 class BlockStructure:
     """
@@ -148,6 +158,31 @@ class BlockStructure:
         """
         return iter(self._block_relations.keys())
 
+    def get_affected_block_keys(self, block_keys):
+        """
+        Returns the keys of the given blocks that are in the block
+        structure, along with the keys of all of their ancestors and
+        descendants.
+
+        Arguments:
+            block_keys (iterable(UsageKey)) - The usage keys of the
+                blocks, typically blocks that changed.
+
+        Returns:
+            set(UsageKey) - The keys of the affected blocks.
+        """
+        affected_block_keys = set()
+        for relatives in (self.get_parents, self.get_children):
+            to_visit = [block_key for block_key in block_keys if block_key in self]
+            visited = set()
+            while to_visit:
+                block_key = to_visit.pop()
+                if block_key not in visited:
+                    visited.add(block_key)
+                    to_visit.extend(relatives(block_key))
+            affected_block_keys |= visited
+        return affected_block_keys
+
     #--- Block structure traversal methods ---#
 
     def topological_traversal(
@@ -415,6 +450,12 @@ class BlockStructureBlockData(BlockStructure):
         # Map of a transformer's name to its non-block-specific data.
         self.transformer_data = TransformerDataMap()
 
+        # Usage keys of the blocks whose BlockData is shared with the
+        # instance this one was shallow-copied from, and is to be copied
+        # before it is modified.
+        # set(UsageKey)
+        self._shared_block_keys = set()
+
     def copy(self):
         """
         Returns a new instance of BlockStructureBlockData with a
@@ -428,6 +469,27 @@ class BlockStructureBlockData(BlockStructure):
             deepcopy(self._block_data_map),
         )
 
+    def shallow_copy(self):
+        """
+        Returns a new instance of BlockStructureBlockData that shares the
+        BlockData of this instance's blocks, copying each one only when
+        the new instance first modifies it.
+
+        The block relations and the non-block-specific transformer data
+        are copied.  Field values are never copied, so they are to be
+        replaced rather than modified in place, and this instance is not
+        to be modified while copies share its data.
+        """
+        from .factory import BlockStructureFactory
+        block_structure = BlockStructureFactory.create_new(
+            self.root_block_usage_key,
+            {usage_key: relations.copy() for usage_key, relations in self._block_relations.items()},
+            _copy_transformer_data_map(self.transformer_data),
+            dict(self._block_data_map),
+        )
+        block_structure._shared_block_keys = set(self._block_data_map)
+        return block_structure
+
     def iteritems(self):
         """
         Returns iterator of (UsageKey, BlockData) pairs for all
@@ -594,6 +656,7 @@ class BlockStructureBlockData(BlockStructure):
                 whose data entry is to be deleted.
         """
         try:
+            self._get_own_block(usage_key)
             transformer_block_data = self.get_transformer_block_data(usage_key, transformer)
             delattr(transformer_block_data, key)
         except (AttributeError, KeyError):
@@ -731,6 +794,38 @@ class BlockStructureBlockData(BlockStructure):
     #--- Internal methods ---#
     # To be used within the block_structure framework or by tests.
 
+    def _copy_transformer_data(self, transformer, source_block_structure, block_keys):
+        """
+        Copies the given transformer's non-block-specific data, except for
+        its version, and its data for the blocks with the given block_keys
+        from the given block structure into this one.
+
+        Arguments:
+            transformer (BlockStructureTransformer) - The transformer
+                whose data is to be copied.
+
+            source_block_structure (BlockStructureBlockData) - The block
+                structure to copy the data from.
+
+            block_keys (iterable(UsageKey)) - The usage keys of the blocks
+                whose data is to be copied.
+        """
+        try:
+            source_transformer_data = source_block_structure.transformer_data[transformer]
+        except KeyError:
+            pass
+        else:
+            for key, value in source_transformer_data.fields.items():
+                if key != TRANSFORMER_VERSION_KEY:
+                    self.set_transformer_data(transformer, key, value)
+
+        for block_key in block_keys:
+            try:
+                source_block_data = source_block_structure.get_transformer_block_data(block_key, transformer)
+            except KeyError:
+                continue
+            self._get_or_create_block(block_key).transformer_data[transformer] = source_block_data
+
     def _get_transformer_data_version(self, transformer):
         """
         Returns the version number stored for the given transformer.
@@ -758,12 +853,42 @@ class BlockStructureBlockData(BlockStructure):
         maps it to the given key.
         """
         try:
-            return self._block_data_map[usage_key]
+            return self._get_own_block(usage_key)
         except KeyError:
             block_data = BlockData(usage_key)
             self._block_data_map[usage_key] = block_data
             return block_data
 
+    def _get_own_block(self, usage_key):
+        """
+        Returns the BlockData associated with the given usage_key, first
+        copying it if it is shared with another instance (see
+        shallow_copy), so that it can be modified.
+
+        Raises KeyError if not found.
+        """
+        block_data = self._block_data_map[usage_key]
+        if usage_key in self._shared_block_keys:
+            self._shared_block_keys.discard(usage_key)
+            copied = BlockData(usage_key)
+            copied.fields = dict(block_data.fields)
+            copied.transformer_data = _copy_transformer_data_map(block_data.transformer_data)
+            self._block_data_map[usage_key] = block_data = copied
+        return block_data
+
+
+def _copy_transformer_data_map(transformer_data_map):
+    """
+    Returns a new TransformerDataMap with shallow copies of the
+    TransformerData in the given map.
+    """
+    copied_map = TransformerDataMap()
+    for name, transformer_data in transformer_data_map.items():
+        copied = TransformerData()
+        copied.fields = dict(transformer_data.fields)
+        copied_map[name] = copied
+    return copied_map
+
 
 class BlockStructureModulestoreData(BlockStructureBlockData):
     """
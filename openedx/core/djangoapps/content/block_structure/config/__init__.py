@@ -2,6 +2,7 @@
 This module contains various configuration settings via
 waffle switches for the Block Structure framework.
 """
+from django.conf import settings
 from edx_django_utils.cache import RequestCache
 from edx_toggles.toggles import WaffleSwitch
 
@@ -66,6 +67,40 @@ RAISE_ERROR_WHEN_NOT_FOUND = WaffleSwitch(
     "block_structure.raise_error_when_not_found", __name__
 )
 
+# .. toggle_name: block_structure.columnar_serialization
+# .. toggle_implementation: WaffleSwitch
+# .. toggle_default: False
+# .. toggle_description: When enabled, block structures are written to the cache and storage using the
+#   compact, schema-versioned columnar format (see block_structure/serializer.py) instead of zpickle.
+#   The columnar format decodes each transformer's block data lazily, upon first access. Data in either
+#   format can always be read, regardless of this switch.
+# .. toggle_warnings: Block structures written while this switch is enabled can only be read by releases
+#   that include the columnar reader.
+# .. toggle_use_cases: temporary
+# .. toggle_creation_date: 2026-10-18
+# .. toggle_target_removal_date: 2027-01-18
+COLUMNAR_SERIALIZATION = WaffleSwitch(
+    "block_structure.columnar_serialization", __name__
+)
+
+# .. toggle_name: block_structure.incremental_collect
+# .. toggle_implementation: WaffleSwitch
+# .. toggle_default: False
+# .. toggle_description: When enabled, updating a course's block structure after a publish only re-collects
+#   the data of the published blocks (along with their ancestors and descendants) for transformers that
+#   support incremental collection, and reuses the previously collected data for all other blocks. Other
+#   transformers are collected in full, as are all transformers whenever the previously collected data isn't
+#   from the course version the publish started from.
+# .. toggle_warnings: The publish path only reports its changes for Split courses, and the previously collected
+#   data's version is only known with block_structure.storage_backing_for_cache enabled; otherwise, the block
+#   structure is always collected in full.
+# .. toggle_use_cases: temporary
+# .. toggle_creation_date: 2026-10-18
+# .. toggle_target_removal_date: 2027-01-18
+INCREMENTAL_COLLECT = WaffleSwitch(
+    "block_structure.incremental_collect", __name__
+)
+
 
 def enable_storage_backing_for_cache_in_request():
     """
@@ -90,3 +125,17 @@ def cache_timeout_in_seconds():
     Returns and caches the current setting for cache_timeout_in_seconds.
     """
     return BlockStructureConfiguration.current().cache_timeout_in_seconds
+
+
+def process_cache_max_size_in_bytes():
+    """
+    Returns the maximum total size of the block structures kept in the
+    per-process cache; 0 disables the per-process cache.
+    """
+    # .. setting_name: BLOCK_STRUCTURES_SETTINGS['PROCESS_CACHE_MAX_SIZE_IN_BYTES']
+    # .. setting_default: 0
+    # .. setting_description: Maximum total size, in bytes of estimated memory use, of the decoded block
+    #   structures kept in each process's in-memory LRU cache, in front of the Django cache. Entries are
+    #   keyed by the version data of the stored block structure, so they are only used when
+    #   `block_structure.storage_backing_for_cache` is enabled. Set to 0 to disable the per-process cache.
+    return settings.BLOCK_STRUCTURES_SETTINGS.get('PROCESS_CACHE_MAX_SIZE_IN_BYTES', 0)
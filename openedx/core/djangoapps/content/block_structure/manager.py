@@ -5,6 +5,7 @@ BlockStructures.
 
 
 from contextlib import contextmanager
+from logging import getLogger
 
 from . import config
 from .exceptions import BlockStructureNotFound, TransformerDataIncompatible, UsageKeyNotInBlockStructure
@@ -12,6 +13,8 @@ from .factory import BlockStructureFactory
 from .store import BlockStructureStore
 from .transformers import BlockStructureTransformers
 
+logger = getLogger(__name__)  # pylint: disable=C0103
+
 
 class BlockStructureManager:
     """
@@ -106,29 +109,107 @@ class BlockStructureManager:
 
         return block_structure
 
-    def update_collected_if_needed(self):
+    def update_collected_if_needed(self, changed_usage_keys=None, previous_version=None, version=None):
         """
         The store is updated with newly collected transformers data from
         the modulestore, only if the data in the store is outdated.
+
+        Arguments:
+            changed_usage_keys (iterable(UsageKey)) - The usage keys of the
+                subtrees that a publish changed, taking the course in the
+                modulestore from previous_version to version, if known.
+                See _update_collected.
+
+            previous_version (string) - See changed_usage_keys.
+
+            version (string) - See changed_usage_keys.
         """
         with self._bulk_operations():
             if not self.store.is_up_to_date(self.root_block_usage_key, self.modulestore):
-                self._update_collected()
+                self._update_collected(changed_usage_keys, previous_version, version)
 
-    def _update_collected(self):
+    def _update_collected(self, changed_usage_keys=None, previous_version=None, version=None):
         """
         The store is updated with newly collected transformers data from
         the modulestore.
+
+        When the block_structure.incremental_collect switch is enabled,
+        the data in the store was collected from previous_version of the
+        course and the modulestore has version of the course, transformers
+        that support it only re-collect data for the blocks affected by the
+        change: those in changed_usage_keys and those that are new or whose
+        children changed, along with all of their ancestors and descendants.
         """
         with self._bulk_operations():
             block_structure = BlockStructureFactory.create_from_modulestore(
                 self.root_block_usage_key,
                 self.modulestore,
             )
-            BlockStructureTransformers.collect(block_structure)
+
+            previous_block_structure = self._get_previous_collected(
+                block_structure, changed_usage_keys, previous_version, version,
+            )
+            if previous_block_structure is None:
+                BlockStructureTransformers.collect(block_structure)
+            else:
+                changed_block_keys = self._get_changed_block_keys(
+                    block_structure, previous_block_structure, changed_usage_keys,
+                )
+                logger.info(
+                    'BlockStructure: Incrementally collecting %d changed blocks out of %d for %s.',
+                    len(changed_block_keys), len(block_structure), self.root_block_usage_key,
+                )
+                BlockStructureTransformers.collect(block_structure, previous_block_structure, changed_block_keys)
+
             self.store.add(block_structure)
             return block_structure
 
+    def _get_previous_collected(self, block_structure, changed_usage_keys, previous_version, version):
+        """
+        Returns the block structure previously collected into the store, to
+        collect the given block structure, loaded from the modulestore,
+        incrementally from, or None.
+
+        The changed_usage_keys only describe all the changes since the data
+        in the store was collected if that data was collected from
+        previous_version and the block structure was loaded from version.
+        """
+        if not config.INCREMENTAL_COLLECT.is_enabled() or not changed_usage_keys:
+            return None
+
+        root_block_version = getattr(block_structure.get_xblock(self.root_block_usage_key), 'course_version', None)
+        data_version = self.store.get_data_version(self.root_block_usage_key)
+        if (
+            previous_version is None or data_version is None or str(data_version) != str(previous_version) or
+            version is None or root_block_version is None or str(root_block_version) != str(version)
+        ):
+            return None
+
+        try:
+            return BlockStructureFactory.create_from_store(self.root_block_usage_key, self.store)
+        except BlockStructureNotFound:
+            return None
+
+    @staticmethod
+    def _get_changed_block_keys(block_structure, previous_block_structure, changed_usage_keys):
+        """
+        Returns the keys of the blocks of the given block structure, loaded
+        from the modulestore, that changed since the previous block structure
+        was collected: the given changed blocks and the blocks that are new
+        or whose children changed.
+        """
+        # Published usage keys aren't in any branch.
+        changed_usage_keys = {usage_key.for_branch(None) for usage_key in changed_usage_keys}
+        return {
+            block_key
+            for block_key in block_structure
+            if (
+                block_key.for_branch(None) in changed_usage_keys or
+                block_key not in previous_block_structure or
+                block_structure.get_children(block_key) != previous_block_structure.get_children(block_key)
+            )
+        }
+
     def clear(self):
         """
         Removes data for the block structure associated with the given
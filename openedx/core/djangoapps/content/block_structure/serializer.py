@@ -0,0 +1,440 @@
+"""
+Compact, schema-versioned serialization format for collected block structures.
+
+Unlike the zpickle format, which pickles the entire
+(block_relations, transformer_data, block_data_map) tuple as a single
+object graph, this format stores a block structure as a set of
+independently compressed sections:
+
+    keys        - Interned table of all usage keys in the structure.  Keys
+                  that belong to the root's course are stored as
+                  (block_type index, block_id) pairs.
+    relations   - Parent and child indices into the key table.
+    structure   - Structure-level (non-block-specific) transformer data.
+    xblock      - Collected xBlock fields, stored column by column.
+    t:<name>    - Block-specific data of a single transformer, stored
+                  column by column.
+
+Transformer sections are only decompressed and decoded the first time a
+transformer's block data is accessed, so a request only pays for the
+transformer fields it actually reads.
+
+Binary layout (integers are big-endian):
+
+    MAGIC | FORMAT_VERSION (uint8) | TOC length (uint32) | TOC | sections
+
+where TOC is a zlib-compressed pickle of [(section name, length), ...]
+listing the sections in the order in which they follow.
+"""
+
+
+import pickle
+import struct
+import zlib
+from copy import deepcopy
+
+from .block_structure import BlockData, TransformerData, TransformerDataMap, _BlockRelations
+
+# Prefix identifying data serialized in this format.  zlib streams (and
+# therefore zpickled data) always start with 0x78, so the two formats
+# cannot be confused.
+MAGIC = b'BSC'
+
+# Incrementally update this value whenever the layout of the format
+# changes.  Readers refuse data written with an unknown version.
+FORMAT_VERSION = 1
+
+PICKLE_PROTOCOL = 4
+
+_HEADER = struct.Struct('!3sBI')
+_TRANSFORMER_SECTION_PREFIX = 't:'
+
+
+class UnsupportedFormatVersion(ValueError):
+    """
+    Raised when the serialized data was written with a format version
+    that this reader does not support.
+    """
+    pass  # lint-amnesty, pylint: disable=unnecessary-pass
+
+
+def is_serialized(serialized_data):
+    """
+    Returns whether the given data was serialized with this format.
+    """
+    return bytes(serialized_data[:len(MAGIC)]) == MAGIC
+
+
+def serialize(block_relations, transformer_data, block_data_map):
+    """
+    Serializes the given block structure data and returns bytes.
+
+    Arguments:
+        block_relations (dict {UsageKey: _BlockRelations})
+        transformer_data (TransformerDataMap)
+        block_data_map (dict {UsageKey: BlockData})
+    """
+    key_table = list(block_relations)
+    key_table.extend(key for key in block_data_map if key not in block_relations)
+    key_index = {key: index for index, key in enumerate(key_table)}
+
+    sections = [
+        ('keys', _encode_keys(key_table)),
+        ('relations', _encode_relations(key_table, key_index, block_relations)),
+        ('structure', {name: data.fields for name, data in transformer_data.items()}),
+        ('xblock', _encode_xblock_fields(key_index, block_data_map)),
+    ]
+    sections.extend(
+        (_TRANSFORMER_SECTION_PREFIX + name, columns)
+        for name, columns in _encode_transformer_block_data(key_index, block_data_map).items()
+    )
+
+    encoded_sections = [(name, _dumps(payload)) for name, payload in sections]
+    toc = _dumps([(name, len(encoded)) for name, encoded in encoded_sections])
+    return b''.join(
+        [_HEADER.pack(MAGIC, FORMAT_VERSION, len(toc)), toc] +
+        [encoded for _, encoded in encoded_sections]
+    )
+
+
+def deserialize(serialized_data):
+    """
+    Deserializes the given data, returning a tuple of
+    (block_relations, transformer_data, block_data_map).
+
+    Block-specific transformer data is decoded lazily, per transformer,
+    upon first access.
+
+    Raises:
+        UnsupportedFormatVersion if the data was written with an
+        unknown version of this format.
+    """
+    sections = _split_sections(memoryview(serialized_data))
+
+    key_table = _decode_keys(_loads(sections['keys']))
+    block_relations = _decode_relations(key_table, _loads(sections['relations']))
+
+    transformer_data = TransformerDataMap()
+    for name, fields in _loads(sections['structure']).items():
+        transformer_data[name] = _new_field_data(TransformerData, fields)
+
+    transformer_sections = _LazyTransformerSections(
+        {
+            name[len(_TRANSFORMER_SECTION_PREFIX):]: bytes(section)
+            for name, section in sections.items()
+            if name.startswith(_TRANSFORMER_SECTION_PREFIX)
+        },
+        num_blocks=len(key_table),
+    )
+    block_data_map = _decode_xblock_fields(key_table, _loads(sections['xblock']), transformer_sections)
+
+    return block_relations, transformer_data, block_data_map
+
+
+def load_all(block_data_map):
+    """
+    Decodes all of the lazily loaded transformer data of the given block
+    data map, as returned by deserialize.  Afterwards, reading the data
+    no longer modifies it.
+    """
+    block_data = next(iter(block_data_map.values()), None)
+    if block_data is not None and isinstance(block_data.transformer_data, _LazyTransformerDataMap):
+        # All the blocks of a structure share the same sections.
+        block_data.transformer_data._lazy_sections.load_all()  # pylint: disable=protected-access
+
+
+class _LazyTransformerSections:
+    """
+    Holds the still-encoded transformer sections of a single deserialized
+    block structure and distributes their decoded contents into the
+    structure's per-block TransformerDataMaps on demand.
+    """
+    def __init__(self, sections, num_blocks):
+        # Map of transformer name to its encoded section.
+        # dict {string: bytes}
+        self._sections = sections
+
+        # List of the per-block transformer data maps, indexed by the
+        # block's position in the key table; None for blocks without
+        # BlockData.
+        # list [_LazyTransformerDataMap or None]
+        self.block_maps = [None] * num_blocks
+
+        # Names of transformers whose sections are not decoded yet.
+        # set(string)
+        self.pending = set(sections)
+
+    def load(self, name):
+        """
+        Decodes the section of the given transformer, if not yet decoded.
+        """
+        if name not in self.pending:
+            return
+        self.pending.discard(name)
+
+        # The encoded section is no longer needed once decoded.
+        present_indices, columns = _loads(self._sections.pop(name))
+        block_transformer_data = {index: TransformerData() for index in present_indices}
+        for field_name, (indices, values) in columns.items():
+            for index, value in zip(indices, values):
+                block_transformer_data[index].fields[field_name] = value
+
+        for index, data in block_transformer_data.items():
+            block_map = self.block_maps[index]
+            if block_map is not None:
+                dict.__setitem__(block_map, name, data)
+
+    def load_all(self):
+        """
+        Decodes all remaining transformer sections.
+        """
+        for name in list(self.pending):
+            self.load(name)
+
+    def __deepcopy__(self, memo):
+        copied = _LazyTransformerSections(dict(self._sections), len(self.block_maps))
+        copied.pending = set(self.pending)
+        memo[id(self)] = copied
+        return copied
+
+
+class _LazyTransformerDataMap(TransformerDataMap):
+    """
+    A TransformerDataMap for a single block whose entries are decoded
+    from the serialized data when first accessed.
+    """
+    def __init__(self, lazy_sections, index):
+        super().__init__()
+        self._lazy_sections = lazy_sections
+        self._index = index
+        lazy_sections.block_maps[index] = self
+
+    def __getitem__(self, key):
+        self._lazy_sections.load(self._translate_key(key))
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        self._lazy_sections.load(self._translate_key(key))
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._lazy_sections.load(self._translate_key(key))
+        super().__delitem__(key)
+
+    def __contains__(self, key):
+        key = self._translate_key(key)
+        self._lazy_sections.load(key)
+        return super().__contains__(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __iter__(self):
+        self._lazy_sections.load_all()
+        return super().__iter__()
+
+    def __len__(self):
+        self._lazy_sections.load_all()
+        return super().__len__()
+
+    def keys(self):
+        self._lazy_sections.load_all()
+        return super().keys()
+
+    def values(self):
+        self._lazy_sections.load_all()
+        return super().values()
+
+    def items(self):
+        self._lazy_sections.load_all()
+        return super().items()
+
+    def __eq__(self, other):
+        self._lazy_sections.load_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __deepcopy__(self, memo):
+        copied = _LazyTransformerDataMap(deepcopy(self._lazy_sections, memo), self._index)
+        memo[id(self)] = copied
+        for name, data in dict.items(self):
+            dict.__setitem__(copied, name, deepcopy(data, memo))
+        return copied
+
+    def __reduce__(self):
+        # Pickle as a regular, fully decoded TransformerDataMap.
+        return TransformerDataMap, (), None, None, iter(self.items())
+
+
+def _dumps(payload):
+    return zlib.compress(pickle.dumps(payload, PICKLE_PROTOCOL))
+
+
+def _loads(data):
+    return pickle.loads(zlib.decompress(data))
+
+
+def _split_sections(data):
+    """
+    Returns a dict of section name to the (still encoded) section data.
+    """
+    magic, version, toc_length = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError('Data is not a serialized block structure.')
+    if version != FORMAT_VERSION:
+        raise UnsupportedFormatVersion(f'Unsupported block structure format version {version}.')
+
+    offset = _HEADER.size
+    toc = _loads(data[offset:offset + toc_length])
+    offset += toc_length
+
+    sections = {}
+    for name, length in toc:
+        sections[name] = data[offset:offset + length]
+        offset += length
+    return sections
+
+
+def _new_field_data(cls, fields):
+    """
+    Returns a new instance of the given FieldData class with the given fields.
+    """
+    field_data = cls()
+    field_data.fields = fields
+    return field_data
+
+
+def _encode_keys(key_table):
+    """
+    Interns the usage keys that belong to the course of the first (root)
+    key, so that each is stored as a (block_type index, block_id) pair
+    rather than as a fully pickled key.  All other keys are stored as
+    1-tuples of the key itself.
+    """
+    course_key = getattr(key_table[0], 'course_key', None) if key_table else None
+    block_types = {}
+    entries = []
+    for key in key_table:
+        block_type = getattr(key, 'block_type', None)
+        block_id = getattr(key, 'block_id', None)
+        if (
+            course_key is not None and
+            getattr(key, 'course_key', None) == course_key and
+            course_key.make_usage_key(block_type, block_id) == key
+        ):
+            entries.append((block_types.setdefault(block_type, len(block_types)), block_id))
+        else:
+            entries.append((key,))
+    return course_key, list(block_types), entries
+
+
+def _decode_keys(payload):
+    """
+    Returns the key table from the given encoded keys.
+    """
+    course_key, block_types, entries = payload
+    return [
+        course_key.make_usage_key(block_types[entry[0]], entry[1]) if len(entry) == 2 else entry[0]
+        for entry in entries
+    ]
+
+
+def _encode_relations(key_table, key_index, block_relations):
+    """
+    Returns parent and child indices for each block in the key table.
+    """
+    parents = []
+    children = []
+    for key in key_table:
+        relations = block_relations.get(key)
+        if relations is None:
+            parents.append(None)
+            children.append(None)
+        else:
+            parents.append([key_index[parent] for parent in relations.parents])
+            children.append([key_index[child] for child in relations.children])
+    return parents, children
+
+
+def _decode_relations(key_table, payload):
+    """
+    Returns the block relations map from the given encoded relations.
+    """
+    parents, children = payload
+    block_relations = {}
+    for key, parent_indices, child_indices in zip(key_table, parents, children):
+        if parent_indices is None:
+            continue
+        relations = _BlockRelations()
+        relations.parents = [key_table[index] for index in parent_indices]
+        relations.children = [key_table[index] for index in child_indices]
+        block_relations[key] = relations
+    return block_relations
+
+
+def _encode_columns(indexed_fields):
+    """
+    Returns a dict of field name to an (indices, values) tuple for the
+    given iterable of (block index, fields dict) pairs.
+    """
+    columns = {}
+    for index, fields in indexed_fields:
+        for field_name, value in fields.items():
+            indices, values = columns.setdefault(field_name, ([], []))
+            indices.append(index)
+            values.append(value)
+    return columns
+
+
+def _encode_xblock_fields(key_index, block_data_map):
+    """
+    Returns the indices of all blocks with BlockData along with their
+    xBlock fields, column by column.
+    """
+    present_indices = [key_index[key] for key in block_data_map]
+    columns = _encode_columns(
+        (key_index[key], block_data.fields) for key, block_data in block_data_map.items()
+    )
+    return present_indices, columns
+
+
+def _decode_xblock_fields(key_table, payload, transformer_sections):
+    """
+    Returns the block data map from the given encoded xBlock fields,
+    with lazily loaded transformer data.
+    """
+    present_indices, columns = payload
+    block_data_by_index = {}
+    for index in present_indices:
+        block_data = BlockData(key_table[index])
+        block_data.transformer_data = _LazyTransformerDataMap(transformer_sections, index)
+        block_data_by_index[index] = block_data
+
+    for field_name, (indices, values) in columns.items():
+        for index, value in zip(indices, values):
+            block_data_by_index[index].fields[field_name] = value
+
+    return {key_table[index]: block_data_by_index[index] for index in present_indices}
+
+
+def _encode_transformer_block_data(key_index, block_data_map):
+    """
+    Returns a dict of transformer name to the indices of the blocks that
+    have data for that transformer along with the data, column by column.
+    """
+    blocks_by_transformer = {}
+    for key, block_data in block_data_map.items():
+        for name, data in block_data.transformer_data.items():
+            blocks_by_transformer.setdefault(name, []).append((key_index[key], data.fields))
+
+    return {
+        name: ([index for index, _ in indexed_fields], _encode_columns(indexed_fields))
+        for name, indexed_fields in blocks_by_transformer.items()
+    }
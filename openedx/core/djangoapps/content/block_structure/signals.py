@@ -8,7 +8,7 @@ from django.conf import settings
 from django.dispatch.dispatcher import receiver
 from opaque_keys.edx.locator import LibraryLocator
 
-from xmodule.modulestore.django import SignalHandler
+from xmodule.modulestore.django import SignalHandler, modulestore
 
 from . import config
 from .api import clear_course_from_cache
@@ -37,8 +37,18 @@ def update_block_structure_on_course_publish(sender, course_key, **kwargs):  # p
                 course_key,
             )
 
+    task_kwargs = dict(course_id=str(course_key))
+    if config.INCREMENTAL_COLLECT.is_enabled():
+        published_changes = modulestore().get_published_changes(course_key)
+        if published_changes:
+            task_kwargs.update(
+                published_usage_keys=[str(usage_key) for usage_key in published_changes.usage_keys],
+                previous_version=str(published_changes.previous_version),
+                version=str(published_changes.version),
+            )
+
     update_course_in_cache_v2.apply_async(
-        kwargs=dict(course_id=str(course_key)),
+        kwargs=task_kwargs,
         countdown=settings.BLOCK_STRUCTURES_SETTINGS['COURSE_PUBLISH_TASK_DELAY'],
     )
 
@@ -4,13 +4,15 @@ Module for the Storage of BlockStructure objects.
 # pylint: disable=protected-access
 
 
+import sys
 from logging import getLogger
 
 from django.utils.encoding import python_2_unicode_compatible
+from edx_django_utils.monitoring import set_custom_attribute
 
-from openedx.core.lib.cache_utils import zpickle, zunpickle
+from openedx.core.lib.cache_utils import BoundedLRUCache, zpickle, zunpickle
 
-from . import config
+from . import config, serializer
 from .block_structure import BlockStructureBlockData
 from .exceptions import BlockStructureNotFound
 from .factory import BlockStructureFactory
@@ -19,6 +21,23 @@ from .transformer_registry import TransformerRegistry
 
 logger = getLogger(__name__)  # pylint: disable=C0103
 
+# Per-process cache of deserialized block structures, created upon first use.
+_PROCESS_CACHE = None
+
+
+def get_process_cache():
+    """
+    Returns the per-process cache of deserialized block structures, or
+    None if it is disabled.
+    """
+    global _PROCESS_CACHE  # pylint: disable=global-statement
+    max_size_in_bytes = config.process_cache_max_size_in_bytes()
+    if not max_size_in_bytes:
+        return None
+    if _PROCESS_CACHE is None or _PROCESS_CACHE.max_size_in_bytes != max_size_in_bytes:
+        _PROCESS_CACHE = BoundedLRUCache(max_size_in_bytes)
+    return _PROCESS_CACHE
+
 
 @python_2_unicode_compatible
 class StubModel:
@@ -80,6 +99,11 @@ class BlockStructureStore:
         The given root_block_usage_key must equate the
         root_block_usage_key previously passed to the `add` method.
 
+        When the per-process cache is enabled, deserialized block
+        structures are kept in memory, keyed by the version data of
+        their stored model, and each caller receives its own
+        copy-on-write copy (see BlockStructureBlockData.shallow_copy).
+
         Arguments:
             root_block_usage_key (UsageKey) - The usage_key for the
                 root of the block structure that is to be retrieved
@@ -95,13 +119,28 @@ class BlockStructureStore:
         """
         bs_model = self._get_model(root_block_usage_key)
 
+        process_cache = self._get_process_cache()
+        if process_cache is not None:
+            process_cache_key = self._encode_process_cache_key(bs_model)
+            block_structure = process_cache.get(process_cache_key)
+            set_custom_attribute('block_structure_process_cache_hit', block_structure is not None)
+            if block_structure is not None:
+                return block_structure.shallow_copy()
+
         try:
             serialized_data = self._get_from_cache(bs_model)
         except BlockStructureNotFound:
             serialized_data = self._get_from_store(bs_model)
             self._add_to_cache(serialized_data, bs_model)
 
-        return self._deserialize(serialized_data, root_block_usage_key)
+        block_structure = self._deserialize(serialized_data, root_block_usage_key)
+        if process_cache is not None:
+            # The cached instance is shared by all threads, so it is fully
+            # decoded up front and never modified; callers get copies.
+            serializer.load_all(block_structure._block_data_map)
+            process_cache.set(process_cache_key, block_structure, _get_size_in_bytes(block_structure))
+            return block_structure.shallow_copy()
+        return block_structure
 
     def delete(self, root_block_usage_key):
         """
@@ -114,6 +153,9 @@ class BlockStructureStore:
         """
         bs_model = self._get_model(root_block_usage_key)
         self._cache.delete(self._encode_root_cache_key(bs_model))
+        process_cache = self._get_process_cache()
+        if process_cache is not None:
+            process_cache.delete(self._encode_process_cache_key(bs_model))
         bs_model.delete()
         logger.info("BlockStructure: Deleted from cache and store; %s.", bs_model)
 
@@ -132,6 +174,30 @@ class BlockStructureStore:
 
         return False
 
+    def get_data_version(self, root_block_usage_key):
+        """
+        Returns the version of the modulestore data that the data in
+        storage for the given key was collected from, or None if unknown.
+        """
+        if config.STORAGE_BACKING_FOR_CACHE.is_enabled():
+            try:
+                return self._get_model(root_block_usage_key).data_version
+            except BlockStructureNotFound:
+                pass
+
+        return None
+
+    @staticmethod
+    def _get_process_cache():
+        """
+        Returns the per-process cache, if enabled. Since its entries are
+        keyed by the version data of the stored model, the per-process
+        cache is only used when storage backing is enabled.
+        """
+        if config.STORAGE_BACKING_FOR_CACHE.is_enabled():
+            return get_process_cache()
+        return None
+
     def _get_model(self, root_block_usage_key):
         """
         Returns the model associated with the given key.
@@ -196,21 +262,33 @@ class BlockStructureStore:
     def _serialize(self, block_structure):
         """
         Serializes the data for the given block_structure.
+
+        The columnar format is used when the COLUMNAR_SERIALIZATION
+        switch is enabled; zpickle otherwise.
         """
         data_to_cache = (
             block_structure._block_relations,
             block_structure.transformer_data,
             block_structure._block_data_map,
         )
+        if config.COLUMNAR_SERIALIZATION.is_enabled():
+            return serializer.serialize(*data_to_cache)
         return zpickle(data_to_cache)
 
     def _deserialize(self, serialized_data, root_block_usage_key):
         """
         Deserializes the given data and returns the parsed block_structure.
+
+        Data in either the columnar or the zpickle format is accepted,
+        so that entries written before the COLUMNAR_SERIALIZATION switch
+        was toggled remain readable.
         """
 
         try:
-            block_relations, transformer_data, block_data_map = zunpickle(serialized_data)
+            if serializer.is_serialized(serialized_data):
+                block_relations, transformer_data, block_data_map = serializer.deserialize(serialized_data)
+            else:
+                block_relations, transformer_data, block_data_map = zunpickle(serialized_data)
         except Exception:
             # Somehow failed to de-serialized the data, assume it's corrupt.
             bs_model = self._get_model(root_block_usage_key)
@@ -237,6 +315,18 @@ class BlockStructureStore:
             root_usage_key=str(bs_model.data_usage_key),
         )
 
+    @classmethod
+    def _encode_process_cache_key(cls, bs_model):
+        """
+        Returns the per-process cache key to use for the given
+        BlockStructureModel.  Including the model's version data
+        ensures that outdated entries are never returned.
+        """
+        version_data = cls._version_data_of_model(bs_model)
+        return (str(bs_model.data_usage_key),) + tuple(
+            str(version_data[field_name]) for field_name in BlockStructureModel.VERSION_FIELDS
+        )
+
     @staticmethod
     def _version_data_of_block(root_block):
         """
@@ -259,3 +349,28 @@ class BlockStructureStore:
             field_name: getattr(bs_model, field_name, None)
             for field_name in BlockStructureModel.VERSION_FIELDS
         }
+
+
+def _get_size_in_bytes(block_structure):
+    """
+    Returns an estimate of the memory used by the given decoded block
+    structure, in bytes: the total size of all the objects it refers to,
+    each counted once.
+    """
+    size = 0
+    seen = set()
+    pending = [block_structure]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+        elif hasattr(obj, '__dict__'):
+            pending.append(obj.__dict__)
+    return size
@@ -4,13 +4,14 @@ Asynchronous tasks related to the Course Blocks sub-application.
 
 
 import logging
+from functools import partial
 
 from celery import shared_task
 from django.conf import settings
 from edx_django_utils.monitoring import set_code_owner_attribute
 from edxval.api import ValInternalError
 from lxml.etree import XMLSyntaxError
-from opaque_keys.edx.keys import CourseKey
+from opaque_keys.edx.keys import CourseKey, UsageKey
 
 from capa.responsetypes import LoncapaProblemError
 from openedx.core.djangoapps.content.block_structure import api
@@ -45,6 +46,11 @@ def update_course_in_cache_v2(self, **kwargs):
         course_id (string) - The string serialized value of the course key.
         with_storage (boolean) - Whether or not storage backing should be
             enabled for the generated block structure(s).
+        published_usage_keys (list(string)) - The serialized usage keys of
+            the subtrees a publish changed, taking the published course
+            from previous_version to version.  Optional.
+        previous_version (string) - See published_usage_keys.
+        version (string) - See published_usage_keys.
     """
     _update_course_in_cache(self, **kwargs)
 
@@ -64,7 +70,15 @@ def _update_course_in_cache(self, **kwargs):
     """
     if kwargs.get('with_storage'):
         enable_storage_backing_for_cache_in_request()
-    _call_and_retry_if_needed(self, api.update_course_in_cache, **kwargs)
+    api_method = api.update_course_in_cache
+    if kwargs.get('published_usage_keys'):
+        api_method = partial(
+            api_method,
+            changed_usage_keys=[UsageKey.from_string(usage_key) for usage_key in kwargs['published_usage_keys']],
+            previous_version=kwargs.get('previous_version'),
+            version=kwargs.get('version'),
+        )
+    _call_and_retry_if_needed(self, api_method, **kwargs)
 
 
 @block_structure_task()
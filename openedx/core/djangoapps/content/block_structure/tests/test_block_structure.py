@@ -47,6 +47,18 @@ class TestBlockStructure(TestCase, ChildrenMapTestMixin):
             assert node in block_structure
         assert (len(children_map) + 1) not in block_structure
 
+    @ddt.data(
+        ([3], {0, 1, 2, 3, 5, 6}),
+        ([4], {0, 2, 4}),
+        ([1, 4], {0, 1, 2, 3, 4, 5, 6}),
+        ([5, 100], {0, 1, 2, 3, 5}),
+        ([], set()),
+    )
+    @ddt.unpack
+    def test_get_affected_block_keys(self, block_keys, expected_affected_block_keys):
+        block_structure = self.create_block_structure(self.DAG_CHILDREN_MAP, BlockStructure)
+        assert block_structure.get_affected_block_keys(block_keys) == expected_affected_block_keys
+
 
 @ddt.ddt
 class TestBlockStructureData(TestCase, ChildrenMapTestMixin):
@@ -292,3 +304,36 @@ class TestBlockStructureData(TestCase, ChildrenMapTestMixin):
         _set_value(new_copy, 'edit2')
         assert _get_value(block_structure) == 'edit1'
         assert _get_value(new_copy) == 'edit2'
+
+    def test_shallow_copy(self):
+        block_structure = self.create_block_structure(ChildrenMapTestMixin.LINEAR_CHILDREN_MAP)
+        for block in block_structure:
+            block_structure.set_transformer_block_field(block, 'transformer', 'test_key', 'original_value')
+            block_structure.override_xblock_field(block, 'display_name', 'original_name')
+        block_structure.set_transformer_data('transformer', 'test_key', 'original_value')
+
+        new_copy = block_structure.shallow_copy()
+        assert new_copy[1] is block_structure[1]
+
+        # verify edits to the copy do not affect the original
+        new_copy.set_transformer_block_field(1, 'transformer', 'test_key', 'edit')
+        new_copy.override_xblock_field(2, 'display_name', 'edited_name')
+        new_copy.remove_transformer_block_field(3, 'transformer', 'test_key')
+        new_copy.set_transformer_data('transformer', 'test_key', 'edit')
+        new_copy.remove_block(0, keep_descendants=True)
+
+        assert new_copy.get_transformer_block_field(1, 'transformer', 'test_key') == 'edit'
+        assert new_copy.get_xblock_field(2, 'display_name') == 'edited_name'
+        assert new_copy.get_transformer_block_field(3, 'transformer', 'test_key') is None
+        assert new_copy.get_transformer_data('transformer', 'test_key') == 'edit'
+        self.assert_block_structure(new_copy, [[], [2], [3], []], missing_blocks=[0])
+
+        for block in block_structure:
+            assert block_structure.get_transformer_block_field(block, 'transformer', 'test_key') == 'original_value'
+            assert block_structure.get_xblock_field(block, 'display_name') == 'original_name'
+        assert block_structure.get_transformer_data('transformer', 'test_key') == 'original_value'
+        self.assert_block_structure(block_structure, [[1], [2], [3], []])
+
+        # modified blocks are no longer shared
+        assert new_copy[1] is not block_structure[1]
+        assert new_copy[3] is not block_structure[3]
@@ -8,7 +8,7 @@ from django.test import TestCase
 from edx_toggles.toggles.testutils import override_waffle_switch
 
 from ..block_structure import BlockStructureBlockData
-from ..config import RAISE_ERROR_WHEN_NOT_FOUND, STORAGE_BACKING_FOR_CACHE
+from ..config import INCREMENTAL_COLLECT, RAISE_ERROR_WHEN_NOT_FOUND, STORAGE_BACKING_FOR_CACHE
 from ..exceptions import BlockStructureNotFound, UsageKeyNotInBlockStructure
 from ..manager import BlockStructureManager
 from ..transformers import BlockStructureTransformers
@@ -94,6 +94,36 @@ class TestTransformer1(MockTransformer):
         return data_key + 't1.val1.' + str(block_key)
 
 
+class TestIncrementalTransformer(TestTransformer1):
+    """
+    Test Transformer class that supports incremental collection, and records
+    the blocks it collected data for.
+    """
+    SUPPORTS_INCREMENTAL_COLLECT = True
+    collect_data_key = 't2.collect'
+    transform_data_key = 't2.transform'
+    collected_block_keys = None
+
+    @classmethod
+    def collect(cls, block_structure):
+        """
+        Collects block data for the block structure.
+        """
+        cls.collect_incrementally(block_structure, set(block_structure))
+
+    @classmethod
+    def collect_incrementally(cls, block_structure, block_keys):
+        """
+        Collects block data for the given blocks of the block structure.
+        """
+        for block_key in block_keys:
+            block_structure.set_transformer_block_field(
+                block_key, cls, cls.collect_data_key, cls._create_block_value(block_key, cls.collect_data_key)
+            )
+        cls.collected_block_keys = set(block_keys)
+        cls.collect_call_count += 1
+
+
 @ddt.ddt
 class TestBlockStructureManager(UsageKeyFactoryMixin, ChildrenMapTestMixin, TestCase):
     """
@@ -226,3 +256,102 @@ class TestBlockStructureManager(UsageKeyFactoryMixin, ChildrenMapTestMixin, Test
         self.bs_manager.clear()
         self.collect_and_verify(expect_modulestore_called=True, expect_cache_updated=True)
         assert TestTransformer1.collect_call_count == 2
+
+    def _set_course_version(self, version):
+        """
+        Sets the version of the course in the mock modulestore.
+        """
+        self.modulestore.blocks[self.block_key_factory(0)].field_map['course_version'] = version
+
+    def _update_collected_incrementally(self, changed_blocks, previous_version='v1', version='v2', change=None):
+        """
+        Collects the course at version v1, then calls change, if given, and
+        updates the course at version v2 with the given changed blocks.
+        """
+        self.registered_transformers.append(TestIncrementalTransformer())
+        TestIncrementalTransformer.collect_call_count = 0
+        self._set_course_version('v1')
+        with mock_registered_transformers(self.registered_transformers):
+            self.bs_manager.update_collected_if_needed()
+            assert TestIncrementalTransformer.collected_block_keys == set(self.modulestore.blocks)
+
+            if change:
+                change()
+            self._set_course_version('v2')
+            self.bs_manager.update_collected_if_needed(
+                [self.block_key_factory(block_id) for block_id in changed_blocks], previous_version, version,
+            )
+            assert TestIncrementalTransformer.collect_call_count == 2
+
+            # data for the blocks that weren't re-collected was copied
+            self.collect_and_verify(expect_modulestore_called=False, expect_cache_updated=False)
+            TestIncrementalTransformer.assert_collected(self.bs_manager.get_collected())
+
+    @ddt.data(
+        # changed blocks, expected collected blocks
+        ([3], {0, 1, 3}),
+        ([2], {0, 2}),
+        ([1], {0, 1, 3, 4}),
+        ([3, 4], {0, 1, 3, 4}),
+    )
+    @ddt.unpack
+    @override_waffle_switch(STORAGE_BACKING_FOR_CACHE, active=True)
+    @override_waffle_switch(INCREMENTAL_COLLECT, active=True)
+    def test_update_collected_incrementally(self, changed_blocks, expected_collected_blocks):
+        self._update_collected_incrementally(changed_blocks)
+        assert TestIncrementalTransformer.collected_block_keys == {
+            self.block_key_factory(block_id) for block_id in expected_collected_blocks
+        }
+
+        # non-incremental transformers are fully re-collected
+        assert TestTransformer1.collect_call_count == 2
+
+    @ddt.data(
+        # the collected data isn't from the version the changes started from
+        dict(previous_version='v0'),
+        # the modulestore isn't at the version the changes led to
+        dict(version='v3'),
+        dict(previous_version=None, version=None),
+    )
+    @override_waffle_switch(STORAGE_BACKING_FOR_CACHE, active=True)
+    @override_waffle_switch(INCREMENTAL_COLLECT, active=True)
+    def test_update_collected_incrementally_other_versions(self, versions):
+        self._update_collected_incrementally([3], **versions)
+        assert TestIncrementalTransformer.collected_block_keys == set(self.modulestore.blocks)
+
+    @override_waffle_switch(STORAGE_BACKING_FOR_CACHE, active=True)
+    def test_update_collected_incrementally_disabled(self):
+        self._update_collected_incrementally([3])
+        assert TestIncrementalTransformer.collected_block_keys == set(self.modulestore.blocks)
+
+    @override_waffle_switch(STORAGE_BACKING_FOR_CACHE, active=True)
+    @override_waffle_switch(INCREMENTAL_COLLECT, active=True)
+    def test_update_collected_incrementally_with_new_children(self):
+        def move_block_4():
+            """
+            Moves block 4 from block 1 to block 2.
+            """
+            self.children_map = [[1, 2], [3], [4], [], []]
+            self.modulestore.blocks[self.block_key_factory(1)].children = [self.block_key_factory(3)]
+            self.modulestore.blocks[self.block_key_factory(2)].children = [self.block_key_factory(4)]
+
+        # block 1 changed too, since its children changed
+        self._update_collected_incrementally([4], change=move_block_4)
+        assert TestIncrementalTransformer.collected_block_keys == set(self.modulestore.blocks)
+
+    @override_waffle_switch(STORAGE_BACKING_FOR_CACHE, active=True)
+    @override_waffle_switch(INCREMENTAL_COLLECT, active=True)
+    def test_update_collected_incrementally_transformer_version(self):
+        def update_transformer_version():
+            """
+            Updates the version of the incremental transformer.
+            """
+            TestIncrementalTransformer.WRITE_VERSION += 1
+
+        # data collected by an older version of the transformer is fully
+        # re-collected
+        try:
+            self._update_collected_incrementally([3], change=update_transformer_version)
+        finally:
+            TestIncrementalTransformer.WRITE_VERSION -= 1
+        assert TestIncrementalTransformer.collected_block_keys == set(self.modulestore.blocks)
@@ -0,0 +1,118 @@
+"""
+Tests for block_structure/serializer.py
+"""
+
+import pickle
+from copy import deepcopy
+from unittest import TestCase
+
+import ddt
+import pytest
+
+from openedx.core.lib.cache_utils import zpickle
+
+from .. import serializer
+from ..block_structure import BlockStructureBlockData
+from .helpers import ChildrenMapTestMixin, MockTransformer, UsageKeyFactoryMixin
+
+
+class OtherMockTransformer(MockTransformer):
+    """
+    A second mock transformer, to verify sections are decoded independently.
+    """
+    pass  # lint-amnesty, pylint: disable=unnecessary-pass
+
+
+@ddt.ddt
+class TestSerializer(UsageKeyFactoryMixin, ChildrenMapTestMixin, TestCase):
+    """
+    Tests for the columnar block structure serialization format.
+    """
+    def create_collected_structure(self, children_map):
+        """
+        Returns a block structure for the given children_map with
+        xBlock fields and transformer data set on each block.
+        """
+        block_structure = self.create_block_structure(children_map, BlockStructureBlockData)
+        block_structure._add_transformer(MockTransformer)  # pylint: disable=protected-access
+        for block_id in range(len(children_map)):
+            block_key = self.block_key_factory(block_id)
+            block_structure.override_xblock_field(block_key, 'display_name', f'Block {block_id}')
+            block_structure.set_transformer_block_field(block_key, MockTransformer, 'value', block_id)
+            if block_id % 2:
+                block_structure.set_transformer_block_field(block_key, OtherMockTransformer, 'odd', [block_id])
+        return block_structure
+
+    def round_trip(self, block_structure):
+        """
+        Serializes and deserializes the given block structure.
+        """
+        serialized = serializer.serialize(
+            block_structure._block_relations,  # pylint: disable=protected-access
+            block_structure.transformer_data,
+            block_structure._block_data_map,  # pylint: disable=protected-access
+        )
+        assert serializer.is_serialized(serialized)
+        deserialized = BlockStructureBlockData(block_structure.root_block_usage_key)
+        (
+            deserialized._block_relations,  # pylint: disable=protected-access
+            deserialized.transformer_data,
+            deserialized._block_data_map,  # pylint: disable=protected-access
+        ) = serializer.deserialize(serialized)
+        return deserialized
+
+    @ddt.data(
+        ChildrenMapTestMixin.SIMPLE_CHILDREN_MAP,
+        ChildrenMapTestMixin.LINEAR_CHILDREN_MAP,
+        ChildrenMapTestMixin.DAG_CHILDREN_MAP,
+    )
+    def test_round_trip(self, children_map):
+        block_structure = self.round_trip(self.create_collected_structure(children_map))
+        self.assert_block_structure(block_structure, children_map)
+        assert block_structure.get_transformer_data(MockTransformer, '_version') == MockTransformer.WRITE_VERSION
+        for block_id in range(len(children_map)):
+            block_key = self.block_key_factory(block_id)
+            assert block_structure.get_xblock_field(block_key, 'display_name') == f'Block {block_id}'
+            assert block_structure.get_transformer_block_field(block_key, MockTransformer, 'value') == block_id
+            assert block_structure.get_transformer_block_field(
+                block_key, OtherMockTransformer, 'odd',
+            ) == ([block_id] if block_id % 2 else None)
+
+    def test_transformer_sections_decoded_lazily(self):
+        block_structure = self.round_trip(self.create_collected_structure(self.SIMPLE_CHILDREN_MAP))
+        root_key = block_structure.root_block_usage_key
+        lazy_sections = block_structure[root_key].transformer_data._lazy_sections  # pylint: disable=protected-access
+        assert lazy_sections.pending == {MockTransformer.name(), OtherMockTransformer.name()}
+
+        block_structure.get_transformer_block_field(root_key, MockTransformer, 'value')
+        assert lazy_sections.pending == {OtherMockTransformer.name()}
+
+    def test_copy_is_independent(self):
+        block_structure = self.round_trip(self.create_collected_structure(self.SIMPLE_CHILDREN_MAP))
+        copied = block_structure.copy()
+        block_key = self.block_key_factory(1)
+
+        copied.set_transformer_block_field(block_key, OtherMockTransformer, 'odd', 'changed')
+        assert copied.get_transformer_block_field(block_key, OtherMockTransformer, 'odd') == 'changed'
+        assert block_structure.get_transformer_block_field(block_key, OtherMockTransformer, 'odd') == [1]
+        assert deepcopy(block_structure)[block_key].transformer_data[OtherMockTransformer].odd == [1]
+
+    def test_pickle_decoded(self):
+        block_structure = self.round_trip(self.create_collected_structure(self.SIMPLE_CHILDREN_MAP))
+        block_key = self.block_key_factory(3)
+        unpickled = pickle.loads(pickle.dumps(block_structure[block_key]))
+        assert unpickled.transformer_data[OtherMockTransformer].odd == [3]
+
+    def test_zpickle_not_detected(self):
+        assert not serializer.is_serialized(zpickle(({}, {}, {})))
+
+    def test_unsupported_version(self):
+        block_structure = self.create_collected_structure(self.SIMPLE_CHILDREN_MAP)
+        serialized = bytearray(serializer.serialize(
+            block_structure._block_relations,  # pylint: disable=protected-access
+            block_structure.transformer_data,
+            block_structure._block_data_map,  # pylint: disable=protected-access
+        ))
+        serialized[len(serializer.MAGIC)] = serializer.FORMAT_VERSION + 1
+        with pytest.raises(serializer.UnsupportedFormatVersion):
+            serializer.deserialize(bytes(serialized))
@@ -7,12 +7,13 @@ import pytest
 import ddt
 from edx_toggles.toggles.testutils import override_waffle_switch
 from opaque_keys.edx.locator import CourseLocator, LibraryLocator
+from xmodule.modulestore import ModuleStoreEnum
 from xmodule.modulestore.exceptions import ItemNotFoundError
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
-from xmodule.modulestore.tests.factories import CourseFactory
+from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
 
 from ..api import get_block_structure_manager
-from ..config import INVALIDATE_CACHE_ON_PUBLISH
+from ..config import INCREMENTAL_COLLECT, INVALIDATE_CACHE_ON_PUBLISH
 from ..signals import update_block_structure_on_course_publish
 from .helpers import is_course_in_block_structure_cache
 
@@ -76,3 +77,26 @@ class CourseBlocksSignalTest(ModuleStoreTestCase):
     def test_update_only_for_courses(self, key, expect_update_called, mock_update):
         update_block_structure_on_course_publish(sender=None, course_key=key)
         assert mock_update.called == expect_update_called
+
+    @ddt.data(True, False)
+    @patch('openedx.core.djangoapps.content.block_structure.tasks.update_course_in_cache_v2.apply_async')
+    def test_update_with_published_changes(self, incremental_collect_enabled, mock_update):
+        course = CourseFactory.create(default_store=ModuleStoreEnum.Type.split)
+        vertical = ItemFactory.create(parent=course, category='vertical')
+        with self.store.branch_setting(ModuleStoreEnum.Branch.published_only, course.id):
+            previous_version = self.store.get_course(course.id).course_version
+
+        mock_update.reset_mock()
+        with override_waffle_switch(INCREMENTAL_COLLECT, active=incremental_collect_enabled):
+            self.store.publish(vertical.location, self.user.id)
+
+        with self.store.branch_setting(ModuleStoreEnum.Branch.published_only, course.id):
+            version = self.store.get_course(course.id).course_version
+        expected_task_kwargs = dict(course_id=str(course.id))
+        if incremental_collect_enabled:
+            expected_task_kwargs.update(
+                published_usage_keys=[str(vertical.location.for_branch(None))],
+                previous_version=str(previous_version),
+                version=str(version),
+            )
+        assert mock_update.call_args[1]['kwargs'] == expected_task_kwargs
@@ -2,16 +2,19 @@
 Tests for block_structure/cache.py
 """
 
+import itertools
+
 import pytest
 import ddt
+from django.test.utils import override_settings
 from edx_toggles.toggles.testutils import override_waffle_switch
 
 from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
 
-from ..config import STORAGE_BACKING_FOR_CACHE
+from ..config import COLUMNAR_SERIALIZATION, STORAGE_BACKING_FOR_CACHE
 from ..config.models import BlockStructureConfiguration
 from ..exceptions import BlockStructureNotFound
-from ..store import BlockStructureStore
+from ..store import BlockStructureStore, get_process_cache
 from .helpers import ChildrenMapTestMixin, MockCache, MockTransformer, UsageKeyFactoryMixin
 
 
@@ -60,6 +63,18 @@ class TestBlockStructureStore(UsageKeyFactoryMixin, ChildrenMapTestMixin, CacheI
             assert stored_value is not None
             self.assert_block_structure(stored_value, self.children_map)
 
+    @ddt.data(*itertools.product((True, False), repeat=2))
+    @ddt.unpack
+    def test_read_across_formats(self, columnar_on_write, columnar_on_read):
+        with override_waffle_switch(COLUMNAR_SERIALIZATION, active=columnar_on_write):
+            self.store.add(self.block_structure)
+        with override_waffle_switch(COLUMNAR_SERIALIZATION, active=columnar_on_read):
+            stored_value = self.store.get(self.block_structure.root_block_usage_key)
+        self.assert_block_structure(stored_value, self.children_map)
+        assert stored_value.get_transformer_block_field(
+            self.block_key_factory(0), MockTransformer, 'test',
+        ) == f'{MockTransformer.name()} val'
+
     @ddt.data(True, False)
     def test_delete(self, with_storage_backing):
         with override_waffle_switch(STORAGE_BACKING_FOR_CACHE, active=with_storage_backing):
@@ -68,6 +83,35 @@ class TestBlockStructureStore(UsageKeyFactoryMixin, ChildrenMapTestMixin, CacheI
             with pytest.raises(BlockStructureNotFound):
                 self.store.get(self.block_structure.root_block_usage_key)
 
+    @override_settings(BLOCK_STRUCTURES_SETTINGS={'PROCESS_CACHE_MAX_SIZE_IN_BYTES': 10 ** 6})
+    def test_process_cache(self):
+        with override_waffle_switch(STORAGE_BACKING_FOR_CACHE, active=True):
+            process_cache = get_process_cache()
+            process_cache.clear()
+            self.store.add(self.block_structure)
+            first_value = self.store.get(self.block_structure.root_block_usage_key)
+
+            # Served from the process cache, even if the django cache is cleared.
+            self.mock_cache.map.clear()
+            second_value = self.store.get(self.block_structure.root_block_usage_key)
+            self.assert_block_structure(second_value, self.children_map)
+            assert process_cache.hits == 1
+
+            # Each caller gets its own copy.
+            first_value.remove_block(self.block_key_factory(1), keep_descendants=False)
+            self.assert_block_structure(second_value, self.children_map)
+            self.assert_block_structure(self.store.get(self.block_structure.root_block_usage_key), self.children_map)
+
+            self.store.delete(self.block_structure.root_block_usage_key)
+            assert len(process_cache) == 0
+
+    @override_settings(BLOCK_STRUCTURES_SETTINGS={'PROCESS_CACHE_MAX_SIZE_IN_BYTES': 10 ** 6})
+    def test_process_cache_requires_storage_backing(self):
+        get_process_cache().clear()
+        self.store.add(self.block_structure)
+        self.store.get(self.block_structure.root_block_usage_key)
+        assert len(get_process_cache()) == 0
+
     def test_uncached_without_storage(self):
         self.store.add(self.block_structure)
         self.mock_cache.map.clear()
@@ -64,6 +64,18 @@ class TestBlockStructureTransformers(ChildrenMapTestMixin, TestCase):
             self.transformers.transform(block_structure=MagicMock())
             assert mock_transform_call.called
 
+    @patch('openedx.core.djangoapps.content.block_structure.transformers.set_custom_attribute')
+    def test_transform_timings(self, mock_set_custom_attribute):
+        self.add_mock_transformer()
+        block_structure = self.create_block_structure(self.SIMPLE_CHILDREN_MAP)
+
+        self.transformers.transform(block_structure)
+        steps = {'MockTransformer', 'MockFilteringTransformer', 'filters', 'prune_unreachable'}
+        assert set(self.transformers.transform_timings) == steps
+        assert {
+            call[0][0] for call in mock_set_custom_attribute.call_args_list
+        } == {f'block_structure_transform_ms.{step}' for step in steps}
+
     def test_verify_versions(self):
         block_structure = self.create_block_structure(
             self.SIMPLE_CHILDREN_MAP,
@@ -108,6 +108,35 @@ class BlockStructureTransformer:
         """
         pass  # lint-amnesty, pylint: disable=unnecessary-pass
 
+    # Whether the transformer implements collect_incrementally.
+    SUPPORTS_INCREMENTAL_COLLECT = False
+
+    @classmethod
+    def collect_incrementally(cls, block_structure, block_keys):
+        """
+        Collects the transformer's data for only the blocks with the given
+        block_keys.  Called instead of collect when a course is updated
+        and the transformer's SUPPORTS_INCREMENTAL_COLLECT is True; the
+        other blocks in the block_structure already hold the data the
+        transformer collected for them before the update, since they
+        haven't changed.
+
+        block_keys contains the blocks that changed along with all of
+        their ancestors and descendants.  So transformers whose data for
+        a block only depends on the block itself, its ancestors and its
+        descendants can implement this method by limiting the traversals
+        of their collect method to block_keys.  As in collect, any xBlock
+        fields the transformer needs must be requested.
+
+        Arguments:
+            block_structure (BlockStructureModulestoreData) - A mutable
+                block structure that is to be modified with collected
+                data to be cached for the transformer.
+
+            block_keys (set(UsageKey)) - The blocks to collect data for.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def transform(self, usage_info, block_structure):
         """
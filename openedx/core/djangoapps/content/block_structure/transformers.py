@@ -1,8 +1,12 @@
 """
 Module for a collection of BlockStructureTransformers.
 """
+import time
+from contextlib import contextmanager
 from logging import getLogger
 
+from edx_django_utils.monitoring import set_custom_attribute
+
 from .exceptions import TransformerDataIncompatible, TransformerException
 from .transformer import FilteringTransformerMixin, combine_filters
 from .transformer_registry import TransformerRegistry
@@ -40,6 +44,8 @@ class BlockStructureTransformers:
         """
         self.usage_info = usage_info
         self._transformers = {'supports_filter': [], 'no_filter': []}
+        # Milliseconds spent by each step of the last transform, by step.
+        self.transform_timings = {}
         if transformers:
             self.__iadd__(transformers)
 
@@ -69,17 +75,49 @@ class BlockStructureTransformers:
         return self
 
     @classmethod
-    def collect(cls, block_structure):
+    def collect(cls, block_structure, previous_block_structure=None, changed_block_keys=None):
         """
         Collects data for each registered transformer.
+
+        If a previously collected block structure and the keys of the
+        blocks that changed since are given, transformers that support it
+        only collect data for the blocks affected by the changes, and
+        reuse their previously collected data for the other blocks.
         """
+        affected_block_keys = None
+        if previous_block_structure is not None and changed_block_keys is not None:
+            affected_block_keys = block_structure.get_affected_block_keys(changed_block_keys)
+            unaffected_block_keys = [
+                block_key for block_key in block_structure if block_key not in affected_block_keys
+            ]
+
         for transformer in TransformerRegistry.get_registered_transformers():
             block_structure._add_transformer(transformer)  # pylint: disable=protected-access
-            transformer.collect(block_structure)
+            if affected_block_keys is not None and cls._can_collect_incrementally(
+                transformer, previous_block_structure,
+            ):
+                block_structure._copy_transformer_data(  # pylint: disable=protected-access
+                    transformer, previous_block_structure, unaffected_block_keys,
+                )
+                transformer.collect_incrementally(block_structure, affected_block_keys)
+            else:
+                transformer.collect(block_structure)
 
         # Collect all fields that were requested by the transformers.
         block_structure._collect_requested_xblock_fields()  # pylint: disable=protected-access
 
+    @classmethod
+    def _can_collect_incrementally(cls, transformer, previous_block_structure):
+        """
+        Returns whether the given transformer supports incremental collection
+        and its data in the given previously collected block structure was
+        collected by its current version.
+        """
+        previous_version = previous_block_structure._get_transformer_data_version(  # pylint: disable=protected-access
+            transformer,
+        )
+        return transformer.SUPPORTS_INCREMENTAL_COLLECT and previous_version == transformer.WRITE_VERSION
+
     @classmethod
     def verify_versions(cls, block_structure):
         """
@@ -109,12 +147,34 @@ class BlockStructureTransformers:
         collection. Tranformers with filters are combined and run first in a
         single course tree traversal, then remaining transformers are run in
         the order that they were added.
+
+        The time taken by each transformer, by the combined traversal and by
+        the final pruning are kept in transform_timings and reported as
+        custom monitoring attributes.
         """
+        self.transform_timings = {}
         self._transform_with_filters(block_structure)
         self._transform_without_filters(block_structure)
 
         # Prune the block structure to remove any unreachable blocks.
-        block_structure._prune_unreachable()  # pylint: disable=protected-access
+        with self._timed('prune_unreachable'):
+            block_structure._prune_unreachable()  # pylint: disable=protected-access
+
+        for step, milliseconds in self.transform_timings.items():
+            set_custom_attribute(f'block_structure_transform_ms.{step}', round(milliseconds, 2))
+
+    @contextmanager
+    def _timed(self, step):
+        """
+        Adds the time taken by the wrapped code to the timing of the given
+        step of the transform.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.transform_timings[step] = self.transform_timings.get(step, 0) + elapsed
 
     def _transform_with_filters(self, block_structure):
         """
@@ -126,10 +186,14 @@ class BlockStructureTransformers:
 
         filters = []
         for transformer in self._transformers['supports_filter']:
-            filters.extend(transformer.transform_block_filters(self.usage_info, block_structure))
+            with self._timed(transformer.name()):
+                filters.extend(transformer.transform_block_filters(self.usage_info, block_structure))
 
-        combined_filters = combine_filters(block_structure, filters)
-        block_structure.filter_topological_traversal(combined_filters)
+        # The filters of all the transformers are applied together, so their
+        # time is only known as a whole.
+        with self._timed('filters'):
+            combined_filters = combine_filters(block_structure, filters)
+            block_structure.filter_topological_traversal(combined_filters)
 
     def _transform_without_filters(self, block_structure):
         """
@@ -137,4 +201,5 @@ class BlockStructureTransformers:
         method from the given transformers.
         """
         for transformer in self._transformers['no_filter']:
-            transformer.transform(self.usage_info, block_structure)
+            with self._timed(transformer.name()):
+                transformer.transform(self.usage_info, block_structure)
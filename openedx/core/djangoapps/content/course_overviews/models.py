@@ -5,6 +5,7 @@ Declaration of CourseOverview model
 
 import json
 import logging
+import pickle
 from urllib.parse import urlparse, urlunparse
 
 from ccx_keys.locator import CCXLocator
@@ -28,7 +29,7 @@ from lms.djangoapps.discussion import django_comment_client
 from openedx.core.djangoapps.catalog.models import CatalogIntegration
 from openedx.core.djangoapps.lang_pref.api import get_closest_released_language
 from openedx.core.djangoapps.models.course_details import CourseDetails
-from openedx.core.lib.cache_utils import request_cached, RequestCache
+from openedx.core.lib.cache_utils import BoundedLRUCache, request_cached, RequestCache
 from common.djangoapps.static_replace.models import AssetBaseUrlConfig
 from xmodule import block_metadata_utils, course_metadata_utils
 from xmodule.course_module import DEFAULT_START_DATE, CourseBlock
@@ -39,6 +40,23 @@ from xmodule.tabs import CourseTab
 
 log = logging.getLogger(__name__)
 
+# Per-process cache of pickled CourseOverviews, created upon first use.
+_PROCESS_CACHE = None
+
+
+def get_process_cache():
+    """
+    Returns the per-process cache of CourseOverviews, or None if it is
+    disabled.
+    """
+    global _PROCESS_CACHE  # pylint: disable=global-statement
+    max_size_in_bytes = getattr(settings, 'COURSE_OVERVIEW_PROCESS_CACHE_MAX_SIZE_IN_BYTES', 0)
+    if not max_size_in_bytes:
+        return None
+    if _PROCESS_CACHE is None or _PROCESS_CACHE.max_size_in_bytes != max_size_in_bytes:
+        _PROCESS_CACHE = BoundedLRUCache(max_size_in_bytes)
+    return _PROCESS_CACHE
+
 
 class CourseOverviewCaseMismatchException(Exception):
     pass
@@ -264,65 +282,80 @@ class CourseOverview(TimeStampedModel):
         store = modulestore()
         with store.bulk_operations(course_id):
             course = store.get_course(course_id)
-            if isinstance(course, CourseBlock):
-                try:
-                    course_overview = cls._create_or_update(course)
-                    with transaction.atomic():
-                        course_overview.save()
-                        # Remove and recreate all the course tabs
-                        CourseOverviewTab.objects.filter(course_overview=course_overview).delete()
-                        CourseOverviewTab.objects.bulk_create([
-                            CourseOverviewTab(
-                                tab_id=tab.tab_id,
-                                type=tab.type,
-                                name=tab.name,
-                                course_staff_only=tab.course_staff_only,
-                                url_slug=tab.get('url_slug'),
-                                link=tab.get('link'),
-                                is_hidden=tab.get('is_hidden', False),
-                                course_overview=course_overview)
-                            for tab in course.tabs
-                        ])
-                        # Remove and recreate course images
-                        CourseOverviewImageSet.objects.filter(course_overview=course_overview).delete()
-                        CourseOverviewImageSet.create(course_overview, course)
-
-                except IntegrityError:
-                    # There is a rare race condition that will occur if
-                    # CourseOverview.get_from_id is called while a
-                    # another identical overview is already in the process
-                    # of being created.
-                    # One of the overviews will be saved normally, while the
-                    # other one will cause an IntegrityError because it tries
-                    # to save a duplicate.
-                    # (see: https://openedx.atlassian.net/browse/TNL-2854).
-                    log.info(
-                        "Multiple CourseOverviews for course %s requested "
-                        "simultaneously; will only save one.",
-                        course_id,
-                    )
-                except Exception:
-                    log.exception(
-                        "Saving CourseOverview for course %s failed with "
-                        "unexpected exception!",
-                        course_id,
-                    )
-                    raise
-
-                return course_overview
-            elif course is not None:
-                raise OSError(  # lint-amnesty, pylint: disable=raising-format-tuple
-                    "Error while loading CourseOverview for course {} "
-                    "from the module store: {}",
-                    str(course_id),
-                    course.error_msg if isinstance(course, ErrorBlock) else str(course)
-                )
-            else:
+            return cls._load_from_course(course_id, course)
+
+    @classmethod
+    def _load_from_course(cls, course_id, course):
+        """
+        Create or update a CourseOverview from the given CourseBlock, loaded
+        from the module store, cache the overview, and return it.
+
+        Arguments:
+            course_id (CourseKey): the ID of the course overview to be loaded.
+            course (CourseBlock|ErrorBlock|None): the course, as returned by
+                the module store.
+
+        Raises the same errors as load_from_module_store.
+        """
+        if isinstance(course, CourseBlock):
+            try:
+                course_overview = cls._create_or_update(course)
+                with transaction.atomic():
+                    course_overview.save()
+                    # Remove and recreate all the course tabs
+                    CourseOverviewTab.objects.filter(course_overview=course_overview).delete()
+                    CourseOverviewTab.objects.bulk_create([
+                        CourseOverviewTab(
+                            tab_id=tab.tab_id,
+                            type=tab.type,
+                            name=tab.name,
+                            course_staff_only=tab.course_staff_only,
+                            url_slug=tab.get('url_slug'),
+                            link=tab.get('link'),
+                            is_hidden=tab.get('is_hidden', False),
+                            course_overview=course_overview)
+                        for tab in course.tabs
+                    ])
+                    # Remove and recreate course images
+                    CourseOverviewImageSet.objects.filter(course_overview=course_overview).delete()
+                    CourseOverviewImageSet.create(course_overview, course)
+
+            except IntegrityError:
+                # There is a rare race condition that will occur if
+                # CourseOverview.get_from_id is called while a
+                # another identical overview is already in the process
+                # of being created.
+                # One of the overviews will be saved normally, while the
+                # other one will cause an IntegrityError because it tries
+                # to save a duplicate.
+                # (see: https://openedx.atlassian.net/browse/TNL-2854).
                 log.info(
-                    "Could not create CourseOverview for non-existent course: %s",
+                    "Multiple CourseOverviews for course %s requested "
+                    "simultaneously; will only save one.",
                     course_id,
                 )
-                raise cls.DoesNotExist()
+            except Exception:
+                log.exception(
+                    "Saving CourseOverview for course %s failed with "
+                    "unexpected exception!",
+                    course_id,
+                )
+                raise
+
+            return course_overview
+        elif course is not None:
+            raise OSError(  # lint-amnesty, pylint: disable=raising-format-tuple
+                "Error while loading CourseOverview for course {} "
+                "from the module store: {}",
+                str(course_id),
+                course.error_msg if isinstance(course, ErrorBlock) else str(course)
+            )
+        else:
+            log.info(
+                "Could not create CourseOverview for non-existent course: %s",
+                course_id,
+            )
+            raise cls.DoesNotExist()
 
     @classmethod
     def course_exists(cls, course_id):
@@ -366,13 +399,9 @@ class CourseOverview(TimeStampedModel):
             - IOError if some other error occurs while trying to load the
                 course from the module store.
         """
-        try:
-            course_overview = cls.objects.select_related('image_set').get(id=course_id)
-            if course_overview.version < cls.VERSION:
-                # Reload the overview from the modulestore to update the version
-                course_overview = cls.load_from_module_store(course_id)
-        except cls.DoesNotExist:
-            course_overview = None
+        # Outdated overviews aren't returned, so they are reloaded from the
+        # modulestore to update the version.
+        course_overview = cls._get_many_from_db([course_id]).get(course_id)
 
         # Regenerate the thumbnail images if they're missing (either because
         # they were never generated, or because they were flushed out after
@@ -393,8 +422,9 @@ class CourseOverview(TimeStampedModel):
         """
         Return a dict mapping course_ids to CourseOverviews.
 
-        Tries to select all CourseOverviews in one query,
-        then fetches remaining (uncached) overviews from the modulestore.
+        Tries to select all CourseOverviews in one query (see
+        _get_many_from_db), then fetches the courses of the remaining
+        (uncached) overviews from the modulestore in bulk.
 
         Course IDs for non-existant courses will map to None.
 
@@ -403,21 +433,91 @@ class CourseOverview(TimeStampedModel):
 
         Returns: dict[CourseKey, CourseOverview|None]
         """
-        overviews = {
-            overview.id: overview
-            for overview in cls.objects.select_related('image_set').filter(
-                id__in=course_ids,
-                version__gte=cls.VERSION
-            )
-        }
-        for course_id in course_ids:
-            if course_id not in overviews:
-                try:
+        overviews = cls._get_many_from_db(course_ids)
+        missing_ids = [course_id for course_id in course_ids if course_id not in overviews]
+        if not missing_ids:
+            return overviews
+
+        courses = {course.id: course for course in modulestore().get_courses(course_keys=missing_ids)}
+        for course_id in missing_ids:
+            try:
+                if course_id in courses:
+                    overviews[course_id] = cls._load_from_course(course_id, courses[course_id])
+                else:
+                    # Broken courses aren't returned by get_courses; loading
+                    # them on their own raises the appropriate error.
                     overviews[course_id] = cls.load_from_module_store(course_id)
-                except CourseOverview.DoesNotExist:
-                    overviews[course_id] = None
+            except CourseOverview.DoesNotExist:
+                overviews[course_id] = None
+        return overviews
+
+    @classmethod
+    def _get_many_from_db(cls, course_ids):
+        """
+        Return a dict mapping course_ids to the up-to-date CourseOverviews in
+        the database, with their tabs and image sets loaded.
+
+        CourseOverviews are kept in a per-process cache, along with the
+        versions of their rows.  Cached overviews are used if a single query
+        for the current versions of their rows shows they haven't changed
+        since, and the rest are loaded in bulk.
+
+        Arguments:
+            course_ids (iterable[CourseKey])
+
+        Returns: dict[CourseKey, CourseOverview]
+        """
+        process_cache = get_process_cache()
+        overviews = {}
+        missing_ids = set(course_ids)
+
+        if process_cache is not None:
+            cached_entries = {}
+            for course_id in missing_ids:
+                entry = process_cache.get(course_id)
+                if entry is not None:
+                    cached_entries[course_id] = entry
+            if cached_entries:
+                row_versions = cls.objects.filter(id__in=cached_entries).values_list(
+                    'id', 'version', 'modified', 'image_set__modified',
+                )
+                for course_id, version, modified, image_set_modified in row_versions:
+                    row_version, pickled_overview = cached_entries.get(course_id, (None, None))
+                    if version >= cls.VERSION and row_version == (version, modified, image_set_modified):
+                        overviews[course_id] = pickle.loads(pickled_overview)
+                missing_ids.difference_update(overviews)
+
+        if missing_ids:
+            for overview in cls.objects.select_related('image_set').prefetch_related('tab_set').filter(
+                id__in=missing_ids,
+                version__gte=cls.VERSION
+            ):
+                overviews[overview.id] = overview
+                if process_cache is not None:
+                    pickled_overview = pickle.dumps(overview, pickle.HIGHEST_PROTOCOL)
+                    process_cache.set(overview.id, (overview._row_version, pickled_overview), len(pickled_overview))
+
         return overviews
 
+    @property
+    def _row_version(self):
+        """
+        The versions of this overview's row and its image set's row, which
+        change whenever the overview is updated.
+        """
+        image_set_modified = self.image_set.modified if hasattr(self, 'image_set') else None
+        return (self.version, self.modified, image_set_modified)
+
+    @classmethod
+    def clear_process_cache(cls, course_id):
+        """
+        Remove the CourseOverview of the given course from this process's
+        cache.  Other processes will find it outdated when they next use it.
+        """
+        process_cache = get_process_cache()
+        if process_cache is not None:
+            process_cache.delete(course_id)
+
     @classmethod
     def _get_course_has_highlights(cls, course):
         # Avoid circular import here
@@ -687,7 +787,10 @@ class CourseOverview(TimeStampedModel):
         """
         Returns an iterator of CourseTabs.
         """
-        for tab_dict in self.tab_set.all().values():
+        # Not tab_set.all().values(), which would ignore prefetched tabs.
+        tab_fields = [field.attname for field in CourseOverviewTab._meta.concrete_fields]
+        for tab_model in self.tab_set.all():
+            tab_dict = {field: getattr(tab_model, field) for field in tab_fields}
             tab = CourseTab.from_json(tab_dict)
             if tab is None:
                 log.warning("Can't instantiate CourseTab from %r", tab_dict)
@@ -1118,7 +1221,16 @@ def _invalidate_overview_cache(**kwargs):  # pylint: disable=unused-argument
     RequestCache('course_overview').clear()
 
 
+def _invalidate_overview_process_cache(instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Remove a saved or deleted course overview from the process cache.
+    """
+    CourseOverview.clear_process_cache(instance.id)
+
+
 post_save.connect(_invalidate_overview_cache, sender=CourseOverview)
 post_save.connect(_invalidate_overview_cache, sender=CourseOverviewImageConfig)
 post_delete.connect(_invalidate_overview_cache, sender=CourseOverview)
 post_delete.connect(_invalidate_overview_cache, sender=CourseOverviewImageConfig)
+post_save.connect(_invalidate_overview_process_cache, sender=CourseOverview)
+post_delete.connect(_invalidate_overview_process_cache, sender=CourseOverview)
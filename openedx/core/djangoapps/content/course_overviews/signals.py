@@ -31,6 +31,7 @@ def _listen_for_course_publish(sender, course_key, **kwargs):  # pylint: disable
     except CourseOverview.DoesNotExist:
         previous_course_overview = None
     updated_course_overview = CourseOverview.load_from_module_store(course_key)
+    CourseOverview.clear_process_cache(course_key)
     _check_for_course_changes(previous_course_overview, updated_course_overview)
 
 
@@ -41,6 +42,7 @@ def _listen_for_course_delete(sender, course_key, **kwargs):  # pylint: disable=
     invalidates the corresponding CourseOverview cache entry if one exists.
     """
     CourseOverview.objects.filter(id=course_key).delete()
+    CourseOverview.clear_process_cache(course_key)
 
 
 def _check_for_course_changes(previous_course_overview, updated_course_overview):
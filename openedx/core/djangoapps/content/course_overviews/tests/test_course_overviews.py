@@ -39,7 +39,7 @@ from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
 from xmodule.modulestore.tests.factories import CourseFactory, check_mongo_calls_range
 
-from ..models import CourseOverview, CourseOverviewImageConfig, CourseOverviewImageSet
+from ..models import CourseOverview, CourseOverviewImageConfig, CourseOverviewImageSet, get_process_cache
 from .factories import CourseOverviewFactory
 
 
@@ -541,7 +541,7 @@ class CourseOverviewTestCase(CatalogIntegrationMixin, ModuleStoreTestCase, Cache
         * one has an *out-of-date* course overview, that
         all four course overviews will appear in teh resulting dictionary,
         with the former two coming from the CourseOverviews SQL cache
-        and the latter two coming from the modulestore.
+        and the latter two coming from the modulestore, in bulk.
         """
         course_with_overview_1 = CourseFactory.create(emit_signals=True)
         course_with_overview_2 = CourseFactory.create(emit_signals=True)
@@ -572,7 +572,44 @@ class CourseOverviewTestCase(CatalogIntegrationMixin, ModuleStoreTestCase, Cache
         assert overviews_by_id[course_with_old_overview.id].id == course_with_old_overview.id
         assert overviews_by_id[old_overview.id].id == old_overview.id
         assert overviews_by_id[non_existent_course_key] is None
-        assert mock_load_from_modulestore.call_count == 3
+        # Only the course that the bulk fetch didn't find is loaded on its own.
+        mock_load_from_modulestore.assert_called_once_with(non_existent_course_key)
+
+    @override_settings(COURSE_OVERVIEW_PROCESS_CACHE_MAX_SIZE_IN_BYTES=10 * 1024 * 1024)
+    def test_get_from_ids_process_cache(self):
+        """
+        Assert that CourseOverviews.get_from_ids only checks the versions of
+        the overviews in the process cache, and reloads the outdated ones.
+        """
+        course_ids = [CourseFactory.create(emit_signals=True).id for _ in range(3)]
+        get_process_cache().clear()
+        self.addCleanup(get_process_cache().clear)
+
+        # The overviews and their tabs.
+        with self.assertNumQueries(2):
+            overviews_by_id = CourseOverview.get_from_ids(course_ids)
+        # Their versions.
+        with self.assertNumQueries(1):
+            cached_overviews_by_id = CourseOverview.get_from_ids(course_ids)
+        with self.assertNumQueries(0):
+            for course_id in course_ids:
+                assert cached_overviews_by_id[course_id] is not overviews_by_id[course_id]
+                assert cached_overviews_by_id[course_id].display_name == overviews_by_id[course_id].display_name
+                assert [tab.tab_id for tab in cached_overviews_by_id[course_id].tabs] == \
+                    [tab.tab_id for tab in overviews_by_id[course_id].tabs]
+
+        # Updated by another process, which doesn't invalidate this process's cache.
+        CourseOverview.objects.filter(id=course_ids[0]).update(display_name='Updated', modified=timezone.now())
+        with self.assertNumQueries(3):
+            cached_overviews_by_id = CourseOverview.get_from_ids(course_ids)
+        assert cached_overviews_by_id[course_ids[0]].display_name == 'Updated'
+
+        # Updated by this process.
+        overview = CourseOverview.objects.get(id=course_ids[1])
+        overview.display_name = 'Saved'
+        overview.save()
+        assert course_ids[1] not in get_process_cache()
+        assert CourseOverview.get_from_id(course_ids[1]).display_name == 'Saved'
 
 
 @ddt.ddt
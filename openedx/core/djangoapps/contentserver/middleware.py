@@ -5,6 +5,7 @@ Middleware to serve assets.
 
 import datetime
 import logging
+import uuid
 
 from django.http import (
     HttpResponse,
@@ -12,7 +13,8 @@ from django.http import (
     HttpResponseForbidden,
     HttpResponseNotFound,
     HttpResponseNotModified,
-    HttpResponsePermanentRedirect
+    HttpResponsePermanentRedirect,
+    StreamingHttpResponse
 )
 from django.utils.deprecation import MiddlewareMixin
 from opaque_keys import InvalidKeyError
@@ -21,7 +23,7 @@ from opaque_keys.edx.locator import AssetLocator
 from openedx.core.djangoapps.header_control import force_header_for_response
 from common.djangoapps.student.models import CourseEnrollment
 from xmodule.assetstore.assetmgr import AssetManager
-from xmodule.contentstore.content import XASSET_LOCATION_TAG, StaticContent
+from xmodule.contentstore.content import XASSET_LOCATION_TAG, StaticContent, StaticContentStream
 from xmodule.exceptions import NotFoundError
 from xmodule.modulestore import InvalidLocationError
 from xmodule.modulestore.exceptions import ItemNotFoundError
@@ -41,6 +43,15 @@ except ImportError:
 
 HTTP_DATE_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
 
+# Assets smaller than this are cached with their data, larger ones aren't
+# cached and are streamed from the contentstore.  We cap this at 1MB because
+# it's the default for memcached and also we don't want to do too much
+# buffering in memory when we're serving an actual request.
+MAX_CACHED_CONTENT_LENGTH = 1048576
+
+# Requests for more ranges than this get the full content instead.
+MAX_BYTE_RANGES = 16
+
 
 class StaticContentServer(MiddlewareMixin):
     """
@@ -117,25 +128,31 @@ class StaticContentServer(MiddlewareMixin):
                 return HttpResponseForbidden('Unauthorized')
 
             # Figure out if the client sent us a conditional request, and let them know
-            # if this asset has changed since then.
+            # if this asset has changed since then.  If-None-Match takes precedence
+            # over If-Modified-Since.
+            etag = self.get_etag(content)
             last_modified_at_str = content.last_modified_at.strftime(HTTP_DATE_FORMAT)
-            if 'HTTP_IF_MODIFIED_SINCE' in request.META:
+            if 'HTTP_IF_NONE_MATCH' in request.META:
+                if etag is not None and etag_matches(request.META['HTTP_IF_NONE_MATCH'], etag):
+                    response = HttpResponseNotModified()
+                    response['ETag'] = etag
+                    return response
+            elif 'HTTP_IF_MODIFIED_SINCE' in request.META:
                 if_modified_since = request.META['HTTP_IF_MODIFIED_SINCE']
                 if if_modified_since == last_modified_at_str:
                     return HttpResponseNotModified()
 
-            # *** File streaming within a byte range ***
+            # *** File streaming within byte ranges ***
             # If a Range is provided, parse Range attribute of the request
             # Add Content-Range in the response if Range is structurally correct
             # Request -> Range attribute structure: "Range: bytes=first-[last]"
             # Response -> Content-Range attribute structure: "Content-Range: bytes first-last/totalLength"
             # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.35
+            # Several satisfiable ranges are sent as a multipart/byteranges message.
+            # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.16
             response = None
+            content_type = content.content_type
             if request.META.get('HTTP_RANGE'):
-                # If we have a StaticContent, get a StaticContentStream.  Can't manipulate the bytes otherwise.
-                if isinstance(content, StaticContent):
-                    content = AssetManager.find(loc, as_stream=True)
-
                 header_value = request.META['HTTP_RANGE']
                 try:
                     unit, ranges = parse_range_header(header_value, content.length)
@@ -149,37 +166,41 @@ class StaticContentServer(MiddlewareMixin):
                     if unit != 'bytes':
                         # Only accept ranges in bytes
                         log.warning("Unknown unit in Range header: %s for content: %s", header_value, str(loc))
-                    elif len(ranges) > 1:
-                        # According to Http/1.1 spec content for multiple ranges should be sent as a multipart message.
-                        # http://www.w3.org/Protocols/rfc2616/rfc2616-sec14.html#sec14.16
-                        # But we send back the full content.
+                    elif len(ranges) > MAX_BYTE_RANGES:
+                        # Don't let a request make us seek all over the asset; send back the full content.
                         log.warning(
-                            "More than 1 ranges in Range header: %s for content: %s", header_value, str(loc)
+                            "Too many ranges in Range header: %s for content: %s", header_value, str(loc)
                         )
                     else:
-                        first, last = ranges[0]
+                        ranges = [(first, last) for first, last in ranges if 0 <= first <= last < content.length]
+                        if not ranges:
+                            log.warning(
+                                "Cannot satisfy ranges in Range header: %s for content: %s",
+                                header_value, str(loc)
+                            )
+                            return HttpResponse(status=416)  # Requested Range Not Satisfiable
 
-                        if 0 <= first <= last < content.length:
-                            # If the byte range is satisfiable
-                            response = HttpResponse(content.stream_data_in_range(first, last))
+                        if len(ranges) == 1:
+                            first, last = ranges[0]
+                            response = self._make_response(content, content.stream_data_in_range(first, last))
                             response['Content-Range'] = 'bytes {first}-{last}/{length}'.format(
                                 first=first, last=last, length=content.length
                             )
                             response['Content-Length'] = str(last - first + 1)
-                            response.status_code = 206  # Partial Content
-
-                            if newrelic:
-                                newrelic.agent.add_custom_parameter('contentserver.ranged', True)
                         else:
-                            log.warning(
-                                "Cannot satisfy ranges in Range header: %s for content: %s",
-                                header_value, str(loc)
-                            )
-                            return HttpResponse(status=416)  # Requested Range Not Satisfiable
+                            boundary = uuid.uuid4().hex
+                            length, parts = multipart_byteranges(content, ranges, boundary)
+                            response = self._make_response(content, parts)
+                            response['Content-Length'] = str(length)
+                            content_type = f'multipart/byteranges; boundary={boundary}'
+                        response.status_code = 206  # Partial Content
+
+                        if newrelic:
+                            newrelic.agent.add_custom_parameter('contentserver.ranged', True)
 
             # If Range header is absent or syntactically invalid return a full content response.
             if response is None:
-                response = HttpResponse(content.stream_data())
+                response = self._make_response(content, content.stream_data())
                 response['Content-Length'] = content.length
 
             if newrelic:
@@ -188,7 +209,9 @@ class StaticContentServer(MiddlewareMixin):
 
             # "Accept-Ranges: bytes" tells the user that only "bytes" ranges are allowed
             response['Accept-Ranges'] = 'bytes'
-            response['Content-Type'] = content.content_type
+            response['Content-Type'] = content_type
+            if etag is not None:
+                response['ETag'] = etag
             response['X-Frame-Options'] = 'ALLOW'
 
             # Set any caching headers, and do any response cleanup needed.  Based on how much
@@ -199,6 +222,27 @@ class StaticContentServer(MiddlewareMixin):
 
             return response
 
+    @staticmethod
+    def _make_response(content, data):
+        """
+        Returns a response with the given data of the content.  Data streamed
+        from the contentstore is sent as it is read, chunk by chunk, rather than
+        loaded in memory first.
+        """
+        if isinstance(content, StaticContentStream):
+            return StreamingHttpResponse(data)
+        return HttpResponse(data)
+
+    @staticmethod
+    def get_etag(content):
+        """
+        Returns the ETag of the content, based on its digest, if it has one.
+        """
+        content_digest = getattr(content, 'content_digest', None)
+        if content_digest is None:
+            return None
+        return f'"{content_digest}"'
+
     def set_caching_headers(self, content, response):
         """
         Sets caching headers based on whether or not the asset is locked.
@@ -293,10 +337,10 @@ class StaticContentServer(MiddlewareMixin):
             except (ItemNotFoundError, NotFoundError):  # lint-amnesty, pylint: disable=try-except-raise
                 raise
 
-            # Now that we fetched it, let's go ahead and try to cache it. We cap this at 1MB
-            # because it's the default for memcached and also we don't want to do too much
-            # buffering in memory when we're serving an actual request.
-            if content.length is not None and content.length < 1048576:
+            # Now that we fetched it, let's go ahead and try to cache it, if it is small.
+            # Large assets aren't cached, so that their metadata is always read along
+            # with their data.
+            if content.length is not None and content.length < MAX_CACHED_CONTENT_LENGTH:
                 content = content.copy_to_in_mem()
                 set_cached_content(content)
 
@@ -344,3 +388,48 @@ def parse_range_header(header_value, content_length):
         raise ValueError('Invalid syntax')
 
     return unit, ranges
+
+
+def etag_matches(header_value, etag):
+    """
+    Returns whether the If-None-Match header value matches the given ETag,
+    using the weak comparison required for If-None-Match.
+    """
+    def opaque_tag(tag):
+        tag = tag.strip()
+        return tag[2:] if tag.startswith('W/') else tag
+
+    if header_value.strip() == '*':
+        return True
+    return opaque_tag(etag) in {opaque_tag(tag) for tag in header_value.split(',')}
+
+
+def multipart_byteranges(content, ranges, boundary):
+    """
+    Returns the length and an iterator of the body of a multipart/byteranges
+    message with the given ranges of the content.
+
+    See spec for details: http://www.w3.org/Protocols/rfc2616/rfc2616-sec19.html#sec19.2
+    """
+    part_headers = [
+        (
+            '\r\n--{boundary}\r\n'
+            'Content-Type: {content_type}\r\n'
+            'Content-Range: bytes {first}-{last}/{length}\r\n'
+            '\r\n'
+        ).format(
+            boundary=boundary, content_type=content.content_type, first=first, last=last, length=content.length,
+        ).encode('utf-8')
+        for first, last in ranges
+    ]
+    closing = f'\r\n--{boundary}--\r\n'.encode('utf-8')
+
+    def parts():
+        for part_header, (first, last) in zip(part_headers, ranges):
+            yield part_header
+            yield from content.stream_data_in_range(first, last)
+        yield closing
+
+    length = sum(len(part_header) for part_header in part_headers) + len(closing)
+    length += sum(last - first + 1 for first, last in ranges)
+    return length, parts()
@@ -29,7 +29,7 @@ from xmodule.modulestore.exceptions import ItemNotFoundError
 from common.djangoapps.student.models import CourseEnrollment
 from common.djangoapps.student.tests.factories import UserFactory, AdminFactory
 
-from ..middleware import parse_range_header, HTTP_DATE_FORMAT, StaticContentServer
+from ..middleware import etag_matches, parse_range_header, HTTP_DATE_FORMAT, StaticContentServer
 
 log = logging.getLogger(__name__)
 
@@ -255,6 +255,24 @@ class ContentStoreToyCourseTest(SharedModuleStoreTestCase):
         assert 'Content-Range' not in resp
         assert resp['Content-Length'] == str(self.length_unlocked)
 
+    def test_range_request_multipart(self):
+        """
+        Test that a request for several ranges outputs a multipart/byteranges message with each range.
+        """
+        resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes=0-9, 20-29, {first}-{last}'.format(
+            first=self.length_unlocked, last=self.length_unlocked + 10))
+
+        assert resp.status_code == 206
+        assert resp['Content-Type'].startswith('multipart/byteranges; boundary=')
+        boundary = resp['Content-Type'].split('boundary=')[1]
+        content = resp.content
+        assert resp['Content-Length'] == str(len(content))
+        assert content.count(b'--' + boundary.encode('utf-8')) == 3
+        assert content.endswith('--{}--\r\n'.format(boundary).encode('utf-8'))
+        for first, last in ((0, 9), (20, 29)):
+            assert 'Content-Range: bytes {first}-{last}/{length}'.format(
+                first=first, last=last, length=self.length_unlocked).encode('utf-8') in content
+
     @ddt.data(
         'bytes 0-',
         'bits=0-',
@@ -287,6 +305,38 @@ class ContentStoreToyCourseTest(SharedModuleStoreTestCase):
             first=(self.length_unlocked), last=(self.length_unlocked)))
         assert resp.status_code == 416
 
+    def test_etag(self):
+        """
+        Test that assets are sent with an ETag, and that a request with a matching
+        If-None-Match gets a 304 Not Modified.
+        """
+        resp = self.client.get(self.url_unlocked)
+        assert resp.status_code == 200
+        etag = resp['ETag']
+
+        resp = self.client.get(self.url_unlocked, HTTP_IF_NONE_MATCH=etag)
+        assert resp.status_code == 304
+        assert resp['ETag'] == etag
+
+        resp = self.client.get(self.url_unlocked, HTTP_IF_NONE_MATCH='"{}"'.format(FAKE_MD5_HASH))
+        assert resp.status_code == 200
+
+    @patch('openedx.core.djangoapps.contentserver.middleware.MAX_CACHED_CONTENT_LENGTH', 0)
+    def test_large_asset_streamed(self):
+        """
+        Test that assets too large to be cached are streamed, and not cached.
+        """
+        with patch('openedx.core.djangoapps.contentserver.middleware.set_cached_content') as mock_set_cached_content:
+            resp = self.client.get(self.url_unlocked)
+            assert resp.status_code == 200
+            assert resp.streaming
+            assert len(b''.join(resp.streaming_content)) == self.length_unlocked
+
+            resp = self.client.get(self.url_unlocked, HTTP_RANGE='bytes=0-9')
+            assert resp.status_code == 206
+            assert len(b''.join(resp.streaming_content)) == 10
+        mock_set_cached_content.assert_not_called()
+
     def test_vary_header_sent(self):
         """
         Tests that we're properly setting the Vary header to ensure browser requests don't get
@@ -449,3 +499,22 @@ class ParseRangeHeaderTestCase(unittest.TestCase):
         self.assertRaisesRegex(
             exception_class, exception_message_regex, parse_range_header, header_value, self.content_length
         )
+
+
+@ddt.ddt
+class EtagMatchesTestCase(unittest.TestCase):
+    """
+    Tests for the etag_matches function.
+    """
+
+    @ddt.data(
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ('*', True),
+        ('"xyz"', False),
+        ('abc', False),
+    )
+    @ddt.unpack
+    def test_etag_matches(self, header_value, expected):
+        assert etag_matches(header_value, '"abc"') == expected
@@ -3,15 +3,40 @@
 
 
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
 from uuid import uuid4
 
 import requests
+from crum import get_current_request
+from django.conf import settings
+from django.utils import translation
 from django.utils.translation import get_language
+from edx_django_utils.cache import RequestCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .settings import SERVICE_HOST as COMMENTS_SERVICE
 
 log = logging.getLogger(__name__)
 
+FORUMS_CONFIG_CACHE_NAMESPACE = 'comment_client.forums_config'
+
+# Defaults of the COMMENTS_SERVICE_POOL_SIZE, COMMENTS_SERVICE_MAX_RETRIES and
+# COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS settings.
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+# The session of this process, with the pid and settings it was created for.
+_session = (None, None)
+_session_lock = threading.Lock()
+
+# The forums config of the thread that started the calls run by fan_out.
+_fan_out_context = threading.local()
+
 
 def strip_none(dic):
     return {k: v for k, v in dic.items() if v is not None}  # lint-amnesty, pylint: disable=consider-using-dict-comprehension
@@ -30,11 +55,111 @@ def extract(dic, keys):
         return strip_none({k: dic.get(k) for k in keys})
 
 
-def perform_request(method, url, data_or_params=None, raw=False,
-                    metric_action=None, metric_tags=None, paged_results=False):
+def _get_forums_config():
+    """
+    Return the current ForumsConfig, which is only looked up once per request.
+    """
+    config = getattr(_fan_out_context, 'config', None)
+    if config is not None:
+        return config
+
     # To avoid dependency conflict
     from openedx.core.djangoapps.django_comment_common.models import ForumsConfig
+    if get_current_request() is None:
+        return ForumsConfig.current()
+
+    request_cache = RequestCache(FORUMS_CONFIG_CACHE_NAMESPACE)
+    cached_response = request_cache.get_cached_response('config')
+    if cached_response.is_found:
+        return cached_response.value
     config = ForumsConfig.current()
+    request_cache.set('config', config)
+    return config
+
+
+def _get_session():
+    """
+    Return the requests session of this process, which keeps up to
+    COMMENTS_SERVICE_POOL_SIZE connections to the comments service open and
+    retries failed connections and idempotent requests up to
+    COMMENTS_SERVICE_MAX_RETRIES times.
+
+    Returns None if COMMENTS_SERVICE_POOL_SIZE is 0, in which case every
+    request opens a new connection.
+
+    Processes forked from each other (e.g. web server workers) must not share
+    connections, so each process creates its own session.
+    """
+    global _session  # pylint: disable=global-statement
+    pool_size = getattr(settings, 'COMMENTS_SERVICE_POOL_SIZE', DEFAULT_POOL_SIZE)
+    if not pool_size:
+        return None
+    max_retries = getattr(settings, 'COMMENTS_SERVICE_MAX_RETRIES', DEFAULT_MAX_RETRIES)
+    session_key = (os.getpid(), pool_size, max_retries)
+    if _session[0] == session_key:
+        return _session[1]
+    with _session_lock:
+        if _session[0] != session_key:
+            session = requests.Session()
+            # The session is shared by all users, so it mustn't keep cookies.
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            adapter = HTTPAdapter(
+                pool_maxsize=pool_size,
+                # Connection errors are always retried, read errors only for
+                # the idempotent methods.
+                max_retries=Retry(total=max_retries, backoff_factor=0.1),
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _session = (session_key, session)
+        return _session[1]
+
+
+def fan_out(*calls):
+    """
+    Make the given calls to the comments service concurrently and return
+    their results, in the same order.
+
+    Each call is a function without arguments, e.g. a functools.partial of
+    a comment client method.  Up to COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS
+    of them are run at once, in other threads, with the language and forums
+    config of the calling thread.  If any of them raises an exception, the
+    exception of the first of those is raised once all the calls are done.
+
+    The calls must not use the database: the other threads don't see the
+    transaction of the calling thread.
+    """
+    max_workers = min(
+        len(calls),
+        getattr(settings, 'COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS', DEFAULT_MAX_CONCURRENT_REQUESTS),
+    )
+    if max_workers <= 1:
+        return [call() for call in calls]
+
+    config = _get_forums_config()
+    language = get_language()
+
+    def run(call):
+        _fan_out_context.config = config
+        try:
+            with translation.override(language):
+                return call()
+        finally:
+            _fan_out_context.config = None
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='comment-client') as executor:
+        futures = [executor.submit(run, call) for call in calls]
+        # Wait for all the calls before raising any of their exceptions.
+        exceptions = [future.exception() for future in futures]
+    for exception in exceptions:
+        if exception is not None:
+            raise exception
+    return [future.result() for future in futures]
+
+
+def perform_request(method, url, data_or_params=None, raw=False,
+                    metric_action=None, metric_tags=None, paged_results=False):
+    config = _get_forums_config()
 
     if not config.enabled:
         raise CommentClientMaintenanceError('service disabled')
@@ -62,7 +187,7 @@ def perform_request(method, url, data_or_params=None, raw=False,
         data = None
         params = data_or_params.copy()
         params.update(request_id_dict)
-    response = requests.request(
+    response = (_get_session() or requests).request(
         method,
         url,
         data=data,
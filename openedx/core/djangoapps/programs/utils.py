@@ -509,6 +509,15 @@ class ProgramDataExtender:
 
     def _extend_course_runs(self):
         """Execute course run data handlers."""
+        # Look up the user's enrollments in all the course runs at once, rather than one by one in the handlers.
+        CourseEnrollment.bulk_get_enrollment_states(
+            [self.user],
+            [
+                CourseKey.from_string(course_run['key'])
+                for course in self.data['courses']
+                for course_run in course['course_runs']
+            ],
+        )
         for course in self.data['courses']:
             for course_run in course['course_runs']:
                 # State to be shared across handlers.
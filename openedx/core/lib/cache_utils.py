@@ -6,6 +6,7 @@ Utilities related to caching.
 import collections
 import functools
 import itertools
+import threading
 import zlib
 import pickle
 
@@ -150,6 +151,106 @@ class process_cached:  # pylint: disable=invalid-name
         return functools.partial(self.__call__, obj)
 
 
+class BoundedLRUCache:
+    """
+    A thread-safe, least-recently-used cache for the life of a process,
+    bounded by the total size of its entries.
+
+    The size of each entry is provided by the caller when the entry is
+    set, so callers can choose whatever approximation of an entry's
+    memory footprint is cheap for them to compute (for example, the
+    length of the data the value was deserialized from).
+
+    Hit, miss, and eviction counters are kept for monitoring purposes.
+
+    WARNING: Values are shared by all callers within the process. Either
+    cache immutable values or copy them on read.
+    """
+
+    def __init__(self, max_size_in_bytes):
+        self.max_size_in_bytes = max_size_in_bytes
+        self.size_in_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Returns the value cached for the given key, marking it as the most
+        recently used; returns default if not found.
+        """
+        with self._lock:
+            try:
+                value, _ = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, size):
+        """
+        Caches the given value of the given size for the given key,
+        evicting the least recently used entries as needed to stay
+        within max_size_in_bytes.  Values larger than max_size_in_bytes
+        are not cached.
+        """
+        with self._lock:
+            self._pop(key)
+            if size > self.max_size_in_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.size_in_bytes += size
+            while self.size_in_bytes > self.max_size_in_bytes:
+                self._pop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def delete(self, key):
+        """
+        Removes the given key from the cache, if present.
+        """
+        with self._lock:
+            self._pop(key)
+
+    def clear(self):
+        """
+        Removes all entries and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size_in_bytes = self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """
+        Returns a dict with the current counters of the cache.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'size_in_bytes': self.size_in_bytes,
+            }
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _pop(self, key):
+        """
+        Removes the given key, if present. Must be called with the lock held.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size_in_bytes -= entry[1]
+
+
 class CacheInvalidationManager:
     """
     This class provides a decorator for simple functions, which can handle invalidation.
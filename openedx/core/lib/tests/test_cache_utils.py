@@ -8,7 +8,7 @@ from unittest.mock import Mock
 import ddt
 from edx_django_utils.cache import RequestCache
 
-from openedx.core.lib.cache_utils import request_cached
+from openedx.core.lib.cache_utils import BoundedLRUCache, request_cached
 
 
 @ddt.ddt
@@ -295,3 +295,48 @@ class TestRequestCachedDecorator(TestCase):
         result = wrapped(3)
         assert result == 2
         assert to_be_wrapped.call_count == 2
+
+
+class TestBoundedLRUCache(TestCase):
+    """
+    Test the BoundedLRUCache class.
+    """
+    def test_miss_and_then_hit(self):
+        cache = BoundedLRUCache(max_size_in_bytes=10)
+        assert cache.get('a') is None
+        cache.set('a', 1, size=4)
+        assert cache.get('a') == 1
+        assert cache.stats() == {'hits': 1, 'misses': 1, 'evictions': 0, 'entries': 1, 'size_in_bytes': 4}
+
+    def test_evicts_least_recently_used(self):
+        cache = BoundedLRUCache(max_size_in_bytes=10)
+        cache.set('a', 1, size=4)
+        cache.set('b', 2, size=4)
+        cache.get('a')
+        cache.set('c', 3, size=4)
+
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+        assert cache.size_in_bytes == 8
+        assert cache.evictions == 1
+
+    def test_replace_and_delete(self):
+        cache = BoundedLRUCache(max_size_in_bytes=10)
+        cache.set('a', 1, size=4)
+        cache.set('a', 2, size=6)
+        assert cache.get('a') == 2
+        assert cache.size_in_bytes == 6
+
+        cache.delete('a')
+        cache.delete('a')
+        assert len(cache) == 0
+        assert cache.size_in_bytes == 0
+
+    def test_oversized_value_not_cached(self):
+        cache = BoundedLRUCache(max_size_in_bytes=10)
+        cache.set('a', 1, size=4)
+        cache.set('b', 2, size=11)
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert cache.evictions == 0
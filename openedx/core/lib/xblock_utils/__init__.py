@@ -273,6 +273,23 @@ def replace_static_urls(data_dir, block, view, frag, context, course_id=None, st
     ))
 
 
+def replace_courseware_urls(
+    data_dir, course_id, jump_to_id_base_url, block, view, frag, context, static_asset_path='',
+):  # pylint: disable=unused-argument
+    """
+    Does what replace_static_urls, replace_course_urls and
+    replace_jump_to_id_urls do, in a single pass over the fragment's content.
+    See static_replace.replace_courseware_urls.
+    """
+    return wrap_fragment(frag, static_replace.replace_courseware_urls(
+        frag.content,
+        course_id,
+        jump_to_id_base_url,
+        data_directory=data_dir,
+        static_asset_path=static_asset_path,
+    ))
+
+
 def grade_histogram(module_id):
     '''
     Print out a histogram of grades on a given problem in staff member debug info.